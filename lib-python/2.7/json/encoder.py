@@ -206,6 +206,17 @@ class JSONEncoder(object):
         '{"foo": ["bar", "baz"]}'
 
         """
+        # subclasses may override any method, so they take the slow path
+        if (_pypyjson_encode is not None and type(self) is JSONEncoder and
+                self.ensure_ascii and
+                self.indent is None and not self.sort_keys and
+                self.encoding == 'utf-8' and
+                type(self.item_separator) is str and
+                type(self.key_separator) is str):
+            return _pypyjson_encode(o, self.item_separator,
+                                    self.key_separator, self.allow_nan,
+                                    self.check_circular, self.skipkeys,
+                                    self.default)
         if self.check_circular:
             markers = {}
         else:
@@ -536,3 +547,7 @@ try:
     from _pypyjson import raw_encode_basestring_ascii
 except ImportError:
     pass
+try:
+    from _pypyjson import encode as _pypyjson_encode
+except ImportError:
+    _pypyjson_encode = None
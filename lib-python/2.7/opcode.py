@@ -195,5 +195,7 @@ def_op('CALL_METHOD', 202)            # #args not including 'self'
 def_op('BUILD_LIST_FROM_ARG', 203)
 jrel_op('JUMP_IF_NOT_DEBUG', 204)     # jump over assert statements
 def_op('LOAD_REVDB_VAR', 205)         # reverse debugger (syntax example: $5)
+def_op('LOAD_FAST_LOAD_FAST', 206)    # two local variables, 8 bits each
+def_op('LOAD_FAST_LOAD_ATTR', 207)    # local variable, name index: 8 bits each
 
 del def_op, name_op, jrel_op, jabs_op
@@ -625,3 +625,9 @@ def load(f):
 def loads(str):
     f = StringIO(str)
     return Unpickler(f).load()
+
+# the module-level functions are implemented at interp-level on PyPy
+try:
+    from _pypypickle import dump, dumps, load, loads
+except ImportError:
+    pass
@@ -36,7 +36,7 @@ working_modules.update([
     "cStringIO", "thread", "itertools", "pyexpat", "_ssl", "cpyext", "array",
     "binascii", "_multiprocessing", '_warnings', "_collections",
     "_multibytecodec", "micronumpy", "_continuation", "_cffi_backend",
-    "_csv", "_cppyy", "_pypyjson", "_jitlog"
+    "_csv", "_cppyy", "_pypyjson", "_pypypickle", "_jitlog"
 ])
 
 import rpython.rlib.rvmprof.cintf
@@ -238,6 +238,10 @@ pypy_optiondescription = OptionDescription("objspace", "Object Space Options", [
         IntOption("methodcachesizeexp",
                   " 2 ** methodcachesizeexp is the size of the of the method cache ",
                   default=11),
+        IntOption("megamorphiclimit",
+                  "number of different maps after which an attribute or "
+                  "method site uses the global megamorphic cache (0: never)",
+                  default=8),
         BoolOption("intshortcut",
                    "special case addition and subtraction of two integers in BINARY_ADD/"
                    "/BINARY_SUBTRACT and their inplace counterparts",
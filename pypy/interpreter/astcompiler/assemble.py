@@ -310,6 +310,35 @@ class PythonCodeMaker(ast.ASTVisitor):
             self.lineno = lineno
             self.lineno_set = False
 
+    def _fuse_superinstructions(self, blocks):
+        """Replace some common pairs of instructions with a single
+        superinstruction, to reduce the number of dispatches done by the
+        interpreter.  Only pairs inside a block are considered, so the
+        second instruction is never a jump target, and only if the second
+        instruction does not start a new line.
+        """
+        for block in blocks:
+            instrs = block.instructions
+            if len(instrs) < 2:
+                continue
+            result = []
+            i = 0
+            while i < len(instrs):
+                instr = instrs[i]
+                i += 1
+                if (instr.opcode == ops.LOAD_FAST and instr.arg < 256 and
+                        i < len(instrs)):
+                    next_instr = instrs[i]
+                    if next_instr.lineno == 0 and next_instr.arg < 256:
+                        fused_op = _superinstructions.get(next_instr.opcode,
+                                                          -1)
+                        if fused_op != -1:
+                            instr.opcode = fused_op
+                            instr.arg |= next_instr.arg << 8
+                            i += 1
+                result.append(instr)
+            block.instructions = result
+
     def _resolve_block_targets(self, blocks):
         """Compute the arguments of jump instructions."""
         last_extended_arg_count = 0
@@ -506,6 +535,7 @@ class PythonCodeMaker(ast.ASTVisitor):
             else:
                 self.first_lineno = 1
         blocks = self.first_block.post_order()
+        self._fuse_superinstructions(blocks)
         self._resolve_block_targets(blocks)
         lnotab = self._build_lnotab(blocks)
         stack_depth = self._stacksize(blocks)
@@ -674,6 +704,15 @@ _static_opcode_stack_effects = {
 
     ops.BUILD_LIST_FROM_ARG: 1,
     ops.LOAD_REVDB_VAR: 1,
+
+    ops.LOAD_FAST_LOAD_FAST: 2,
+    ops.LOAD_FAST_LOAD_ATTR: 1,
+}
+
+# LOAD_FAST followed by the key is replaced by the value
+_superinstructions = {
+    ops.LOAD_FAST: ops.LOAD_FAST_LOAD_FAST,
+    ops.LOAD_ATTR: ops.LOAD_FAST_LOAD_ATTR,
 }
 
 
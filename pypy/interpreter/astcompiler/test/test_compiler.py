@@ -166,6 +166,30 @@ class TestCompiler(BaseTestCompiler):
             expected = eval("17 %s 5" % operator)
             yield self.simple_test, "x = 17; x %s= 5" % operator, "x", expected
 
+    def test_superinstructions(self):
+        yield self.st, """def f(a, b):
+            return a - b
+x = f(7, 2)""", "x", 5
+        yield self.st, """def f(a):
+            return a.real
+x = f(42)""", "x", 42
+        yield self.st, """def f(n):
+            if n:
+                a = 5
+            return n + a
+try:
+    f(0)
+except UnboundLocalError as e:
+    x = str(e)""", "x", "local variable 'a' referenced before assignment"
+        yield self.st, """def f(n):
+            if n:
+                a = 5
+            return a.real
+try:
+    f(0)
+except UnboundLocalError as e:
+    x = str(e)""", "x", "local variable 'a' referenced before assignment"
+
     def test_subscript(self):
         yield self.simple_test, "d={2:3}; x=d[2]", "x", 3
         yield self.simple_test, "d={(2,):3}; x=d[2,]", "x", 3
@@ -1129,6 +1153,36 @@ class TestOptimizations:
                           ops.POP_JUMP_IF_FALSE: 1,
                           ops.RETURN_VALUE: 2}
 
+    def test_superinstructions(self):
+        source = """def f(x, y):
+            return x.foo - y * x
+        """
+        code, blocks = generate_function_code(source, self.space)
+        code._fuse_superinstructions(blocks)
+        instrs = []
+        for block in blocks:
+            instrs.extend(block.instructions)
+        opcodes = [instr.opcode for instr in instrs]
+        assert opcodes == [ops.LOAD_FAST_LOAD_ATTR, ops.LOAD_FAST_LOAD_FAST,
+                           ops.BINARY_MULTIPLY, ops.BINARY_SUBTRACT,
+                           ops.RETURN_VALUE]
+        assert instrs[0].arg == 0 | (0 << 8)     # x, 'foo'
+        assert instrs[1].arg == 1 | (0 << 8)     # y, x
+
+    def test_superinstructions_not_across_lines(self):
+        source = """def f(x, y):
+            return (x,
+                    y)
+        """
+        code, blocks = generate_function_code(source, self.space)
+        code._fuse_superinstructions(blocks)
+        counts = {}
+        for block in blocks:
+            for instr in block.instructions:
+                counts[instr.opcode] = counts.get(instr.opcode, 0) + 1
+        assert counts == {ops.LOAD_FAST: 2, ops.BUILD_TUPLE: 1,
+                          ops.RETURN_VALUE: 1}
+
     def test_remove_dead_yield(self):
         source = """def f(x):
             return
@@ -341,6 +341,10 @@ class __extend__(pyframe.PyFrame):
                 self.LOAD_DEREF(oparg, next_instr)
             elif opcode == opcodedesc.LOAD_FAST.index:
                 self.LOAD_FAST(oparg, next_instr)
+            elif opcode == opcodedesc.LOAD_FAST_LOAD_FAST.index:
+                self.LOAD_FAST_LOAD_FAST(oparg, next_instr)
+            elif opcode == opcodedesc.LOAD_FAST_LOAD_ATTR.index:
+                self.LOAD_FAST_LOAD_ATTR(oparg, next_instr)
             elif opcode == opcodedesc.LOAD_GLOBAL.index:
                 self.LOAD_GLOBAL(oparg, next_instr)
             elif opcode == opcodedesc.LOAD_LOCALS.index:
@@ -494,6 +498,18 @@ class __extend__(pyframe.PyFrame):
             self._load_fast_failed(varindex)
         self.pushvalue(w_value)
 
+    # Superinstructions, emitted by astcompiler/assemble.py in place of
+    # two consecutive instructions of the same line.  The two arguments
+    # are packed in 'oparg', 8 bits each.
+
+    def LOAD_FAST_LOAD_FAST(self, oparg, next_instr):
+        self.LOAD_FAST(oparg & 0xff, next_instr)
+        self.LOAD_FAST(oparg >> 8, next_instr)
+
+    def LOAD_FAST_LOAD_ATTR(self, oparg, next_instr):
+        self.LOAD_FAST(oparg & 0xff, next_instr)
+        self.LOAD_ATTR(oparg >> 8, next_instr)
+
     @dont_inline
     def _load_fast_failed(self, varindex):
         varname = self.getlocalvarname(varindex)
@@ -949,8 +965,14 @@ class __extend__(pyframe.PyFrame):
             from pypy.objspace.std.mapdict import LOAD_ATTR_caching
             w_value = LOAD_ATTR_caching(self.getcode(), w_obj, nameindex)
         else:
-            w_attributename = self.getname_w(nameindex)
-            w_value = self.space.getattr(w_obj, w_attributename)
+            from pypy.objspace.std.mapdict import (
+                is_megamorphic, LOAD_ATTR_megamorphic)
+            pycode = self.getcode()
+            if is_megamorphic(pycode, nameindex):
+                w_value = LOAD_ATTR_megamorphic(pycode, w_obj, nameindex)
+            else:
+                w_attributename = self.getname_w(nameindex)
+                w_value = self.space.getattr(w_obj, w_attributename)
         self.pushvalue(w_value)
 
     @jit.unroll_safe
@@ -2,7 +2,7 @@ import pytest
 import struct
 import sys
 from pypy.interpreter.unicodehelper import (
-    encode_utf8, decode_utf8, unicode_encode_utf_32_be)
+    encode_utf8, decode_utf8, unicode_encode_utf_32_be, utf8_length)
 
 class FakeSpace:
     pass
@@ -32,6 +32,22 @@ def test_decode_utf8():
     else:
         assert map(ord, got) == [55296, 56320]
 
+def test_utf8_length():
+    assert utf8_length("") == 0
+    assert utf8_length("abc") == 3
+    assert utf8_length("\xc3\xa9\xe1\x88\xb4x") == 3
+    if sys.maxunicode > 65535:
+        assert utf8_length("\xf0\x90\x80\x80") == 1
+    else:
+        assert utf8_length("\xf0\x90\x80\x80") == 2
+    for s in ["\x80", "\xc3", "\xc0\x80", "\xe1\x88", "\xe0\x80\x80",
+              "\xed\xa0\x80", "\xf4\x90\x80\x80", "\xf5\x80\x80\x80",
+              "abc\xff", "\xe1\x88x"]:
+        assert utf8_length(s) == -1
+    for s in ["\xc2\x80", "\xdf\xbf", "\xe0\xa0\x80", "\xed\x9f\xbf",
+              "\xee\x80\x80", "\xf0\x90\x80\x80", "\xf4\x8f\xbf\xbf"]:
+        assert utf8_length(s) == len(s.decode("utf-8"))
+
 @pytest.mark.parametrize('unich', [u"\ud800", u"\udc80"])
 def test_utf32_surrogates(unich):
     assert (unicode_encode_utf_32_be(unich, 1, None) ==
@@ -77,6 +77,52 @@ def encode_utf8(space, uni):
         errorhandler=None,
         allow_surrogates=True)
 
+def utf8_length(s):
+    # Returns the length of decode_utf8(s) if 's' is valid UTF-8 without
+    # any surrogates, i.e. if encode_utf8() gives back the same string.
+    # Otherwise, returns -1.
+    end = len(s)
+    pos = 0
+    length = 0
+    while pos < end:
+        ordch1 = ord(s[pos])
+        if ordch1 < 0x80:
+            pos += 1
+        elif ordch1 < 0xC2:
+            return -1
+        elif ordch1 < 0xE0:
+            if pos + 1 >= end or not _is_cont_byte(s, pos + 1):
+                return -1
+            pos += 2
+        elif ordch1 < 0xF0:
+            if (pos + 2 >= end or not _is_cont_byte(s, pos + 1) or
+                    not _is_cont_byte(s, pos + 2)):
+                return -1
+            ordch2 = ord(s[pos + 1])
+            if ((ordch1 == 0xE0 and ordch2 < 0xA0) or      # overlong
+                    (ordch1 == 0xED and ordch2 >= 0xA0)):  # surrogate
+                return -1
+            pos += 3
+        elif ordch1 < 0xF5:
+            if (pos + 3 >= end or not _is_cont_byte(s, pos + 1) or
+                    not _is_cont_byte(s, pos + 2) or
+                    not _is_cont_byte(s, pos + 3)):
+                return -1
+            ordch2 = ord(s[pos + 1])
+            if ((ordch1 == 0xF0 and ordch2 < 0x90) or      # overlong
+                    (ordch1 == 0xF4 and ordch2 >= 0x90)):  # > 0x10FFFF
+                return -1
+            pos += 4
+            if MAXUNICODE < 0x10000:
+                length += 1     # a surrogate pair on narrow hosts
+        else:
+            return -1
+        length += 1
+    return length
+
+def _is_cont_byte(s, pos):
+    return (ord(s[pos]) & 0xC0) == 0x80
+
 # ____________________________________________________________
 # utf-16
 
@@ -18,7 +18,6 @@ class Module(MixedModule):
         'sorted'        : 'app_functional.sorted',
         'any'           : 'app_functional.any',
         'all'           : 'app_functional.all',
-        'sum'           : 'app_functional.sum',
         'map'           : 'app_functional.map',
         'reduce'        : 'app_functional.reduce',
         'filter'        : 'app_functional.filter',
@@ -83,6 +82,7 @@ class Module(MixedModule):
         'xrange'        : 'functional.W_XRange',
         'enumerate'     : 'functional.W_Enumerate',
         'min'           : 'functional.min',
+        'sum'           : 'functional.sum',
         'max'           : 'functional.max',
         'reversed'      : 'functional.reversed',
         'super'         : 'descriptor.W_Super',
@@ -10,7 +10,7 @@ from pypy.interpreter.gateway import interp2app, unwrap_spec, WrappedDefault
 from pypy.interpreter.typedef import TypeDef
 from rpython.rlib import jit, rarithmetic
 from rpython.rlib.objectmodel import specialize
-from rpython.rlib.rarithmetic import r_uint, intmask
+from rpython.rlib.rarithmetic import r_uint, intmask, ovfcheck
 from rpython.rlib.rbigint import rbigint
 
 
@@ -136,8 +136,33 @@ min_jitdriver = jit.JitDriver(name='min',
 max_jitdriver = jit.JitDriver(name='max',
         greens=['has_key', 'has_item', 'w_type'], reds='auto')
 
+@specialize.call_location()
+def min_max_unboxed(space, implementation_of, lst):
+    # fast path for lists of ints or floats: compare the unboxed items with
+    # the same operator as the general loop, which gives the same result
+    # also for NaNs and for 0.0 and -0.0
+    result = lst[0]
+    for i in range(1, len(lst)):
+        item = lst[i]
+        if implementation_of == "max":
+            if item > result:
+                result = item
+        else:
+            if item < result:
+                result = item
+    return result
+
 @specialize.arg(3)
 def min_max_sequence(space, w_sequence, w_key, implementation_of):
+    if w_key is None:
+        intlist = space.listview_int(w_sequence)
+        if intlist:
+            return space.newint(min_max_unboxed(space, implementation_of,
+                                                intlist))
+        floatlist = space.listview_float(w_sequence)
+        if floatlist:
+            return space.newfloat(min_max_unboxed(space, implementation_of,
+                                                  floatlist))
     if implementation_of == "max":
         compare = space.gt
         jitdriver = max_jitdriver
@@ -220,6 +245,60 @@ def min_max(space, args, implementation_of):
                     "%s() expects at least one argument",
                     implementation_of)
 
+sum_jitdriver = jit.JitDriver(name='sum', greens=['w_type'], reds='auto')
+
+def sum_unboxed(space, w_sequence, w_start):
+    """Sum the items of a list of ints or floats without boxing them.
+    Returns None if the fast path does not apply."""
+    w_starttype = space.type(w_start)
+    if space.is_w(w_starttype, space.w_int):
+        intlist = space.listview_int(w_sequence)
+        if intlist:
+            total = space.int_w(w_start)
+            try:
+                for item in intlist:
+                    total = ovfcheck(total + item)
+            except OverflowError:
+                return None     # the general loop switches to longs
+            return space.newint(total)
+    elif not space.is_w(w_starttype, space.w_float):
+        return None
+    floatlist = space.listview_float(w_sequence)
+    if floatlist:
+        ftotal = space.float_w(w_start)
+        for fitem in floatlist:
+            ftotal += fitem
+        return space.newfloat(ftotal)
+    return None
+
+@unwrap_spec(w_start=WrappedDefault(0))
+def sum(space, w_sequence, w_start):
+    """sum(sequence[, start]) -> value
+
+Returns the sum of a sequence of numbers (NOT strings) plus the value
+of parameter 'start' (which defaults to 0).  When the sequence is
+empty, returns start."""
+    if space.isinstance_w(w_start, space.w_basestring):
+        raise oefmt(space.w_TypeError, "sum() can't sum strings")
+    w_result = sum_unboxed(space, w_sequence, w_start)
+    if w_result is not None:
+        return w_result
+    w_iter = space.iter(w_sequence)
+    w_type = space.type(w_iter)
+    w_last = w_start
+    while True:
+        sum_jitdriver.jit_merge_point(w_type=w_type)
+        try:
+            w_item = space.next(w_iter)
+        except OperationError as e:
+            if not e.match(space, space.w_StopIteration):
+                raise
+            break
+        # Very intentionally *not* inplace_add, that would have different
+        # semantics if start was a mutable type, such as a list
+        w_last = space.add(w_last, w_item)
+    return w_last
+
 def max(space, __args__):
     """max(iterable[, key=func]) -> value
     max(a, b, c, ...[, key=func]) -> value
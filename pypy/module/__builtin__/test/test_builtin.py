@@ -226,6 +226,30 @@ class AppTestBuiltinApp:
                 return 42
         assert sum([Foo()], None) == 42
 
+    def test_sum_unboxed(self):
+        import sys
+        assert sum([1, 2, 3], 10) == 16
+        assert sum([sys.maxint, 1]) == sys.maxint + 1
+        assert type(sum([sys.maxint, 1])) is long
+        assert sum([1.5, 2.5]) == 4.0
+        assert type(sum([1.5, 2.5])) is float
+        assert sum([1.5, 2.5], 1) == 5.0
+        assert sum([0.1] * 10, 0.5) == 0.5 + 0.1 + 0.1 + 0.1 + 0.1 + 0.1 + \
+                                           0.1 + 0.1 + 0.1 + 0.1 + 0.1
+        assert sum([1, 2], 0.5) == 3.5
+        assert sum([], 1.5) == 1.5
+        assert sum(set([1, 2, 3])) == 6
+        assert sum([1, 2], True) == 4
+        assert sum(sequence=[1, 2], start=3) == 6
+        raises(TypeError, sum, [1, 2], "")
+        raises(TypeError, sum, [1, 2], "a")
+        raises(TypeError, sum, [1.5], [])
+        #
+        class L(list):
+            def __iter__(self):
+                yield 42
+        assert sum(L([1, 2])) == 42
+
     def test_type_selftest(self):
         assert type(type) is type
 
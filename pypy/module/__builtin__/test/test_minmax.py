@@ -83,3 +83,21 @@ class AppTestMinList:
 
     def test_min_mixed(self):
         assert min(['1', 2, 3, 'aa']) == 2
+
+    def test_min_max_unboxed(self):
+        import sys
+        assert min([3, -sys.maxint - 1, 5]) == -sys.maxint - 1
+        assert max([3, sys.maxint, 5]) == sys.maxint
+        assert min(set([3, 1, 2])) == 1
+        assert max([1.5, -2.5, 0.5]) == 1.5
+        nan = float('nan')
+        assert max([nan, 1.0, 2.0]) is nan
+        assert max([1.0, nan, 2.0]) == 2.0
+        assert min([1.0, nan, 0.5]) == 0.5
+        assert str(max([0.0, -0.0])) == '0.0'
+        assert str(max([-0.0, 0.0])) == '-0.0'
+        assert min([3, 1, 2], key=lambda x: -x) == 3
+        class L(list):
+            def __iter__(self):
+                yield 42
+        assert max(L([1, 2])) == 42
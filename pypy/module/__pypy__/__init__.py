@@ -98,6 +98,7 @@ class Module(MixedModule):
         'dict_popitem_first'        : 'interp_dict.dict_popitem_first',
         'delitem_if_value_is'       : 'interp_dict.delitem_if_value_is',
         'move_to_end'               : 'interp_dict.move_to_end',
+        'dict_strategy_memory'      : 'interp_dict.dict_strategy_memory',
         'strategy'                  : 'interp_magic.strategy',  # dict,set,list
         'specialized_zip_2_lists'   : 'interp_magic.specialized_zip_2_lists',
         'set_debug'                 : 'interp_magic.set_debug',
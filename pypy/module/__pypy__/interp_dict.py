@@ -1,4 +1,7 @@
 
+from rpython.rlib import rgc
+from rpython.rlib.objectmodel import we_are_translated
+
 from pypy.interpreter.error import OperationError, oefmt
 from pypy.interpreter.gateway import unwrap_spec
 
@@ -76,3 +79,75 @@ def move_to_end(space, w_obj, w_key, last=True):
     if not isinstance(w_obj, W_DictMultiObject):
         raise OperationError(space.w_TypeError, space.w_None)
     return w_obj.nondescr_move_to_end(space, w_key, last)
+
+def _storage_gcref(w_dict):
+    dstorage = w_dict.dstorage
+    if not we_are_translated():
+        # before translation, the storage is a rerased.Erased instance
+        if dstorage._x is None:
+            return rgc.NULL_GCREF
+        return rgc.cast_instance_to_gcref(dstorage._x)
+    return dstorage
+
+def _storage_memory_usage(gcref):
+    # the size of 'gcref' and of all the objects reachable from it, stopping
+    # at app-level objects: the arrays, RPython dicts and strings that make
+    # up the storage of a dict.  Storages that are app-level objects
+    # themselves (e.g. of instance dicts) count as 0.
+    from pypy.module.gc.referents import try_cast_gcref_to_w_root
+    if not gcref or try_cast_gcref_to_w_root(gcref) is not None:
+        return 0
+    total = 0
+    rgc.toggle_gcflag_extra(gcref)
+    pending = [gcref]
+    i = 0
+    while i < len(pending):
+        gcref = pending[i]
+        i += 1
+        total += rgc.get_rpy_memory_usage(gcref)
+        for gcref1 in rgc.get_rpy_referents(gcref):
+            if not gcref1 or rgc.get_gcflag_extra(gcref1):
+                continue
+            if try_cast_gcref_to_w_root(gcref1) is not None:
+                continue
+            rgc.toggle_gcflag_extra(gcref1)
+            pending.append(gcref1)
+    for gcref in pending:
+        rgc.toggle_gcflag_extra(gcref)    # reset the gcflag_extra's
+    return total
+
+def dict_strategy_memory(space, w_objects=None):
+    """ dict_strategy_memory([objects]) -> {strategy name: (count, bytes)}
+
+    Return how many of the given objects are dicts of each dict strategy,
+    and the memory in bytes that these dicts use, not counting the keys and
+    values that are app-level objects.  Without argument, all the dicts in
+    the heap are counted (like gc.get_objects(), this is slow and not
+    supported by all GCs).
+    """
+    from pypy.objspace.std.dictmultiobject import W_DictMultiObject
+    from pypy.module.gc.referents import try_cast_gcref_to_w_root
+    if not rgc.has_gcflag_extra():
+        raise oefmt(space.w_NotImplementedError,
+                    "operation not implemented by this GC")
+    if space.is_none(w_objects):
+        objects_w = rgc.do_get_objects(try_cast_gcref_to_w_root)
+    else:
+        objects_w = space.listview(w_objects)
+    counts = {}
+    sizes = {}
+    for w_obj in objects_w:
+        if not isinstance(w_obj, W_DictMultiObject):
+            continue
+        name = w_obj.get_strategy().__class__.__name__
+        size = rgc.get_rpy_memory_usage(rgc.cast_instance_to_gcref(w_obj))
+        size += _storage_memory_usage(_storage_gcref(w_obj))
+        counts[name] = counts.get(name, 0) + 1
+        sizes[name] = sizes.get(name, 0) + size
+    rgc.assert_no_more_gcflags()
+    w_result = space.newdict()
+    for name, count in counts.items():
+        space.setitem(w_result, space.newtext(name),
+                      space.newtuple([space.newint(count),
+                                      space.newint(sizes[name])]))
+    return w_result
@@ -123,6 +123,26 @@ class AppTest(object):
         d = {1: None, 5: None}
         assert strategy(d) == "IntDictStrategy"
 
+    def test_dict_strategy_memory(self):
+        from __pypy__ import dict_strategy_memory, strategy
+        small = [{(i, 1): i, (i, 2): None} for i in range(3)]
+        big = {}
+        for i in range(20):
+            big[(i, 2)] = i
+        assert strategy(small[0]) == "SmallObjectDictStrategy"
+        assert strategy(big) == "ObjectDictStrategy"
+        report = dict_strategy_memory(small + [big, {}, "not a dict", 5])
+        assert sorted(report) == ["EmptyDictStrategy", "ObjectDictStrategy",
+                                  "SmallObjectDictStrategy"]
+        count, size = report["SmallObjectDictStrategy"]
+        assert count == 3
+        assert size > 0
+        count, size = report["ObjectDictStrategy"]
+        assert count == 1
+        assert size > 0
+        assert report["EmptyDictStrategy"][0] == 1
+        assert dict_strategy_memory([]) == {}
+
     def test_set_strategy(self):
         from __pypy__ import strategy
 
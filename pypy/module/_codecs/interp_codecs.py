@@ -441,10 +441,18 @@ if hasattr(runicode, 'str_decode_mbcs'):
 
 # utf-8 functions are not regular, because we have to pass
 # "allow_surrogates=True"
-@unwrap_spec(uni=unicode, errors='text_or_none')
-def utf_8_encode(space, uni, errors="strict"):
+@unwrap_spec(errors='text_or_none')
+def utf_8_encode(space, w_uni, errors="strict"):
+    from pypy.objspace.std.unicodeobject import W_UnicodeObject
     if errors is None:
         errors = 'strict'
+    if isinstance(w_uni, W_UnicodeObject):
+        storage = w_uni.get_utf8_storage()
+        if storage is not None:
+            # still stored as UTF-8, no need to encode
+            return space.newtuple([space.newbytes(storage.utf8),
+                                   space.newint(storage.length)])
+    uni = space.unicode_w(w_uni)
     state = space.fromcache(CodecState)
     # NB. can't call unicode_encode_utf_8() directly because that's
     # an @elidable function nowadays.  Instead, we need the _impl().
@@ -457,9 +465,15 @@ def utf_8_encode(space, uni, errors="strict"):
 @unwrap_spec(string='bufferstr', errors='text_or_none',
              w_final = WrappedDefault(False))
 def utf_8_decode(space, string, errors="strict", w_final=None):
+    from pypy.objspace.std.unicodeobject import W_UnicodeObject
     if errors is None:
         errors = 'strict'
     final = space.is_true(w_final)
+    # valid UTF-8 is decoded lazily, whatever 'final' and 'errors' are
+    length = unicodehelper.utf8_length(string)
+    if length >= 0:
+        return space.newtuple([W_UnicodeObject.from_utf8(string, length),
+                               space.newint(len(string))])
     state = space.fromcache(CodecState)
     # NB. can't call str_decode_utf_8() directly because that's
     # an @elidable function nowadays.  Instead, we need the _impl().
@@ -7,6 +7,8 @@ class Module(MixedModule):
 
     interpleveldefs = {
         'loads' : 'interp_decoder.loads',
+        'iterload' : 'interp_stream.iterload',
+        'encode' : 'interp_encoder.encode',
         'raw_encode_basestring_ascii':
             'interp_encoder.raw_encode_basestring_ascii',
         }
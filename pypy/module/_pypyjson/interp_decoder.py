@@ -1,7 +1,7 @@
 import sys
 from rpython.rlib.rstring import StringBuilder
 from rpython.rlib.objectmodel import specialize, always_inline, r_dict
-from rpython.rlib import rfloat, runicode
+from rpython.rlib import jit, rfloat, runicode
 from rpython.rtyper.lltypesystem import lltype, rffi
 from pypy.interpreter.error import oefmt
 from pypy.interpreter import unicodehelper
@@ -60,6 +60,155 @@ def slice_hash(a):
 
 TYPE_UNKNOWN = 0
 TYPE_STRING = 1
+
+# limits that keep the tree of maps from growing without bounds when the
+# decoded objects do not share their keys (e.g. if they are used as hash
+# tables); objects that would exceed them are decoded into regular dicts
+MAX_KEYS_PER_MAP = 64
+MAX_TRANSITIONS = 16
+MAX_TRANSITIONS_TERMINATOR = 256
+MAX_MAPS = 10000
+
+def _key_repr(key):
+    """ Returns the bytes that encode 'key' in a JSON document without escape
+    sequences, if that representation is unambiguous; otherwise None. Only
+    used for the fast path that checks whether the next key in the input is
+    the expected one. """
+    builder = StringBuilder(len(key))
+    for uchr in key:
+        code = ord(uchr)
+        if code < 0x20 or code >= 0x80 or uchr == u'"' or uchr == u'\\':
+            return None
+        builder.append(chr(code))
+    return builder.build()
+
+
+class JSONMap(object):
+    """ A map describes the sequence of keys of the JSON objects that were
+    decoded with it, like the maps of mapdict describe the attributes of an
+    instance. The maps form a tree that is shared between all calls to
+    loads(), rooted in the Terminator. """
+
+    _immutable_fields_ = ['prev', 'key', 'key_repr', 'length', 'terminator']
+
+    def __init__(self, prev, key):
+        self.prev = prev
+        self.key = key
+        self.key_repr = _key_repr(key)
+        self.length = prev.length + 1
+        self.terminator = prev.terminator
+        self._init_transitions()
+
+    def _init_transitions(self):
+        # the first transition that was ever added, which is the one that the
+        # decoder tries first
+        self.single_nextmap = None
+        # all transitions, created when a second one is added
+        self.all_next = None
+        self.keys_in_order = None
+        self.key_to_index = None
+        self.strategy_instance = None
+
+    def number_of_transitions(self):
+        if self.all_next is not None:
+            return len(self.all_next)
+        if self.single_nextmap is not None:
+            return 1
+        return 0
+
+    def get_next(self, key):
+        """ Returns the map that results from adding 'key', or None if the
+        tree of maps refuses to grow any further. """
+        nextmap = self.single_nextmap
+        if nextmap is not None and nextmap.key == key:
+            return nextmap
+        if self.all_next is not None:
+            nextmap = self.all_next.get(key, None)
+            if nextmap is not None:
+                return nextmap
+        terminator = self.terminator
+        if self.length == 0:
+            max_transitions = MAX_TRANSITIONS_TERMINATOR
+        else:
+            max_transitions = MAX_TRANSITIONS
+        if (self.length >= MAX_KEYS_PER_MAP or
+                self.number_of_transitions() >= max_transitions or
+                terminator.number_of_maps >= MAX_MAPS or
+                self._contains_key(key)):  # duplicate key
+            return None
+        nextmap = JSONMap(self, key)
+        terminator.number_of_maps += 1
+        if self.single_nextmap is None:
+            self.single_nextmap = nextmap
+        else:
+            if self.all_next is None:
+                self.all_next = {self.single_nextmap.key: self.single_nextmap}
+            self.all_next[key] = nextmap
+        return nextmap
+
+    def _contains_key(self, key):
+        curr = self
+        while curr.length > 0:
+            if curr.key == key:
+                return True
+            curr = curr.prev
+        return False
+
+    def get_keys_in_order(self):
+        keys = self.keys_in_order
+        if keys is None:
+            keys = [u''] * self.length
+            curr = self
+            while curr.length > 0:
+                keys[curr.length - 1] = curr.key
+                curr = curr.prev
+            self.keys_in_order = keys
+        return keys
+
+    @jit.elidable
+    def get_index(self, key):
+        if self.length == 0:
+            return -1
+        key_to_index = self.key_to_index
+        if key_to_index is None:
+            key_to_index = {}
+            keys = self.get_keys_in_order()
+            for i in range(len(keys)):
+                key_to_index[keys[i]] = i
+            self.key_to_index = key_to_index
+        return key_to_index.get(key, -1)
+
+    def get_strategy_instance(self, space):
+        from pypy.objspace.std.jsondict import JsonDictStrategy
+        strategy = self.strategy_instance
+        if strategy is None:
+            strategy = JsonDictStrategy(space, self)
+            self.strategy_instance = strategy
+        return strategy
+
+    def make_unicode_dict(self, space, values_w):
+        from pypy.objspace.std.jsondict import _force_value
+        keys = self.get_keys_in_order()
+        d = {}
+        for i in range(len(values_w)):
+            d[keys[i]] = _force_value(space, values_w[i])
+        return d
+
+
+class Terminator(JSONMap):
+    """ The root of the tree of maps, describing the empty object. One
+    instance per space, created with space.fromcache(). """
+
+    def __init__(self, space):
+        self.prev = None
+        self.key = u''
+        self.key_repr = None
+        self.length = 0
+        self.terminator = self
+        self.number_of_maps = 0
+        self._init_transitions()
+
+
 class JSONDecoder(object):
     def __init__(self, space, s):
         self.space = space
@@ -237,23 +386,24 @@ class JSONDecoder(object):
         return i, ovf_maybe, sign * intval
 
     def decode_array(self, i):
-        w_list = self.space.newlist([])
         start = i
         i = self.skip_whitespace(start)
         if self.ll_chars[i] == ']':
             self.pos = i+1
-            return w_list
+            return self.space.newlist([])
         #
+        # collect the items first, so that newlist() picks the best strategy
+        items_w = []
         while True:
             w_item = self.decode_any(i)
             i = self.pos
-            self.space.call_method(w_list, 'append', w_item)
+            items_w.append(w_item)
             i = self.skip_whitespace(i)
             ch = self.ll_chars[i]
             i += 1
             if ch == ']':
                 self.pos = i
-                return w_list
+                return self.space.newlist(items_w)
             elif ch == ',':
                 pass
             elif ch == '\0':
@@ -270,10 +420,50 @@ class JSONDecoder(object):
             self.pos = i+1
             return self.space.newdict()
 
-        d = {}
+        currmap = self.space.fromcache(Terminator)
+        values_w = []
         while True:
             # parse a key: value
-            name = self.decode_key(i)
+            nextmap = self.decode_key_fast(i, currmap)
+            if nextmap is None:
+                key = self.decode_key(i)
+                nextmap = currmap.get_next(key)
+                if nextmap is None:
+                    # the maps refuse to describe this object, continue
+                    # with a regular dict
+                    d = currmap.make_unicode_dict(self.space, values_w)
+                    return self.decode_object_dict(start, d, key)
+            currmap = nextmap
+            i = self.skip_whitespace(self.pos)
+            ch = self.ll_chars[i]
+            if ch != ':':
+                self._raise("No ':' found at char %d", i)
+            i += 1
+            i = self.skip_whitespace(i)
+            #
+            if self.ll_chars[i] == '"':
+                w_value = self.decode_string_lazy(i+1)
+            else:
+                w_value = self.decode_any(i)
+            values_w.append(w_value)
+            i = self.skip_whitespace(self.pos)
+            ch = self.ll_chars[i]
+            i += 1
+            if ch == '}':
+                self.pos = i
+                return self._create_dict_from_map(currmap, values_w)
+            elif ch == ',':
+                pass
+            elif ch == '\0':
+                self._raise("Unterminated object starting at char %d", start)
+            else:
+                self._raise("Unexpected '%s' when decoding object (char %d)",
+                            ch, i-1)
+
+    def decode_object_dict(self, start, d, name):
+        """ Continue decoding an object into the dict 'd'. self.pos is just
+        after the already decoded key 'name'. """
+        while True:
             i = self.skip_whitespace(self.pos)
             ch = self.ll_chars[i]
             if ch != ':':
@@ -296,6 +486,12 @@ class JSONDecoder(object):
             else:
                 self._raise("Unexpected '%s' when decoding object (char %d)",
                             ch, i-1)
+            # parse the next key
+            name = self.decode_key(i)
+
+    def _create_dict_from_map(self, jsonmap, values_w):
+        from pypy.objspace.std.jsondict import from_values_and_jsonmap
+        return from_values_and_jsonmap(self.space, values_w, jsonmap)
 
     def _create_dict(self, d):
         from pypy.objspace.std.dictmultiobject import from_unicode_key_dict
@@ -318,6 +514,28 @@ class JSONDecoder(object):
                 self.pos = i-1
                 return self.decode_string_escaped(start)
 
+    def decode_string_lazy(self, i):
+        """ Like decode_string, but ascii-only strings without escapes are
+        not turned into unicode objects yet: they are only materialized when
+        the value is read from the dict that stores them. """
+        from pypy.objspace.std.jsondict import W_LazyJSONString
+        start = i
+        bits = 0
+        while True:
+            ch = self.ll_chars[i]
+            i += 1
+            bits |= ord(ch)
+            if ch == '"':
+                self.pos = i
+                if bits & 0x80:
+                    # non-ascii: decode eagerly, to report invalid utf-8
+                    return self.space.newunicode(
+                            self._create_string(start, i - 1, bits))
+                return W_LazyJSONString(self.getslice(start, i - 1))
+            elif ch == '\\' or ch < '\x20':
+                self.pos = i-1
+                return self.decode_string_escaped(start)
+
     def _create_string(self, start, end, bits):
         if bits & 0x80:
             # the 8th bit is set, it's an utf8 string
@@ -403,6 +621,31 @@ class JSONDecoder(object):
         lowsurr = int(hexdigits, 16) # the possible ValueError is caugth by the caller
         return 0x10000 + (((highsurr - 0xd800) << 10) | (lowsurr - 0xdc00))
 
+    def decode_key_fast(self, i, currmap):
+        """ Check whether the key starting at i is the one that most commonly
+        follows currmap, without decoding it. Returns the next map and sets
+        self.pos, or returns None if the fast path does not apply. """
+        nextmap = currmap.single_nextmap
+        if nextmap is None:
+            return None
+        key_repr = nextmap.key_repr
+        if key_repr is None:
+            return None
+        ll_chars = self.ll_chars
+        i = self.skip_whitespace(i)
+        if ll_chars[i] != '"':
+            return None
+        i += 1
+        # no bounds checks needed: the '\0' at the end never matches
+        for j in range(len(key_repr)):
+            if ll_chars[i + j] != key_repr[j]:
+                return None
+        i += len(key_repr)
+        if ll_chars[i] != '"':
+            return None
+        self.pos = i + 1
+        return nextmap
+
     def decode_key(self, i):
         """ returns an unwrapped unicode """
         from rpython.rlib.rarithmetic import intmask
@@ -450,6 +693,10 @@ def loads(space, w_s):
         raise oefmt(space.w_TypeError,
                     "Expected utf8-encoded str, got unicode")
     s = space.bytes_w(w_s)
+    return decode_bytes(space, s)
+
+def decode_bytes(space, s):
+    """ Decode the complete JSON document 's', which must be a str. """
     decoder = JSONDecoder(space, s)
     try:
         w_res = decoder.decode_any(0)
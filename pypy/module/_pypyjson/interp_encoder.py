@@ -1,6 +1,13 @@
+import math
+
+from rpython.rlib import rstackovf
+from rpython.rlib.objectmodel import specialize
+from rpython.rlib.rfloat import isfinite, INFINITY
 from rpython.rlib.rstring import StringBuilder
 from rpython.rlib.runicode import str_decode_utf_8
 from pypy.interpreter import unicodehelper
+from pypy.interpreter.error import OperationError, oefmt
+from pypy.interpreter.gateway import unwrap_spec
 
 
 HEX = '0123456789abcdef'
@@ -16,38 +23,28 @@ ESCAPE_BEFORE_SPACE = [ESCAPE_DICT.get(chr(_i), '\\u%04x' % _i)
                        for _i in range(32)]
 
 
-def raw_encode_basestring_ascii(space, w_string):
-    if space.isinstance_w(w_string, space.w_bytes):
-        s = space.bytes_w(w_string)
-        for i in range(len(s)):
-            c = s[i]
-            if c >= ' ' and c <= '~' and c != '"' and c != '\\':
-                pass
-            else:
-                first = i
-                break
+def _first_special_char(s):
+    """ Returns the index of the first char of 's' that cannot be copied
+    unchanged into an ascii-only JSON string, or -1. """
+    for i in range(len(s)):
+        c = s[i]
+        if c >= ' ' and c <= '~' and c != '"' and c != '\\':
+            pass
         else:
-            # the input is a string with only non-special ascii chars
-            return w_string
+            return i
+    return -1
 
-        eh = unicodehelper.decode_error_handler(space)
-        u = str_decode_utf_8(
-                s, len(s), None, final=True, errorhandler=eh,
-                allow_surrogates=True)[0]
-        sb = StringBuilder(len(u))
-        sb.append_slice(s, 0, first)
-    else:
-        # We used to check if 'u' contains only safe characters, and return
-        # 'w_string' directly.  But this requires an extra pass over all
-        # characters, and the expected use case of this function, from
-        # json.encoder, will anyway re-encode a unicode result back to
-        # a string (with the ascii encoding).  This requires two passes
-        # over the characters.  So we may as well directly turn it into a
-        # string here --- only one pass.
-        u = space.unicode_w(w_string)
-        sb = StringBuilder(len(u))
-        first = 0
+def _write_bytes_ascii(space, sb, s, first):
+    """ Escape the utf-8 encoded string 's' into 'sb'. The first 'first'
+    chars are known to need no escaping. """
+    eh = unicodehelper.decode_error_handler(space)
+    u = str_decode_utf_8(
+            s, len(s), None, final=True, errorhandler=eh,
+            allow_surrogates=True)[0]
+    sb.append_slice(s, 0, first)
+    _write_unicode_ascii(sb, u, first)
 
+def _write_unicode_ascii(sb, u, first):
     for i in range(first, len(u)):
         c = ord(u[i])
         if c <= ord('~'):
@@ -78,5 +75,305 @@ def raw_encode_basestring_ascii(space, w_string):
                 sb.append(HEX[(s2 >> 4) & 0x0f])
                 sb.append(HEX[s2 & 0x0f])
 
+
+def raw_encode_basestring_ascii(space, w_string):
+    if space.isinstance_w(w_string, space.w_bytes):
+        s = space.bytes_w(w_string)
+        first = _first_special_char(s)
+        if first < 0:
+            # the input is a string with only non-special ascii chars
+            return w_string
+        sb = StringBuilder(len(s))
+        _write_bytes_ascii(space, sb, s, first)
+    else:
+        # We used to check if 'u' contains only safe characters, and return
+        # 'w_string' directly.  But this requires an extra pass over all
+        # characters, and the expected use case of this function, from
+        # json.encoder, will anyway re-encode a unicode result back to
+        # a string (with the ascii encoding).  This requires two passes
+        # over the characters.  So we may as well directly turn it into a
+        # string here --- only one pass.
+        u = space.unicode_w(w_string)
+        sb = StringBuilder(len(u))
+        _write_unicode_ascii(sb, u, 0)
+
     res = sb.build()
     return space.newtext(res)
+
+
+class JSONEncoder(object):
+    """ Serializes trees of dicts, lists, tuples, strings, numbers, booleans
+    and None into a single StringBuilder, producing the same output as
+    json.JSONEncoder with ensure_ascii=True, indent=None and
+    sort_keys=False.  Lists and dicts are read through their strategies, so
+    that e.g. lists of ints are written without boxing the items.  Other
+    objects are passed to the 'default' callback.  Instances of subclasses
+    are read with app-level operations, like json.JSONEncoder does. """
+
+    def __init__(self, space, item_separator, key_separator, allow_nan,
+                 check_circular, skipkeys, w_default):
+        self.space = space
+        self.item_separator = item_separator
+        self.key_separator = key_separator
+        self.allow_nan = allow_nan
+        self.skipkeys = skipkeys
+        self.w_default = w_default
+        if check_circular:
+            self.markers = {}
+        else:
+            self.markers = None
+        self.builder = StringBuilder()
+
+    def mark(self, w_obj):
+        if self.markers is not None:
+            if w_obj in self.markers:
+                raise oefmt(self.space.w_ValueError,
+                            "Circular reference detected")
+            self.markers[w_obj] = None
+
+    def unmark(self, w_obj):
+        if self.markers is not None:
+            del self.markers[w_obj]
+
+    def write_string(self, w_string):
+        space = self.space
+        sb = self.builder
+        sb.append('"')
+        if space.isinstance_w(w_string, space.w_bytes):
+            s = space.bytes_w(w_string)
+            first = _first_special_char(s)
+            if first < 0:
+                sb.append(s)
+            else:
+                _write_bytes_ascii(space, sb, s, first)
+        else:
+            _write_unicode_ascii(sb, space.unicode_w(w_string), 0)
+        sb.append('"')
+
+    def floatstr(self, x):
+        from pypy.objspace.std.floatobject import float2string
+        if isfinite(x):
+            return float2string(x, 'r', 0)
+        if not self.allow_nan:
+            space = self.space
+            raise oefmt(space.w_ValueError,
+                        "Out of range float values are not JSON compliant: "
+                        "%R", space.newfloat(x))
+        if math.isinf(x):
+            if x > 0.0:
+                return 'Infinity'
+            return '-Infinity'
+        return 'NaN'
+
+    def floatstr_subclass(self, w_obj):
+        # like JSONEncoder.__floatstr() in lib-python, which compares the
+        # object and then calls float.__repr__() on it
+        space = self.space
+        if space.is_true(space.ne(w_obj, w_obj)):
+            text = 'NaN'
+        elif space.eq_w(w_obj, space.newfloat(INFINITY)):
+            text = 'Infinity'
+        elif space.eq_w(w_obj, space.newfloat(-INFINITY)):
+            text = '-Infinity'
+        else:
+            w_repr = space.getattr(space.w_float, space.newtext('__repr__'))
+            return space.text_w(space.call_function(w_repr, w_obj))
+        if not self.allow_nan:
+            raise oefmt(space.w_ValueError,
+                        "Out of range float values are not JSON compliant: "
+                        "%R", w_obj)
+        return text
+
+    def encode(self, w_obj):
+        space = self.space
+        sb = self.builder
+        if space.isinstance_w(w_obj, space.w_basestring):
+            self.write_string(w_obj)
+        elif space.is_w(w_obj, space.w_None):
+            sb.append('null')
+        elif space.is_w(w_obj, space.w_True):
+            sb.append('true')
+        elif space.is_w(w_obj, space.w_False):
+            sb.append('false')
+        elif space.is_w(space.type(w_obj), space.w_int):
+            sb.append(str(space.int_w(w_obj)))
+        elif (space.isinstance_w(w_obj, space.w_int) or
+                  space.isinstance_w(w_obj, space.w_long)):
+            sb.append(space.text_w(space.str(w_obj)))
+        elif space.is_w(space.type(w_obj), space.w_float):
+            sb.append(self.floatstr(space.float_w(w_obj)))
+        elif space.isinstance_w(w_obj, space.w_float):
+            sb.append(self.floatstr_subclass(w_obj))
+        elif space.isinstance_w(w_obj, space.w_list):
+            self.encode_list(w_obj)
+        elif space.is_w(space.type(w_obj), space.w_tuple):
+            self.encode_items(w_obj, space.fixedview(w_obj))
+        elif space.isinstance_w(w_obj, space.w_tuple):
+            # a subclass, which might override __iter__
+            self.encode_items(w_obj, space.unpackiterable(w_obj))
+        elif space.isinstance_w(w_obj, space.w_dict):
+            self.encode_dict(w_obj)
+        else:
+            self.mark(w_obj)
+            w_res = space.call_function(self.w_default, w_obj)
+            self.encode(w_res)
+            self.unmark(w_obj)
+
+    def encode_list(self, w_list):
+        space = self.space
+        sb = self.builder
+        if space.is_w(space.type(w_list), space.w_list):
+            intlist = space.listview_int(w_list)
+            if intlist is not None:
+                sb.append('[')
+                for i in range(len(intlist)):
+                    if i > 0:
+                        sb.append(self.item_separator)
+                    sb.append(str(intlist[i]))
+                sb.append(']')
+                return
+            floatlist = space.listview_float(w_list)
+            if floatlist is not None:
+                sb.append('[')
+                for i in range(len(floatlist)):
+                    if i > 0:
+                        sb.append(self.item_separator)
+                    sb.append(self.floatstr(floatlist[i]))
+                sb.append(']')
+                return
+            byteslist = space.listview_bytes(w_list)
+            if byteslist is not None and self._all_plain_ascii(byteslist):
+                sb.append('[')
+                for i in range(len(byteslist)):
+                    if i > 0:
+                        sb.append(self.item_separator)
+                    sb.append('"')
+                    sb.append(byteslist[i])
+                    sb.append('"')
+                sb.append(']')
+                return
+            # a copy: encoding the items may call app-level code, like
+            # default(), which can change the list
+            items_w = space.fixedview(w_list)
+        else:
+            # a subclass, which might override __iter__
+            items_w = space.unpackiterable(w_list)
+        self.encode_items(w_list, items_w)
+
+    def _all_plain_ascii(self, byteslist):
+        for s in byteslist:
+            if _first_special_char(s) >= 0:
+                return False
+        return True
+
+    @specialize.call_location()     # fixed-size and resizable lists
+    def encode_items(self, w_seq, items_w):
+        sb = self.builder
+        if not items_w:
+            sb.append('[]')
+            return
+        self.mark(w_seq)
+        sb.append('[')
+        for i in range(len(items_w)):
+            if i > 0:
+                sb.append(self.item_separator)
+            self.encode(items_w[i])
+        sb.append(']')
+        self.unmark(w_seq)
+
+    def encode_dict(self, w_dict):
+        from pypy.objspace.std.dictmultiobject import W_DictMultiObject
+        space = self.space
+        sb = self.builder
+        if (space.is_w(space.type(w_dict), space.w_dict) and
+                isinstance(w_dict, W_DictMultiObject)):
+            if w_dict.length() == 0:
+                sb.append('{}')
+                return
+            self.mark(w_dict)
+            sb.append('{')
+            first = True
+            iteratorimplementation = w_dict.iteritems()
+            while True:
+                w_key, w_value = iteratorimplementation.next_item()
+                if w_key is None:
+                    break
+                first = self.encode_item(first, w_key, w_value)
+        else:
+            # a subclass, which might override iteritems()
+            if space.len_w(w_dict) == 0:
+                sb.append('{}')
+                return
+            self.mark(w_dict)
+            sb.append('{')
+            first = True
+            w_iter = space.call_method(w_dict, 'iteritems')
+            while True:
+                try:
+                    w_item = space.next(w_iter)
+                except OperationError as e:
+                    if not e.match(space, space.w_StopIteration):
+                        raise
+                    break
+                w_key, w_value = space.fixedview(w_item, 2)
+                first = self.encode_item(first, w_key, w_value)
+        sb.append('}')
+        self.unmark(w_dict)
+
+    def encode_item(self, first, w_key, w_value):
+        space = self.space
+        sb = self.builder
+        if space.isinstance_w(w_key, space.w_basestring):
+            key = None
+        # JavaScript is weakly typed for these, so it makes sense to
+        # also allow them.  Many encoders seem to do something like this.
+        elif space.is_w(space.type(w_key), space.w_float):
+            key = self.floatstr(space.float_w(w_key))
+        elif space.isinstance_w(w_key, space.w_float):
+            key = self.floatstr_subclass(w_key)
+        elif space.is_w(w_key, space.w_True):
+            key = 'true'
+        elif space.is_w(w_key, space.w_False):
+            key = 'false'
+        elif space.is_w(w_key, space.w_None):
+            key = 'null'
+        elif (space.isinstance_w(w_key, space.w_int) or
+                  space.isinstance_w(w_key, space.w_long)):
+            key = space.text_w(space.str(w_key))
+        elif self.skipkeys:
+            return first
+        else:
+            raise oefmt(space.w_TypeError, "key %R is not a string", w_key)
+        if not first:
+            sb.append(self.item_separator)
+        if key is None:
+            self.write_string(w_key)
+        else:
+            sb.append('"')
+            sb.append(key)
+            sb.append('"')
+        sb.append(self.key_separator)
+        self.encode(w_value)
+        return False
+
+
+@unwrap_spec(item_separator='text', key_separator='text', allow_nan=bool,
+             check_circular=bool, skipkeys=bool)
+def encode(space, w_obj, item_separator, key_separator, allow_nan,
+           check_circular, skipkeys, w_default):
+    """ encode(obj, item_separator, key_separator, allow_nan, check_circular,
+    skipkeys, default)
+
+    Return the ascii-only JSON representation of obj as a str, like
+    json.JSONEncoder(ensure_ascii=True, indent=None, sort_keys=False) does.
+    """
+    encoder = JSONEncoder(space, item_separator, key_separator, allow_nan,
+                          check_circular, skipkeys, w_default)
+    try:
+        encoder.encode(w_obj)
+    except rstackovf.StackOverflow:
+        rstackovf.check_stack_overflow()
+        raise oefmt(space.w_RuntimeError,
+                    "maximum recursion depth exceeded while encoding a "
+                    "JSON object")
+    return space.newtext(encoder.builder.build())
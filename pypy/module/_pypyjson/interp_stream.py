@@ -0,0 +1,252 @@
+from pypy.interpreter.baseobjspace import W_Root
+from pypy.interpreter.error import OperationError, oefmt
+from pypy.interpreter.gateway import unwrap_spec
+from pypy.interpreter.typedef import TypeDef, interp2app
+from pypy.module._pypyjson.interp_decoder import decode_bytes, is_whitespace
+
+# states of W_JSONStreamDecoder
+(BEFORE_ARRAY, FIRST_ITEM, NEXT_ITEM, AFTER_ITEM, AFTER_ARRAY,
+ BETWEEN_VALUES, IN_VALUE, DONE) = range(8)
+
+
+class W_JSONStreamDecoder(W_Root):
+    """ Decodes a sequence of JSON values from a stream, one at a time.
+
+    The input is read in chunks, either by calling the read() method of the
+    stream (files, _io readers, mmap objects) or by slicing an object that
+    supports the buffer interface. Only the text of the value that is
+    currently being decoded is kept around: the decoder scans the input for
+    the end of the next complete value, and then turns that slice into
+    objects with the regular JSONDecoder.
+
+    If 'items' is False, the input is a sequence of top-level values
+    separated by whitespace (e.g. JSON lines). If 'items' is True, the input
+    is a single array whose items are returned one by one.
+    """
+
+    def __init__(self, space, w_stream, items, chunksize):
+        self.space = space
+        self.w_stream = w_stream
+        self.buf = None
+        self.bufpos = 0
+        if space.findattr(w_stream, space.newtext('read')) is None:
+            self.buf = space.readbuf_w(w_stream)
+        self.chunksize = chunksize
+        self.eof = False
+        self.data = ''
+        self.pos = 0
+        if items:
+            self.state = BEFORE_ARRAY
+        else:
+            self.state = BETWEEN_VALUES
+        self.next_state = BETWEEN_VALUES
+        self._reset_scanner()
+
+    def _reset_scanner(self):
+        self.value_start = self.pos
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def _read_chunk(self, size):
+        space = self.space
+        if self.buf is not None:
+            length = self.buf.getlength()
+            start = self.bufpos
+            stop = min(start + size, length)
+            if start >= stop:
+                return ''
+            self.bufpos = stop
+            return self.buf.getslice(start, stop, 1, stop - start)
+        w_chunk = space.call_method(self.w_stream, 'read', space.newint(size))
+        if space.isinstance_w(w_chunk, space.w_unicode):
+            raise oefmt(space.w_TypeError,
+                        "Expected the stream to return utf8-encoded str, "
+                        "got unicode")
+        return space.bytes_w(w_chunk)
+
+    def _fill(self):
+        """ Read more data, dropping the text before the current value.
+        Returns False at the end of the input. """
+        if self.eof:
+            return False
+        if self.state == IN_VALUE:
+            keep = self.value_start
+        else:
+            keep = self.pos
+        pending = len(self.data) - keep
+        # read at least as much as is pending, to make the total cost of
+        # copying linear in the size of a single value
+        chunk = self._read_chunk(max(self.chunksize, pending))
+        if not chunk:
+            self.eof = True
+            return False
+        assert keep >= 0
+        self.data = self.data[keep:] + chunk
+        self.pos -= keep
+        self.value_start -= keep
+        return True
+
+    def _skip_whitespace(self):
+        """ Advance self.pos to the next non-whitespace char. Returns False
+        if there is none before the end of the input. """
+        while True:
+            data = self.data
+            i = self.pos
+            while i < len(data) and is_whitespace(data[i]):
+                i += 1
+            self.pos = i
+            if i < len(data):
+                return True
+            if not self._fill():
+                return False
+
+    def _scan_value(self):
+        """ Advance self.pos to the end of the value starting at
+        self.value_start. Returns False if more input is needed. """
+        data = self.data
+        start = self.value_start
+        i = self.pos
+        while i < len(data):
+            ch = data[i]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.depth == 0:
+                        self.pos = i + 1
+                        return True
+            elif ch == '{' or ch == '[' or ch == '"':
+                if self.depth == 0 and i > start:
+                    # end of a number or constant
+                    self.pos = i
+                    return True
+                if ch == '"':
+                    self.in_string = True
+                else:
+                    self.depth += 1
+            elif ch == '}' or ch == ']' or ch == ',':
+                if self.depth == 0:
+                    if i == start:
+                        # not the start of a valid value, let the decoder
+                        # report the error
+                        i += 1
+                    self.pos = i
+                    return True
+                if ch != ',':
+                    self.depth -= 1
+                    if self.depth == 0:
+                        self.pos = i + 1
+                        return True
+            elif self.depth == 0 and is_whitespace(ch):
+                self.pos = i
+                return True
+            i += 1
+        self.pos = i
+        return False
+
+    def _decode_value(self):
+        while not self._scan_value():
+            if not self._fill():
+                # end of the input: either a number or constant ends here,
+                # or the value is truncated and decoding it gives the
+                # correct error
+                break
+        start = self.value_start
+        stop = self.pos
+        assert start >= 0
+        assert stop >= start
+        return decode_bytes(self.space, self.data[start:stop])
+
+    def _start_value(self, next_state):
+        self.state = IN_VALUE
+        self.next_state = next_state
+        self._reset_scanner()
+
+    def descr_iter(self, space):
+        return self
+
+    def descr_next(self, space):
+        while True:
+            state = self.state
+            if state == IN_VALUE:
+                w_res = self._decode_value()
+                self.state = self.next_state
+                return w_res
+            elif state == BETWEEN_VALUES:
+                if self._skip_whitespace():
+                    self._start_value(BETWEEN_VALUES)
+                else:
+                    self.state = DONE
+            elif state == BEFORE_ARRAY:
+                if not self._skip_whitespace():
+                    raise oefmt(space.w_ValueError,
+                                "No JSON object could be decoded")
+                ch = self.data[self.pos]
+                if ch != '[':
+                    raise oefmt(space.w_ValueError,
+                                "Expected '[' at the start of the stream, "
+                                "got '%s'", ch)
+                self.pos += 1
+                self.state = FIRST_ITEM
+            elif state == FIRST_ITEM:
+                if (self._skip_whitespace() and
+                        self.data[self.pos] == ']'):
+                    self.pos += 1
+                    self.state = AFTER_ARRAY
+                else:
+                    self._start_value(AFTER_ITEM)
+            elif state == NEXT_ITEM:
+                self._skip_whitespace()
+                self._start_value(AFTER_ITEM)
+            elif state == AFTER_ITEM:
+                if not self._skip_whitespace():
+                    raise oefmt(space.w_ValueError,
+                                "Unterminated array in JSON stream")
+                ch = self.data[self.pos]
+                self.pos += 1
+                if ch == ',':
+                    self.state = NEXT_ITEM
+                elif ch == ']':
+                    self.state = AFTER_ARRAY
+                else:
+                    raise oefmt(space.w_ValueError,
+                                "Unexpected '%s' when decoding array stream",
+                                ch)
+            elif state == AFTER_ARRAY:
+                if self._skip_whitespace():
+                    raise oefmt(space.w_ValueError,
+                                "Extra data after the end of the array")
+                self.state = DONE
+            else:
+                assert state == DONE
+                # drop the references to the input
+                self.data = ''
+                self.buf = None
+                raise OperationError(space.w_StopIteration, space.w_None)
+
+
+@unwrap_spec(items=bool, chunksize=int)
+def iterload(space, w_stream, items=False, chunksize=65536):
+    """ iterload(stream, items=False, chunksize=65536)
+
+    Return an iterator over the JSON values in 'stream', which is either an
+    object with a read() method (a binary file, _io reader or mmap), or an
+    object supporting the buffer interface. If 'items' is true, the stream
+    must contain a single JSON array, and its items are returned instead.
+    The memory used only depends on the size of the largest single value.
+    """
+    if chunksize <= 0:
+        raise oefmt(space.w_ValueError, "chunksize must be positive")
+    return W_JSONStreamDecoder(space, w_stream, items, chunksize)
+
+
+W_JSONStreamDecoder.typedef = TypeDef(
+    '_pypyjson.iterload',
+    __iter__ = interp2app(W_JSONStreamDecoder.descr_iter),
+    next = interp2app(W_JSONStreamDecoder.descr_next),
+)
+W_JSONStreamDecoder.typedef.acceptable_as_base_class = False
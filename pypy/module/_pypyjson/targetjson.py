@@ -5,7 +5,7 @@ sys.path.insert(0, str(ROOT))
 
 import time
 from pypy.interpreter.error import OperationError
-from pypy.module._pypyjson.interp_decoder import loads, JSONDecoder
+from pypy.module._pypyjson.interp_decoder import loads, JSONDecoder, Terminator
 from rpython.rlib.objectmodel import specialize, dont_inline
 
 def _create_dict(self, d):
@@ -13,7 +13,12 @@ def _create_dict(self, d):
     w_res.dictval = d
     return w_res
 
+def _create_dict_from_map(self, jsonmap, values_w):
+    return self._create_dict(jsonmap.make_unicode_dict(self.space, values_w))
+
 JSONDecoder._create_dict = _create_dict
+JSONDecoder._create_dict_from_map = _create_dict_from_map
+JSONDecoder.decode_string_lazy = JSONDecoder.decode_string
 
 ## MSG = open('msg.json').read()
 
@@ -59,6 +64,12 @@ class FakeSpace(object):
     w_int = W_Int
     w_float = W_Float
 
+    terminator = Terminator(None)
+
+    def fromcache(self, cls):
+        assert cls is Terminator
+        return self.terminator
+
     def newtuple(self, items):
         return None
 
@@ -1,5 +1,6 @@
 # -*- encoding: utf-8 -*-
-from pypy.module._pypyjson.interp_decoder import JSONDecoder
+from pypy.module._pypyjson.interp_decoder import JSONDecoder, Terminator
+from pypy.module._pypyjson import interp_decoder
 
 def test_skip_whitespace():
     s = '   hello   '
@@ -23,8 +24,49 @@ def test_decode_key():
     assert y is x
     dec.close()
 
+def test_json_map():
+    m = Terminator(None)
+    w_a = m.get_next(u"a")
+    w_b = w_a.get_next(u"b")
+    assert w_b.get_keys_in_order() == [u"a", u"b"]
+    assert w_b.get_index(u"a") == 0
+    assert w_b.get_index(u"b") == 1
+    assert w_b.get_index(u"c") == -1
+    assert w_a.get_next(u"b") is w_b
+    assert m.get_next(u"a") is w_a
+    assert m.single_nextmap is w_a
+    w_c = m.get_next(u"c")
+    assert m.single_nextmap is w_a
+    assert m.all_next == {u"a": w_a, u"c": w_c}
+    assert m.number_of_maps == 3
+
+def test_json_map_duplicate_key():
+    m = Terminator(None)
+    w_a = m.get_next(u"a")
+    assert w_a.get_next(u"a") is None
+
+def test_json_map_limits(monkeypatch):
+    monkeypatch.setattr(interp_decoder, "MAX_TRANSITIONS", 2)
+    monkeypatch.setattr(interp_decoder, "MAX_KEYS_PER_MAP", 3)
+    m = Terminator(None).get_next(u"x")
+    assert m.get_next(u"a") is not None
+    assert m.get_next(u"b") is not None
+    assert m.get_next(u"c") is None
+    w_a = m.get_next(u"a")
+    assert w_a is not None
+    assert w_a.get_next(u"b").get_next(u"c") is None
+
+def test_key_repr():
+    m = Terminator(None)
+    assert m.get_next(u"abc").key_repr == "abc"
+    assert m.get_next(u"a\"b").key_repr is None
+    assert m.get_next(u"a\\b").key_repr is None
+    assert m.get_next(u"\xe0").key_repr is None
+    assert m.get_next(u"\n").key_repr is None
+
+
 class AppTest(object):
-    spaceconfig = {"objspace.usemodules._pypyjson": True}
+    spaceconfig = {"usemodules": ['_pypyjson', 'struct']}
 
     def test_raise_on_unicode(self):
         import _pypyjson
@@ -232,6 +274,148 @@ class AppTest(object):
         assert check("\\\"\b\f\n\r\t") == '\\\\\\"\\b\\f\\n\\r\\t'
         assert check("\x07") == "\\u0007"
 
+    def test_encode(self):
+        import _pypyjson
+        def default(o):
+            raise TypeError(repr(o) + " is not JSON serializable")
+        def check(obj, expected, item_sep=', ', key_sep=': ', allow_nan=True,
+                  skipkeys=False):
+            res = _pypyjson.encode(obj, item_sep, key_sep, allow_nan, True,
+                                   skipkeys, default)
+            assert type(res) is str
+            assert res == expected
+        check(None, 'null')
+        check(True, 'true')
+        check(False, 'false')
+        check(42, '42')
+        check(-2 ** 70, '-1180591620717411303424')
+        check(1.5, '1.5')
+        check(1e100, '1e+100')
+        check(float('inf'), 'Infinity')
+        check(float('-inf'), '-Infinity')
+        check(float('nan'), 'NaN')
+        check("abc", '"abc"')
+        check("a\"\n\xc3\xa0", '"a\\"\\n\\u00e0"')
+        check(u"\u1234\U00012345", '"\\u1234\\ud808\\udf45"')
+        check([], '[]')
+        check([1, 2, 3], '[1, 2, 3]')
+        check([1.5, 2.0], '[1.5, 2.0]')
+        check(["a", "b"], '["a", "b"]')
+        check(["a", "\n"], '["a", "\\n"]')
+        check([1, "a", None, [True]], '[1, "a", null, [true]]')
+        check((1, 2), '[1, 2]')
+        check({}, '{}')
+        check({"a": [1, {"b": 2.5}]}, '{"a": [1, {"b": 2.5}]}')
+        check({1: 2}, '{"1": 2}')
+        check({1.5: 2}, '{"1.5": 2}')
+        check({True: 1}, '{"true": 1}')
+        check({None: 1}, '{"null": 1}')
+        check([1, {"a": 2}], '[1,{"a":2}]', item_sep=',', key_sep=':')
+        check({(1,): 2}, '{}', skipkeys=True)
+        raises(TypeError, check, {(1,): 2}, '')
+        raises(TypeError, check, object(), '')
+        raises(ValueError, check, float('nan'), '', allow_nan=False)
+        raises(ValueError, check, [float('inf')], '', allow_nan=False)
+
+    def test_encode_subclasses(self):
+        import _pypyjson
+        class MyList(list):
+            def __iter__(self):
+                return iter([42])
+        class MyDict(dict):
+            def iteritems(self):
+                return iter([("x", 42)])
+        class MyInt(int):
+            def __str__(self):
+                return "17"
+        res = _pypyjson.encode([MyList([1]), MyDict(a=1), MyInt(5)],
+                               ', ', ': ', True, True, False, None)
+        assert res == '[[42], {"x": 42}, 17]'
+
+    def test_encode_float_and_tuple_subclasses(self):
+        import _pypyjson, json
+        class MyFloat(float):
+            def __repr__(self):
+                return "MyFloat()"
+        class AlwaysNaN(float):
+            def __ne__(self, other):
+                return True
+        class MyTuple(tuple):
+            def __iter__(self):
+                return iter([42])
+        class SlowEncoder(json.JSONEncoder):
+            pass
+        obj = [MyFloat(1.5), AlwaysNaN(2.5), MyTuple((1, 2)),
+               {MyFloat(0.5): 1}]
+        res = _pypyjson.encode(obj, ', ', ': ', True, True, False, None)
+        assert res == '[1.5, NaN, [42], {"0.5": 1}]'
+        # the same as the app-level encoder
+        assert res == json.dumps(obj, cls=SlowEncoder)
+        raises(ValueError, _pypyjson.encode, [AlwaysNaN(2.5)], ', ', ': ',
+               False, True, False, None)
+
+    def test_json_dumps_encoder_subclass(self):
+        import json
+        class MyEncoder(json.JSONEncoder):
+            def _JSONEncoder__floatstr(self, o):
+                return "float"
+        assert json.dumps([1.5, 2], cls=MyEncoder) == '[float, 2]'
+        assert json.dumps([1.5, 2]) == '[1.5, 2]'
+
+    def test_encode_default(self):
+        import _pypyjson
+        class A(object):
+            pass
+        def default(o):
+            assert isinstance(o, A)
+            return {"A": [1]}
+        res = _pypyjson.encode([A(), A()], ', ', ': ', True, True, False,
+                               default)
+        assert res == '[{"A": [1]}, {"A": [1]}]'
+
+    def test_encode_default_changes_list(self):
+        import _pypyjson
+        class A(object):
+            pass
+        l = [A(), A(), A()]
+        def default(o):
+            del l[:]
+            return 5
+        res = _pypyjson.encode(l, ', ', ': ', True, True, False, default)
+        assert res == '[5, 5, 5]'
+        assert l == []
+
+    def test_encode_circular(self):
+        import _pypyjson
+        l = []
+        l.append(l)
+        raises(ValueError, _pypyjson.encode, l, ', ', ': ', True, True,
+               False, None)
+        d = {}
+        d["a"] = d
+        raises(ValueError, _pypyjson.encode, d, ', ', ': ', True, True,
+               False, None)
+        # the same object twice is fine
+        x = [1]
+        assert _pypyjson.encode([x, x], ', ', ': ', True, True, False,
+                                None) == '[[1], [1]]'
+
+    def test_encode_json_dict(self):
+        import _pypyjson
+        s = '{"a": "x", "b": [1, 2.5, "y"], "c": {"d": null}}'
+        d = _pypyjson.loads(s)
+        assert _pypyjson.encode(d, ', ', ': ', True, True, False, None) == s
+
+    def test_json_dumps(self):
+        import json
+        obj = {"a": [1, 2.5, u"\xe0", None], "b": {"c": True}}
+        assert json.loads(json.dumps(obj)) == obj
+        assert json.dumps([1, {"a": 2}], separators=(',', ':')) == \
+                '[1,{"a":2}]'
+        assert json.dumps({"b": 1, "a": 2}, sort_keys=True) == \
+                '{"a": 2, "b": 1}'
+        assert json.dumps([1], indent=1) == '[\n 1\n]'
+
     def test_error_position(self):
         import _pypyjson
         test_cases = [
@@ -248,3 +432,133 @@ class AppTest(object):
         for inputtext, errmsg in test_cases:
             exc = raises(ValueError, _pypyjson.loads, inputtext)
             assert str(exc.value) == errmsg
+
+    def test_objects_with_shared_keys(self):
+        import _pypyjson
+        json = '[{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "c": "z"}]'
+        res = _pypyjson.loads(json)
+        assert res == [{u'a': 1, u'b': u'x'}, {u'a': 2, u'b': u'y'},
+                       {u'a': 3, u'c': u'z'}]
+        # the maps are shared between calls
+        assert _pypyjson.loads(json) == res
+
+    def test_nested_objects(self):
+        import _pypyjson
+        json = '{"a": {"a": {"b": []}}, "b": [{"a": "\\n"}]}'
+        res = _pypyjson.loads(json)
+        assert res == {u'a': {u'a': {u'b': []}}, u'b': [{u'a': u'\n'}]}
+
+    def test_duplicate_keys(self):
+        import _pypyjson
+        res = _pypyjson.loads('{"a": 1, "b": 2, "a": 3}')
+        assert res == {u'a': 3, u'b': 2}
+        res = _pypyjson.loads('{"a": 1, "a": 2, "b": 4}')
+        assert res == {u'a': 2, u'b': 4}
+
+    def test_escaped_keys(self):
+        import _pypyjson
+        res = _pypyjson.loads('[{"\\u0061": 1}, {"a": 2}, {"a\\"": 3}]')
+        assert res == [{u'a': 1}, {u'a': 2}, {u'a"': 3}]
+
+    def test_many_keys(self):
+        import _pypyjson
+        d = dict([(u'key%d' % i, i) for i in range(200)])
+        json = '{%s}' % ', '.join(['"%s": %d' % (str(k), v)
+                                   for k, v in d.items()])
+        assert _pypyjson.loads(json) == d
+
+    def test_many_different_shapes(self):
+        import _pypyjson
+        l = [{u'x%d' % i: i, u'y': u'a'} for i in range(100)]
+        json = '[%s]' % ', '.join(
+            ['{"x%d": %d, "y": "a"}' % (i, i) for i in range(100)])
+        assert _pypyjson.loads(json) == l
+
+    def test_invalid_utf_8_value_in_object(self):
+        import _pypyjson
+        raises(UnicodeDecodeError, _pypyjson.loads, '{"a": "\xe0"}')
+
+    def test_error_in_object(self):
+        import _pypyjson
+        raises(ValueError, _pypyjson.loads, '{"a": 1 "b": 2}')
+        raises(ValueError, _pypyjson.loads, '{"a" 1}')
+        raises(ValueError, _pypyjson.loads, '{"a": 1, "b"')
+        raises(ValueError, _pypyjson.loads, '{"a": 1, ')
+
+
+class AppTestIterload(object):
+    spaceconfig = {"objspace.usemodules._pypyjson": True,
+                   "usemodules": ['_pypyjson', 'mmap', '_io']}
+
+    def test_values(self):
+        import _pypyjson, _io
+        s = '{"a": 1}\n[1, 2]\n"x y" 42 -1.5 null true\n{"b": {"c": []}}'
+        for chunksize in [1, 2, 3, 7, 65536]:
+            f = _io.BytesIO(s)
+            res = list(_pypyjson.iterload(f, chunksize=chunksize))
+            assert res == [{u'a': 1}, [1, 2], u'x y', 42, -1.5, None, True,
+                           {u'b': {u'c': []}}]
+
+    def test_items(self):
+        import _pypyjson, _io
+        s = ' [ {"a": "]"}, [1, [2]], "x\\"]", 42, 1E3 ,null ] \n'
+        for chunksize in [1, 2, 5, 65536]:
+            f = _io.BytesIO(s)
+            res = list(_pypyjson.iterload(f, items=True, chunksize=chunksize))
+            assert res == [{u'a': u']'}, [1, [2]], u'x"]', 42, 1000.0, None]
+        assert list(_pypyjson.iterload(_io.BytesIO('[]'), items=True)) == []
+        assert list(_pypyjson.iterload(_io.BytesIO(' [ ] '), items=True)) == []
+
+    def test_buffer(self):
+        import _pypyjson
+        s = '[1, 2, {"a": 3}]'
+        assert list(_pypyjson.iterload(buffer(s), items=True,
+                                       chunksize=2)) == [1, 2, {u'a': 3}]
+        assert list(_pypyjson.iterload(bytearray(s))) == [[1, 2, {u'a': 3}]]
+
+    def test_mmap(self):
+        import _pypyjson, mmap
+        s = '{"a": 1}\n{"a": 2}\n'
+        m = mmap.mmap(-1, len(s))
+        m.write(s)
+        m.seek(0)
+        assert list(_pypyjson.iterload(m, chunksize=4)) == [{u'a': 1},
+                                                            {u'a': 2}]
+
+    def test_empty(self):
+        import _pypyjson, _io
+        assert list(_pypyjson.iterload(_io.BytesIO(''))) == []
+        assert list(_pypyjson.iterload(_io.BytesIO('  \n'))) == []
+        raises(ValueError, list,
+               _pypyjson.iterload(_io.BytesIO(''), items=True))
+
+    def test_errors(self):
+        import _pypyjson, _io
+        def error(s, items=False):
+            f = _io.BytesIO(s)
+            raises(ValueError, list, _pypyjson.iterload(f, items=items))
+        error('{"a": 1')
+        error('[1, 2')
+        error('"abc')
+        error('1 ]')
+        error('1 , 2')
+        error('{"a": 1}x')
+        error('{"a": 1}', items=True)
+        error('[1, 2', items=True)
+        error('[1, 2,]', items=True)
+        error('[1 2]', items=True)
+        error('[1, 2] 3', items=True)
+        raises(ValueError, _pypyjson.iterload, _io.BytesIO('1'), chunksize=0)
+
+    def test_unicode_stream(self):
+        import _pypyjson, _io
+        f = _io.StringIO(u'[1]')
+        raises(TypeError, list, _pypyjson.iterload(f))
+
+    def test_lazy(self):
+        import _pypyjson, _io
+        f = _io.BytesIO('1 2 [')
+        it = _pypyjson.iterload(f)
+        assert next(it) == 1
+        assert next(it) == 2
+        raises(ValueError, next, it)
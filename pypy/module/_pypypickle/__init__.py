@@ -0,0 +1,14 @@
+from pypy.interpreter.mixedmodule import MixedModule
+
+class Module(MixedModule):
+    """fast implementation of the cPickle module-level functions"""
+
+    appleveldefs = {}
+
+    interpleveldefs = {
+        'dumps' : 'interp_pickle.dumps',
+        'dump' : 'interp_pickle.dump',
+        'loads' : 'interp_pickle.loads',
+        'load' : 'interp_pickle.load',
+        'HIGHEST_PROTOCOL' : 'space.newint(2)',
+        }
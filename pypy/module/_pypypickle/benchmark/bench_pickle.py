@@ -0,0 +1,65 @@
+""" Compares the interp-level cPickle functions with the pure Python
+Pickler and Unpickler classes of lib_pypy/cPickle.py, which the module-level
+functions used before.
+
+    pypy bench_pickle.py [number of repetitions]
+"""
+
+import sys, time
+from StringIO import StringIO
+import cPickle
+import _pypypickle
+
+def py_dumps(obj, protocol):
+    f = StringIO()
+    cPickle.Pickler(f, protocol).dump(obj)
+    return f.getvalue()
+
+def py_loads(s):
+    return cPickle.Unpickler(StringIO(s)).load()
+
+def make_cache():
+    # a typical cache: many small records with shared strings
+    return dict(('key%d' % i, {'id': i, 'name': 'user%d' % i,
+                               'score': i * 0.5, 'tags': ['a', 'b', 'c'],
+                               'active': i % 2 == 0, 'parent': None})
+                for i in range(20000))
+
+def make_payload():
+    # a typical multiprocessing payload: long lists of numbers and tuples
+    return [(i, float(i), str(i)) for i in range(50000)] + [range(100000)]
+
+def count_operation(name, function, n):
+    t0 = time.time()
+    for i in xrange(n):
+        function()
+    tk = time.time()
+    print "%-40s %8.3f s" % (name, tk - t0)
+    return tk - t0
+
+def bench(name, obj, n):
+    for protocol in [0, 2]:
+        s = _pypypickle.dumps(obj, protocol)
+        assert py_loads(s) == obj
+        t_py = count_operation("%s, dumps, protocol %d, Python" %
+                               (name, protocol),
+                               lambda: py_dumps(obj, protocol), n)
+        t_fast = count_operation("%s, dumps, protocol %d, interp-level" %
+                                 (name, protocol),
+                                 lambda: _pypypickle.dumps(obj, protocol), n)
+        print "%40s %8.1fx" % ("speedup", t_py / t_fast)
+        t_py = count_operation("%s, loads, protocol %d, Python" %
+                               (name, protocol),
+                               lambda: py_loads(s), n)
+        t_fast = count_operation("%s, loads, protocol %d, interp-level" %
+                                 (name, protocol),
+                                 lambda: _pypypickle.loads(s), n)
+        print "%40s %8.1fx" % ("speedup", t_py / t_fast)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    else:
+        n = 10
+    bench("cache", make_cache(), n)
+    bench("payload", make_payload(), n)
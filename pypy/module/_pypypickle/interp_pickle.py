@@ -0,0 +1,1211 @@
+from rpython.rlib import rstackovf
+from rpython.rlib.mutbuffer import MutableStringBuffer
+from rpython.rlib.rarithmetic import string_to_int
+from rpython.rlib.rbigint import rbigint
+from rpython.rlib.rfloat import string_to_float
+from rpython.rlib.rstring import (
+    StringBuilder, ParseStringError, ParseStringOverflowError)
+from rpython.rlib.rstruct import ieee
+
+from pypy.interpreter import gateway, unicodehelper
+from pypy.interpreter.error import OperationError, oefmt
+from pypy.interpreter.pyparser.parsestring import PyString_DecodeEscape
+from pypy.interpreter.streamutil import wrap_streamerror
+from pypy.module._file.interp_file import W_File
+from pypy.module._file.interp_stream import StreamErrors
+from pypy.objspace.std.bytesobject import string_escape_encode
+from pypy.objspace.std.floatobject import float2string
+
+
+HIGHEST_PROTOCOL = 2
+
+# Keep in sync with pickle.Pickler._BATCHSIZE
+BATCHSIZE = 1000
+
+MARK            = '('
+STOP            = '.'
+POP             = '0'
+POP_MARK        = '1'
+DUP             = '2'
+FLOAT           = 'F'
+INT             = 'I'
+BININT          = 'J'
+BININT1         = 'K'
+LONG            = 'L'
+BININT2         = 'M'
+NONE            = 'N'
+PERSID          = 'P'
+BINPERSID       = 'Q'
+REDUCE          = 'R'
+STRING          = 'S'
+BINSTRING       = 'T'
+SHORT_BINSTRING = 'U'
+UNICODE         = 'V'
+BINUNICODE      = 'X'
+APPEND          = 'a'
+BUILD           = 'b'
+GLOBAL          = 'c'
+DICT            = 'd'
+EMPTY_DICT      = '}'
+APPENDS         = 'e'
+GET             = 'g'
+BINGET          = 'h'
+INST            = 'i'
+LONG_BINGET     = 'j'
+LIST            = 'l'
+EMPTY_LIST      = ']'
+OBJ             = 'o'
+PUT             = 'p'
+BINPUT          = 'q'
+LONG_BINPUT     = 'r'
+SETITEM         = 's'
+TUPLE           = 't'
+EMPTY_TUPLE     = ')'
+SETITEMS        = 'u'
+BINFLOAT        = 'G'
+TRUE            = 'I01\n'
+FALSE           = 'I00\n'
+
+PROTO           = '\x80'
+NEWOBJ          = '\x81'
+EXT1            = '\x82'
+EXT2            = '\x83'
+EXT4            = '\x84'
+TUPLE1          = '\x85'
+TUPLE2          = '\x86'
+TUPLE3          = '\x87'
+NEWTRUE         = '\x88'
+NEWFALSE        = '\x89'
+LONG1           = '\x8a'
+LONG4           = '\x8b'
+
+TUPLESIZE2CODE = [EMPTY_TUPLE, TUPLE1, TUPLE2, TUPLE3]
+
+# the first item of the tuples returned by reduce_object()
+REDUCE_GLOBAL = 0
+REDUCE_CALL = 1
+REDUCE_NEWOBJ = 2
+REDUCE_INST = 3
+
+HEX = '0123456789abcdef'
+
+
+# The rare cases, which need copy_reg or the import machinery, are handled
+# at app-level, with the same logic as pickle.py.
+app = gateway.applevel(r'''
+    import sys
+    from types import (InstanceType, ClassType, FunctionType,
+                       BuiltinFunctionType, TypeType, ModuleType)
+
+    # keep in sync with the interp-level constants
+    REDUCE_GLOBAL = 0
+    REDUCE_CALL = 1
+    REDUCE_NEWOBJ = 2
+    REDUCE_INST = 3
+
+    def unpickling_error():
+        from pickle import UnpicklingError
+        return UnpicklingError
+
+    def reduce_global(obj, name, proto):
+        from pickle import PicklingError, whichmodule
+        from copy_reg import _extension_registry
+        if name is None:
+            name = obj.__name__
+        module = getattr(obj, "__module__", None)
+        if module is None:
+            module = whichmodule(obj, name)
+        try:
+            __import__(module)
+            mod = sys.modules[module]
+            klass = getattr(mod, name)
+        except (ImportError, KeyError, AttributeError):
+            raise PicklingError(
+                "Can't pickle %r: it's not found as %s.%s" %
+                (obj, module, name))
+        else:
+            if klass is not obj:
+                raise PicklingError(
+                    "Can't pickle %r: it's not the same object as %s.%s" %
+                    (obj, module, name))
+        code = 0
+        if proto >= 2:
+            code = _extension_registry.get((module, name), 0)
+        return (REDUCE_GLOBAL, module, name, code)
+
+    def reduce_inst(obj):
+        cls = obj.__class__
+        if hasattr(obj, '__getinitargs__'):
+            args = tuple(obj.__getinitargs__())
+        else:
+            args = ()
+        try:
+            getstate = obj.__getstate__
+        except AttributeError:
+            state = obj.__dict__
+        else:
+            state = getstate()
+        return (REDUCE_INST, cls, args, state, cls.__module__,
+                cls.__name__)
+
+    def reduce_tuple(obj, proto, func, args, state=None, listitems=None,
+                     dictitems=None):
+        from pickle import PicklingError
+        if not isinstance(args, tuple):
+            raise PicklingError("args from reduce() should be a tuple")
+        try:
+            func.__call__
+        except AttributeError:
+            raise PicklingError("func from reduce should be callable")
+        if proto >= 2 and getattr(func, "__name__", "") == "__newobj__":
+            cls = args[0]
+            if not hasattr(cls, "__new__"):
+                raise PicklingError(
+                    "args[0] from __newobj__ args has no __new__")
+            if cls is not obj.__class__:
+                raise PicklingError(
+                    "args[0] from __newobj__ args has the wrong class")
+            return (REDUCE_NEWOBJ, cls, args[1:], state, listitems,
+                    dictitems)
+        return (REDUCE_CALL, func, args, state, listitems, dictitems)
+
+    def reduce_object(obj, proto):
+        """ Returns how to pickle an object that is not of one of the
+        builtin types handled at interp-level. """
+        from pickle import PicklingError
+        from copy_reg import dispatch_table
+        t = type(obj)
+        if t is InstanceType:
+            return reduce_inst(obj)
+        if t is ClassType or t is BuiltinFunctionType or t is TypeType:
+            return reduce_global(obj, None, proto)
+        if t is FunctionType:
+            try:
+                return reduce_global(obj, None, proto)
+            except PicklingError:
+                pass
+        reduce = dispatch_table.get(t)
+        if reduce:
+            rv = reduce(obj)
+        else:
+            try:
+                issc = issubclass(t, TypeType)
+            except TypeError:
+                issc = False
+            if issc:
+                return reduce_global(obj, None, proto)
+            reduce = getattr(obj, "__reduce_ex__", None)
+            if reduce:
+                rv = reduce(proto)
+            else:
+                reduce = getattr(obj, "__reduce__", None)
+                if reduce:
+                    rv = reduce()
+                else:
+                    raise PicklingError("Can't pickle %r object: %r" %
+                                        (t.__name__, obj))
+        if type(rv) is str:
+            return reduce_global(obj, rv, proto)
+        if type(rv) is not tuple:
+            raise PicklingError("%s must return string or tuple" % reduce)
+        if not (2 <= len(rv) <= 5):
+            raise PicklingError("Tuple returned by %s must have "
+                                "two to five elements" % reduce)
+        return reduce_tuple(obj, proto, *rv)
+
+    def reduce_moduledict(obj):
+        """ Returns (getattr, (module, '__dict__')) if obj is the __dict__
+        of a module, None otherwise. """
+        try:
+            name = obj['__name__']
+            if type(name) is not str:
+                return None
+            themodule = sys.modules[name]
+            if type(themodule) is not ModuleType:
+                return None
+            if themodule.__dict__ is not obj:
+                return None
+        except (AttributeError, KeyError, TypeError):
+            return None
+        return getattr, (themodule, '__dict__')
+
+    def find_global(module, name):
+        __import__(module)
+        mod = sys.modules[module]
+        return getattr(mod, name)
+
+    def get_extension(code):
+        from copy_reg import _inverted_registry, _extension_cache
+        nil = []
+        obj = _extension_cache.get(code, nil)
+        if obj is not nil:
+            return obj
+        key = _inverted_registry.get(code)
+        if not key:
+            raise ValueError("unregistered extension code %d" % code)
+        obj = find_global(*key)
+        _extension_cache[code] = obj
+        return obj
+
+    def instantiate(klass, args):
+        from pickle import _EmptyClass
+        if (not args and
+                type(klass) is ClassType and
+                not hasattr(klass, "__getinitargs__")):
+            value = _EmptyClass()
+            value.__class__ = klass
+            return value
+        try:
+            return klass(*args)
+        except TypeError, err:
+            raise TypeError, "in constructor for %s: %s" % (
+                klass.__name__, str(err)), sys.exc_info()[2]
+
+    def build(inst, state):
+        setstate = getattr(inst, "__setstate__", None)
+        if setstate:
+            setstate(state)
+            return
+        slotstate = None
+        if isinstance(state, tuple) and len(state) == 2:
+            state, slotstate = state
+        if state:
+            d = inst.__dict__
+            try:
+                for k, v in state.iteritems():
+                    d[intern(k)] = v
+            # keys in state don't have to be strings
+            # don't blow up, but don't go out of our way
+            except TypeError:
+                d.update(state)
+        if slotstate:
+            for k, v in slotstate.items():
+                setattr(inst, k, v)
+''', filename=__file__)
+
+unpickling_error = app.interphook('unpickling_error')
+reduce_object = app.interphook('reduce_object')
+reduce_moduledict = app.interphook('reduce_moduledict')
+find_global = app.interphook('find_global')
+get_extension = app.interphook('get_extension')
+instantiate = app.interphook('instantiate')
+build = app.interphook('build')
+
+
+def _get_protocol(space, w_protocol):
+    if space.is_none(w_protocol):
+        return 0
+    protocol = space.int_w(w_protocol)
+    if protocol < 0:
+        return HIGHEST_PROTOCOL
+    if protocol > HIGHEST_PROTOCOL:
+        raise oefmt(space.w_ValueError,
+                    "pickle protocol %d asked for; the highest available "
+                    "protocol is %d", protocol, HIGHEST_PROTOCOL)
+    return protocol
+
+def encode_long(bigint):
+    """ Returns the minimal two's complement little-endian representation
+    of 'bigint', like pickle.encode_long(). """
+    if not bigint.tobool():
+        return ''
+    nbytes = (bigint.bit_length() >> 3) + 1
+    s = bigint.tobytes(nbytes, 'little', True)
+    if (bigint.sign < 0 and nbytes > 1 and s[nbytes - 1] == '\xff' and
+            ord(s[nbytes - 2]) >= 0x80):
+        end = nbytes - 1
+        assert end >= 0
+        s = s[:end]
+    return s
+
+def _write_hex(sb, n, digits):
+    for i in range(digits - 1, -1, -1):
+        sb.append(HEX[(n >> (i * 4)) & 0xf])
+
+def _write_raw_unicode_escape(sb, u):
+    """ The raw-unicode-escape codec, but also escaping backslashes and
+    newlines, as required by the UNICODE opcode. """
+    for i in range(len(u)):
+        n = ord(u[i])
+        if n >= 0x10000:
+            sb.append('\\U')
+            _write_hex(sb, n, 8)
+        elif n >= 0x100 or n == ord('\\') or n == ord('\n'):
+            sb.append('\\u')
+            _write_hex(sb, n, 4)
+        else:
+            sb.append(chr(n))
+
+def _read_int4(s):
+    """ Reads a signed 4-bytes little-endian integer. """
+    x = ord(s[3])
+    if x >= 0x80:
+        x -= 0x100
+    return (x << 24) | (ord(s[2]) << 16) | (ord(s[1]) << 8) | ord(s[0])
+
+
+class Pickler(object):
+    """ Writes the pickle of an object into a StringBuilder. The builtin
+    types are written directly, everything else goes through the same
+    __reduce_ex__/copy_reg logic as pickle.py. The memo is keyed by the
+    identity of the objects and keeps them alive, so temporary objects
+    returned by __reduce__ can never be confused with each other. """
+
+    def __init__(self, space, proto):
+        self.space = space
+        self.proto = proto
+        self.bin = proto >= 1
+        self.memo = {}
+        self.builder = StringBuilder()
+
+    def dump(self, w_obj):
+        if self.proto >= 2:
+            self.builder.append(PROTO)
+            self.builder.append(chr(self.proto))
+        try:
+            self.save(w_obj)
+        except rstackovf.StackOverflow:
+            rstackovf.check_stack_overflow()
+            raise oefmt(self.space.w_RuntimeError,
+                        "maximum recursion depth exceeded while pickling "
+                        "an object")
+        self.builder.append(STOP)
+        return self.builder.build()
+
+    def write(self, s):
+        self.builder.append(s)
+
+    def write_int4(self, x):
+        sb = self.builder
+        sb.append(chr(x & 0xff))
+        sb.append(chr((x >> 8) & 0xff))
+        sb.append(chr((x >> 16) & 0xff))
+        sb.append(chr((x >> 24) & 0xff))
+
+    # ____________________________________________________________
+    # memo
+
+    def memoize(self, w_obj):
+        # like cPickle, start counting at one
+        index = len(self.memo) + 1
+        self.memo[w_obj] = index
+        if not self.bin:
+            self.write(PUT)
+            self.write(str(index))
+            self.write('\n')
+        elif index < 256:
+            self.write(BINPUT)
+            self.write(chr(index))
+        else:
+            self.write(LONG_BINPUT)
+            self.write_int4(index)
+
+    def write_get(self, index):
+        if not self.bin:
+            self.write(GET)
+            self.write(str(index))
+            self.write('\n')
+        elif index < 256:
+            self.write(BINGET)
+            self.write(chr(index))
+        else:
+            self.write(LONG_BINGET)
+            self.write_int4(index)
+
+    # ____________________________________________________________
+
+    def save(self, w_obj):
+        space = self.space
+        w_type = space.type(w_obj)
+        # ints, floats, bools and None are never memoized
+        if space.is_w(w_type, space.w_int):
+            self.save_int(space.int_w(w_obj))
+            return
+        if space.is_w(w_type, space.w_float):
+            self.save_float(space.float_w(w_obj))
+            return
+        if space.is_w(w_obj, space.w_None):
+            self.write(NONE)
+            return
+        if space.is_w(w_type, space.w_bool):
+            self.save_bool(space.is_true(w_obj))
+            return
+        index = self.memo.get(w_obj, 0)
+        if index > 0:
+            self.write_get(index)
+        elif space.is_w(w_type, space.w_bytes):
+            self.save_string(w_obj)
+        elif space.is_w(w_type, space.w_unicode):
+            self.save_unicode(w_obj)
+        elif space.is_w(w_type, space.w_tuple):
+            self.save_tuple(w_obj)
+        elif space.is_w(w_type, space.w_list):
+            self.save_list(w_obj)
+        elif space.is_w(w_type, space.w_dict):
+            self.save_dict(w_obj)
+        elif space.is_w(w_type, space.w_long):
+            self.save_long(w_obj)
+        else:
+            self.save_other(w_obj)
+
+    def save_bool(self, value):
+        if self.proto >= 2:
+            self.write(NEWTRUE if value else NEWFALSE)
+        else:
+            self.write(TRUE if value else FALSE)
+
+    def save_int(self, x):
+        if self.bin:
+            if x >= 0:
+                if x <= 0xff:
+                    self.write(BININT1)
+                    self.write(chr(x))
+                    return
+                if x <= 0xffff:
+                    self.write(BININT2)
+                    self.write(chr(x & 0xff))
+                    self.write(chr(x >> 8))
+                    return
+            high_bits = x >> 31
+            if high_bits == 0 or high_bits == -1:
+                self.write(BININT)
+                self.write_int4(x)
+                return
+        self.write(INT)
+        self.write(str(x))
+        self.write('\n')
+
+    def save_long(self, w_obj):
+        space = self.space
+        if self.proto >= 2:
+            s = encode_long(space.bigint_w(w_obj))
+            n = len(s)
+            if n < 256:
+                self.write(LONG1)
+                self.write(chr(n))
+            else:
+                self.write(LONG4)
+                self.write_int4(n)
+            self.write(s)
+            return
+        self.write(LONG)
+        self.write(space.text_w(space.repr(w_obj)))
+        self.write('\n')
+
+    def save_float(self, x):
+        if self.bin:
+            buf = MutableStringBuffer(8)
+            ieee.pack_float(buf, 0, x, 8, True)
+            self.write(BINFLOAT)
+            self.write(buf.finish())
+        else:
+            self.write(FLOAT)
+            self.write(float2string(x, 'r', 0))
+            self.write('\n')
+
+    def save_string(self, w_obj):
+        s = self.space.bytes_w(w_obj)
+        if self.bin:
+            n = len(s)
+            if n < 256:
+                self.write(SHORT_BINSTRING)
+                self.write(chr(n))
+            else:
+                self.write(BINSTRING)
+                self.write_int4(n)
+            self.write(s)
+        else:
+            quote = "'"
+            if quote in s and '"' not in s:
+                quote = '"'
+            self.write(STRING)
+            self.write(string_escape_encode(s, quote))
+            self.write('\n')
+        self.memoize(w_obj)
+
+    def save_unicode(self, w_obj):
+        space = self.space
+        u = space.unicode_w(w_obj)
+        if self.bin:
+            s = unicodehelper.encode_utf8(space, u)
+            self.write(BINUNICODE)
+            self.write_int4(len(s))
+            self.write(s)
+        else:
+            self.write(UNICODE)
+            _write_raw_unicode_escape(self.builder, u)
+            self.write('\n')
+        self.memoize(w_obj)
+
+    def save_tuple(self, w_tuple):
+        items_w = self.space.fixedview(w_tuple)
+        n = len(items_w)
+        if n == 0:
+            if self.proto:
+                self.write(EMPTY_TUPLE)
+            else:
+                self.write(MARK)
+                self.write(TUPLE)
+            return
+        if n <= 3 and self.proto >= 2:
+            for w_item in items_w:
+                self.save(w_item)
+            # if the tuple is recursive, it was memoized while saving its
+            # items: throw away what we have put on the stack and fetch it
+            # from the memo
+            index = self.memo.get(w_tuple, 0)
+            if index > 0:
+                self.write(POP * n)
+                self.write_get(index)
+            else:
+                self.write(TUPLESIZE2CODE[n])
+                self.memoize(w_tuple)
+            return
+        self.write(MARK)
+        for w_item in items_w:
+            self.save(w_item)
+        index = self.memo.get(w_tuple, 0)
+        if index > 0:
+            if self.proto:
+                self.write(POP_MARK)
+            else:
+                # proto 0 -- POP_MARK not available
+                self.write(POP * (n + 1))
+            self.write_get(index)
+            return
+        self.write(TUPLE)
+        self.memoize(w_tuple)
+
+    def save_list(self, w_list):
+        if self.bin:
+            self.write(EMPTY_LIST)
+        else:
+            self.write(MARK)
+            self.write(LIST)
+        self.memoize(w_list)
+        self.batch_appends(self.space.iter(w_list))
+
+    def save_dict(self, w_dict):
+        from pypy.objspace.std.dictmultiobject import W_DictMultiObject
+        space = self.space
+        if space.finditem_str(w_dict, '__name__') is not None:
+            w_res = reduce_moduledict(space, w_dict)
+            if not space.is_w(w_res, space.w_None):
+                w_func, w_args = space.fixedview(w_res, 2)
+                self.save(w_func)
+                self.save(w_args)
+                self.write(REDUCE)
+                return
+        if self.bin:
+            self.write(EMPTY_DICT)
+        else:
+            self.write(MARK)
+            self.write(DICT)
+        self.memoize(w_dict)
+        if not isinstance(w_dict, W_DictMultiObject):
+            self.batch_setitems(space.call_method(w_dict, 'iteritems'))
+            return
+        iterator = w_dict.iteritems()
+        while True:
+            keys_w = []
+            values_w = []
+            while len(keys_w) < BATCHSIZE:
+                w_key, w_value = iterator.next_item()
+                if w_key is None:
+                    break
+                keys_w.append(w_key)
+                values_w.append(w_value)
+            self.write_setitems(keys_w, values_w)
+            if len(keys_w) < BATCHSIZE:
+                break
+
+    def _next(self, w_iter):
+        space = self.space
+        try:
+            return space.next(w_iter)
+        except OperationError as e:
+            if not e.match(space, space.w_StopIteration):
+                raise
+            return None
+
+    def batch_appends(self, w_iter):
+        if not self.bin:
+            while True:
+                w_item = self._next(w_iter)
+                if w_item is None:
+                    break
+                self.save(w_item)
+                self.write(APPEND)
+            return
+        while True:
+            items_w = []
+            while len(items_w) < BATCHSIZE:
+                w_item = self._next(w_iter)
+                if w_item is None:
+                    break
+                items_w.append(w_item)
+            n = len(items_w)
+            if n > 1:
+                self.write(MARK)
+                for w_item in items_w:
+                    self.save(w_item)
+                self.write(APPENDS)
+            elif n == 1:
+                self.save(items_w[0])
+                self.write(APPEND)
+            if n < BATCHSIZE:
+                break
+
+    def batch_setitems(self, w_iter):
+        space = self.space
+        while True:
+            keys_w = []
+            values_w = []
+            while len(keys_w) < BATCHSIZE:
+                w_item = self._next(w_iter)
+                if w_item is None:
+                    break
+                w_key, w_value = space.fixedview(w_item, 2)
+                keys_w.append(w_key)
+                values_w.append(w_value)
+            self.write_setitems(keys_w, values_w)
+            if len(keys_w) < BATCHSIZE:
+                break
+
+    def write_setitems(self, keys_w, values_w):
+        n = len(keys_w)
+        if n > 1 and self.bin:
+            self.write(MARK)
+            for i in range(n):
+                self.save(keys_w[i])
+                self.save(values_w[i])
+            self.write(SETITEMS)
+        else:
+            for i in range(n):
+                self.save(keys_w[i])
+                self.save(values_w[i])
+                self.write(SETITEM)
+
+    # ____________________________________________________________
+    # objects of other types
+
+    def save_other(self, w_obj):
+        space = self.space
+        w_res = reduce_object(space, w_obj, space.newint(self.proto))
+        res_w = space.fixedview(w_res)
+        kind = space.int_w(res_w[0])
+        if kind == REDUCE_GLOBAL:
+            self.save_global(w_obj, space.text_w(res_w[1]),
+                             space.text_w(res_w[2]), space.int_w(res_w[3]))
+        elif kind == REDUCE_INST:
+            self.save_inst(w_obj, res_w[1], space.fixedview(res_w[2]),
+                           res_w[3], space.text_w(res_w[4]),
+                           space.text_w(res_w[5]))
+        else:
+            self.save_reduce(w_obj, kind == REDUCE_NEWOBJ, res_w[1],
+                             res_w[2], res_w[3], res_w[4], res_w[5])
+
+    def save_global(self, w_obj, module, name, code):
+        if code > 0:
+            if code <= 0xff:
+                self.write(EXT1)
+                self.write(chr(code))
+            elif code <= 0xffff:
+                self.write(EXT2)
+                self.write(chr(code & 0xff))
+                self.write(chr(code >> 8))
+            else:
+                self.write(EXT4)
+                self.write_int4(code)
+            return
+        self.write(GLOBAL)
+        self.write(module)
+        self.write('\n')
+        self.write(name)
+        self.write('\n')
+        self.memoize(w_obj)
+
+    def save_inst(self, w_obj, w_cls, args_w, w_state, module, name):
+        self.write(MARK)
+        if self.bin:
+            self.save(w_cls)
+            for w_arg in args_w:
+                self.save(w_arg)
+            self.write(OBJ)
+        else:
+            for w_arg in args_w:
+                self.save(w_arg)
+            self.write(INST)
+            self.write(module)
+            self.write('\n')
+            self.write(name)
+            self.write('\n')
+        self.memoize(w_obj)
+        self.save(w_state)
+        self.write(BUILD)
+
+    def save_reduce(self, w_obj, newobj, w_func, w_args, w_state,
+                    w_listitems, w_dictitems):
+        space = self.space
+        self.save(w_func)
+        self.save(w_args)
+        if newobj:
+            self.write(NEWOBJ)
+        else:
+            self.write(REDUCE)
+        index = self.memo.get(w_obj, 0)
+        if index > 0:
+            # the object is recursive: throw away what we have put on the
+            # stack and fetch it from the memo
+            self.write(POP)
+            self.write_get(index)
+        else:
+            self.memoize(w_obj)
+        if not space.is_w(w_listitems, space.w_None):
+            self.batch_appends(w_listitems)
+        if not space.is_w(w_dictitems, space.w_None):
+            self.batch_setitems(w_dictitems)
+        if not space.is_w(w_state, space.w_None):
+            self.save(w_state)
+            self.write(BUILD)
+
+
+# ____________________________________________________________
+# input
+
+class AbstractReader(object):
+    """ Subclasses provide read(n), and readline() which returns the next
+    line without the final newline. """
+
+    def __init__(self, space):
+        self.space = space
+
+    def raise_eof(self):
+        space = self.space
+        raise OperationError(space.w_EOFError, space.w_None)
+
+    def read1(self):
+        return self.read(1)[0]
+
+class StringReader(AbstractReader):
+    def __init__(self, space, s):
+        AbstractReader.__init__(self, space)
+        self.s = s
+        self.pos = 0
+
+    def read(self, n):
+        pos = self.pos
+        end = pos + n
+        if n < 0 or end > len(self.s):
+            self.raise_eof()
+        self.pos = end
+        assert pos >= 0
+        return self.s[pos:end]
+
+    def read1(self):
+        pos = self.pos
+        if pos >= len(self.s):
+            self.raise_eof()
+        self.pos = pos + 1
+        return self.s[pos]
+
+    def readline(self):
+        s = self.s
+        pos = self.pos
+        if pos >= len(s):
+            self.raise_eof()
+        end = s.find('\n', pos)
+        if end < 0:
+            end = len(s)
+            self.pos = end
+        else:
+            self.pos = end + 1
+        assert pos >= 0
+        return s[pos:end]
+
+class FileReader(AbstractReader):
+    def __init__(self, space, w_f):
+        AbstractReader.__init__(self, space)
+        self.w_read = space.getattr(w_f, space.newtext('read'))
+        self.w_readline = space.getattr(w_f, space.newtext('readline'))
+
+    def read(self, n):
+        space = self.space
+        s = space.bytes_w(space.call_function(self.w_read, space.newint(n)))
+        if len(s) != n:
+            self.raise_eof()
+        return s
+
+    def readline(self):
+        space = self.space
+        s = space.bytes_w(space.call_function(self.w_readline))
+        return _strip_newline(self, s)
+
+class BuiltinFileReader(AbstractReader):
+    """ Reads from the stream of a builtin file object, which does its own
+    buffering, instead of calling the app-level read() for every opcode. """
+
+    def __init__(self, space, w_f):
+        AbstractReader.__init__(self, space)
+        self.w_f = w_f
+
+    def read(self, n):
+        w_f = self.w_f
+        w_f.lock()
+        try:
+            try:
+                s = w_f.direct_read(n)
+            except StreamErrors as e:
+                raise wrap_streamerror(self.space, e, w_f.w_name)
+        finally:
+            w_f.unlock()
+        if len(s) != n:
+            self.raise_eof()
+        return s
+
+    def readline(self):
+        w_f = self.w_f
+        w_f.lock()
+        try:
+            try:
+                s = w_f.direct_readline()
+            except StreamErrors as e:
+                raise wrap_streamerror(self.space, e, w_f.w_name)
+        finally:
+            w_f.unlock()
+        return _strip_newline(self, s)
+
+def _strip_newline(reader, s):
+    if not s:
+        reader.raise_eof()
+    end = len(s) - 1
+    if s[end] == '\n':
+        assert end >= 0
+        return s[:end]
+    return s
+
+
+class Unpickler(object):
+    """ Reads one pickle with protocol 0 to 2. The stack of marks is kept
+    separately, like in cPickle, so that finding the topmost mark does not
+    need a scan of the stack. """
+
+    def __init__(self, space, reader):
+        self.space = space
+        self.reader = reader
+        self.stack_w = []
+        self.marks = []
+        self.memo = {}
+
+    def error(self, msg):
+        space = self.space
+        return OperationError(unpickling_error(space), space.newtext(msg))
+
+    def load(self):
+        reader = self.reader
+        while True:
+            op = reader.read1()
+            if op == STOP:
+                break
+            self.dispatch(op)
+        return self.pop()
+
+    # ____________________________________________________________
+    # stack
+
+    def push(self, w_obj):
+        self.stack_w.append(w_obj)
+
+    def pop(self):
+        if not self.stack_w:
+            raise self.error("unpickling stack underflow")
+        return self.stack_w.pop()
+
+    def top(self):
+        if not self.stack_w:
+            raise self.error("unpickling stack underflow")
+        return self.stack_w[-1]
+
+    def set_top(self, w_obj):
+        self.stack_w[-1] = w_obj
+
+    def marker(self):
+        if not self.marks:
+            raise self.error("could not find MARK")
+        return self.marks.pop()
+
+    def pop_mark(self):
+        """ Removes the items up to the topmost mark and returns them. """
+        k = self.marker()
+        if k > len(self.stack_w):
+            # the items above the mark were already popped
+            raise self.error("unpickling stack underflow")
+        items_w = self.stack_w[k:]
+        del self.stack_w[k:]
+        return items_w
+
+    # ____________________________________________________________
+    # arguments
+
+    def read_line_int(self):
+        line = self.reader.readline()
+        try:
+            return string_to_int(line)
+        except (ParseStringError, ParseStringOverflowError):
+            raise self.error("could not convert string to int")
+
+    def read_int4(self):
+        return _read_int4(self.reader.read(4))
+
+    def read_count4(self, opname):
+        n = self.read_int4()
+        if n < 0:
+            raise self.error("%s pickle has negative byte count" % opname)
+        return n
+
+    def read_memo_index(self, op):
+        if op == GET or op == PUT:
+            return self.read_line_int()
+        elif op == BINGET or op == BINPUT:
+            return ord(self.reader.read1())
+        else:
+            return self.read_int4()
+
+    # ____________________________________________________________
+
+    def dispatch(self, op):
+        space = self.space
+        reader = self.reader
+        if op == MARK:
+            self.marks.append(len(self.stack_w))
+        elif op == BININT1:
+            self.push(space.newint(ord(reader.read1())))
+        elif op == BININT2:
+            s = reader.read(2)
+            self.push(space.newint(ord(s[0]) | (ord(s[1]) << 8)))
+        elif op == BININT:
+            self.push(space.newint(self.read_int4()))
+        elif op == BINFLOAT:
+            self.push(space.newfloat(ieee.unpack_float(reader.read(8), True)))
+        elif op == SHORT_BINSTRING:
+            n = ord(reader.read1())
+            self.push(space.newbytes(reader.read(n)))
+        elif op == BINSTRING:
+            n = self.read_count4("BINSTRING")
+            self.push(space.newbytes(reader.read(n)))
+        elif op == BINUNICODE:
+            n = self.read_count4("BINUNICODE")
+            s = reader.read(n)
+            self.push(space.newunicode(unicodehelper.decode_utf8(space, s)))
+        elif op == NONE:
+            self.push(space.w_None)
+        elif op == NEWTRUE:
+            self.push(space.w_True)
+        elif op == NEWFALSE:
+            self.push(space.w_False)
+        elif (op == BINPUT or op == LONG_BINPUT or op == PUT):
+            index = self.read_memo_index(op)
+            if index < 0:
+                raise self.error("negative PUT argument")
+            self.memo[index] = self.top()
+        elif (op == BINGET or op == LONG_BINGET or op == GET):
+            index = self.read_memo_index(op)
+            w_obj = self.memo.get(index, None)
+            if w_obj is None:
+                raise OperationError(space.w_KeyError, space.newint(index))
+            self.push(w_obj)
+        elif op == EMPTY_TUPLE:
+            self.push(space.newtuple([]))
+        elif op == TUPLE1 or op == TUPLE2 or op == TUPLE3:
+            n = ord(op) - ord(TUPLE1) + 1
+            k = len(self.stack_w) - n
+            if k < 0:
+                raise self.error("unpickling stack underflow")
+            items_w = self.stack_w[k:]
+            del self.stack_w[k:]
+            self.push(space.newtuple(items_w))
+        elif op == TUPLE:
+            self.push(space.newtuple(self.pop_mark()[:]))
+        elif op == EMPTY_LIST:
+            self.push(space.newlist([]))
+        elif op == LIST:
+            self.push(space.newlist(self.pop_mark()))
+        elif op == EMPTY_DICT:
+            self.push(space.newdict())
+        elif op == DICT:
+            items_w = self.pop_mark()
+            w_dict = space.newdict()
+            self.setitems(w_dict, items_w)
+            self.push(w_dict)
+        elif op == APPEND:
+            w_item = self.pop()
+            self.append_items(self.top(), [w_item])
+        elif op == APPENDS:
+            items_w = self.pop_mark()
+            self.append_items(self.top(), items_w)
+        elif op == SETITEM:
+            w_value = self.pop()
+            w_key = self.pop()
+            space.setitem(self.top(), w_key, w_value)
+        elif op == SETITEMS:
+            items_w = self.pop_mark()
+            self.setitems(self.top(), items_w)
+        elif op == POP:
+            if self.marks and self.marks[-1] == len(self.stack_w):
+                self.marks.pop()
+            else:
+                self.pop()
+        elif op == POP_MARK:
+            self.pop_mark()
+        elif op == DUP:
+            self.push(self.top())
+        elif op == INT:
+            line = reader.readline()
+            if line == '01':
+                self.push(space.w_True)
+            elif line == '00':
+                self.push(space.w_False)
+            else:
+                self.push(self.parse_int(line))
+        elif op == LONG:
+            line = reader.readline()
+            self.push(space.call_function(space.w_long, space.newtext(line),
+                                          space.newint(0)))
+        elif op == LONG1 or op == LONG4:
+            if op == LONG1:
+                n = ord(reader.read1())
+            else:
+                n = self.read_count4("LONG")
+            bigint = rbigint.frombytes(reader.read(n), 'little', True)
+            self.push(space.newlong_from_rbigint(bigint))
+        elif op == FLOAT:
+            self.push(self.parse_float(reader.readline()))
+        elif op == STRING:
+            self.push(self.parse_string(reader.readline()))
+        elif op == UNICODE:
+            u = unicodehelper.decode_raw_unicode_escape(space,
+                                                        reader.readline())
+            self.push(space.newunicode(u))
+        elif op == GLOBAL:
+            module = reader.readline()
+            name = reader.readline()
+            self.push(find_global(space, space.newtext(module),
+                                  space.newtext(name)))
+        elif op == EXT1 or op == EXT2 or op == EXT4:
+            if op == EXT1:
+                code = ord(reader.read1())
+            elif op == EXT2:
+                s = reader.read(2)
+                code = ord(s[0]) | (ord(s[1]) << 8)
+            else:
+                code = self.read_int4()
+            self.push(get_extension(space, space.newint(code)))
+        elif op == REDUCE:
+            w_args = self.pop()
+            w_func = self.top()
+            self.set_top(space.call(w_func, w_args))
+        elif op == NEWOBJ:
+            args_w = space.fixedview(self.pop())
+            w_cls = self.top()
+            w_new = space.getattr(w_cls, space.newtext('__new__'))
+            self.set_top(space.call(w_new, space.newtuple([w_cls] + args_w)))
+        elif op == BUILD:
+            w_state = self.pop()
+            build(space, self.top(), w_state)
+        elif op == INST:
+            module = reader.readline()
+            name = reader.readline()
+            w_cls = find_global(space, space.newtext(module),
+                                space.newtext(name))
+            self.push(instantiate(space, w_cls,
+                                  space.newtuple(self.pop_mark()[:])))
+        elif op == OBJ:
+            items_w = self.pop_mark()
+            if not items_w:
+                raise self.error("unpickling stack underflow")
+            w_cls = items_w[0]
+            self.push(instantiate(space, w_cls, space.newtuple(items_w[1:])))
+        elif op == PROTO:
+            proto = ord(reader.read1())
+            if proto > HIGHEST_PROTOCOL:
+                raise oefmt(space.w_ValueError,
+                            "unsupported pickle protocol: %d", proto)
+        elif op == PERSID or op == BINPERSID:
+            raise self.error("A load persistent id instruction was "
+                             "encountered, but no persistent_load function "
+                             "was specified.")
+        else:
+            raise self.error("invalid load key, '%s'." % (op,))
+
+    def parse_int(self, line):
+        space = self.space
+        try:
+            return space.newint(string_to_int(line))
+        except (ParseStringError, ParseStringOverflowError):
+            # let int() return a long or raise the ValueError
+            return space.call_function(space.w_int, space.newtext(line))
+
+    def parse_float(self, line):
+        space = self.space
+        try:
+            return space.newfloat(string_to_float(line))
+        except ParseStringError:
+            return space.call_function(space.w_float, space.newtext(line))
+
+    def parse_string(self, line):
+        space = self.space
+        n = len(line)
+        if n < 2 or line[0] != line[n - 1] or (line[0] != "'" and
+                                               line[0] != '"'):
+            raise oefmt(space.w_ValueError, "insecure string pickle")
+        end = n - 1
+        assert end >= 1
+        s = PyString_DecodeEscape(space, line[1:end], 'strict', None)
+        return space.newbytes(s)
+
+    def append_items(self, w_list, items_w):
+        space = self.space
+        if space.is_w(space.type(w_list), space.w_list):
+            space.call_method(w_list, 'extend', space.newlist(items_w))
+        else:
+            for w_item in items_w:
+                space.call_method(w_list, 'append', w_item)
+
+    def setitems(self, w_dict, items_w):
+        space = self.space
+        n = len(items_w)
+        if n & 1:
+            raise self.error("odd number of items for SETITEMS")
+        for i in range(0, n, 2):
+            space.setitem(w_dict, items_w[i], items_w[i + 1])
+
+
+# ____________________________________________________________
+# app-level interface
+
+def dumps(space, w_obj, w_protocol=None):
+    """dumps(obj, protocol=0) -- Return a string containing an object in
+    pickle format."""
+    pickler = Pickler(space, _get_protocol(space, w_protocol))
+    return space.newbytes(pickler.dump(w_obj))
+
+def dump(space, w_obj, w_file, w_protocol=None):
+    """dump(obj, file, protocol=0) -- Write an object in pickle format to
+    the given file."""
+    pickler = Pickler(space, _get_protocol(space, w_protocol))
+    s = pickler.dump(w_obj)
+    space.call_method(w_file, 'write', space.newbytes(s))
+
+def loads(space, w_string):
+    """loads(string) -- Load a pickle from the given string"""
+    reader = StringReader(space, space.bufferstr_w(w_string))
+    return Unpickler(space, reader).load()
+
+def load(space, w_file):
+    """load(file) -- Load a pickle from the given file"""
+    # special case real files for performance, like marshal.load()
+    if isinstance(w_file, W_File):
+        reader = BuiltinFileReader(space, w_file)
+    else:
+        reader = FileReader(space, w_file)
+    return Unpickler(space, reader).load()
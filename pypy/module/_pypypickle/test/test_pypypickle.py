@@ -0,0 +1,338 @@
+from rpython.rlib.rbigint import rbigint
+from rpython.rlib.rstring import StringBuilder
+from pypy.module._pypypickle.interp_pickle import (
+    encode_long, _write_raw_unicode_escape, _read_int4)
+
+
+def test_encode_long():
+    def enc(x):
+        return encode_long(rbigint.fromlong(x))
+    assert enc(0) == ''
+    assert enc(255) == '\xff\x00'
+    assert enc(32767) == '\xff\x7f'
+    assert enc(-256) == '\x00\xff'
+    assert enc(-32768) == '\x00\x80'
+    assert enc(-128) == '\x80'
+    assert enc(127) == '\x7f'
+    assert enc(-1) == '\xff'
+    assert enc(-129) == '\x7f\xff'
+    for x in [1, -1, 2**63, -2**63, 2**64 - 1, -2**100, 12345678901234567]:
+        assert rbigint.frombytes(enc(x), 'little', True).tolong() == x
+
+def test_write_raw_unicode_escape():
+    sb = StringBuilder()
+    _write_raw_unicode_escape(sb, u'a\\b\nc\xe9\u1234\U00012345')
+    assert sb.build() == 'a\\u005cb\\u000ac\xe9\\u1234\\U00012345'
+
+def test_read_int4():
+    assert _read_int4('\x01\x00\x00\x00') == 1
+    assert _read_int4('\xff\xff\xff\xff') == -1
+    assert _read_int4('\x00\x00\x00\x80') == -2**31
+    assert _read_int4('\xff\xff\xff\x7f') == 2**31 - 1
+
+
+class AppTestPickle(object):
+    spaceconfig = {"usemodules": ['_pypypickle', 'struct', 'binascii']}
+
+    def setup_class(cls):
+        cls.w_mod = cls.space.appexec([], """():
+            import sys, types
+            mod = sys.modules['pypypickle_test'] = types.ModuleType(
+                'pypypickle_test')
+            exec '''if 1:
+                import pickle
+                from StringIO import StringIO
+
+                class Pickler(pickle.Pickler):
+                    # the memo numbering of cPickle starts at one
+                    def memoize(self, obj):
+                        self.memo[id(None)] = None
+                        return pickle.Pickler.memoize(self, obj)
+
+                def pydumps(obj, proto):
+                    f = StringIO()
+                    Pickler(f, proto).dump(obj)
+                    return f.getvalue()
+
+                def func():
+                    pass
+
+                class Old:
+                    def __init__(self, x):
+                        self.x = x
+
+                class OldInitArgs:
+                    def __init__(self, a, b):
+                        self.a = a
+                        self.b = b
+                    def __getinitargs__(self):
+                        return (self.a, self.b)
+
+                class New(object):
+                    def __init__(self, x):
+                        self.x = x
+
+                class WithState(object):
+                    def __getstate__(self):
+                        return {'state': 42}
+                    def __setstate__(self, state):
+                        self.restored = state
+
+                class Reduce(object):
+                    def __init__(self, *args):
+                        self.args = args
+                    def __reduce__(self):
+                        return (Reduce, self.args)
+
+                class MyList(list):
+                    pass
+
+                class MyDict(dict):
+                    pass
+            ''' in mod.__dict__
+            return mod
+        """)
+
+    def test_roundtrip_builtin_types(self):
+        import _pypypickle
+        import pickle
+        values = [None, True, False, 0, 1, -1, 255, 256, 65535, 65536,
+                  2**31 - 1, -2**31, 2**31, 2**62, -2**63, 2**100, -2**100,
+                  0L, -128L, 1.5, -0.0, 1e300, float('inf'),
+                  '', 'abc', 'a' * 300, "it's", '"\'\n\x00\xff',
+                  u'', u'abc', u'\xe9\u1234\U00012345\\\n',
+                  (), (1,), (1, 2), (1, 2, 3), (1, 2, 3, 4),
+                  [], [1, 'a', None], range(2500),
+                  {}, {'a': 1, 2: [3]}, dict.fromkeys(range(1500)),
+                  [(1, 2), {u'x': [1.5, 2L]}]]
+        for proto in [0, 1, 2, -1]:
+            for x in values:
+                s = _pypypickle.dumps(x, proto)
+                assert _pypypickle.loads(s) == x
+                assert pickle.loads(s) == x
+                assert type(_pypypickle.loads(s)) is type(x)
+
+    def test_same_output_as_pickle(self):
+        import _pypypickle
+        mod = self.mod
+        shared = [1, 2]
+        values = [None, True, 42, -2**40, 2**70, 3.25, 'abc', u'\xe9\n',
+                  (1, 2), (1, 2, 3, 4, 5), [shared, shared, (shared,)],
+                  range(2500), {'a': [1], 'b': (2,)}, mod.func, mod.Old,
+                  mod.New, len, int]
+        for proto in [0, 1, 2]:
+            for x in values:
+                assert _pypypickle.dumps(x, proto) == mod.pydumps(x, proto)
+
+    def test_protocol(self):
+        import _pypypickle
+        assert _pypypickle.HIGHEST_PROTOCOL == 2
+        assert _pypypickle.dumps(1) == 'I1\n.'
+        assert _pypypickle.dumps(1, None) == 'I1\n.'
+        assert _pypypickle.dumps(1, -1) == '\x80\x02K\x01.'
+        raises(ValueError, _pypypickle.dumps, 1, 3)
+        raises(ValueError, _pypypickle.loads, '\x80\x03K\x01.')
+
+    def test_recursive(self):
+        import _pypypickle
+        for proto in [0, 1, 2]:
+            l = []
+            l.append(l)
+            l2 = _pypypickle.loads(_pypypickle.dumps(l, proto))
+            assert l2[0] is l2
+            d = {}
+            d['d'] = d
+            d2 = _pypypickle.loads(_pypypickle.dumps(d, proto))
+            assert d2['d'] is d2
+            l = []
+            t = (l,)
+            l.append(t)
+            t2 = _pypypickle.loads(_pypypickle.dumps(t, proto))
+            assert t2[0][0] is t2
+
+    def test_identity_memo(self):
+        import _pypypickle
+        for proto in [0, 1, 2]:
+            a = [1]
+            s = 'x' * 10
+            x = _pypypickle.loads(_pypypickle.dumps([a, a, s, s], proto))
+            assert x[0] is x[1]
+            assert x[2] is x[3]
+            # equal but distinct objects are not shared
+            x = _pypypickle.loads(_pypypickle.dumps([[1], [1]], proto))
+            assert x[0] is not x[1]
+
+    def test_instances(self):
+        import _pypypickle
+        import pickle
+        mod = self.mod
+        for proto in [0, 1, 2]:
+            for loads in [_pypypickle.loads, pickle.loads]:
+                o = loads(_pypypickle.dumps(mod.Old(5), proto))
+                assert o.__class__ is mod.Old
+                assert o.x == 5
+                o = loads(_pypypickle.dumps(mod.OldInitArgs(1, 2), proto))
+                assert (o.a, o.b) == (1, 2)
+                o = loads(_pypypickle.dumps(mod.New([6]), proto))
+                assert type(o) is mod.New
+                assert o.x == [6]
+                o = loads(_pypypickle.dumps(mod.WithState(), proto))
+                assert o.restored == {'state': 42}
+                o = loads(_pypypickle.dumps(mod.Reduce(1, 'a'), proto))
+                assert type(o) is mod.Reduce
+                assert o.args == (1, 'a')
+                l = mod.MyList([1, 2])
+                l.attr = 3
+                o = loads(_pypypickle.dumps(l, proto))
+                assert type(o) is mod.MyList
+                assert o == [1, 2]
+                assert o.attr == 3
+                o = loads(_pypypickle.dumps(mod.MyDict(a=1), proto))
+                assert type(o) is mod.MyDict
+                assert o == {'a': 1}
+
+    def test_newobj(self):
+        import _pypypickle
+        mod = self.mod
+        s = _pypypickle.dumps(mod.New(1), 2)
+        assert '\x81' in s     # NEWOBJ
+        assert 'copy_reg' not in s
+
+    def test_globals(self):
+        import _pypypickle
+        mod = self.mod
+        for proto in [0, 1, 2]:
+            for x in [mod.func, mod.Old, mod.New, len, int, type(None)]:
+                assert _pypypickle.loads(_pypypickle.dumps(x, proto)) is x
+
+    def test_extension_registry(self):
+        import _pypypickle
+        import copy_reg
+        mod = self.mod
+        for code in [0xf0, 0xfff0, 0xfffff0]:
+            copy_reg.add_extension('pypypickle_test', 'New', code)
+            try:
+                s = _pypypickle.dumps(mod.New, 2)
+                assert 'pypypickle_test' not in s
+                assert _pypypickle.loads(s) is mod.New
+                s = _pypypickle.dumps(mod.New, 1)
+                assert 'pypypickle_test' in s
+            finally:
+                copy_reg.remove_extension('pypypickle_test', 'New', code)
+
+    def test_copy_reg_dispatch_table(self):
+        import _pypypickle
+        import copy_reg
+        mod = self.mod
+        def reduce_new(obj):
+            return (mod.Reduce, ('via copy_reg',))
+        copy_reg.pickle(mod.New, reduce_new)
+        try:
+            o = _pypypickle.loads(_pypypickle.dumps(mod.New(1)))
+        finally:
+            del copy_reg.dispatch_table[mod.New]
+        assert type(o) is mod.Reduce
+        assert o.args == ('via copy_reg',)
+
+    def test_pickling_errors(self):
+        import _pypypickle
+        import pickle
+        import sys
+        class BadReduce(object):
+            def __reduce__(self):
+                return 5
+        raises(pickle.PicklingError, _pypypickle.dumps, BadReduce())
+        class Local(object):
+            pass
+        raises(pickle.PicklingError, _pypypickle.dumps, Local)
+        l = []
+        for i in range(sys.getrecursionlimit() * 100):
+            l = [l]
+        raises(RuntimeError, _pypypickle.dumps, l)
+
+    def test_unpickling_errors(self):
+        import _pypypickle
+        import pickle
+        raises(EOFError, _pypypickle.loads, '')
+        raises(EOFError, _pypypickle.loads, 'I1\n')
+        raises(EOFError, _pypypickle.loads, 'T\x05\x00\x00\x00ab')
+        raises(pickle.UnpicklingError, _pypypickle.loads, 'z')
+        raises(pickle.UnpicklingError, _pypypickle.loads, '0.')
+        raises(pickle.UnpicklingError, _pypypickle.loads, 't.')
+        raises(pickle.UnpicklingError, _pypypickle.loads, 'Pxyz\n.')
+        # popping below the topmost mark
+        raises(pickle.UnpicklingError, _pypypickle.loads, ']](al.')
+        raises(pickle.UnpicklingError, _pypypickle.loads, '}I1\nI2\n(sd.')
+        raises(KeyError, _pypypickle.loads, 'h\x05.')
+        raises(ValueError, _pypypickle.loads, "S'abc\n.")
+
+    def test_load_protocol_0_text(self):
+        import _pypypickle
+        assert _pypypickle.loads("S'a\\nb'\np1\n.") == 'a\nb'
+        assert _pypypickle.loads('S"it\'s"\n.') == "it's"
+        assert _pypypickle.loads("I01\n.") is True
+        assert _pypypickle.loads("I00\n.") is False
+        assert _pypypickle.loads("I12345678901234567890\n.") == (
+            12345678901234567890)
+        assert _pypypickle.loads("L5L\n.") == 5L
+        assert _pypypickle.loads("F1.5\n.") == 1.5
+        assert _pypypickle.loads("Vabc\\u1234\n.") == u'abc\u1234'
+        t = _pypypickle.loads("(I1\nI2\n(lp1\ng1\nt.")
+        assert t == (1, 2, [], [])
+        assert t[2] is t[3]
+
+    def test_loads_buffer(self):
+        import _pypypickle
+        s = _pypypickle.dumps([1, 2, 3], 2)
+        assert _pypypickle.loads(buffer(s)) == [1, 2, 3]
+        assert _pypypickle.loads(bytearray(s)) == [1, 2, 3]
+        # extra data is ignored
+        assert _pypypickle.loads(s + 'garbage') == [1, 2, 3]
+
+    def test_dump_load_file(self):
+        import _pypypickle
+        from StringIO import StringIO
+        for proto in [0, 1, 2]:
+            f = StringIO()
+            _pypypickle.dump([1, 'a'], f, proto)
+            _pypypickle.dump({'b': 2.5}, f, proto)
+            f.seek(0)
+            assert _pypypickle.load(f) == [1, 'a']
+            assert _pypypickle.load(f) == {'b': 2.5}
+            raises(EOFError, _pypypickle.load, f)
+
+    def test_dump_load_real_file(self):
+        import _pypypickle
+        import os, tempfile
+        fd, name = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            with open(name, 'wb') as f:
+                for proto in [0, 1, 2]:
+                    _pypypickle.dump(['x', proto, 1.5], f, proto)
+            with open(name, 'rb') as f:
+                for proto in [0, 1, 2]:
+                    assert _pypypickle.load(f) == ['x', proto, 1.5]
+                raises(EOFError, _pypypickle.load, f)
+            # the file is left just after the pickle
+            with open(name, 'ab') as f:
+                f.write('rest\n')
+            with open(name, 'rb') as f:
+                for proto in [0, 1, 2]:
+                    assert _pypypickle.load(f) == ['x', proto, 1.5]
+                assert f.read() == 'rest\n'
+            class MyFile(file):
+                pass
+            with MyFile(name, 'rb') as f:
+                assert _pypypickle.load(f) == ['x', 0, 1.5]
+                assert _pypypickle.load(f) == ['x', 1, 1.5]
+        finally:
+            os.unlink(name)
+
+    def test_cPickle_module_functions(self):
+        import cPickle, _pypypickle
+        assert cPickle.dumps is _pypypickle.dumps
+        assert cPickle.loads is _pypypickle.loads
+        assert cPickle.loads(cPickle.dumps([1, (2,)], 2)) == [1, (2,)]
+        # the classes are still the pure Python ones
+        assert cPickle.Unpickler.__module__ == 'cPickle'
@@ -761,7 +761,7 @@ W_ArrayBase.typedef = TypeDef(
     pop = interpindirect2app(W_ArrayBase.descr_pop),
     insert = interpindirect2app(W_ArrayBase.descr_insert),
 
-    tolist = interp2app(W_ArrayBase.descr_tolist),
+    tolist = interpindirect2app(W_ArrayBase.descr_tolist),
     fromlist = interp2app(W_ArrayBase.descr_fromlist),
     tostring = interp2app(W_ArrayBase.descr_tostring),
     fromstring = interp2app(W_ArrayBase.descr_fromstring),
@@ -1022,6 +1022,25 @@ def make_array(mytype):
 
         # interface
 
+        def descr_tolist(self, space):
+            # for arrays of ints and floats, build a list with the
+            # corresponding unboxed strategy directly
+            if mytype.typecode in 'bBhHil':
+                buf = self.get_buffer()
+                intlist = [0] * self.len
+                for i in range(self.len):
+                    intlist[i] = rffi.cast(lltype.Signed, buf[i])
+                keepalive_until_here(self)
+                return space.newlist_int(intlist)
+            if mytype.typecode in 'fd':
+                buf = self.get_buffer()
+                floatlist = [0.0] * self.len
+                for i in range(self.len):
+                    floatlist[i] = float(buf[i])
+                keepalive_until_here(self)
+                return space.newlist_float(floatlist)
+            return W_ArrayBase.descr_tolist(self, space)
+
         def descr_append(self, space, w_x):
             x = self.item_w(w_x)
             index = self.len
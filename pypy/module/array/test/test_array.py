@@ -377,6 +377,10 @@ class AppTestArray(object):
         l = a.tolist()
         assert type(l) is list and len(l) == 3
         assert a[0] == 1 and a[1] == 2 and a[2] == 3
+        for tc in 'bBhHilfd':
+            l = self.array(tc, [1, 2, 120]).tolist()
+            assert l == [1, 2, 120]
+            assert type(l[2]) is (float if tc in 'fd' else int)
 
         b = self.array('i', a.tostring())
         assert len(b) == 3 and b[0] == 1 and b[1] == 2 and b[2] == 3
@@ -65,6 +65,13 @@ class GcStats(object):
         self.memory_allocated_sum = self._format(self._s.total_allocated_memory + self._s.total_memory_pressure +
                                             self._s.jit_backend_allocated)
         self.total_gc_time = self._s.total_gc_time
+        # number of minor collections where less than 1%, 2%, 4%, ...
+        # 64% of the nursery survived, and then all the others
+        self.nursery_survival = self._s.nursery_survival
+        # resident set size of the process, to compare with the above;
+        # -1 if unknown on this platform
+        self.rss = self._s.rss
+        self.peak_rss = self._s.peak_rss
 
     def _format(self, v):
         if v < 1000000:
@@ -95,7 +102,11 @@ class GcStats(object):
     -----------------------------
     Total:                   %s
 
+    Resident set size (RSS):  %s (peak: %s)
+
     Total time spent in GC:  %s
+    Minor collections by surviving part of the nursery:
+        %s
     """ % (self.total_gc_memory, self.peak_memory,
               self.total_arena_memory,
               self.total_rawmalloced_memory,
@@ -111,7 +122,23 @@ class GcStats(object):
            self.jit_backend_allocated,
            extra,
            self.memory_allocated_sum,
-           self.total_gc_time / 1000.0)
+           self._format_rss(self.rss), self._format_rss(self.peak_rss),
+           self.total_gc_time / 1000.0,
+           self._format_survival())
+
+    def _format_rss(self, v):
+        if v < 0:
+            return "unknown"
+        return self._format(v)
+
+    def _format_survival(self):
+        items = []
+        limit = 1
+        for count in self.nursery_survival[:-1]:
+            items.append("<%d%%: %d" % (limit, count))
+            limit *= 2
+        items.append(">=%d%%: %d" % (limit // 2, self.nursery_survival[-1]))
+        return ", ".join(items)
 
 
 def get_stats(memory_pressure=False):
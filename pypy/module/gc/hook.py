@@ -34,7 +34,8 @@ class LowLevelGcHooks(GcHooks):
     def is_gc_collect_enabled(self):
         return self.w_hooks.gc_collect_enabled
 
-    def on_gc_minor(self, duration, total_memory_used, pinned_objects):
+    def on_gc_minor(self, duration, total_memory_used, pinned_objects,
+                    nursery_size, surviving_size):
         action = self.w_hooks.gc_minor
         action.count += 1
         action.duration += duration
@@ -42,9 +43,12 @@ class LowLevelGcHooks(GcHooks):
         action.duration_max = max(action.duration_max, duration)
         action.total_memory_used = total_memory_used
         action.pinned_objects = pinned_objects
+        action.nursery_size = nursery_size
+        action.surviving_size += surviving_size
         action.fire()
 
-    def on_gc_collect_step(self, duration, oldstate, newstate):
+    def on_gc_collect_step(self, duration, oldstate, newstate,
+                           increment_step, sweep_step, nursery_size):
         action = self.w_hooks.gc_collect_step
         action.count += 1
         action.duration += duration
@@ -52,6 +56,9 @@ class LowLevelGcHooks(GcHooks):
         action.duration_max = max(action.duration_max, duration)
         action.oldstate = oldstate
         action.newstate = newstate
+        action.increment_step = increment_step
+        action.sweep_step = sweep_step
+        action.nursery_size = nursery_size
         action.fire()
 
     def on_gc_collect(self, num_major_collects,
@@ -133,6 +140,7 @@ class NoRecursiveAction(AsyncAction):
 class GcMinorHookAction(NoRecursiveAction):
     total_memory_used = 0
     pinned_objects = 0
+    nursery_size = 0
 
     def __init__(self, space):
         NoRecursiveAction.__init__(self, space)
@@ -144,6 +152,7 @@ class GcMinorHookAction(NoRecursiveAction):
         self.duration = 0.0
         self.duration_min = inf
         self.duration_max = 0.0
+        self.surviving_size = 0
 
     def fix_annotation(self):
         # the annotation of the class and its attributes must be completed
@@ -156,6 +165,8 @@ class GcMinorHookAction(NoRecursiveAction):
             self.duration_max = NonConstant(-53.2)
             self.total_memory_used = NonConstant(r_uint(42))
             self.pinned_objects = NonConstant(-42)
+            self.nursery_size = NonConstant(-42)
+            self.surviving_size = NonConstant(-42)
             self.fire()
 
     def _do_perform(self, ec, frame):
@@ -165,7 +176,9 @@ class GcMinorHookAction(NoRecursiveAction):
             self.duration_min,
             self.duration_max,
             self.total_memory_used,
-            self.pinned_objects)
+            self.pinned_objects,
+            self.nursery_size,
+            self.surviving_size)
         self.reset()
         self.space.call_function(self.w_callable, w_stats)
 
@@ -173,6 +186,9 @@ class GcMinorHookAction(NoRecursiveAction):
 class GcCollectStepHookAction(NoRecursiveAction):
     oldstate = 0
     newstate = 0
+    increment_step = 0
+    sweep_step = 0
+    nursery_size = 0
 
     def __init__(self, space):
         NoRecursiveAction.__init__(self, space)
@@ -196,6 +212,9 @@ class GcCollectStepHookAction(NoRecursiveAction):
             self.duration_max = NonConstant(-53.2)
             self.oldstate = NonConstant(-42)
             self.newstate = NonConstant(-42)
+            self.increment_step = NonConstant(-42)
+            self.sweep_step = NonConstant(-42)
+            self.nursery_size = NonConstant(-42)
             self.fire()
 
     def _do_perform(self, ec, frame):
@@ -206,7 +225,10 @@ class GcCollectStepHookAction(NoRecursiveAction):
             self.duration_max,
             self.oldstate,
             self.newstate,
-            rgc.is_done__states(self.oldstate, self.newstate))
+            rgc.is_done__states(self.oldstate, self.newstate),
+            self.increment_step,
+            self.sweep_step,
+            self.nursery_size)
         self.reset()
         self.space.call_function(self.w_callable, w_stats)
 
@@ -256,13 +278,16 @@ class GcCollectHookAction(NoRecursiveAction):
 class W_GcMinorStats(W_Root):
 
     def __init__(self, count, duration, duration_min, duration_max,
-                 total_memory_used, pinned_objects):
+                 total_memory_used, pinned_objects, nursery_size,
+                 surviving_size):
         self.count = count
         self.duration = duration
         self.duration_min = duration_min
         self.duration_max = duration_max
         self.total_memory_used = total_memory_used
         self.pinned_objects = pinned_objects
+        self.nursery_size = nursery_size
+        self.surviving_size = surviving_size
 
 
 class W_GcCollectStepStats(W_Root):
@@ -284,7 +309,8 @@ class W_GcCollectStepStats(W_Root):
     GC_STATES = tuple(incminimark.GC_STATES + ['USERDEL'])
 
     def __init__(self, count, duration, duration_min, duration_max,
-                 oldstate, newstate, major_is_done):
+                 oldstate, newstate, major_is_done,
+                 increment_step, sweep_step, nursery_size):
         self.count = count
         self.duration = duration
         self.duration_min = duration_min
@@ -292,6 +318,9 @@ class W_GcCollectStepStats(W_Root):
         self.oldstate = oldstate
         self.newstate = newstate
         self.major_is_done = major_is_done
+        self.increment_step = increment_step
+        self.sweep_step = sweep_step
+        self.nursery_size = nursery_size
 
 
 class W_GcCollectStats(W_Root):
@@ -346,7 +375,9 @@ W_GcMinorStats.typedef = TypeDef(
         "duration_min",
         "duration_max",
         "total_memory_used",
-        "pinned_objects"))
+        "pinned_objects",
+        "nursery_size",
+        "surviving_size"))
     )
 
 W_GcCollectStepStats.typedef = TypeDef(
@@ -367,7 +398,10 @@ W_GcCollectStepStats.typedef = TypeDef(
         "duration_min",
         "duration_max",
         "oldstate",
-        "newstate"))
+        "newstate",
+        "increment_step",
+        "sweep_step",
+        "nursery_size"))
     )
 
 W_GcCollectStats.typedef = TypeDef(
@@ -110,6 +110,7 @@ class StepCollector(object):
                 self.finalizing = True
         #
         duration = -1
+        unknown_size = -1
         return W_GcCollectStepStats(
             count = 1,
             duration = duration,
@@ -117,7 +118,10 @@ class StepCollector(object):
             duration_max = duration,
             oldstate = oldstate,
             newstate = newstate,
-            major_is_done = major_is_done)
+            major_is_done = major_is_done,
+            increment_step = unknown_size,
+            sweep_step = unknown_size,
+            nursery_size = unknown_size)
 
     def _collect_step(self):
         return rgc.collect_step()
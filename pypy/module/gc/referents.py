@@ -1,6 +1,7 @@
 from rpython.rlib import rgc, jit_hooks
 from pypy.interpreter.baseobjspace import W_Root
-from pypy.interpreter.typedef import TypeDef, interp_attrproperty
+from pypy.interpreter.typedef import (TypeDef, interp_attrproperty,
+    GetSetProperty)
 from pypy.interpreter.gateway import unwrap_spec, interp2app
 from pypy.interpreter.error import oefmt, wrap_oserror
 from rpython.rlib.objectmodel import we_are_translated
@@ -190,6 +191,15 @@ class W_GcStats(W_Root):
         self.peak_rawmalloced_memory = rgc.get_stats(rgc.PEAK_RAWMALLOCED_MEMORY)
         self.nursery_size = rgc.get_stats(rgc.NURSERY_SIZE)
         self.total_gc_time = rgc.get_stats(rgc.TOTAL_GC_TIME)
+        self.nursery_survival = [
+            rgc.get_stats(rgc.NURSERY_SURVIVAL + i)
+            for i in range(rgc.NURSERY_SURVIVAL_BUCKETS)]
+        self.rss = rgc.get_stats(rgc.RSS_MEMORY)
+        self.peak_rss = rgc.get_stats(rgc.PEAK_RSS_MEMORY)
+
+    def descr_get_nursery_survival(self, space):
+        return space.newlist([space.newint(n)
+                              for n in self.nursery_survival])
 
 W_GcStats.typedef = TypeDef("GcStats",
     total_memory_pressure=interp_attrproperty("total_memory_pressure",
@@ -218,6 +228,11 @@ W_GcStats.typedef = TypeDef("GcStats",
         cls=W_GcStats, wrapfn="newint"),
     total_gc_time=interp_attrproperty("total_gc_time",
         cls=W_GcStats, wrapfn="newint"),
+    nursery_survival=GetSetProperty(W_GcStats.descr_get_nursery_survival),
+    rss=interp_attrproperty("rss",
+        cls=W_GcStats, wrapfn="newint"),
+    peak_rss=interp_attrproperty("peak_rss",
+        cls=W_GcStats, wrapfn="newint"),
 )
 
 @unwrap_spec(memory_pressure=bool)
@@ -12,13 +12,19 @@ class AppTestGcHooks(object):
         space = cls.space
         gchooks = space.fromcache(LowLevelGcHooks)
 
-        @unwrap_spec(ObjSpace, int, r_uint, int)
-        def fire_gc_minor(space, duration, total_memory_used, pinned_objects):
-            gchooks.fire_gc_minor(duration, total_memory_used, pinned_objects)
-
-        @unwrap_spec(ObjSpace, int, int, int)
-        def fire_gc_collect_step(space, duration, oldstate, newstate):
-            gchooks.fire_gc_collect_step(duration, oldstate, newstate)
+        @unwrap_spec(ObjSpace, int, r_uint, int, int, int)
+        def fire_gc_minor(space, duration, total_memory_used, pinned_objects,
+                          nursery_size=0, surviving_size=0):
+            gchooks.fire_gc_minor(duration, total_memory_used, pinned_objects,
+                                  nursery_size, surviving_size)
+
+        @unwrap_spec(ObjSpace, int, int, int, int, int, int)
+        def fire_gc_collect_step(space, duration, oldstate, newstate,
+                                 increment_step=0, sweep_step=0,
+                                 nursery_size=0):
+            gchooks.fire_gc_collect_step(duration, oldstate, newstate,
+                                         increment_step, sweep_step,
+                                         nursery_size)
 
         @unwrap_spec(ObjSpace, int, int, int, r_uint, r_uint, r_uint)
         def fire_gc_collect(space, a, b, c, d, e, f):
@@ -26,11 +32,11 @@ class AppTestGcHooks(object):
 
         @unwrap_spec(ObjSpace)
         def fire_many(space):
-            gchooks.fire_gc_minor(5.0, 0, 0)
-            gchooks.fire_gc_minor(7.0, 0, 0)
-            gchooks.fire_gc_collect_step(5.0, 0, 0)
-            gchooks.fire_gc_collect_step(15.0, 0, 0)
-            gchooks.fire_gc_collect_step(22.0, 0, 0)
+            gchooks.fire_gc_minor(5.0, 0, 0, 0, 0)
+            gchooks.fire_gc_minor(7.0, 0, 0, 0, 0)
+            gchooks.fire_gc_collect_step(5.0, 0, 0, 0, 0, 0)
+            gchooks.fire_gc_collect_step(15.0, 0, 0, 0, 0, 0)
+            gchooks.fire_gc_collect_step(22.0, 0, 0, 0, 0, 0)
             gchooks.fire_gc_collect(1, 2, 3, 4, 5, 6)
 
         cls.w_fire_gc_minor = space.wrap(interp2app(fire_gc_minor))
@@ -67,6 +73,19 @@ class AppTestGcHooks(object):
             (1, 40, 50, 60),
             ]
 
+    def test_on_gc_minor_sizes(self):
+        import gc
+        lst = []
+        def on_gc_minor(stats):
+            lst.append((stats.count,
+                        stats.nursery_size,
+                        stats.surviving_size))
+        gc.hooks.on_gc_minor = on_gc_minor
+        self.fire_gc_minor(10, 20, 30, 4096, 100)
+        self.fire_gc_minor(10, 20, 30, 8192, 200)
+        assert lst == [(1, 4096, 100), (1, 8192, 200)]
+        gc.hooks.on_gc_minor = None
+
     def test_on_gc_collect_step(self):
         import gc
         SCANNING = 0
@@ -93,6 +112,20 @@ class AppTestGcHooks(object):
         self.fire_gc_collect_step(70, SCANNING, MARKING)  # won't fire
         assert lst == oldlst
 
+    def test_on_gc_collect_step_sizes(self):
+        import gc
+        MARKING = 1
+        lst = []
+        def on_gc_collect_step(stats):
+            lst.append((stats.increment_step,
+                        stats.sweep_step,
+                        stats.nursery_size))
+        gc.hooks.on_gc_collect_step = on_gc_collect_step
+        self.fire_gc_collect_step(10, MARKING, MARKING, 4096, 3072, 1024)
+        self.fire_gc_collect_step(10, MARKING, MARKING, 2048, 3072, 512)
+        assert lst == [(4096, 3072, 1024), (2048, 3072, 512)]
+        gc.hooks.on_gc_collect_step = None
+
     def test_on_gc_collect(self):
         import gc
         lst = []
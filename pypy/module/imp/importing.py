@@ -870,11 +870,13 @@ def getimportlock(space):
 # CPython leaves a gap of 10 when it increases its own magic number.
 # To avoid assigning exactly the same numbers as CPython, we can pick
 # any number between CPython + 2 and CPython + 9.  Right now,
-# default_magic = CPython + 7.
+# default_magic = CPython + 8.
 #
 #     CPython + 0                  -- used by CPython without the -U option
 #     CPython + 1                  -- used by CPython with the -U option
-#     CPython + 7 = default_magic  -- used by PyPy (incompatible!)
+#     CPython + 7                  -- used by older PyPys
+#     CPython + 8 = default_magic  -- used by PyPy (incompatible!), which
+#                                     added the LOAD_FAST_LOAD_* opcodes
 #
 from pypy.interpreter.pycode import default_magic
 MARSHAL_VERSION_FOR_PYC = 2
@@ -2,6 +2,9 @@ from pypy.interpreter.mixedmodule import MixedModule
 
 class Module(MixedModule):
     appleveldefs = {
+        'warmstart': 'app_warmstart.warmstart',
+        'load_warmstart_profile': 'app_warmstart.load_warmstart_profile',
+        'save_warmstart_profile': 'app_warmstart.save_warmstart_profile',
     }
 
     interpleveldefs = {
@@ -12,11 +15,18 @@ class Module(MixedModule):
         'dont_trace_here': 'interp_jit.dont_trace_here',
         'trace_next_iteration': 'interp_jit.trace_next_iteration',
         'trace_next_iteration_hash': 'interp_jit.trace_next_iteration_hash',
+        'set_warmstart_profile': 'interp_warmstart.set_warmstart_profile',
+        'get_warmstart_profile': 'interp_warmstart.get_warmstart_profile',
         'set_compile_hook': 'interp_resop.set_compile_hook',
         'set_abort_hook': 'interp_resop.set_abort_hook',
         'set_trace_too_long_hook': 'interp_resop.set_trace_too_long_hook',
+        'set_trace_segment_hook': 'interp_resop.set_trace_segment_hook',
         'get_stats_snapshot': 'interp_resop.get_stats_snapshot',
         'get_stats_asmmemmgr': 'interp_resop.get_stats_asmmemmgr',
+        'get_stats_loop_memory': 'interp_resop.get_stats_loop_memory',
+        'get_stats_loop_profile': 'interp_resop.get_stats_loop_profile',
+        'enable_loop_profile': 'interp_resop.enable_loop_profile',
+        'disable_loop_profile': 'interp_resop.disable_loop_profile',
         # those things are disabled because they have bugs, but if
         # they're found to be useful, fix test_ztranslation_jit_stats
         # in the backend first. get_stats_snapshot still produces
@@ -0,0 +1,39 @@
+def load_warmstart_profile(filename):
+    """Read a warm-start profile saved by save_warmstart_profile() and pass
+    it to set_warmstart_profile().  A missing or unreadable file gives an
+    empty profile, so that the recording starts anyway."""
+    import marshal, pypyjit
+    try:
+        f = open(filename, 'rb')
+    except IOError:
+        profile = []
+    else:
+        try:
+            try:
+                profile = marshal.load(f)
+            except (EOFError, ValueError, TypeError):
+                profile = []
+        finally:
+            f.close()
+    pypyjit.set_warmstart_profile(profile)
+
+def save_warmstart_profile(filename):
+    """Write the result of get_warmstart_profile() to 'filename'.  The file
+    is replaced atomically, so that several processes can share it."""
+    import marshal, os, pypyjit
+    profile = pypyjit.get_warmstart_profile()
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    f = open(tmpname, 'wb')
+    try:
+        marshal.dump(profile, f)
+    finally:
+        f.close()
+    os.rename(tmpname, filename)
+
+def warmstart(filename):
+    """Load the warm-start profile from 'filename', and save the updated
+    profile into the same file when the process exits.  Call this early,
+    before the modules that should benefit from it are imported."""
+    import atexit
+    load_warmstart_profile(filename)
+    atexit.register(save_warmstart_profile, filename)
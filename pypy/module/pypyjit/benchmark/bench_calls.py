@@ -0,0 +1,63 @@
+""" A call-heavy program: a deep chain of framework-like functions around a
+few small helpers.  Compare the timings of
+
+    pypy bench_calls.py
+    pypy --jit inline_max_size=80,inline_hot_size=20 bench_calls.py
+
+With the default parameters the loop in main() tries to inline the whole
+chain, and the functions are only marked as not inlinable one by one,
+after each trace too long.  With inline_max_size the functions with more
+than 80 bytes of bytecode are compiled from their start and called
+directly from the first trace, and with inline_hot_size the tiny helpers
+clamp() and scale() are inlined even after being marked as not inlinable.
+"""
+
+import sys, time
+
+def clamp(x):
+    if x < 0:
+        return 0
+    return x
+
+def scale(x, factor):
+    return clamp(x * factor) // 3
+
+def validate(record):
+    total = 0
+    for key in ('a', 'b', 'c', 'd'):
+        value = record.get(key, 0)
+        if value < 0:
+            raise ValueError(key)
+        total += scale(value, 2)
+    if total > 1000000:
+        total = total % 1000000
+    return total
+
+def transform(record):
+    result = {}
+    for key, value in record.items():
+        result[key] = scale(value, 3) + clamp(value - 5)
+    result['sum'] = validate(result)
+    return result
+
+def handle(record):
+    record = transform(record)
+    record = transform(record)
+    return validate(record) + scale(record['sum'], 5)
+
+def dispatch(request):
+    if request % 7 == 0:
+        return handle({'a': request, 'b': 1, 'c': 2, 'd': 3})
+    return handle({'a': request, 'b': request, 'c': 1, 'd': request % 11})
+
+def main(n):
+    total = 0
+    for i in xrange(n):
+        total += dispatch(i)
+    return total
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    t0 = time.time()
+    main(n)
+    print "%d requests take: %f" % (n, time.time() - t0)
@@ -4,7 +4,8 @@ from rpython.rlib.jit import JitHookInterface, Counters
 
 from pypy.interpreter.error import OperationError
 from pypy.module.pypyjit.interp_resop import (Cache, wrap_greenkey,
-    WrappedOp, W_JitLoopInfo, wrap_oplist)
+    unwrap_greenkey, WrappedOp, W_JitLoopInfo, wrap_oplist)
+from pypy.module.pypyjit.interp_warmstart import WarmStartCache
 
 class PyPyJitIface(JitHookInterface):
     def are_hooks_enabled(self):
@@ -12,7 +13,9 @@ class PyPyJitIface(JitHookInterface):
         cache = space.fromcache(Cache)
         return (cache.w_compile_hook is not None or
                 cache.w_abort_hook is not None or
-                cache.w_trace_too_long_hook is not None)
+                cache.w_trace_too_long_hook is not None or
+                cache.w_trace_segment_hook is not None or
+                space.fromcache(WarmStartCache).enabled)
 
 
     def on_abort(self, reason, jitdriver, greenkey, greenkey_repr, logops, operations):
@@ -36,20 +39,31 @@ class PyPyJitIface(JitHookInterface):
             finally:
                 cache.in_recursion = False
 
-    def on_trace_too_long(self, jitdriver, greenkey, greenkey_repr):
+    def on_trace_too_long(self, jitdriver, greenkey, greenkey_repr,
+                          segmented, count):
         space = self.space
         cache = space.fromcache(Cache)
         if cache.in_recursion:
             return
-        if cache.w_trace_too_long_hook is not None:
+        if segmented:
+            w_hook = cache.w_trace_segment_hook
+        else:
+            w_hook = cache.w_trace_too_long_hook
+        if w_hook is not None:
             cache.in_recursion = True
             try:
                 try:
-                    space.call_function(cache.w_trace_too_long_hook,
-                        space.newtext(jitdriver.name),
-                        wrap_greenkey(space, jitdriver, greenkey, greenkey_repr))
+                    w_greenkey = wrap_greenkey(space, jitdriver, greenkey,
+                                               greenkey_repr)
+                    if segmented:
+                        space.call_function(w_hook,
+                            space.newtext(jitdriver.name), w_greenkey,
+                            space.newint(count))
+                    else:
+                        space.call_function(w_hook,
+                            space.newtext(jitdriver.name), w_greenkey)
                 except OperationError as e:
-                    e.write_unraisable(space, "jit hook", cache.w_trace_too_long_hook)
+                    e.write_unraisable(space, "jit hook", w_hook)
             finally:
                 cache.in_recursion = False
 
@@ -67,6 +81,8 @@ class PyPyJitIface(JitHookInterface):
 
     def _compile_hook(self, debug_info, is_bridge):
         space = self.space
+        if not is_bridge:
+            self._record_warmstart(debug_info)
         cache = space.fromcache(Cache)
         if cache.in_recursion:
             return
@@ -83,4 +99,12 @@ class PyPyJitIface(JitHookInterface):
             finally:
                 cache.in_recursion = False
 
+    def _record_warmstart(self, debug_info):
+        warmstart = self.space.fromcache(WarmStartCache)
+        if (warmstart.enabled and debug_info.greenkey is not None and
+                debug_info.get_jitdriver().name == 'pypyjit'):
+            pycode, next_instr, is_being_profiled = unwrap_greenkey(
+                debug_info.greenkey)
+            warmstart.record_loop(pycode, next_instr, is_being_profiled)
+
 pypy_hooks = PyPyJitIface()
@@ -61,6 +61,9 @@ def get_location(next_instr, is_being_profiled, bytecode):
 def should_unroll_one_iteration(next_instr, is_being_profiled, bytecode):
     return (bytecode.co_flags & CO_GENERATOR) != 0
 
+def get_code_size(next_instr, is_being_profiled, bytecode):
+    return len(bytecode.co_code)
+
 class PyPyJitDriver(JitDriver):
     reds = ['frame', 'ec']
     greens = ['next_instr', 'is_being_profiled', 'pycode']
@@ -71,6 +74,7 @@ pypyjitdriver = PyPyJitDriver(get_printable_location = get_printable_location,
                               get_unique_id = get_unique_id,
                               should_unroll_one_iteration =
                               should_unroll_one_iteration,
+                              get_code_size = get_code_size,
                               name='pypyjit',
                               is_recursive=True)
 
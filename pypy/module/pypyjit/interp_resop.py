@@ -24,24 +24,31 @@ class Cache(object):
         self.w_compile_hook = None
         self.w_abort_hook = None
         self.w_trace_too_long_hook = None
+        self.w_trace_segment_hook = None
         self.compile_hook_with_ops = False
 
     def getno(self):
         self.no += 1
         return self.no - 1
 
+def unwrap_greenkey(greenkey):
+    """Return the pycode, next_instr and is_being_profiled of a greenkey
+    of the 'pypyjit' jitdriver."""
+    next_instr = greenkey[0].getint()
+    is_being_profiled = greenkey[1].getint()
+    ll_code = lltype.cast_opaque_ptr(lltype.Ptr(OBJECT),
+                                     greenkey[2].getref_base())
+    pycode = cast_base_ptr_to_instance(PyCode, ll_code)
+    return pycode, next_instr, bool(is_being_profiled)
+
 def wrap_greenkey(space, jitdriver, greenkey, greenkey_repr):
     if greenkey is None:
         return space.w_None
     jitdriver_name = jitdriver.name
     if jitdriver_name == 'pypyjit':
-        next_instr = greenkey[0].getint()
-        is_being_profiled = greenkey[1].getint()
-        ll_code = lltype.cast_opaque_ptr(lltype.Ptr(OBJECT),
-                                         greenkey[2].getref_base())
-        pycode = cast_base_ptr_to_instance(PyCode, ll_code)
+        pycode, next_instr, is_being_profiled = unwrap_greenkey(greenkey)
         return space.newtuple([pycode, space.newint(next_instr),
-                               space.newbool(bool(is_being_profiled))])
+                               space.newbool(is_being_profiled)])
     else:
         return space.newtext(greenkey_repr)
 
@@ -100,6 +107,26 @@ def set_trace_too_long_hook(space, w_hook):
     cache.w_trace_too_long_hook = w_hook
     cache.in_recursion = NonConstant(False)
 
+def set_trace_segment_hook(space, w_hook):
+    """ set_trace_segment_hook(hook)
+
+    Set a hook (callable) that will be called each time a trace is too
+    long, but is compiled up to the current position instead of being
+    aborted.  The rest of it will be traced as a bridge.
+
+    The hook will be called with the signature:
+
+        hook(jitdriver_name, greenkey, count)
+
+    greenkey is the one of the loop, or None if the trace was itself a
+    bridge.  count is the number of segments compiled so far.
+    """
+    cache = space.fromcache(Cache)
+    if space.is_w(w_hook, space.w_None):
+        w_hook = None
+    cache.w_trace_segment_hook = w_hook
+    cache.in_recursion = NonConstant(False)
+
 def wrap_oplist(space, logops, operations, ops_offset=None):
     # this function is called from the JIT
     from rpython.jit.metainterp.resoperation import rop
@@ -397,6 +424,60 @@ def get_stats_asmmemmgr(space):
     m2 = jit_hooks.stats_asmmemmgr_used(None)
     return space.newtuple([space.newint(m1), space.newint(m2)])
 
+def get_stats_loop_memory(space):
+    """Returns the memory used by the loops that the JIT keeps alive, as
+    a pair (total_memory, {loop_number: (code_size, resume_size)}).  The
+    sizes are in bytes.  When the total goes above the JIT parameter
+    'loop_memory_limit', the least recently used loops are freed."""
+    total = jit_hooks.stats_loop_memory_used(None)
+    ll_loops = jit_hooks.stats_get_loop_memory(None)
+    w_loops = space.newdict()
+    if ll_loops:
+        for i in range(len(ll_loops)):
+            w_sizes = space.newtuple([space.newint(ll_loops[i].code_size),
+                                      space.newint(ll_loops[i].resume_size)])
+            space.setitem(w_loops, space.newint(ll_loops[i].number), w_sizes)
+    return space.newtuple([space.newint(total), w_loops])
+
+def enable_loop_profile(space):
+    """ Start counting how many times each compiled loop is entered from
+    the interpreter, how many times each guard fails back to the
+    interpreter, and how many bridges are compiled from each guard.  The
+    previous counts are cleared.  See get_stats_loop_profile().
+    """
+    jit_hooks.stats_set_loop_profile(None, True)
+
+def disable_loop_profile(space):
+    """ Stop counting, but keep the counts so far.
+    """
+    jit_hooks.stats_set_loop_profile(None, False)
+
+def get_stats_loop_profile(space):
+    """Returns the counts recorded since enable_loop_profile(), as a pair
+    ({loop_no: entries}, {guard_no: (loop_no, failures, bridges)}).  The
+    loop numbers are the ones of JitLoopInfo.loop_no and of the jitlog.
+    The guard numbers are the ones of JitLoopInfo.bridge_no, of the
+    'b' keys of get_stats_snapshot().loop_run_times and of the jitlog.
+    Failures are only counted while the guard has no bridge; after that,
+    the runs of the bridge are counted in loop_run_times."""
+    ll_loops = jit_hooks.stats_get_loop_entries(None)
+    w_loops = space.newdict()
+    if ll_loops:
+        for i in range(len(ll_loops)):
+            space.setitem(w_loops, space.newint(ll_loops[i].number),
+                          space.newint(ll_loops[i].entries))
+    ll_guards = jit_hooks.stats_get_guard_failures(None)
+    w_guards = space.newdict()
+    if ll_guards:
+        for i in range(len(ll_guards)):
+            w_counts = space.newtuple([
+                space.newint(ll_guards[i].loop_number),
+                space.newint(ll_guards[i].failures),
+                space.newint(ll_guards[i].bridges)])
+            space.setitem(w_guards, space.newint(ll_guards[i].number),
+                          w_counts)
+    return space.newtuple([w_loops, w_guards])
+
 def enable_debug(space):
     """ Set the jit debugging - completely necessary for some stats to work,
     most notably assembler counters.
@@ -0,0 +1,216 @@
+"""
+Warm-start profiles: remember at which bytecode positions the JIT compiled
+loops, and how far the JIT counters of the other loops of the same code
+objects got.  A later run of the program can load this profile, so that
+these loops are traced the first time they are reached instead of after
+'threshold' iterations.
+
+Code objects are identified by their co_filename, co_firstlineno and
+co_name, because the greenkeys used by the JIT contain the code object
+itself, whose identity changes from one run to the next.  The guards that
+had a bridge attached are not part of the profile: they only exist in the
+machine code of a given run.
+"""
+
+import weakref
+
+from pypy.interpreter.error import oefmt
+from pypy.interpreter.pycode import CodeHookCache
+from pypy.tool.stdlib_opcode import opcodedesc, HAVE_ARGUMENT
+from rpython.rlib import jit_hooks
+from rpython.rlib.jit import dont_look_inside
+from rpython.rlib.objectmodel import we_are_translated
+from rpython.rlib.rarithmetic import r_uint
+from rpython.rtyper.annlowlevel import cast_instance_to_gcref
+
+# the counter value recorded for the positions where a loop was compiled
+HOT = 1.0
+# restored counters are capped to this value, like trace_next_iteration()
+MAX_COUNTER = 0.98
+
+
+class CodeProfile(object):
+    """The profile of all code objects with the same code_key()."""
+
+    def __init__(self, filename, firstlineno, name):
+        self.filename = filename
+        self.firstlineno = firstlineno
+        self.name = name
+        # maps 'next_instr * 2 + is_being_profiled' to a counter value
+        self.counters = {}
+        # the last code object with this key created in this process
+        self.code_ref = None
+
+    def set_counter(self, next_instr, is_being_profiled, value):
+        self.counters[next_instr * 2 + int(is_being_profiled)] = value
+
+    def get_code(self):
+        if self.code_ref is None:
+            return None
+        return self.code_ref()
+
+    def update_counters(self, pycode):
+        """Read the current JIT counters of the loops in 'pycode'."""
+        for next_instr in loop_header_positions(pycode):
+            key = next_instr * 2
+            if self.counters.get(key, 0.0) >= HOT:
+                continue
+            value = get_counter(pycode, next_instr)
+            if value > 0.0:
+                self.counters[key] = value
+            elif key in self.counters:
+                del self.counters[key]
+
+
+class WarmStartCache(object):
+    def __init__(self, space):
+        self.space = space
+        self.enabled = False
+        self.profiles = {}
+
+    def get_profile(self, filename, firstlineno, name):
+        key = code_key(filename, firstlineno, name)
+        profile = self.profiles.get(key, None)
+        if profile is None:
+            profile = CodeProfile(filename, firstlineno, name)
+            self.profiles[key] = profile
+        return profile
+
+    def record_loop(self, pycode, next_instr, is_being_profiled):
+        """Called when the JIT compiled a loop starting at this greenkey."""
+        profile = self.get_profile(pycode.co_filename, pycode.co_firstlineno,
+                                   pycode.co_name)
+        profile.code_ref = weakref.ref(pycode)
+        profile.set_counter(next_instr, is_being_profiled, HOT)
+
+
+def code_key(filename, firstlineno, name):
+    return '%s\x00%d\x00%s' % (filename, firstlineno, name)
+
+def loop_header_positions(pycode):
+    """Return the positions where the JIT counts iterations in 'pycode':
+    the start of the code, and the targets of backward jumps."""
+    co_code = pycode.co_code
+    result = [0]
+    i = 0
+    while i < len(co_code):
+        start = i
+        opcode = ord(co_code[i])
+        if opcode < HAVE_ARGUMENT:
+            i += 1
+            continue
+        if i + 2 >= len(co_code):
+            break
+        oparg = ord(co_code[i + 1]) | (ord(co_code[i + 2]) << 8)
+        i += 3
+        # like in pyopcode.py, EXTENDED_ARG gives the high bits of the
+        # argument of the following opcode
+        while opcode == opcodedesc.EXTENDED_ARG.index:
+            if i + 2 >= len(co_code):
+                return result
+            opcode = ord(co_code[i])
+            if opcode < HAVE_ARGUMENT:
+                return result    # corrupted bytecode
+            oparg = ((oparg << 16) | ord(co_code[i + 1]) |
+                     (ord(co_code[i + 2]) << 8))
+            i += 3
+        if (opcode == opcodedesc.JUMP_ABSOLUTE.index or
+                opcode == opcodedesc.CONTINUE_LOOP.index):
+            if oparg <= start and oparg not in result:
+                result.append(oparg)
+    return result
+
+# the jit_hooks only work in a translated pypy-c
+
+@dont_look_inside
+def get_counter(pycode, next_instr):
+    if not we_are_translated():
+        return 0.0
+    return jit_hooks.get_counter_at_key(
+        'pypyjit', r_uint(next_instr), 0, cast_instance_to_gcref(pycode))
+
+@dont_look_inside
+def seed_counter(pycode, next_instr, is_being_profiled, value):
+    if not we_are_translated():
+        return
+    ll_pycode = cast_instance_to_gcref(pycode)
+    if value >= HOT:
+        jit_hooks.warm_start_at_key(
+            'pypyjit', r_uint(next_instr), is_being_profiled, ll_pycode)
+    else:
+        jit_hooks.set_counter_at_key(
+            'pypyjit', min(value, MAX_COUNTER), r_uint(next_instr),
+            is_being_profiled, ll_pycode)
+
+def new_code_hook(pycode):
+    cache = pycode.space.fromcache(WarmStartCache)
+    profile = cache.profiles.get(code_key(pycode.co_filename,
+                                          pycode.co_firstlineno,
+                                          pycode.co_name), None)
+    if profile is not None:
+        profile.code_ref = weakref.ref(pycode)
+        for key, value in profile.counters.items():
+            seed_counter(pycode, key >> 1, key & 1, value)
+
+
+def set_warmstart_profile(space, w_profile):
+    """ set_warmstart_profile(profile)
+
+    Start recording a warm-start profile, using 'profile' as a starting
+    point.  It is a list of tuples in the format returned by
+    get_warmstart_profile().  The loops of code objects created from now
+    on that were hot according to 'profile' are traced the first time
+    they are reached, and the other JIT counters of these code objects
+    start with the recorded values.
+    """
+    profiles = {}
+    cache = space.fromcache(WarmStartCache)
+    for w_item in space.listview(w_profile):
+        items_w = space.fixedview(w_item)
+        if len(items_w) != 6:
+            raise oefmt(space.w_TypeError,
+                        "warm-start profile entries must be tuples of 6 "
+                        "items")
+        filename = space.text_w(items_w[0])
+        firstlineno = space.int_w(items_w[1])
+        name = space.text_w(items_w[2])
+        next_instr = space.int_w(items_w[3])
+        is_being_profiled = space.is_true(items_w[4])
+        value = space.float_w(items_w[5])
+        if next_instr < 0:
+            raise oefmt(space.w_ValueError, "negative bytecode position")
+        key = code_key(filename, firstlineno, name)
+        profile = profiles.get(key, None)
+        if profile is None:
+            profile = CodeProfile(filename, firstlineno, name)
+            profiles[key] = profile
+        profile.set_counter(next_instr, is_being_profiled, value)
+    cache.profiles = profiles
+    cache.enabled = True
+    space.fromcache(CodeHookCache)._interp_code_hook = new_code_hook
+
+def get_warmstart_profile(space):
+    """ get_warmstart_profile() -> list
+
+    Return the warm-start profile recorded since the last call to
+    set_warmstart_profile(), as a list of tuples (co_filename,
+    co_firstlineno, co_name, next_instr, is_being_profiled, counter).
+    'counter' is 1.0 for the positions where a loop was compiled, and
+    the value of the JIT counter, between 0.0 and 1.0, for the other
+    loops of the same code objects.
+    """
+    cache = space.fromcache(WarmStartCache)
+    result_w = []
+    for profile in cache.profiles.values():
+        pycode = profile.get_code()
+        if pycode is not None:
+            profile.update_counters(pycode)
+        w_filename = space.newtext(profile.filename)
+        w_firstlineno = space.newint(profile.firstlineno)
+        w_name = space.newtext(profile.name)
+        for key, value in profile.counters.items():
+            result_w.append(space.newtuple([
+                w_filename, w_firstlineno, w_name,
+                space.newint(key >> 1), space.newbool(bool(key & 1)),
+                space.newfloat(value)]))
+    return space.newlist(result_w)
@@ -115,16 +115,27 @@ class AppTestJitHook(object):
                                     greenkey, 'blah', Logger(MockSD),
                                     cls.oplist_no_descrs)
 
+        def interp_on_trace_too_long():
+            if pypy_hooks.are_hooks_enabled():
+                pypy_hooks.on_trace_too_long(pypyjitdriver, greenkey, 'blah',
+                                             False, 1)
+                pypy_hooks.on_trace_too_long(pypyjitdriver, None, '',
+                                             True, 2)
+
         space = cls.space
         cls.w_on_compile = space.wrap(interp2app(interp_on_compile))
         cls.w_on_compile_bridge = space.wrap(interp2app(interp_on_compile_bridge))
         cls.w_on_abort = space.wrap(interp2app(interp_on_abort))
+        cls.w_on_trace_too_long = space.wrap(
+            interp2app(interp_on_trace_too_long))
         cls.w_int_add_num = space.wrap(rop.INT_ADD)
         cls.w_dmp_num = space.wrap(rop.DEBUG_MERGE_POINT)
         cls.w_on_optimize = space.wrap(interp2app(interp_on_optimize))
         cls.orig_oplist = oplist
         cls.orig_oplist_no_descrs = oplist_no_descrs
         cls.w_sorted_keys = space.wrap(sorted(Counters.counter_names))
+        cls.w_profile_filename = space.wrap(
+            str(py.test.ensuretemp('jit_hook').join('warmstart.profile')))
 
     def setup_method(self, meth):
         self.__class__.oplist = self.orig_oplist[:]
@@ -244,6 +255,35 @@ class AppTestJitHook(object):
         assert len(ops) == 4
         assert ops[2].hash == 0
 
+    def test_on_trace_too_long(self):
+        import pypyjit
+        l = []
+        segments = []
+
+        def hook(jitdriver_name, greenkey):
+            l.append((jitdriver_name, greenkey))
+
+        def segment_hook(jitdriver_name, greenkey, count):
+            segments.append((jitdriver_name, greenkey, count))
+
+        pypyjit.set_trace_too_long_hook(hook)
+        self.on_trace_too_long()
+        assert len(l) == 1
+        name, greenkey = l[0]
+        assert name == 'pypyjit'
+        assert greenkey[0].co_name == 'function'
+        assert greenkey[1:] == (0, False)
+        assert segments == []
+        pypyjit.set_trace_segment_hook(segment_hook)
+        self.on_trace_too_long()
+        assert len(l) == 2
+        assert segments == [('pypyjit', None, 2)]
+        pypyjit.set_trace_too_long_hook(None)
+        pypyjit.set_trace_segment_hook(None)
+        self.on_trace_too_long()
+        assert len(l) == 2
+        assert len(segments) == 1
+
     def test_creation(self):
         from pypyjit import ResOperation
 
@@ -270,6 +310,48 @@ class AppTestJitHook(object):
         raises(AttributeError, 'op.pycode')
         assert op.call_depth == 5
 
+    def test_warmstart_profile(self):
+        import pypyjit
+        code = self.f.func_code
+        pypyjit.set_warmstart_profile([])
+        assert pypyjit.get_warmstart_profile() == []
+        self.on_compile()
+        self.on_compile_bridge()
+        entry = (code.co_filename, code.co_firstlineno, 'function',
+                 0, False, 1.0)
+        assert pypyjit.get_warmstart_profile() == [entry]
+        #
+        other = ('other.py', 5, 'g', 12, False, 0.5)
+        pypyjit.set_warmstart_profile([entry, other])
+        assert sorted(pypyjit.get_warmstart_profile()) == sorted(
+            [entry, other])
+        # code objects that match an entry of the profile
+        exec compile("def g():\n    pass\n" * 3, 'other.py', 'exec')
+        assert other in pypyjit.get_warmstart_profile()
+        #
+        raises(TypeError, pypyjit.set_warmstart_profile, [(1, 2)])
+        raises(TypeError, pypyjit.set_warmstart_profile, [(1, 2, 3, 4, 5, 6)])
+        raises(ValueError, pypyjit.set_warmstart_profile,
+               [('x.py', 1, 'f', -1, False, 1.0)])
+        pypyjit.set_warmstart_profile([])
+
+    def test_warmstart_save_load(self):
+        import pypyjit, os
+        filename = self.profile_filename
+        pypyjit.load_warmstart_profile(filename)   # missing: empty profile
+        assert pypyjit.get_warmstart_profile() == []
+        entry = ('x.py', 1, 'f', 24, True, 1.0)
+        pypyjit.set_warmstart_profile([entry])
+        pypyjit.save_warmstart_profile(filename)
+        pypyjit.set_warmstart_profile([])
+        pypyjit.load_warmstart_profile(filename)
+        assert pypyjit.get_warmstart_profile() == [entry]
+        with open(filename, 'wb') as f:
+            f.write('garbage')
+        pypyjit.load_warmstart_profile(filename)
+        assert pypyjit.get_warmstart_profile() == []
+        os.unlink(filename)
+
     def test_get_stats_snapshot(self):
         skip("a bit no idea how to test it")
         from pypyjit import get_stats_snapshot
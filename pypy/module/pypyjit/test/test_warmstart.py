@@ -0,0 +1,42 @@
+from pypy.interpreter.pycode import PyCode
+from pypy.module.pypyjit.interp_warmstart import loop_header_positions
+
+
+class TestWarmStart(object):
+    spaceconfig = dict(usemodules=('pypyjit',))
+
+    def test_loop_header_positions(self):
+        w_code = self.space.appexec([], """():
+            def f(n):
+                total = 0
+                for i in range(n):
+                    while n:
+                        n -= 1
+                        continue
+                    total += i
+                return total
+            return f.func_code
+        """)
+        pycode = self.space.interp_w(PyCode, w_code)
+        positions = loop_header_positions(pycode)
+        assert positions[0] == 0
+        assert len(positions) == 3
+        for pos in positions[1:]:
+            # every loop header is the target of a backward jump
+            assert 0 < pos < len(pycode.co_code)
+
+    def test_loop_header_positions_extended_arg(self):
+        # a loop starting after more than 64KB of bytecode: the jump back
+        # to its start needs an EXTENDED_ARG
+        src = ("def f(n):\n    x = 0\n" + "    x = x + 1\n" * 7000 +
+               "    while n:\n        n -= 1\n    return x\n")
+        w_code = self.space.appexec([self.space.wrap(src)], """(src):
+            d = {}
+            exec src in d
+            return d['f'].func_code
+        """)
+        pycode = self.space.interp_w(PyCode, w_code)
+        assert len(pycode.co_code) > 0x10000
+        positions = loop_header_positions(pycode)
+        assert len(positions) == 2
+        assert 0x10000 < positions[1] < len(pycode.co_code)
@@ -38,6 +38,38 @@ class TestCall(BaseTestPyPyC):
             ...
         """)
 
+    def test_inline_max_size(self):
+        def fn():
+            def big(n):
+                # a lot of bytecode, but only a few operations in a trace
+                if n < 0:
+                    n = -n
+                    n = -n
+                    n = -n
+                    n = -n
+                    n = -n
+                    n = -n
+                return n + 1
+            #
+            # "big" is bigger than inline_max_size: it is traced from its
+            # start and called with call_assembler, instead of inlined
+            i = 0
+            while i < 300:
+                i = big(i) # ID: call_big
+            return i
+        #
+        log = self.run(fn, [], inline_max_size=20)
+        assert log.result == 300
+        loop, = log.loops_by_id('call_big')
+        assert loop.match_by_id('call_big', """
+            ...
+            p53 = call_assembler_r(..., descr=...)
+            guard_not_forced(descr=...)
+            keepalive(...)
+            guard_no_exception(descr=...)
+            ...
+        """)
+
     def test_fib(self):
         def fib(n):
             if n == 0 or n == 1:
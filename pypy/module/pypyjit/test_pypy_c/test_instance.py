@@ -54,6 +54,40 @@ class TestInstance(BaseTestPyPyC):
             jump(..., descr=...)
         """)
 
+    def test_megamorphic_site(self):
+        src = """
+            classes = []
+            for j in range(20):
+                class A(object):
+                    def m(self):
+                        return 1
+                classes.append(A)
+            objs = []
+            for A in classes:
+                a = A()
+                a.x = 1
+                objs.append(a)
+
+            def main(n):
+                i = 0
+                while i < n:
+                    a = objs[i % 20]
+                    i += a.x             # ID: load_attr
+                    i += a.m() - 1       # ID: call_method
+                return i
+        """
+        log = self.run(src, [3000])
+        assert log.result == 3000
+        loop, = log.loops_by_filename(self.filepath)
+        # one residual call per site and no guard_class on the objects
+        ops = loop.ops_by_id('load_attr', opcode='LOAD_ATTR')
+        assert log.opnames(ops) == ['call_r', 'guard_no_exception']
+        ops = loop.ops_by_id('call_method', opcode='LOOKUP_METHOD')
+        assert 'guard_class' not in log.opnames(ops)
+        # and the method is called residually, without promoting its code
+        ops = loop.ops_by_id('call_method', opcode='CALL_METHOD')
+        assert 'guard_value' not in log.opnames(ops)
+
     def test_getattr_with_dynamic_attribute(self):
         src = """
         class A(object):
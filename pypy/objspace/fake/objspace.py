@@ -125,7 +125,8 @@ class Entry(ExtRegistryEntry):
 
 BUILTIN_TYPES = ['int', 'str', 'float', 'long', 'tuple', 'list', 'dict',
                  'unicode', 'complex', 'slice', 'bool', 'basestring', 'object',
-                 'set', 'frozenset', 'bytearray', 'buffer', 'memoryview']
+                 'set', 'frozenset', 'bytearray', 'buffer', 'memoryview',
+                 'NoneType']
 
 INTERP_TYPES = ['function', 'builtin_function', 'module', 'getset_descriptor',
                 'instance', 'classobj']
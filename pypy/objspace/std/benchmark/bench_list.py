@@ -0,0 +1,43 @@
+""" simple benchmarks for the loops over the items of int and float lists.
+
+Compare the timings of
+
+    pypy bench_list.py
+    pypy --jit vec=1 bench_list.py
+
+The second run compiles the loops that search and compare the unwrapped
+items with SIMD instructions.
+"""
+
+import time
+
+def count_operation(name, function, repeat=200):
+    function()     # warm up the JIT
+    t0 = time.time()
+    for i in xrange(repeat):
+        retval = function()
+    tk = time.time()
+    print "%-30s takes: %f" % (name, tk - t0)
+    return retval
+
+def bench_lists(SIZE=100000):
+    ints = [i for i in xrange(SIZE)]    # not a range list
+    ints2 = ints[:]
+    floats = [i * 0.5 for i in xrange(SIZE)]
+    floats2 = floats[:]
+    ints_last = ints[:-1] + [-1]
+    floats_last = floats[:-1] + [-1.0]
+
+    count_operation("int list: in", lambda: -1 in ints)
+    count_operation("int list: index", lambda: ints.index(SIZE - 1))
+    count_operation("int list: count", lambda: ints.count(7))
+    count_operation("int list: ==", lambda: ints == ints2)
+    count_operation("int list: <", lambda: ints < ints_last)
+    count_operation("float list: in", lambda: -1.0 in floats)
+    count_operation("float list: index", lambda: floats.index(floats[-1]))
+    count_operation("float list: count", lambda: floats.count(7.5))
+    count_operation("float list: ==", lambda: floats == floats2)
+    count_operation("float list: <", lambda: floats < floats_last)
+
+if __name__ == '__main__':
+    bench_lists()
@@ -11,9 +11,11 @@ like: (on the left, without the new bytecodes; on the right, with them)
 """
 
 from pypy.interpreter import function
+from pypy.interpreter.baseobjspace import W_Root
 from rpython.rlib import jit
 from pypy.objspace.std.mapdict import LOOKUP_METHOD_mapdict, \
-    LOOKUP_METHOD_mapdict_fill_cache_method
+    LOOKUP_METHOD_mapdict_fill_cache_method, LOOKUP_METHOD_megamorphic, \
+    is_megamorphic
 
 
 # This module exports two extra methods for StdObjSpaceFrame implementing
@@ -38,6 +40,18 @@ def LOOKUP_METHOD(f, nameindex, *ignored):
         # mapdict has an extra-fast version of this function
         if LOOKUP_METHOD_mapdict(f, nameindex, w_obj):
             return
+    elif is_megamorphic(f.getcode(), nameindex):
+        # a single residual call, instead of a guard_class per type seen
+        w_method = LOOKUP_METHOD_megamorphic(space, f.getcode(), nameindex,
+                                             w_obj)
+        if w_method is not None:
+            f.pushvalue(W_MegamorphicMethod(w_method))
+            f.pushvalue(w_obj)
+        else:
+            f.pushvalue(_getattr_megamorphic(space, w_obj,
+                                             f.getname_w(nameindex)))
+            f.pushvalue_none()
+        return
 
     w_name = f.getname_w(nameindex)
     w_value = None
@@ -82,6 +96,23 @@ def LOOKUP_METHOD(f, nameindex, *ignored):
     f.pushvalue(w_value)
     f.pushvalue_none()
 
+class W_MegamorphicMethod(W_Root):
+    """Pushed by a megamorphic LOOKUP_METHOD in the JIT, instead of the
+    function itself, to tell the following CALL_METHOD to call it
+    residually.  It is only ever seen by CALL_METHOD."""
+    _immutable_fields_ = ['w_function']
+
+    def __init__(self, w_function):
+        self.w_function = w_function
+
+@jit.dont_look_inside
+def _getattr_megamorphic(space, w_obj, w_name):
+    return space.getattr(w_obj, w_name)
+
+@jit.dont_look_inside
+def _call_megamorphic(space, w_callable, args):
+    return space.call_args(w_callable, args)
+
 @jit.unroll_safe
 def CALL_METHOD(f, oparg, *ignored):
     # opargs contains the arg, and kwarg count, excluding the implicit 'self'
@@ -93,8 +124,16 @@ def CALL_METHOD(f, oparg, *ignored):
     if not n_kwargs:
         w_callable = f.peekvalue(n_args + (2 * n_kwargs) + 1)
         try:
-            w_result = f.space.call_valuestack(
-                    w_callable, n, f, methodcall=w_self is not None)
+            if w_self is not None and isinstance(w_callable,
+                                                 W_MegamorphicMethod):
+                # the method comes from a megamorphic LOOKUP_METHOD: don't
+                # promote its code, which would need a bridge per method
+                args = f.make_arguments(n, methodcall=True)
+                w_result = _call_megamorphic(f.space, w_callable.w_function,
+                                             args)
+            else:
+                w_result = f.space.call_valuestack(
+                        w_callable, n, f, methodcall=w_self is not None)
         finally:
             f.dropvalues(n_args + 2)
     else:
@@ -117,7 +156,9 @@ def CALL_METHOD(f, oparg, *ignored):
         if w_self is None:
             f.popvalue_maybe_none()    # removes w_self, which is None
         w_callable = f.popvalue()
-        if f.get_is_being_profiled() and function.is_builtin_code(w_callable):
+        if isinstance(w_callable, W_MegamorphicMethod):
+            w_result = _call_megamorphic(f.space, w_callable.w_function, args)
+        elif f.get_is_being_profiled() and function.is_builtin_code(w_callable):
             w_result = f.space.call_args_and_c_profile(f, w_callable, args)
         else:
             w_result = f.space.call_args(w_callable, args)
@@ -12,6 +12,8 @@ from pypy.interpreter.gateway import (
 from pypy.interpreter.mixedmodule import MixedModule
 from pypy.interpreter.signature import Signature
 from pypy.interpreter.typedef import TypeDef
+from pypy.objspace.std.floatobject import (
+    float_equal_to_int, float_is_int, float_key_eq, float_key_hash)
 from pypy.objspace.std.util import negate
 
 
@@ -400,6 +402,7 @@ def _add_indirections():
                     length w_keys values items \
                     iterkeys itervalues iteritems \
                     listview_bytes listview_unicode listview_int \
+                    listview_float \
                     view_as_kwargs".split()
 
     def make_method(method):
@@ -557,6 +560,9 @@ class DictStrategy(object):
     def listview_int(self, w_dict):
         return None
 
+    def listview_float(self, w_dict):
+        return None
+
     def view_as_kwargs(self, w_dict):
         return (None, None)
 
@@ -635,20 +641,32 @@ class EmptyDictStrategy(DictStrategy):
     def get_empty_storage(self):
         return self.erase(None)
 
-    def switch_to_correct_strategy(self, w_dict, w_key):
-        if type(w_key) is self.space.StringObjectCls:
-            self.switch_to_bytes_strategy(w_dict)
+    def switch_to_correct_strategy(self, w_dict, w_key, w_value):
+        # 'w_value' is the first value that is going to be stored
+        space = self.space
+        if type(w_key) is space.StringObjectCls:
+            if _is_unboxable_int(space, w_value):
+                self.switch_to_unboxed_strategy(w_dict, BytesIntDictStrategy)
+            else:
+                self.switch_to_bytes_strategy(w_dict)
             return
-        elif type(w_key) is self.space.UnicodeObjectCls:
+        elif type(w_key) is space.UnicodeObjectCls:
             self.switch_to_unicode_strategy(w_dict)
             return
-        w_type = self.space.type(w_key)
-        if self.space.is_w(w_type, self.space.w_int):
-            self.switch_to_int_strategy(w_dict)
+        w_type = space.type(w_key)
+        if space.is_w(w_type, space.w_int):
+            if _is_unboxable_int(space, w_value):
+                self.switch_to_unboxed_strategy(w_dict, IntIntDictStrategy)
+            elif _is_unboxable_float(space, w_value):
+                self.switch_to_unboxed_strategy(w_dict, IntFloatDictStrategy)
+            else:
+                self.switch_to_int_strategy(w_dict)
+        elif self.space.is_w(w_type, self.space.w_float):
+            self.switch_to_float_strategy(w_dict)
         elif w_type.compares_by_identity():
             self.switch_to_identity_strategy(w_dict)
         else:
-            self.switch_to_object_strategy(w_dict)
+            self.switch_to_small_object_strategy(w_dict)
 
     def switch_to_bytes_strategy(self, w_dict):
         strategy = self.space.fromcache(BytesDictStrategy)
@@ -668,6 +686,19 @@ class EmptyDictStrategy(DictStrategy):
         w_dict.set_strategy(strategy)
         w_dict.dstorage = storage
 
+    def switch_to_float_strategy(self, w_dict):
+        strategy = self.space.fromcache(FloatDictStrategy)
+        storage = strategy.get_empty_storage()
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = storage
+
+    @specialize.arg(2)
+    def switch_to_unboxed_strategy(self, w_dict, strategycls):
+        strategy = self.space.fromcache(strategycls)
+        storage = strategy.get_empty_storage()
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = storage
+
     def switch_to_identity_strategy(self, w_dict):
         from pypy.objspace.std.identitydict import IdentityDictStrategy
         strategy = self.space.fromcache(IdentityDictStrategy)
@@ -675,6 +706,12 @@ class EmptyDictStrategy(DictStrategy):
         w_dict.set_strategy(strategy)
         w_dict.dstorage = storage
 
+    def switch_to_small_object_strategy(self, w_dict):
+        strategy = self.space.fromcache(SmallObjectDictStrategy)
+        storage = strategy.get_empty_storage()
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = storage
+
     def switch_to_object_strategy(self, w_dict):
         strategy = self.space.fromcache(ObjectDictStrategy)
         storage = strategy.get_empty_storage()
@@ -694,12 +731,12 @@ class EmptyDictStrategy(DictStrategy):
 
     def setdefault(self, w_dict, w_key, w_default):
         # here the dict is always empty
-        self.switch_to_correct_strategy(w_dict, w_key)
+        self.switch_to_correct_strategy(w_dict, w_key, w_default)
         w_dict.setitem(w_key, w_default)
         return w_default
 
     def setitem(self, w_dict, w_key, w_value):
-        self.switch_to_correct_strategy(w_dict, w_key)
+        self.switch_to_correct_strategy(w_dict, w_key, w_value)
         w_dict.setitem(w_key, w_value)
 
     def setitem_str(self, w_dict, key, w_value):
@@ -922,6 +959,13 @@ def create_iterator_classes(dictimpl):
             else:
                 # Same strategy.
                 self.prepare_update(w_updatedict, w_dict.length())
+                # prepare_update() can still switch to another strategy
+                if not same_strategy(self, w_updatedict):
+                    for key, value, keyhash in iteritemsh:
+                        w_key = wrapkey(self.space, key)
+                        w_value = wrapvalue(self.space, value)
+                        w_updatedict.setitem(w_key, w_value)
+                    return     # done
             #
             # Use setitem_untyped() to speed up copying without
             # wrapping/unwrapping the key.
@@ -1005,6 +1049,12 @@ class AbstractTypedStrategy(object):
         return self.getitem(w_dict, self.space.newtext(key))
 
     def getitem(self, w_dict, w_key):
+        return self._getitem_typed(w_dict, w_key)
+
+    def _getitem_typed(self, w_dict, w_key):
+        # for the overridden getitem() of the subclasses: calling the
+        # unbound AbstractTypedStrategy.getitem() from several classes
+        # would mix their 'self'
         space = self.space
         if self.is_correct_type(w_key):
             return self.unerase(w_dict.dstorage).get(self.unwrap(w_key), None)
@@ -1130,6 +1180,299 @@ class ObjectDictStrategy(AbstractTypedStrategy, DictStrategy):
 create_iterator_classes(ObjectDictStrategy)
 
 
+SMALL_DICT_INITIAL_SIZE = 4
+SMALL_DICT_MAX_SIZE = 8
+
+
+class SmallDictStorage(object):
+    """ The storage of SmallObjectDictStrategy.  The first 'length' entries
+    of 'hashes' are the hashes of the keys, in insertion order, and the
+    first 2 * 'length' entries of 'items_w' are the keys and values,
+    interleaved. """
+
+    def __init__(self, capacity):
+        self.length = 0
+        self.hashes = [0] * capacity
+        self.items_w = [None] * (2 * capacity)
+
+    def capacity(self):
+        return len(self.hashes)
+
+    def grow(self, capacity):
+        hashes = [0] * capacity
+        items_w = [None] * (2 * capacity)
+        for i in range(self.length):
+            hashes[i] = self.hashes[i]
+            items_w[2 * i] = self.items_w[2 * i]
+            items_w[2 * i + 1] = self.items_w[2 * i + 1]
+        self.hashes = hashes
+        self.items_w = items_w
+
+    def append(self, w_key, w_value, keyhash):
+        length = self.length
+        if length == self.capacity():
+            self.grow(length * 2)
+        self.hashes[length] = keyhash
+        self.items_w[2 * length] = w_key
+        self.items_w[2 * length + 1] = w_value
+        self.length = length + 1
+
+    def remove(self, index):
+        length = self.length - 1
+        for i in range(index, length):
+            self.hashes[i] = self.hashes[i + 1]
+            self.items_w[2 * i] = self.items_w[2 * i + 2]
+            self.items_w[2 * i + 1] = self.items_w[2 * i + 3]
+        # don't keep the removed objects alive
+        self.items_w[2 * length] = None
+        self.items_w[2 * length + 1] = None
+        self.length = length
+
+
+class SmallObjectDictStrategy(DictStrategy):
+    """ Dicts with arbitrary keys and at most SMALL_DICT_MAX_SIZE items.
+    Instead of the r_dict of ObjectDictStrategy, with its index and entries
+    arrays, the items are kept in two small arrays that are searched
+    linearly, comparing the stored hashes first.  When one more item is
+    added, the dict switches to ObjectDictStrategy.  copy() and update()
+    switch in prepare_update() already if the result could be too large.
+    """
+
+    erase, unerase = rerased.new_erasing_pair("smallobject")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+    def get_empty_storage(self):
+        return self.erase(SmallDictStorage(SMALL_DICT_INITIAL_SIZE))
+
+    def _lookup(self, w_dict, storage, w_key, keyhash):
+        """ Returns the index of 'w_key', or -1 if it is not in the dict.
+        Returns -2 if 'w_dict' was changed by an __eq__ method; then the
+        caller must start again. """
+        space = self.space
+        i = 0
+        while i < storage.length:
+            if storage.hashes[i] == keyhash:
+                w_other = storage.items_w[2 * i]
+                if w_other is w_key:
+                    return i
+                found = space.eq_w(w_other, w_key)
+                if w_dict is not None and self._changed(w_dict, storage, i,
+                                                        w_other):
+                    return -2
+                if found:
+                    return i
+            i += 1
+        return -1
+
+    def _changed(self, w_dict, storage, index, w_key):
+        return (w_dict.get_strategy() is not self or
+                self.unerase(w_dict.dstorage) is not storage or
+                index >= storage.length or
+                storage.items_w[2 * index] is not w_key)
+
+    def getitem(self, w_dict, w_key):
+        storage = self.unerase(w_dict.dstorage)
+        i = self._lookup(w_dict, storage, w_key, self.space.hash_w(w_key))
+        if i == -2:
+            return w_dict.getitem(w_key)
+        if i < 0:
+            return None
+        return storage.items_w[2 * i + 1]
+
+    def getitem_str(self, w_dict, key):
+        return self.getitem(w_dict, self.space.newtext(key))
+
+    def setitem(self, w_dict, w_key, w_value):
+        storage = self.unerase(w_dict.dstorage)
+        keyhash = self.space.hash_w(w_key)
+        i = self._lookup(w_dict, storage, w_key, keyhash)
+        if i == -2:
+            w_dict.setitem(w_key, w_value)
+        elif i >= 0:
+            storage.items_w[2 * i + 1] = w_value
+        else:
+            self._add(w_dict, storage, w_key, w_value, keyhash)
+
+    def _add(self, w_dict, storage, w_key, w_value, keyhash):
+        if storage.length >= SMALL_DICT_MAX_SIZE:
+            strategy = self._switch_to_object_strategy(w_dict)
+            d = strategy.unerase(w_dict.dstorage)
+            objectmodel.setitem_with_hash(d, w_key, keyhash, w_value)
+        else:
+            storage.append(w_key, w_value, keyhash)
+
+    def setitem_str(self, w_dict, s, w_value):
+        self.setitem(w_dict, self.space.newtext(s), w_value)
+
+    def setdefault(self, w_dict, w_key, w_default):
+        storage = self.unerase(w_dict.dstorage)
+        keyhash = self.space.hash_w(w_key)
+        i = self._lookup(w_dict, storage, w_key, keyhash)
+        if i == -2:
+            return w_dict.setdefault(w_key, w_default)
+        if i >= 0:
+            return storage.items_w[2 * i + 1]
+        self._add(w_dict, storage, w_key, w_default, keyhash)
+        return w_default
+
+    def delitem(self, w_dict, w_key):
+        storage = self.unerase(w_dict.dstorage)
+        i = self._lookup(w_dict, storage, w_key, self.space.hash_w(w_key))
+        if i == -2:
+            w_dict.delitem(w_key)
+        elif i < 0:
+            raise KeyError
+        else:
+            storage.remove(i)
+
+    def pop(self, w_dict, w_key, w_default):
+        storage = self.unerase(w_dict.dstorage)
+        i = self._lookup(w_dict, storage, w_key, self.space.hash_w(w_key))
+        if i == -2:
+            return w_dict.get_strategy().pop(w_dict, w_key, w_default)
+        if i < 0:
+            if w_default is not None:
+                return w_default
+            raise KeyError
+        w_value = storage.items_w[2 * i + 1]
+        storage.remove(i)
+        return w_value
+
+    def popitem(self, w_dict):
+        storage = self.unerase(w_dict.dstorage)
+        i = storage.length - 1
+        if i < 0:
+            raise KeyError
+        w_key = storage.items_w[2 * i]
+        w_value = storage.items_w[2 * i + 1]
+        storage.remove(i)
+        return w_key, w_value
+
+    def length(self, w_dict):
+        return self.unerase(w_dict.dstorage).length
+
+    def clear(self, w_dict):
+        w_dict.dstorage = self.get_empty_storage()
+
+    def w_keys(self, w_dict):
+        storage = self.unerase(w_dict.dstorage)
+        return self.space.newlist([storage.items_w[2 * i]
+                                   for i in range(storage.length)])
+
+    def values(self, w_dict):
+        storage = self.unerase(w_dict.dstorage)
+        return [storage.items_w[2 * i + 1] for i in range(storage.length)]
+
+    def items(self, w_dict):
+        space = self.space
+        storage = self.unerase(w_dict.dstorage)
+        return [space.newtuple([storage.items_w[2 * i],
+                                storage.items_w[2 * i + 1]])
+                for i in range(storage.length)]
+
+    def switch_to_object_strategy(self, w_dict):
+        self._switch_to_object_strategy(w_dict)
+
+    def _switch_to_object_strategy(self, w_dict):
+        storage = self.unerase(w_dict.dstorage)
+        strategy = self.space.fromcache(ObjectDictStrategy)
+        d_new = strategy.unerase(strategy.get_empty_storage())
+        objectmodel.prepare_dict_update(d_new, storage.length + 1)
+        for i in range(storage.length):
+            objectmodel.setitem_with_hash(d_new, storage.items_w[2 * i],
+                                          storage.hashes[i],
+                                          storage.items_w[2 * i + 1])
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = strategy.erase(d_new)
+        return strategy
+
+    def prepare_update(self, w_dict, num_extra):
+        storage = self.unerase(w_dict.dstorage)
+        if storage.length + num_extra > SMALL_DICT_MAX_SIZE:
+            strategy = self._switch_to_object_strategy(w_dict)
+            strategy.prepare_update(w_dict, num_extra)
+        elif storage.length + num_extra > storage.capacity():
+            storage.grow(storage.length + num_extra)
+
+    def setitem_untyped(self, dstorage, w_key, w_value, keyhash):
+        # used by copy() and update(), after prepare_update()
+        storage = self.unerase(dstorage)
+        i = self._lookup(None, storage, w_key, keyhash)
+        if i >= 0:
+            storage.items_w[2 * i + 1] = w_value
+        else:
+            storage.append(w_key, w_value, keyhash)
+
+    # --------------- iterator interface -----------------
+
+    def getiterkeys(self, w_dict):
+        return SmallDictKeyIterator(self.unerase(w_dict.dstorage))
+
+    def getitervalues(self, w_dict):
+        return SmallDictValueIterator(self.unerase(w_dict.dstorage))
+
+    def getiteritems_with_hash(self, w_dict):
+        return SmallDictItemIterator(self.unerase(w_dict.dstorage))
+
+    def getiterreversed(self, w_dict):
+        return SmallDictReversedIterator(self.unerase(w_dict.dstorage))
+
+
+class SmallDictIterator(object):
+    _mixin_ = True     # the next() methods return different types
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.i = 0
+
+    def __iter__(self):
+        return self
+
+class SmallDictKeyIterator(SmallDictIterator):
+    def next(self):
+        i = self.i
+        if i >= self.storage.length:
+            raise StopIteration
+        self.i = i + 1
+        return self.storage.items_w[2 * i]
+
+class SmallDictValueIterator(SmallDictIterator):
+    def next(self):
+        i = self.i
+        if i >= self.storage.length:
+            raise StopIteration
+        self.i = i + 1
+        return self.storage.items_w[2 * i + 1]
+
+class SmallDictItemIterator(SmallDictIterator):
+    def next(self):
+        i = self.i
+        storage = self.storage
+        if i >= storage.length:
+            raise StopIteration
+        self.i = i + 1
+        return (storage.items_w[2 * i], storage.items_w[2 * i + 1],
+                storage.hashes[i])
+
+class SmallDictReversedIterator(object):
+    def __init__(self, storage):
+        self.storage = storage
+        self.i = storage.length
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        i = self.i - 1
+        if i < 0 or i >= self.storage.length:
+            raise StopIteration
+        self.i = i
+        return self.storage.items_w[2 * i]
+
+create_iterator_classes(SmallObjectDictStrategy)
+
+
 class BytesDictStrategy(AbstractTypedStrategy, DictStrategy):
     erase, unerase = rerased.new_erasing_pair("bytes")
     erase = staticmethod(erase)
@@ -1292,6 +1635,17 @@ class IntDictStrategy(AbstractTypedStrategy, DictStrategy):
                 space.is_w(w_lookup_type, space.w_unicode)
                 )
 
+    def getitem(self, w_dict, w_key):
+        space = self.space
+        if space.is_w(space.type(w_key), space.w_float):
+            # look up floats that are equal to an int without switching
+            # to the object strategy
+            f = space.float_w(w_key)
+            if not float_is_int(f):
+                return None
+            return self.unerase(w_dict.dstorage).get(int(f), None)
+        return self._getitem_typed(w_dict, w_key)
+
     def listview_int(self, w_dict):
         return self.unerase(w_dict.dstorage).keys()
 
@@ -1304,6 +1658,327 @@ class IntDictStrategy(AbstractTypedStrategy, DictStrategy):
 create_iterator_classes(IntDictStrategy)
 
 
+class FloatDictStrategy(AbstractTypedStrategy, DictStrategy):
+    erase, unerase = rerased.new_erasing_pair("float")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+    def wrap(self, unwrapped):
+        return self.space.newfloat(unwrapped)
+
+    def unwrap(self, wrapped):
+        return self.space.float_w(wrapped)
+
+    def get_empty_storage(self):
+        return self.erase(r_dict(float_key_eq, float_key_hash))
+
+    def is_correct_type(self, w_obj):
+        space = self.space
+        return space.is_w(space.type(w_obj), space.w_float)
+
+    def _never_equal_to(self, w_lookup_type):
+        space = self.space
+        # XXX there are many more types
+        return (space.is_w(w_lookup_type, space.w_NoneType) or
+                space.is_w(w_lookup_type, space.w_bytes) or
+                space.is_w(w_lookup_type, space.w_unicode)
+                )
+
+    def getitem(self, w_dict, w_key):
+        space = self.space
+        if space.is_w(space.type(w_key), space.w_int):
+            # look up ints as the equal float, if there is one, without
+            # switching to the object strategy
+            x = space.int_w(w_key)
+            if not float_equal_to_int(x):
+                return None
+            return self.unerase(w_dict.dstorage).get(float(x), None)
+        return self._getitem_typed(w_dict, w_key)
+
+    def listview_float(self, w_dict):
+        return self.unerase(w_dict.dstorage).keys()
+
+    def wrapkey(space, key):
+        return space.newfloat(key)
+
+    def w_keys(self, w_dict):
+        return self.space.newlist_float(self.listview_float(w_dict))
+
+create_iterator_classes(FloatDictStrategy)
+
+
+def _is_unboxable_int(space, w_obj):
+    return space.is_w(space.type(w_obj), space.w_int)
+
+def _is_unboxable_float(space, w_obj):
+    return space.is_w(space.type(w_obj), space.w_float)
+
+
+class AbstractUnboxedValueStrategy(AbstractTypedStrategy):
+    """ Stores the values unboxed, as long as they are all ints or all
+    floats.  When another value is stored, the dict switches to the strategy
+    returned by get_boxed_strategy(), which has the same keys but boxed
+    values.  EmptyDictStrategy picks one of these strategies based on the
+    first key and value that are stored. """
+    _mixin_ = True
+
+    def get_boxed_strategy(self):
+        raise NotImplementedError("abstract base class")
+
+    def is_correct_value_type(self, w_value):
+        raise NotImplementedError("abstract base class")
+
+    def wrap_value(self, value):
+        raise NotImplementedError("abstract base class")
+
+    def unwrap_value(self, w_value):
+        raise NotImplementedError("abstract base class")
+
+    def get_empty_storage(self):
+        return self.erase({})
+
+    def getitem(self, w_dict, w_key):
+        space = self.space
+        if self.is_correct_type(w_key):
+            d = self.unerase(w_dict.dstorage)
+            try:
+                value = d[self.unwrap(w_key)]
+            except KeyError:
+                return None
+            return self.wrap_value(value)
+        elif self._never_equal_to(space.type(w_key)):
+            return None
+        else:
+            return self.getitem_other_key(w_dict, w_key)
+
+    def getitem_other_key(self, w_dict, w_key):
+        self.switch_to_boxed_strategy(w_dict)
+        return w_dict.getitem(w_key)
+
+    def setitem(self, w_dict, w_key, w_value):
+        if self.is_correct_type(w_key) and self.is_correct_value_type(w_value):
+            d = self.unerase(w_dict.dstorage)
+            d[self.unwrap(w_key)] = self.unwrap_value(w_value)
+        else:
+            self.switch_to_boxed_strategy(w_dict)
+            w_dict.setitem(w_key, w_value)
+
+    def setitem_str(self, w_dict, key, w_value):
+        self.switch_to_boxed_strategy(w_dict)
+        w_dict.setitem_str(key, w_value)
+
+    def setdefault(self, w_dict, w_key, w_default):
+        if (self.is_correct_type(w_key) and
+                self.is_correct_value_type(w_default)):
+            d = self.unerase(w_dict.dstorage)
+            value = d.setdefault(self.unwrap(w_key),
+                                 self.unwrap_value(w_default))
+            return self.wrap_value(value)
+        else:
+            self.switch_to_boxed_strategy(w_dict)
+            return w_dict.setdefault(w_key, w_default)
+
+    def delitem(self, w_dict, w_key):
+        if self.is_correct_type(w_key):
+            del self.unerase(w_dict.dstorage)[self.unwrap(w_key)]
+        else:
+            self.switch_to_boxed_strategy(w_dict)
+            w_dict.delitem(w_key)
+
+    def values(self, w_dict):
+        return [self.wrap_value(value)
+                for value in self.unerase(w_dict.dstorage).itervalues()]
+
+    def items(self, w_dict):
+        space = self.space
+        dict_w = self.unerase(w_dict.dstorage)
+        return [space.newtuple([self.wrap(key), self.wrap_value(value)])
+                for (key, value) in dict_w.iteritems()]
+
+    def popitem(self, w_dict):
+        key, value = self.unerase(w_dict.dstorage).popitem()
+        return (self.wrap(key), self.wrap_value(value))
+
+    def pop(self, w_dict, w_key, w_default):
+        space = self.space
+        if self.is_correct_type(w_key):
+            d = self.unerase(w_dict.dstorage)
+            try:
+                value = d.pop(self.unwrap(w_key))
+            except KeyError:
+                if w_default is None:
+                    raise
+                return w_default
+            return self.wrap_value(value)
+        elif self._never_equal_to(space.type(w_key)):
+            if w_default is not None:
+                return w_default
+            raise KeyError
+        else:
+            self.switch_to_boxed_strategy(w_dict)
+            return w_dict.get_strategy().pop(w_dict, w_key, w_default)
+
+    def switch_to_boxed_strategy(self, w_dict):
+        d = self.unerase(w_dict.dstorage)
+        strategy = self.get_boxed_strategy()
+        storage = strategy.get_empty_storage()
+        d_new = strategy.unerase(storage)
+        objectmodel.prepare_dict_update(d_new, len(d))
+        for key, value in d.iteritems():
+            d_new[key] = self.wrap_value(value)
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = storage
+
+    def switch_to_object_strategy(self, w_dict):
+        self.switch_to_boxed_strategy(w_dict)
+        w_dict.get_strategy().switch_to_object_strategy(w_dict)
+
+
+class IntValuesMixin(object):
+    _mixin_ = True
+
+    def is_correct_value_type(self, w_value):
+        return _is_unboxable_int(self.space, w_value)
+
+    def wrap_value(self, value):
+        return self.space.newint(value)
+
+    def unwrap_value(self, w_value):
+        return self.space.int_w(w_value)
+
+    def wrapvalue(space, value):
+        return space.newint(value)
+
+
+class FloatValuesMixin(object):
+    _mixin_ = True
+
+    def is_correct_value_type(self, w_value):
+        return _is_unboxable_float(self.space, w_value)
+
+    def wrap_value(self, value):
+        return self.space.newfloat(value)
+
+    def unwrap_value(self, w_value):
+        return self.space.float_w(w_value)
+
+    def wrapvalue(space, value):
+        return space.newfloat(value)
+
+
+class AbstractIntKeyUnboxedValueStrategy(AbstractUnboxedValueStrategy):
+    _mixin_ = True
+
+    def wrap(self, unwrapped):
+        return self.space.newint(unwrapped)
+
+    def unwrap(self, wrapped):
+        return self.space.int_w(wrapped)
+
+    def is_correct_type(self, w_obj):
+        return _is_unboxable_int(self.space, w_obj)
+
+    def _never_equal_to(self, w_lookup_type):
+        return self.get_boxed_strategy()._never_equal_to(w_lookup_type)
+
+    def get_boxed_strategy(self):
+        return self.space.fromcache(IntDictStrategy)
+
+    def getitem_other_key(self, w_dict, w_key):
+        space = self.space
+        if space.is_w(space.type(w_key), space.w_float):
+            # see IntDictStrategy.getitem()
+            f = space.float_w(w_key)
+            if not float_is_int(f):
+                return None
+            return self.getitem(w_dict, space.newint(int(f)))
+        self.switch_to_boxed_strategy(w_dict)
+        return w_dict.getitem(w_key)
+
+    def listview_int(self, w_dict):
+        return self.unerase(w_dict.dstorage).keys()
+
+    def wrapkey(space, key):
+        return space.newint(key)
+
+    def w_keys(self, w_dict):
+        return self.space.newlist_int(self.listview_int(w_dict))
+
+
+class IntIntDictStrategy(IntValuesMixin, AbstractIntKeyUnboxedValueStrategy,
+                         DictStrategy):
+    erase, unerase = rerased.new_erasing_pair("intint")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+create_iterator_classes(IntIntDictStrategy)
+
+
+class IntFloatDictStrategy(FloatValuesMixin,
+                           AbstractIntKeyUnboxedValueStrategy, DictStrategy):
+    erase, unerase = rerased.new_erasing_pair("intfloat")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+create_iterator_classes(IntFloatDictStrategy)
+
+
+class BytesIntDictStrategy(IntValuesMixin, AbstractUnboxedValueStrategy,
+                           DictStrategy):
+    erase, unerase = rerased.new_erasing_pair("bytesint")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+    def wrap(self, unwrapped):
+        return self.space.newbytes(unwrapped)
+
+    def unwrap(self, wrapped):
+        return self.space.bytes_w(wrapped)
+
+    def is_correct_type(self, w_obj):
+        space = self.space
+        return space.is_w(space.type(w_obj), space.w_bytes)
+
+    def _never_equal_to(self, w_lookup_type):
+        return _never_equal_to_string(self.space, w_lookup_type)
+
+    def get_boxed_strategy(self):
+        return self.space.fromcache(BytesDictStrategy)
+
+    def getitem_str(self, w_dict, key):
+        assert key is not None
+        d = self.unerase(w_dict.dstorage)
+        try:
+            value = d[key]
+        except KeyError:
+            return None
+        return self.wrap_value(value)
+
+    def listview_bytes(self, w_dict):
+        return self.unerase(w_dict.dstorage).keys()
+
+    def wrapkey(space, key):
+        return space.newbytes(key)
+
+    def w_keys(self, w_dict):
+        return self.space.newlist_bytes(self.listview_bytes(w_dict))
+
+    @jit.look_inside_iff(lambda self, w_dict:
+                         w_dict_unrolling_heuristic(w_dict))
+    def view_as_kwargs(self, w_dict):
+        d = self.unerase(w_dict.dstorage)
+        l = len(d)
+        keys, values = [None] * l, [None] * l
+        i = 0
+        for key, value in d.iteritems():
+            keys[i] = key
+            values[i] = self.wrap_value(value)
+            i += 1
+        return keys, values
+
+create_iterator_classes(BytesIntDictStrategy)
+
+
 def update1(space, w_dict, w_data):
     if isinstance(w_data, W_DictMultiObject):    # optimization case only
         update1_dict_dict(space, w_dict, w_data)
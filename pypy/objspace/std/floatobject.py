@@ -10,6 +10,8 @@ from rpython.rlib.rfloat import (
     DTSF_ADD_DOT_0, DTSF_STR_PRECISION, INFINITY, NAN,
     float_as_rbigint_ratio, formatd, isfinite)
 from rpython.rlib.rstring import ParseStringError
+from rpython.rlib.longlong2float import float2longlong
+from rpython.rlib.objectmodel import compute_hash
 from rpython.rlib.unroll import unrolling_iterable
 from rpython.rtyper.lltypesystem.module.ll_math import math_fmod
 from rpython.tool.sourcetools import func_with_new_name
@@ -752,6 +754,32 @@ def _hash_float(space, v):
     return x
 
 
+# helpers for the dict and set strategies that store unboxed floats
+
+def float_key_eq(x, y):
+    """ Equality of two float keys.  Like W_FloatObject.is_w(), this
+    considers a NaN to be equal to another NaN with the same bits. """
+    return x == y or float2longlong(x) == float2longlong(y)
+
+def float_key_hash(x):
+    # any hash that is consistent with float_key_eq() works here, the keys
+    # are rehashed if the dict or set switches to the object strategy
+    return compute_hash(x)
+
+MAXINT_AS_FLOAT = 2.0 ** (LONG_BIT - 1)
+
+def float_equal_to_int(x):
+    """ Returns True if float(x) == x exactly, i.e. if an int key 'x' can
+    be looked up as a float key. """
+    f = float(x)
+    return f < MAXINT_AS_FLOAT and int(f) == x
+
+def float_is_int(f):
+    """ Returns True if 'f' is equal to an int, i.e. if a float key 'f' can
+    be looked up as int(f) in an int-keyed dict or set. """
+    return -MAXINT_AS_FLOAT <= f < MAXINT_AS_FLOAT and math.floor(f) == f
+
+
 def _divmod_w(space, w_float1, w_float2):
     x = w_float1.floatval
     y = w_float2.floatval
@@ -0,0 +1,201 @@
+"""dict implementation specialized for objects loaded by the _pypyjson module.
+
+Somewhat similar to MapDictStrategy, also uses a map.
+"""
+
+from rpython.rlib import objectmodel, rerased
+
+from pypy.interpreter.baseobjspace import W_Root
+from pypy.objspace.std.dictmultiobject import (
+    UnicodeDictStrategy, DictStrategy, create_iterator_classes,
+    W_DictObject, _never_equal_to_string)
+
+
+class W_LazyJSONString(W_Root):
+    """ An ascii-only string value of a JSON object that was not turned into
+    a unicode object yet.  Instances only ever live in the storage of a
+    JsonDictStrategy dict and must never escape to app-level: the strategy
+    forces them whenever a value is read. """
+
+    def __init__(self, s):
+        self.s = s
+        self.w_unicode = None
+
+    def force(self, space):
+        w_unicode = self.w_unicode
+        if w_unicode is None:
+            # the decoder checked that all chars are < 128
+            w_unicode = space.newunicode(self.s.decode('latin-1'))
+            self.w_unicode = w_unicode
+            self.s = None
+        return w_unicode
+
+def _force_value(space, w_value):
+    if isinstance(w_value, W_LazyJSONString):
+        return w_value.force(space)
+    return w_value
+
+
+def from_values_and_jsonmap(space, values_w, jsonmap):
+    strategy = jsonmap.get_strategy_instance(space)
+    storage = strategy.erase(values_w)
+    return W_DictObject(space, strategy, storage)
+
+
+class JsonDictStrategy(DictStrategy):
+    """ The keys are stored in a map shared between all dicts with the same
+    sequence of keys that the JSON decoder produced, the values in a list. As
+    long as only the values of existing keys are changed, the dict stays in
+    this strategy; every other mutation switches to UnicodeDictStrategy.
+    There is no empty storage: clear() switches to EmptyDictStrategy. """
+
+    erase, unerase = rerased.new_erasing_pair("jsondict")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+    _immutable_fields_ = ['jsonmap']
+
+    def __init__(self, space, jsonmap):
+        DictStrategy.__init__(self, space)
+        self.jsonmap = jsonmap
+
+    def wrapkey(space, key):
+        return space.newunicode(key)
+
+    def wrapvalue(space, w_value):
+        return _force_value(space, w_value)
+
+    def is_correct_type(self, w_obj):
+        space = self.space
+        return space.is_w(space.type(w_obj), space.w_unicode)
+
+    def _never_equal_to(self, w_lookup_type):
+        return _never_equal_to_string(self.space, w_lookup_type)
+
+    def length(self, w_dict):
+        return self.jsonmap.length
+
+    def _getvalue(self, w_dict, index):
+        values_w = self.unerase(w_dict.dstorage)
+        w_value = values_w[index]
+        if isinstance(w_value, W_LazyJSONString):
+            w_value = w_value.force(self.space)
+            values_w[index] = w_value
+        return w_value
+
+    def getitem(self, w_dict, w_key):
+        space = self.space
+        if self.is_correct_type(w_key):
+            index = self.jsonmap.get_index(space.unicode_w(w_key))
+            if index < 0:
+                return None
+            return self._getvalue(w_dict, index)
+        elif self._never_equal_to(space.type(w_key)):
+            return None
+        else:
+            self.switch_to_unicode_strategy(w_dict)
+            return w_dict.getitem(w_key)
+
+    def getitem_str(self, w_dict, key):
+        # a str is only equal to a unicode key if it is plain ascii
+        for c in key:
+            if ord(c) >= 128:
+                return None
+        index = self.jsonmap.get_index(key.decode('latin-1'))
+        if index < 0:
+            return None
+        return self._getvalue(w_dict, index)
+
+    def setitem(self, w_dict, w_key, w_value):
+        if self.is_correct_type(w_key):
+            index = self.jsonmap.get_index(self.space.unicode_w(w_key))
+            if index >= 0:
+                self.unerase(w_dict.dstorage)[index] = w_value
+                return
+        self.switch_to_unicode_strategy(w_dict)
+        w_dict.setitem(w_key, w_value)
+
+    def setitem_str(self, w_dict, key, w_value):
+        self.switch_to_unicode_strategy(w_dict)
+        w_dict.setitem_str(key, w_value)
+
+    def setdefault(self, w_dict, w_key, w_default):
+        if self.is_correct_type(w_key):
+            index = self.jsonmap.get_index(self.space.unicode_w(w_key))
+            if index >= 0:
+                return self._getvalue(w_dict, index)
+        self.switch_to_unicode_strategy(w_dict)
+        return w_dict.setdefault(w_key, w_default)
+
+    def delitem(self, w_dict, w_key):
+        self.switch_to_unicode_strategy(w_dict)
+        return w_dict.delitem(w_key)
+
+    def popitem(self, w_dict):
+        self.switch_to_unicode_strategy(w_dict)
+        return w_dict.popitem()
+
+    def w_keys(self, w_dict):
+        return self.space.newlist_unicode(self.listview_unicode(w_dict))
+
+    def listview_unicode(self, w_dict):
+        return self.jsonmap.get_keys_in_order()[:]
+
+    def values(self, w_dict):
+        values_w = self.unerase(w_dict.dstorage)
+        return [self._getvalue(w_dict, i) for i in range(len(values_w))]
+
+    def items(self, w_dict):
+        space = self.space
+        keys = self.jsonmap.get_keys_in_order()
+        return [space.newtuple([space.newunicode(keys[i]),
+                                self._getvalue(w_dict, i)])
+                for i in range(len(keys))]
+
+    def switch_to_unicode_strategy(self, w_dict):
+        strategy = self.space.fromcache(UnicodeDictStrategy)
+        keys = self.jsonmap.get_keys_in_order()
+        storage = strategy.get_empty_storage()
+        d_new = strategy.unerase(storage)
+        for i in range(len(keys)):
+            d_new[keys[i]] = self._getvalue(w_dict, i)
+        w_dict.set_strategy(strategy)
+        w_dict.dstorage = storage
+
+    def switch_to_object_strategy(self, w_dict):
+        self.switch_to_unicode_strategy(w_dict)
+        w_dict.get_strategy().switch_to_object_strategy(w_dict)
+
+    # --------------- iterator interface -----------------
+
+    def getiterkeys(self, w_dict):
+        return iter(self.jsonmap.get_keys_in_order())
+
+    def getitervalues(self, w_dict):
+        return iter(self.unerase(w_dict.dstorage))
+
+    def getiteritems_with_hash(self, w_dict):
+        return JsonItemsWithHash(self.jsonmap.get_keys_in_order(),
+                                 self.unerase(w_dict.dstorage))
+
+create_iterator_classes(JsonDictStrategy)
+
+
+class JsonItemsWithHash(object):
+    # like kwargsdict.ZipItemsWithHash, but with unicode keys
+    def __init__(self, keys, values_w):
+        assert len(keys) == len(values_w)
+        self.keys = keys
+        self.values_w = values_w
+        self.i = 0
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        i = self.i
+        if i >= len(self.keys):
+            raise StopIteration
+        self.i = i + 1
+        key = self.keys[i]
+        return (key, self.values_w[i], objectmodel.compute_hash(key))
@@ -303,6 +303,10 @@ class W_ListObject(W_Root):
         """Find w_item in list[start:end]. If not found, raise ValueError"""
         return self.strategy.find(self, w_item, start, end)
 
+    def count(self, w_item):
+        """Return the number of items in the list that are equal to w_item"""
+        return self.strategy.count(self, w_item)
+
     def append(self, w_item):
         """L.append(object) -- append object to end"""
         self.strategy.append(self, w_item)
@@ -445,6 +449,13 @@ class W_ListObject(W_Root):
     def descr_eq(self, space, w_other):
         if not isinstance(w_other, W_ListObject):
             return space.w_NotImplemented
+        if (self.strategy is w_other.strategy and
+                not list_unroll_condition(self, space, w_other)):
+            if self.length() != w_other.length():
+                return space.w_False
+            i = self.strategy.first_difference(self, w_other)
+            if i >= 0:
+                return space.newbool(i == self.length())
         return self._descr_eq(space, w_other)
 
     @jit.look_inside_iff(list_unroll_condition)
@@ -470,6 +481,14 @@ class W_ListObject(W_Root):
         def compare_unwrappeditems(self, space, w_list2):
             if not isinstance(w_list2, W_ListObject):
                 return space.w_NotImplemented
+            if (self.strategy is w_list2.strategy and
+                    not list_unroll_condition(self, space, w_list2)):
+                i = self.strategy.first_difference(self, w_list2)
+                if i >= 0:
+                    if i < self.length() and i < w_list2.length():
+                        return getattr(space, name)(self.getitem(i),
+                                                    w_list2.getitem(i))
+                    return space.newbool(op(self.length(), w_list2.length()))
             return _compare_unwrappeditems(self, space, w_list2)
 
         @jit.look_inside_iff(list_unroll_condition)
@@ -633,14 +652,7 @@ class W_ListObject(W_Root):
     def descr_count(self, space, w_value):
         '''L.count(value) -> integer -- return number of
         occurrences of value'''
-        # needs to be safe against eq_w() mutating the w_list behind our back
-        count = 0
-        i = 0
-        while i < self.length():
-            if space.eq_w(self.getitem(i), w_value):
-                count += 1
-            i += 1
-        return space.newint(count)
+        return space.newint(self.count(w_value))
 
     @unwrap_spec(index=int)
     def descr_insert(self, space, index, w_value):
@@ -796,6 +808,24 @@ class ListStrategy(object):
             i += 1
         raise ValueError
 
+    def first_difference(self, w_list, w_other):
+        """Return the first index where the items of w_list and w_other,
+        which both use this strategy, are not equal, or the length of the
+        shorter list.  Returns -1 if the items must be compared with
+        eq_w()."""
+        return -1
+
+    def count(self, w_list, w_item):
+        space = self.space
+        # needs to be safe against eq_w() mutating the w_list behind our back
+        count = 0
+        i = 0
+        while i < w_list.length():
+            if space.eq_w(w_list.getitem(i), w_item):
+                count += 1
+            i += 1
+        return count
+
     def length(self, w_list):
         raise NotImplementedError
 
@@ -1098,6 +1128,16 @@ class BaseRangeListStrategy(ListStrategy):
         w_other.strategy = self
         w_other.lstorage = w_list.lstorage
 
+    def count(self, w_list, w_obj):
+        if type(w_obj) is W_IntObject:
+            # a range contains each of its items exactly once
+            try:
+                self.find(w_list, w_obj, 0, sys.maxint)
+            except ValueError:
+                return 0
+            return 1
+        return ListStrategy.count(self, w_list, w_obj)
+
     def getitem(self, w_list, i):
         return self.wrap(self._getitem_unwrapped(w_list, i))
 
@@ -1329,6 +1369,88 @@ class RangeListStrategy(BaseRangeListStrategy):
             return w_list.pop(index)
 
 
+# The loops over the unwrapped items of int and float lists have their own
+# jitdrivers with vectorize=True, so that with the 'vec' JIT parameter
+# enabled they are compiled into SIMD loops, like the micronumpy kernels.
+# Entering such a loop from another one costs about as much as comparing
+# a hundred items, so shorter ranges use a plain loop (a residual call in
+# the JIT).
+
+MIN_VECTORIZED_LENGTH = 128
+
+find_int_driver = jit.JitDriver(name='list.find_int', greens=[],
+                                reds='auto', vectorize=True)
+find_float_driver = jit.JitDriver(name='list.find_float', greens=[],
+                                  reds='auto', vectorize=True)
+difference_int_driver = jit.JitDriver(name='list.difference_int', greens=[],
+                                      reds='auto', vectorize=True)
+difference_float_driver = jit.JitDriver(name='list.difference_float',
+                                        greens=[], reds='auto',
+                                        vectorize=True)
+
+@specialize.argtype(0)
+def _find_plain(l, obj, start, stop):
+    i = start
+    while i < stop:
+        if l[i] == obj:
+            return i
+        i += 1
+    return -1
+
+@specialize.argtype(0)
+def _difference_plain(l1, l2, start, stop):
+    i = start
+    while i < stop:
+        if l1[i] != l2[i]:
+            break
+        i += 1
+    return i
+
+def _find_int(l, obj, start, stop):
+    if stop - start < MIN_VECTORIZED_LENGTH:
+        return _find_plain(l, obj, start, stop)
+    i = start
+    while i < stop:
+        find_int_driver.jit_merge_point()
+        if l[i] == obj:
+            return i
+        i += 1
+    return -1
+
+def _find_float(l, obj, start, stop):
+    if stop - start < MIN_VECTORIZED_LENGTH:
+        return _find_plain(l, obj, start, stop)
+    i = start
+    while i < stop:
+        find_float_driver.jit_merge_point()
+        if l[i] == obj:
+            return i
+        i += 1
+    return -1
+
+def _difference_int(l1, l2, start, stop):
+    if stop - start < MIN_VECTORIZED_LENGTH:
+        return _difference_plain(l1, l2, start, stop)
+    i = start
+    while i < stop:
+        difference_int_driver.jit_merge_point()
+        if l1[i] != l2[i]:
+            break
+        i += 1
+    return i
+
+def _difference_float(l1, l2, start, stop):
+    if stop - start < MIN_VECTORIZED_LENGTH:
+        return _difference_plain(l1, l2, start, stop)
+    i = start
+    while i < stop:
+        difference_float_driver.jit_merge_point()
+        if l1[i] != l2[i]:
+            break
+        i += 1
+    return i
+
+
 class AbstractUnwrappedStrategy(object):
 
     def wrap(self, unwrapped):
@@ -1390,6 +1512,23 @@ class AbstractUnwrappedStrategy(object):
                 return i
         raise ValueError
 
+    def count(self, w_list, w_obj):
+        if self.is_correct_type(w_obj):
+            # reuse _safe_find(), which knows about the equality rules of
+            # the strategy (NaNs, 0.0 == -0.0, ...)
+            obj = self.unwrap(w_obj)
+            count = 0
+            i = 0
+            while True:
+                try:
+                    i = self._safe_find(w_list, obj, i, sys.maxint)
+                except ValueError:
+                    break
+                count += 1
+                i += 1
+            return count
+        return ListStrategy.count(self, w_list, w_obj)
+
     def length(self, w_list):
         return len(self.unerase(w_list.lstorage))
 
@@ -1651,6 +1790,9 @@ class ObjectListStrategy(ListStrategy):
     def find(self, w_list, w_obj, start, stop):
         return ListStrategy.find(self, w_list, w_obj, start, stop)
 
+    def count(self, w_list, w_obj):
+        return ListStrategy.count(self, w_list, w_obj)
+
     def getitems(self, w_list):
         return self.unerase(w_list.lstorage)
 
@@ -1689,6 +1831,18 @@ class IntegerListStrategy(ListStrategy):
     def getitems_int(self, w_list):
         return self.unerase(w_list.lstorage)
 
+    def _safe_find(self, w_list, obj, start, stop):
+        l = self.unerase(w_list.lstorage)
+        i = _find_int(l, obj, start, min(stop, len(l)))
+        if i < 0:
+            raise ValueError
+        return i
+
+    def first_difference(self, w_list, w_other):
+        l1 = self.unerase(w_list.lstorage)
+        l2 = self.unerase(w_other.lstorage)
+        return _difference_int(l1, l2, 0, min(len(l1), len(l2)))
+
 
     _base_extend_from_list = _extend_from_list
 
@@ -1785,6 +1939,21 @@ class FloatListStrategy(ListStrategy):
     def getitems_float(self, w_list):
         return self.unerase(w_list.lstorage)
 
+    def first_difference(self, w_list, w_other):
+        l1 = self.unerase(w_list.lstorage)
+        l2 = self.unerase(w_other.lstorage)
+        stop = min(len(l1), len(l2))
+        i = 0
+        while True:
+            i = _difference_float(l1, l2, i, stop)
+            if i == stop:
+                return i
+            # NaNs with the same bit pattern are identical, hence equal
+            if (longlong2float.float2longlong(l1[i]) !=
+                    longlong2float.float2longlong(l2[i])):
+                return i
+            i += 1
+
 
     _base_extend_from_list = _extend_from_list
 
@@ -1815,10 +1984,9 @@ class FloatListStrategy(ListStrategy):
         l = self.unerase(w_list.lstorage)
         stop = min(stop, len(l))
         if not math.isnan(obj):
-            for i in range(start, stop):
-                val = l[i]
-                if val == obj:
-                    return i
+            i = _find_float(l, obj, start, stop)
+            if i >= 0:
+                return i
         else:
             search = longlong2float.float2longlong(obj)
             for i in range(start, stop):
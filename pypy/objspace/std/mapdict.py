@@ -963,6 +963,7 @@ class CacheEntry(object):
     version_tag = None
     storageindex = 0
     w_method = None # for callmethod
+    seen_maps = None # weakrefs to the maps seen, see _record_map()
     success_counter = 0
     failure_counter = 0
 
@@ -992,6 +993,7 @@ INVALID_CACHE_ENTRY.map_wref = weakref.ref(_invalid_cache_entry_map)
 def init_mapdict_cache(pycode):
     num_entries = len(pycode.co_names_w)
     pycode._mapdict_caches = [INVALID_CACHE_ENTRY] * num_entries
+    pycode._megamorphic_names = [False] * num_entries
 
 @jit.dont_look_inside
 def _fill_cache(pycode, nameindex, map, version_tag, storageindex, w_method=None):
@@ -1007,6 +1009,28 @@ def _fill_cache(pycode, nameindex, map, version_tag, storageindex, w_method=None
     entry.w_method = w_method
     if pycode.space.config.objspace.std.withmethodcachecounter:
         entry.failure_counter += 1
+    _record_map(pycode, nameindex, entry, map)
+
+def _record_map(pycode, nameindex, entry, map):
+    # count the different maps seen by the site; after 'megamorphiclimit' of
+    # them, the site switches to the global MegamorphicCache.  Replacing the
+    # quasi-immutable list invalidates the loops that were compiled with the
+    # site still being polymorphic.
+    limit = pycode.space.config.objspace.std.megamorphiclimit
+    if limit <= 0 or pycode._megamorphic_names[nameindex]:
+        return
+    seen_maps = entry.seen_maps
+    if seen_maps is None:
+        seen_maps = entry.seen_maps = []
+    for wref in seen_maps:
+        if wref() is map:
+            return
+    seen_maps.append(weakref.ref(map))
+    if len(seen_maps) > limit:
+        entry.seen_maps = None
+        megamorphic_names = pycode._megamorphic_names[:]
+        megamorphic_names[nameindex] = True
+        pycode._megamorphic_names = megamorphic_names
 
 def LOAD_ATTR_caching(pycode, w_obj, nameindex):
     # this whole mess is to make the interpreter quite a bit faster; it's not
@@ -1016,6 +1040,8 @@ def LOAD_ATTR_caching(pycode, w_obj, nameindex):
     if entry.is_valid_for_map(map) and entry.w_method is None:
         # everything matches, it's incredibly fast
         return w_obj._mapdict_read_storage(entry.storageindex)
+    if is_megamorphic(pycode, nameindex):
+        return LOAD_ATTR_megamorphic(pycode, w_obj, nameindex)
     return LOAD_ATTR_slowpath(pycode, w_obj, nameindex, map)
 LOAD_ATTR_caching._always_inline_ = True
 
@@ -1030,44 +1056,53 @@ def LOAD_ATTR_slowpath(pycode, w_obj, nameindex, map):
         version_tag = w_type.version_tag()
         if version_tag is not None:
             name = space.text_w(w_name)
-            # We need to care for obscure cases in which the w_descr is
-            # a MutableCell, which may change without changing the version_tag
-            _, w_descr = w_type._pure_lookup_where_with_method_cache(
-                name, version_tag)
-            #
-            attrname, index = ("", INVALID)
-            if w_descr is None:
-                attrname, index = (name, DICT) # common case: no such attr in the class
-            elif isinstance(w_descr, MutableCell):
-                pass              # we have a MutableCell in the class: give up
-            elif space.is_data_descr(w_descr):
-                # we have a data descriptor, which means the dictionary value
-                # (if any) has no relevance.
-                from pypy.interpreter.typedef import Member
-                if isinstance(w_descr, Member):    # it is a slot -- easy case
-                    attrname, index = ("slot", SLOTS_STARTING_FROM + w_descr.index)
-            else:
-                # There is a non-data descriptor in the class.  If there is
-                # also a dict attribute, use the latter, caching its storageindex.
-                # If not, we loose.  We could do better in this case too,
-                # but we don't care too much; the common case of a method
-                # invocation is handled by LOOKUP_METHOD_xxx below.
-                attrname = name
-                index = DICT
-            #
-            if index != INVALID:
-                attr = map.find_map_attr(attrname, index)
-                if attr is not None:
-                    # Note that if map.terminator is a DevolvedDictTerminator
-                    # or the class provides its own dict, not using mapdict, then:
-                    # map.find_map_attr will always return None if index==DICT.
-                    _fill_cache(pycode, nameindex, map, version_tag, attr.storageindex)
-                    return w_obj._mapdict_read_storage(attr.storageindex)
+            storageindex = _find_storageindex(space, map, w_type, name,
+                                              version_tag)
+            if storageindex >= 0:
+                _fill_cache(pycode, nameindex, map, version_tag, storageindex)
+                return w_obj._mapdict_read_storage(storageindex)
     if space.config.objspace.std.withmethodcachecounter:
         INVALID_CACHE_ENTRY.failure_counter += 1
     return space.getattr(w_obj, w_name)
 LOAD_ATTR_slowpath._dont_inline_ = True
 
+def _find_storageindex(space, map, w_type, name, version_tag):
+    """Return the storageindex of the attribute 'name' in the instances of
+    'map', or -1 if reading it needs the generic space.getattr()."""
+    # We need to care for obscure cases in which the w_descr is
+    # a MutableCell, which may change without changing the version_tag
+    _, w_descr = w_type._pure_lookup_where_with_method_cache(
+        name, version_tag)
+    #
+    attrname, index = ("", INVALID)
+    if w_descr is None:
+        attrname, index = (name, DICT) # common case: no such attr in the class
+    elif isinstance(w_descr, MutableCell):
+        pass              # we have a MutableCell in the class: give up
+    elif space.is_data_descr(w_descr):
+        # we have a data descriptor, which means the dictionary value
+        # (if any) has no relevance.
+        from pypy.interpreter.typedef import Member
+        if isinstance(w_descr, Member):    # it is a slot -- easy case
+            attrname, index = ("slot", SLOTS_STARTING_FROM + w_descr.index)
+    else:
+        # There is a non-data descriptor in the class.  If there is
+        # also a dict attribute, use the latter, caching its storageindex.
+        # If not, we loose.  We could do better in this case too,
+        # but we don't care too much; the common case of a method
+        # invocation is handled by LOOKUP_METHOD_xxx below.
+        attrname = name
+        index = DICT
+    #
+    if index != INVALID:
+        attr = map.find_map_attr(attrname, index)
+        if attr is not None:
+            # Note that if map.terminator is a DevolvedDictTerminator
+            # or the class provides its own dict, not using mapdict, then:
+            # map.find_map_attr will always return None if index==DICT.
+            return attr.storageindex
+    return -1
+
 def LOOKUP_METHOD_mapdict(f, nameindex, w_obj):
     pycode = f.getcode()
     entry = pycode._mapdict_caches[nameindex]
@@ -1077,6 +1112,12 @@ def LOOKUP_METHOD_mapdict(f, nameindex, w_obj):
             f.pushvalue(w_method)
             f.pushvalue(w_obj)
             return True
+    elif is_megamorphic(pycode, nameindex):
+        w_method = LOOKUP_METHOD_megamorphic(f.space, pycode, nameindex, w_obj)
+        if w_method is not None:
+            f.pushvalue(w_method)
+            f.pushvalue(w_obj)
+            return True
     return False
 
 def LOOKUP_METHOD_mapdict_fill_cache_method(space, pycode, name, nameindex,
@@ -1100,3 +1141,124 @@ def LOOKUP_METHOD_mapdict_fill_cache_method(space, pycode, name, nameindex,
 # XXX fix me: if a function contains a loop with both LOAD_ATTR and
 # XXX LOOKUP_METHOD on the same attribute name, it keeps trashing and
 # XXX rebuilding the cache
+
+# ____________________________________________________________
+# megamorphic sites
+
+# A site that has seen more than 'megamorphiclimit' maps stops using its own
+# CacheEntry, which would only keep thrashing, and looks up a global cache
+# indexed by (map, name) instead.  In the JIT, the whole lookup is a single
+# residual call, instead of a guard_class and a bridge for every new class.
+
+def is_megamorphic(pycode, nameindex):
+    return pycode._megamorphic_names[nameindex]
+
+class MegamorphicCache(object):
+    def __init__(self, space):
+        SIZE = 1 << space.config.objspace.std.methodcachesizeexp
+        self.maps = [None] * SIZE
+        self.versions = [None] * SIZE
+        self.names = [None] * SIZE
+        self.storageindexes = [-1] * SIZE
+        self.methods_w = [None] * SIZE
+        self.space = space
+
+    def _index(self, map, name):
+        space = self.space
+        SHIFT2 = r_uint.BITS - space.config.objspace.std.methodcachesizeexp
+        SHIFT1 = SHIFT2 - 5
+        map_as_int = objectmodel.current_object_addr_as_int(map)
+        product = intmask(map_as_int * objectmodel.compute_hash(name))
+        return intmask((r_uint(product) ^ (r_uint(product) << SHIFT1)) >> SHIFT2)
+
+    def lookup(self, map, version_tag, name):
+        """Return the index of the entry for 'map' and 'name', or -1."""
+        index = self._index(map, name)
+        if (self.maps[index] is map and
+                self.versions[index] is version_tag and
+                self.names[index] == name):
+            return index
+        return -1
+
+    def store(self, map, version_tag, name, storageindex, w_method):
+        if not self.space._side_effects_ok():
+            return
+        index = self._index(map, name)
+        self.maps[index] = map
+        self.versions[index] = version_tag
+        self.names[index] = name
+        self.storageindexes[index] = storageindex
+        self.methods_w[index] = w_method
+
+    def clear(self):
+        for i in range(len(self.maps)):
+            self.maps[i] = None
+            self.versions[i] = None
+            self.names[i] = None
+            self.storageindexes[i] = -1
+            self.methods_w[i] = None
+
+    def _cleanup_(self):
+        self.clear()
+
+class MegamorphicAttrCache(MegamorphicCache):
+    pass
+
+class MegamorphicMethodCache(MegamorphicCache):
+    pass
+
+@jit.dont_look_inside
+def LOAD_ATTR_megamorphic(pycode, w_obj, nameindex):
+    space = pycode.space
+    w_name = pycode.co_names_w[nameindex]
+    map = w_obj._get_mapdict_map()
+    if map is not None:
+        w_type = map.terminator.w_cls
+        version_tag = w_type.version_tag()
+        if version_tag is not None:
+            name = space.text_w(w_name)
+            cache = space.fromcache(MegamorphicAttrCache)
+            index = cache.lookup(map, version_tag, name)
+            if index >= 0:
+                return w_obj._mapdict_read_storage(cache.storageindexes[index])
+            if w_type.getattribute_if_not_from_object() is None:
+                storageindex = _find_storageindex(space, map, w_type, name,
+                                                  version_tag)
+                if storageindex >= 0:
+                    cache.store(map, version_tag, name, storageindex, None)
+                    return w_obj._mapdict_read_storage(storageindex)
+    return space.getattr(w_obj, w_name)
+
+@jit.dont_look_inside
+def LOOKUP_METHOD_megamorphic(space, pycode, nameindex, w_obj):
+    """Return the function found in the class of 'w_obj' for the name
+    'co_names_w[nameindex]', or None if the name is not a plain method
+    (then the caller must fall back to the general lookup)."""
+    from pypy.interpreter.function import Function, FunctionWithFixedCode
+    map = w_obj._get_mapdict_map()
+    if map is None or isinstance(map.terminator, DevolvedDictTerminator):
+        return None
+    w_type = map.terminator.w_cls
+    # see LOOKUP_METHOD_mapdict_fill_cache_method()
+    if w_type.layout.typedef.hasdict:
+        return None
+    version_tag = w_type.version_tag()
+    if version_tag is None:
+        return None
+    name = space.text_w(pycode.co_names_w[nameindex])
+    cache = space.fromcache(MegamorphicMethodCache)
+    index = cache.lookup(map, version_tag, name)
+    if index >= 0:
+        return cache.methods_w[index]
+    if not w_type.has_object_getattribute():
+        return None
+    _, w_descr = w_type._pure_lookup_where_with_method_cache(name, version_tag)
+    if w_descr is None:
+        return None
+    typ = type(w_descr)
+    if typ is not Function and typ is not FunctionWithFixedCode:
+        return None     # includes the MutableCells
+    if map.find_map_attr(name, DICT) is not None:
+        return None     # the instance attribute wins
+    cache.store(map, version_tag, name, -1, w_descr)
+    return w_descr
@@ -4,6 +4,9 @@ from pypy.interpreter.error import OperationError, oefmt
 from pypy.interpreter.signature import Signature
 from pypy.interpreter.typedef import TypeDef
 from pypy.objspace.std.bytesobject import W_BytesObject
+from pypy.objspace.std.floatobject import (
+    W_FloatObject, float_equal_to_int, float_is_int, float_key_eq,
+    float_key_hash)
 from pypy.objspace.std.intobject import W_IntObject
 from pypy.objspace.std.unicodeobject import W_UnicodeObject
 from pypy.objspace.std.util import IDTAG_SPECIAL, IDTAG_SHIFT
@@ -94,6 +97,10 @@ class W_BaseSetObject(W_Root):
         """ If this is an int set return its contents as a list of uwnrapped ints. Otherwise return None. """
         return self.strategy.listview_int(self)
 
+    def listview_float(self):
+        """ If this is a float set return its contents as a list of uwnrapped floats. Otherwise return None. """
+        return self.strategy.listview_float(self)
+
     def get_storage_copy(self):
         """ Returns a copy of the storage. Needed when we want to clone all elements from one set and
         put them into another. """
@@ -696,6 +703,9 @@ class SetStrategy(object):
     def listview_int(self, w_set):
         return None
 
+    def listview_float(self, w_set):
+        return None
+
     #def erase(self, storage):
     #    raise NotImplementedError
 
@@ -793,6 +803,8 @@ class EmptySetStrategy(SetStrategy):
     def add(self, w_set, w_key):
         if type(w_key) is W_IntObject:
             strategy = self.space.fromcache(IntegerSetStrategy)
+        elif type(w_key) is W_FloatObject:
+            strategy = self.space.fromcache(FloatSetStrategy)
         elif type(w_key) is W_BytesObject:
             strategy = self.space.fromcache(BytesSetStrategy)
         elif type(w_key) is W_UnicodeObject:
@@ -947,6 +959,12 @@ class AbstractUnwrappedSetStrategy(object):
         return keys_w
 
     def has_key(self, w_set, w_key):
+        return self._has_key_typed(w_set, w_key)
+
+    def _has_key_typed(self, w_set, w_key):
+        # for the overridden has_key() of the subclasses: calling the
+        # unbound AbstractUnwrappedSetStrategy.has_key() from several
+        # classes would mix their 'self'
         if not self.is_correct_type(w_key):
             #XXX check type of w_item and immediately return False in some cases
             w_set.switch_to_object_strategy(self.space)
@@ -1242,6 +1260,8 @@ class BytesSetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
     def may_contain_equal_elements(self, strategy):
         if strategy is self.space.fromcache(IntegerSetStrategy):
             return False
+        elif strategy is self.space.fromcache(FloatSetStrategy):
+            return False
         elif strategy is self.space.fromcache(EmptySetStrategy):
             return False
         elif strategy is self.space.fromcache(IdentitySetStrategy):
@@ -1281,6 +1301,8 @@ class UnicodeSetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
     def may_contain_equal_elements(self, strategy):
         if strategy is self.space.fromcache(IntegerSetStrategy):
             return False
+        elif strategy is self.space.fromcache(FloatSetStrategy):
+            return False
         elif strategy is self.space.fromcache(EmptySetStrategy):
             return False
         elif strategy is self.space.fromcache(IdentitySetStrategy):
@@ -1334,10 +1356,71 @@ class IntegerSetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
     def wrap(self, item):
         return self.space.newint(item)
 
+    def has_key(self, w_set, w_key):
+        if type(w_key) is W_FloatObject:
+            # look up floats that are equal to an int without switching
+            # to the object strategy
+            f = self.space.float_w(w_key)
+            if not float_is_int(f):
+                return False
+            return int(f) in self.unerase(w_set.sstorage)
+        return self._has_key_typed(w_set, w_key)
+
     def iter(self, w_set):
         return IntegerIteratorImplementation(self.space, self, w_set)
 
 
+class FloatSetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
+    erase, unerase = rerased.new_erasing_pair("float")
+    erase = staticmethod(erase)
+    unerase = staticmethod(unerase)
+
+    intersect_jmp = jit.JitDriver(greens = [], reds = 'auto',
+                                  name='set(float).intersect')
+
+    def get_empty_storage(self):
+        return self.erase(self.get_empty_dict())
+
+    def get_empty_dict(self):
+        return r_dict(float_key_eq, float_key_hash)
+
+    def listview_float(self, w_set):
+        return self.unerase(w_set.sstorage).keys()
+
+    def is_correct_type(self, w_key):
+        return type(w_key) is W_FloatObject
+
+    def may_contain_equal_elements(self, strategy):
+        if strategy is self.space.fromcache(BytesSetStrategy):
+            return False
+        elif strategy is self.space.fromcache(UnicodeSetStrategy):
+            return False
+        elif strategy is self.space.fromcache(EmptySetStrategy):
+            return False
+        elif strategy is self.space.fromcache(IdentitySetStrategy):
+            return False
+        return True
+
+    def unwrap(self, w_item):
+        return self.space.float_w(w_item)
+
+    def wrap(self, item):
+        return self.space.newfloat(item)
+
+    def has_key(self, w_set, w_key):
+        if type(w_key) is W_IntObject:
+            # look up ints as the equal float, if there is one, without
+            # switching to the object strategy
+            x = self.space.int_w(w_key)
+            if not float_equal_to_int(x):
+                return False
+            return float(x) in self.unerase(w_set.sstorage)
+        return self._has_key_typed(w_set, w_key)
+
+    def iter(self, w_set):
+        return FloatIteratorImplementation(self.space, self, w_set)
+
+
 class ObjectSetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
     erase, unerase = rerased.new_erasing_pair("object")
     erase = staticmethod(erase)
@@ -1409,6 +1492,8 @@ class IdentitySetStrategy(AbstractUnwrappedSetStrategy, SetStrategy):
             return False
         if strategy is self.space.fromcache(IntegerSetStrategy):
             return False
+        if strategy is self.space.fromcache(FloatSetStrategy):
+            return False
         if strategy is self.space.fromcache(BytesSetStrategy):
             return False
         if strategy is self.space.fromcache(UnicodeSetStrategy):
@@ -1514,6 +1599,19 @@ class IntegerIteratorImplementation(IteratorImplementation):
         else:
             return None
 
+class FloatIteratorImplementation(IteratorImplementation):
+    def __init__(self, space, strategy, w_set):
+        IteratorImplementation.__init__(self, space, strategy, w_set)
+        d = strategy.unerase(w_set.sstorage)
+        self.iterator = d.iterkeys()
+
+    def next_entry(self):
+        # note that this 'for' loop only runs once, at most
+        for key in self.iterator:
+            return self.space.newfloat(key)
+        else:
+            return None
+
 class IdentityIteratorImplementation(IteratorImplementation):
     def __init__(self, space, strategy, w_set):
         IteratorImplementation.__init__(self, space, strategy, w_set)
@@ -1605,6 +1703,13 @@ def set_strategy_and_setdata(space, w_set, w_iterable):
         w_set.sstorage = strategy.get_storage_from_unwrapped_list(intlist)
         return
 
+    floatlist = space.listview_float(w_iterable)
+    if floatlist is not None:
+        strategy = space.fromcache(FloatSetStrategy)
+        w_set.strategy = strategy
+        w_set.sstorage = strategy.get_storage_from_unwrapped_list(floatlist)
+        return
+
     length_hint = space.length_hint(w_iterable, 0)
 
     if jit.isconstant(length_hint):
@@ -1626,6 +1731,15 @@ def _pick_correct_strategy_unroll(space, w_set, w_iterable):
         w_set.sstorage = w_set.strategy.get_storage_from_list(iterable_w)
         return
 
+    # check for floats
+    for w_item in iterable_w:
+        if type(w_item) is not W_FloatObject:
+            break
+    else:
+        w_set.strategy = space.fromcache(FloatSetStrategy)
+        w_set.sstorage = w_set.strategy.get_storage_from_list(iterable_w)
+        return
+
     # check for strings
     for w_item in iterable_w:
         if type(w_item) is not W_BytesObject:
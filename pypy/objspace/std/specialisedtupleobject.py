@@ -1,7 +1,11 @@
 from pypy.interpreter.error import oefmt
-from pypy.objspace.std.tupleobject import W_AbstractTupleObject
+from pypy.objspace.std.tupleobject import (
+    W_AbstractTupleObject, UNROLL_CUTOFF, _unroll_condition,
+    _unroll_condition_cmp)
 from pypy.objspace.std.util import negate
-from rpython.rlib.objectmodel import specialize
+from rpython.rlib import jit
+from rpython.rlib.debug import make_sure_not_resized
+from rpython.rlib.objectmodel import specialize, compute_hash
 from rpython.rlib.rarithmetic import intmask
 from rpython.rlib.unroll import unrolling_iterable
 from rpython.tool.sourcetools import func_with_new_name
@@ -144,6 +148,177 @@ Cls_ii = make_specialised_class((int, int))
 Cls_oo = make_specialised_class((object, object))
 Cls_ff = make_specialised_class((float, float))
 
+# ---------- homogeneous tuples of any length ----------
+
+def make_homogeneous_class(typ):
+    """ Makes a tuple class that stores items which are all exact ints,
+    all exact floats or all exact strs in an unboxed, fixed-size list.
+    Unlike the classes above, the same class is used for every length. """
+    if typ == int:
+        name = 'Int'
+        default = 0
+        def wrap(space, x):
+            return space.newint(x)
+        def hash_item(space, x):
+            from pypy.objspace.std.intobject import _hash_int
+            return _hash_int(x)
+        def is_exact_type(w_obj):
+            from pypy.objspace.std.intobject import W_IntObject
+            return type(w_obj) is W_IntObject
+        def unwrap(space, w_obj):
+            return space.int_w(w_obj)
+    elif typ == float:
+        name = 'Float'
+        default = 0.0
+        def wrap(space, x):
+            return space.newfloat(x)
+        def hash_item(space, x):
+            from pypy.objspace.std.floatobject import _hash_float
+            return _hash_float(space, x)
+        def is_exact_type(w_obj):
+            from pypy.objspace.std.floatobject import W_FloatObject
+            return type(w_obj) is W_FloatObject
+        def unwrap(space, w_obj):
+            return space.float_w(w_obj)
+    elif typ == str:
+        name = 'Bytes'
+        default = ''
+        def wrap(space, x):
+            return space.newbytes(x)
+        def hash_item(space, x):
+            h = compute_hash(x)
+            return h - (h == -1)   # same as W_BytesObject.descr_hash()
+        def is_exact_type(w_obj):
+            from pypy.objspace.std.bytesobject import W_BytesObject
+            return type(w_obj) is W_BytesObject
+        def unwrap(space, w_obj):
+            return space.bytes_w(w_obj)
+    else:
+        assert 0
+
+    def item_eq(x, y):
+        if x == y:
+            return True
+        if typ == float:
+            # NaNs are equal to themselves here, like in the tuples above
+            return float2longlong(x) == float2longlong(y)
+        return False
+
+    class cls(W_AbstractTupleObject):
+        _immutable_fields_ = ['items[*]']
+
+        def __init__(self, space, items):
+            make_sure_not_resized(items)
+            self.space = space
+            self.items = items
+
+        def length(self):
+            return len(self.items)
+
+        def tolist(self):
+            items = self.items
+            list_w = [None] * len(items)
+            for i in range(len(items)):
+                list_w[i] = wrap(self.space, items[i])
+            return list_w
+
+        # same source code, but builds and returns a resizable list
+        getitems_copy = func_with_new_name(tolist, 'getitems_copy')
+
+        @jit.look_inside_iff(lambda self, space: _unroll_condition(self))
+        def descr_hash(self, space):
+            mult = 1000003
+            x = 0x345678
+            z = len(self.items)
+            for value in self.items:
+                y = hash_item(space, value)
+                x = (x ^ y) * mult
+                z -= 1
+                mult += 82520 + z + z
+            x += 97531
+            return space.newint(intmask(x))
+
+        def descr_eq(self, space, w_other):
+            if not isinstance(w_other, W_AbstractTupleObject):
+                return space.w_NotImplemented
+            return self._descr_eq(space, w_other)
+
+        @jit.look_inside_iff(_unroll_condition_cmp)
+        def _descr_eq(self, space, w_other):
+            items1 = self.items
+            if w_other.length() != len(items1):
+                return space.w_False
+            if isinstance(w_other, cls):
+                # compare the unboxed items directly
+                items2 = w_other.items
+                for i in range(len(items1)):
+                    if not item_eq(items1[i], items2[i]):
+                        return space.w_False
+                return space.w_True
+            items2_w = w_other.tolist()
+            for i in range(len(items1)):
+                if not space.eq_w(wrap(space, items1[i]), items2_w[i]):
+                    return space.w_False
+            return space.w_True
+
+        descr_ne = negate(descr_eq)
+
+        def descr_contains(self, space, w_obj):
+            if is_exact_type(w_obj):
+                return space.newbool(self._contains_unboxed(
+                    unwrap(space, w_obj)))
+            return W_AbstractTupleObject.descr_contains(self, space, w_obj)
+
+        @jit.look_inside_iff(lambda self, value: _unroll_condition(self))
+        def _contains_unboxed(self, value):
+            for item in self.items:
+                if item_eq(item, value):
+                    return True
+            return False
+
+        def getitem(self, space, index):
+            try:
+                value = self.items[index]
+            except IndexError:
+                raise oefmt(space.w_IndexError, "tuple index out of range")
+            return wrap(space, value)
+
+    @jit.look_inside_iff(lambda space, list_w:
+            jit.loop_unrolling_heuristic(list_w, len(list_w), UNROLL_CUTOFF))
+    def make_from_list(space, list_w):
+        for w_item in list_w:
+            if not is_exact_type(w_item):
+                return None
+        items = [default] * len(list_w)
+        for i in range(len(list_w)):
+            items[i] = unwrap(space, list_w[i])
+        return cls(space, items)
+
+    cls.__name__ = 'W_%sTupleObject' % (name,)
+    cls.make_from_list = staticmethod(make_from_list)
+    return cls
+
+W_IntTupleObject = make_homogeneous_class(int)
+W_FloatTupleObject = make_homogeneous_class(float)
+W_BytesTupleObject = make_homogeneous_class(str)
+
+def makehomogeneoustuple(space, list_w):
+    from pypy.objspace.std.intobject import W_IntObject
+    from pypy.objspace.std.floatobject import W_FloatObject
+    from pypy.objspace.std.bytesobject import W_BytesObject
+    w_first = list_w[0]
+    if type(w_first) is W_IntObject:
+        w_res = W_IntTupleObject.make_from_list(space, list_w)
+    elif type(w_first) is W_FloatObject:
+        w_res = W_FloatTupleObject.make_from_list(space, list_w)
+    elif type(w_first) is W_BytesObject:
+        w_res = W_BytesTupleObject.make_from_list(space, list_w)
+    else:
+        w_res = None
+    if w_res is None:
+        raise NotSpecialised
+    return w_res
+
 def makespecialisedtuple(space, list_w):
     from pypy.objspace.std.intobject import W_IntObject
     from pypy.objspace.std.floatobject import W_FloatObject
@@ -156,6 +331,8 @@ def makespecialisedtuple(space, list_w):
             if type(w_arg2) is W_FloatObject:
                 return Cls_ff(space, space.float_w(w_arg1), space.float_w(w_arg2))
         return Cls_oo(space, w_arg1, w_arg2)
+    elif len(list_w) > 2:
+        return makehomogeneoustuple(space, list_w)
     else:
         raise NotSpecialised
 
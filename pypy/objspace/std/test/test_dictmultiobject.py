@@ -2,7 +2,8 @@ import sys
 import py
 
 from pypy.objspace.std.dictmultiobject import (W_DictMultiObject,
-    W_DictObject, BytesDictStrategy, ObjectDictStrategy)
+    W_DictObject, BytesDictStrategy, ObjectDictStrategy,
+    SmallObjectDictStrategy, SMALL_DICT_MAX_SIZE)
 
 
 class TestW_DictObject(object):
@@ -153,6 +154,42 @@ class TestW_DictObject(object):
         w_d.initialize_content([(w(1), w("a")), (w(2), w("b"))])
         assert self.space.listview_int(w_d) == [1, 2]
 
+    def test_listview_float_dict(self):
+        w = self.space.wrap
+        w_d = self.space.newdict()
+        w_d.initialize_content([(w(1.5), w("a")), (w(2.5), w("b"))])
+        assert sorted(self.space.listview_float(w_d)) == [1.5, 2.5]
+
+    def test_unboxed_value_strategies(self):
+        from pypy.objspace.std.dictmultiobject import (
+            BytesDictStrategy, BytesIntDictStrategy, IntDictStrategy,
+            IntFloatDictStrategy, IntIntDictStrategy)
+        space = self.space
+        w = space.wrap
+        w_d = space.newdict()
+        w_d.setitem(w(1), w(2))
+        assert w_d.get_strategy() is space.fromcache(IntIntDictStrategy)
+        assert w_d.get_strategy().unerase(w_d.dstorage) == {1: 2}
+        assert space.listview_int(w_d) == [1]
+        w_d.setitem(w(3), w("x"))
+        assert w_d.get_strategy() is space.fromcache(IntDictStrategy)
+        assert space.eq_w(w_d.getitem(w(1)), w(2))
+        #
+        w_d = space.newdict()
+        w_d.setitem(w(1), w(2.5))
+        assert w_d.get_strategy() is space.fromcache(IntFloatDictStrategy)
+        assert w_d.get_strategy().unerase(w_d.dstorage) == {1: 2.5}
+        #
+        w_d = space.newdict()
+        w_d.setitem(space.newbytes("a"), w(2))
+        assert w_d.get_strategy() is space.fromcache(BytesIntDictStrategy)
+        assert space.listview_bytes(w_d) == ["a"]
+        assert space.eq_w(w_d.getitem_str("a"), w(2))
+        assert w_d.getitem_str("b") is None
+        w_d.setitem_str("b", w(3))
+        assert w_d.get_strategy() is space.fromcache(BytesDictStrategy)
+        assert space.eq_w(w_d.getitem_str("b"), w(3))
+
     def test_keys_on_string_unicode_int_dict(self, monkeypatch):
         w = self.space.wrap
         wb = self.space.newbytes
@@ -1130,6 +1167,8 @@ class AppTestStrategies(object):
         d = {}
         assert "EmptyDictStrategy" in self.get_strategy(d)
         d[b"a"] = 1
+        assert "BytesIntDictStrategy" in self.get_strategy(d)
+        d[b"b"] = "b"
         assert "BytesDictStrategy" in self.get_strategy(d)
 
         class O(object):
@@ -1157,6 +1196,224 @@ class AppTestStrategies(object):
         assert "IntDictStrategy" in self.get_strategy(d)
         assert d[1L] == "hi"
 
+    def test_int_lookup_float(self):
+        d = {1: "a", 2: "b"}
+        assert d[1.0] == "a"
+        assert d.get(2.5) is None
+        assert float("nan") not in d
+        assert 1e300 not in d
+        assert "IntDictStrategy" in self.get_strategy(d)
+
+    def test_empty_to_float(self):
+        d = {}
+        d[1.5] = "a"
+        assert "FloatDictStrategy" in self.get_strategy(d)
+        d[2.0] = "b"
+        assert d[1.5] == "a"
+        assert d[2] == "b"
+        assert d.get(3) is None
+        assert d.get(2 ** 60 + 1) is None
+        assert d.get("2.0") is None
+        assert "FloatDictStrategy" in self.get_strategy(d)
+        assert sorted(d.keys()) == [1.5, 2.0]
+        assert type(d.keys()[0]) is float
+        assert sorted(d.items()) == [(1.5, "a"), (2.0, "b")]
+        del d[1.5]
+        assert d.pop(2.0) == "b"
+        assert d == {}
+        d[3] = "c"
+        assert "ObjectDictStrategy" in self.get_strategy(d)
+
+    def test_float_nan_and_zero(self):
+        nan = float("nan")
+        d = {nan: 1}
+        assert "FloatDictStrategy" in self.get_strategy(d)
+        assert d[nan] == 1
+        assert d.keys()[0] != d.keys()[0]
+        d[-0.0] = 2
+        d[0.0] = 3
+        assert len(d) == 2
+        assert d[0] == 3
+        assert str([k for k in d if k == 0][0]) == "-0.0"
+        d[1j] = 4
+        assert "ObjectDictStrategy" in self.get_strategy(d)
+        assert d[nan] == 1
+        assert d[0.0] == 3
+
+    def test_unboxed_values(self):
+        d = {}
+        d[1] = 2
+        assert "IntIntDictStrategy" in self.get_strategy(d)
+        d[3] = 4
+        assert d[1] == 2
+        assert d[1.0] == 2
+        assert d.get(5) is None
+        assert d.setdefault(5, 6) == 6
+        assert d.setdefault(5, 7) == 6
+        assert sorted(d.values()) == [2, 4, 6]
+        assert sorted(d.items()) == [(1, 2), (3, 4), (5, 6)]
+        assert d.pop(5) == 6
+        assert d.pop(5, None) is None
+        raises(KeyError, d.pop, 5)
+        assert d.popitem() in [(1, 2), (3, 4)]
+        assert "IntIntDictStrategy" in self.get_strategy(d)
+        #
+        d = {1: 1.5}
+        assert "IntFloatDictStrategy" in self.get_strategy(d)
+        d[2] = 2.5
+        assert sorted(d.itervalues()) == [1.5, 2.5]
+        assert type(d[1]) is float
+        #
+        d = {}
+        d[b"a"] = 1
+        assert "BytesIntDictStrategy" in self.get_strategy(d)
+        d[b"b"] = d.get(b"b", 0) + 1
+        d[b"b"] = d.get(b"b", 0) + 1
+        assert d == {b"a": 1, b"b": 2}
+        assert sorted(d.iteritems()) == [(b"a", 1), (b"b", 2)]
+        def f(**kwargs):
+            return kwargs
+        assert f(**d) == d
+        assert "BytesIntDictStrategy" in self.get_strategy(d.copy())
+
+    def test_unboxed_values_switch(self):
+        d = {1: 2, 3: 4}
+        d[5] = True
+        assert "IntDictStrategy" in self.get_strategy(d)
+        assert d == {1: 2, 3: 4, 5: True}
+        assert d[5] is True
+        #
+        d = {1: 2}
+        d[3] = 4.5
+        assert "IntDictStrategy" in self.get_strategy(d)
+        assert d == {1: 2, 3: 4.5}
+        #
+        d = {1: 1.5}
+        d[2] = 2
+        assert "IntDictStrategy" in self.get_strategy(d)
+        assert type(d[2]) is int
+        #
+        d = {1: 2}
+        d["a"] = 3
+        assert "ObjectDictStrategy" in self.get_strategy(d)
+        assert d == {1: 2, "a": 3}
+        #
+        d = {b"a": 1}
+        d[b"b"] = [1]
+        assert "BytesDictStrategy" in self.get_strategy(d)
+        assert d == {b"a": 1, b"b": [1]}
+        #
+        class Int(int):
+            pass
+        d = {1: Int(2)}
+        assert "IntDictStrategy" in self.get_strategy(d)
+        assert type(d[1]) is Int
+
+    def test_unboxed_values_counter(self):
+        from collections import Counter, defaultdict
+        c = Counter(["a", "b", "a"])
+        assert "BytesIntDictStrategy" in self.get_strategy(c)
+        assert c["a"] == 2
+        d = defaultdict(int)
+        for i in [1, 2, 1, 1]:
+            d[i] += 1
+        assert "IntIntDictStrategy" in self.get_strategy(d)
+        assert d == {1: 3, 2: 1}
+
+    def test_small_object_dict(self):
+        d = {}
+        for i in range(8):
+            d[(i, i)] = i
+        assert "SmallObjectDictStrategy" in self.get_strategy(d)
+        assert d.keys() == [(i, i) for i in range(8)]
+        assert d[(3, 3)] == 3
+        assert d.get((8, 8)) is None
+        assert (2, 2) in d
+        del d[(2, 2)]
+        assert d.pop((4, 4)) == 4
+        assert d.pop((4, 4), None) is None
+        assert d.setdefault((4, 4), 44) == 44
+        assert d.popitem() == ((4, 4), 44)
+        assert d.items() == [((0, 0), 0), ((1, 1), 1), ((3, 3), 3),
+                             ((5, 5), 5), ((6, 6), 6), ((7, 7), 7)]
+        assert list(reversed(d.keys())) == [(7, 7), (6, 6), (5, 5), (3, 3),
+                                            (1, 1), (0, 0)]
+        c = d.copy()
+        assert "SmallObjectDictStrategy" in self.get_strategy(c)
+        assert c == d
+        for i in range(8, 11):
+            d[(i, i)] = i
+        assert "ObjectDictStrategy" in self.get_strategy(d)
+        assert "Small" not in self.get_strategy(d)
+        assert d[(10, 10)] == 10
+        assert d[(0, 0)] == 0
+        assert len(d) == 9
+        d = {1L: 2}
+        assert "SmallObjectDictStrategy" in self.get_strategy(d)
+        assert d[1] == 2
+        assert d[1.0] == 2
+        raises(TypeError, "d[[]]")
+
+    def test_small_object_dict_update_too_large(self):
+        d = {(0, 0): 0}
+        assert "SmallObjectDictStrategy" in self.get_strategy(d)
+        e = {}
+        for i in range(1, 21):
+            e[(i, i)] = i
+        assert "ObjectDictStrategy" in self.get_strategy(e)
+        d.update(e)
+        assert "ObjectDictStrategy" in self.get_strategy(d)
+        assert "Small" not in self.get_strategy(d)
+        assert len(d) == 21
+        assert d[(20, 20)] == 20
+        # same strategy on both sides
+        d = {(0, 0): 0}
+        e = {}
+        for i in range(1, 9):
+            e[(i, i)] = i
+        assert "SmallObjectDictStrategy" in self.get_strategy(e)
+        d.update(e)
+        assert "Small" not in self.get_strategy(d)
+        assert d == dict([((i, i), i) for i in range(9)])
+        # a dict of up to 8 keys stays small
+        d = {(0, 0): 0}
+        d.update({(1, 1): 1, (2, 2): 2})
+        assert "SmallObjectDictStrategy" in self.get_strategy(d)
+        assert len(d) == 3
+
+    def test_small_object_dict_eq_calls(self):
+        class Key(object):
+            def __init__(self, name):
+                self.name = name
+            def __hash__(self):
+                return 42
+            def __eq__(self, other):
+                log.append((self.name, other.name))
+                return self.name == other.name
+        log = []
+        a, b, c = Key("a"), Key("b"), Key("c")
+        d = {a: 1, b: 2}
+        assert "SmallObjectDictStrategy" in self.get_strategy(d)
+        del log[:]
+        assert d[b] == 2     # identity is enough for 'b' itself
+        assert log == [("a", "b")]
+        del log[:]
+        assert d.get(Key("b")) == 2
+        assert log == [("a", "b"), ("b", "b")]
+        d[c] = 3
+        assert len(d) == 3
+
+    def test_small_object_dict_mutated_by_eq(self):
+        class Key(object):
+            def __hash__(self):
+                return 42
+            def __eq__(self, other):
+                d.clear()
+                return False
+        d = {Key(): 1}
+        assert d.get(Key()) is None
+        assert d == {}
+
     def test_iter_dict_length_change(self):
         d = {1: 2, 3: 4, 5: 6}
         it = d.iteritems()
@@ -1242,7 +1499,7 @@ class FakeSpace:
 
     def wrap(self, obj):
         return obj
-    newtext = newbytes = wrap
+    newtext = newbytes = newint = wrap
 
     def isinstance_w(self, obj, klass):
         return isinstance(obj, klass)
@@ -1484,6 +1741,33 @@ class TestBytesDictImplementation(BaseTestRDictImplementation):
         assert self.fakespace.view_as_kwargs(self.impl) == (["fish", "fish2"], [1000, 2000])
 
 
+class TestSmallObjectDictImplementation(BaseTestRDictImplementation):
+    StrategyClass = SmallObjectDictStrategy
+
+    def test_switch_to_object_strategy(self):
+        impl = self.impl
+        for i in range(SMALL_DICT_MAX_SIZE):
+            impl.setitem(i, i + 1)
+        self.check_not_devolved()
+        impl.delitem(3)
+        impl.setitem(3, 4)
+        self.check_not_devolved()
+        assert impl.w_keys() == [0, 1, 2, 4, 5, 6, 7, 3]
+        impl.setitem(SMALL_DICT_MAX_SIZE, 0)
+        assert type(impl.get_strategy()) is ObjectDictStrategy
+        assert sorted(impl.w_keys()) == range(SMALL_DICT_MAX_SIZE + 1)
+        assert impl.getitem(3) == 4
+
+    def test_remove_clears_slots(self):
+        impl = self.impl
+        impl.setitem(1, 2)
+        impl.setitem(3, 4)
+        impl.delitem(1)
+        storage = impl.get_strategy().unerase(impl.dstorage)
+        assert storage.length == 1
+        assert storage.items_w[:4] == [3, 4, None, None]
+
+
 class BaseTestDevolvedDictImplementation(BaseTestRDictImplementation):
     def fill_impl(self):
         BaseTestRDictImplementation.fill_impl(self)
@@ -1495,6 +1779,10 @@ class BaseTestDevolvedDictImplementation(BaseTestRDictImplementation):
 class TestDevolvedBytesDictImplementation(BaseTestDevolvedDictImplementation):
     StrategyClass = BytesDictStrategy
 
+class TestDevolvedSmallObjectDictImplementation(
+        BaseTestDevolvedDictImplementation):
+    StrategyClass = SmallObjectDictStrategy
+
 
 def test_module_uses_strdict():
     from pypy.objspace.std.celldict import ModuleDictStrategy
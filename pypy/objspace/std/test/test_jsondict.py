@@ -0,0 +1,124 @@
+
+class AppTest(object):
+    spaceconfig = {"objspace.usemodules._pypyjson": True}
+
+    def test_check_strategy(self):
+        import __pypy__
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": 1}')
+        assert __pypy__.strategy(d) == "JsonDictStrategy"
+        d = _pypyjson.loads('{}')
+        assert __pypy__.strategy(d) == "EmptyDictStrategy"
+
+    def test_simple(self):
+        import __pypy__
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": 1, "b": "x"}')
+        assert len(d) == 2
+        assert d[u"a"] == 1
+        assert d["b"] == u"x"
+        assert "c" not in d
+        assert d.get(42) is None
+
+    def test_shared_maps(self):
+        import __pypy__
+        import _pypyjson
+
+        l = _pypyjson.loads('[{"a": 1, "b": 2}, {"a": 3, "b": 4}]')
+        assert l == [{u"a": 1, u"b": 2}, {u"a": 3, u"b": 4}]
+        for d in l:
+            assert __pypy__.strategy(d) == "JsonDictStrategy"
+        assert l[0].keys() == [u"a", u"b"]
+
+    def test_keys_values_items(self):
+        import __pypy__
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": "x", "b": 2, "c": "z"}')
+        assert d.keys() == [u"a", u"b", u"c"]
+        assert d.values() == [u"x", 2, u"z"]
+        assert d.items() == [(u"a", u"x"), (u"b", 2), (u"c", u"z")]
+        assert list(d.iterkeys()) == [u"a", u"b", u"c"]
+        assert list(d.itervalues()) == [u"x", 2, u"z"]
+        assert list(d.iteritems()) == [(u"a", u"x"), (u"b", 2), (u"c", u"z")]
+        assert [type(x) for x in d.itervalues()] == [unicode, int, unicode]
+        assert __pypy__.strategy(d) == "JsonDictStrategy"
+
+    def test_lazy_value_identity(self):
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": "hello"}')
+        s = d["a"]
+        assert type(s) is unicode
+        assert d["a"] is s
+        assert d.values()[0] is s
+
+    def test_setitem_existing(self):
+        import __pypy__
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": 1, "b": 2}')
+        d[u"a"] = 5
+        assert __pypy__.strategy(d) == "JsonDictStrategy"
+        assert d == {u"a": 5, u"b": 2}
+
+    def test_mutation_switches(self):
+        import __pypy__
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        d[u"c"] = 3
+        assert __pypy__.strategy(d) == "UnicodeDictStrategy"
+        assert d == {u"a": u"x", u"b": 2, u"c": 3}
+
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        del d[u"a"]
+        assert __pypy__.strategy(d) == "UnicodeDictStrategy"
+        assert d == {u"b": 2}
+
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        d[1] = 3
+        assert __pypy__.strategy(d) == "ObjectDictStrategy"
+        assert d == {u"a": u"x", u"b": 2, 1: 3}
+
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        assert d.pop(u"a") == u"x"
+        assert d == {u"b": 2}
+
+        # the other dicts using the same map are unaffected
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        assert __pypy__.strategy(d) == "JsonDictStrategy"
+        assert d == {u"a": u"x", u"b": 2}
+
+    def test_copy_and_update(self):
+        import _pypyjson
+
+        d = _pypyjson.loads('{"a": "x", "b": 2}')
+        d2 = d.copy()
+        assert d2 == {u"a": u"x", u"b": 2}
+        assert type(d2["a"]) is unicode
+        d3 = {1: 2}
+        d3.update(d)
+        assert d3 == {1: 2, u"a": u"x", u"b": 2}
+        d.clear()
+        assert d == {}
+
+
+class TestJsonDictStrategy(object):
+    spaceconfig = {"objspace.usemodules._pypyjson": True}
+
+    def test_getitem_str(self):
+        from pypy.objspace.std.jsondict import JsonDictStrategy
+        space = self.space
+        w_d = space.appexec([], """():
+            import _pypyjson
+            return _pypyjson.loads('{"a": 1, "b": "x"}')
+        """)
+        assert space.int_w(w_d.getitem_str("a")) == 1
+        assert space.unicode_w(w_d.getitem_str("b")) == u"x"
+        assert w_d.getitem_str("c") is None
+        assert w_d.getitem_str("\xe9") is None
+        # the lookups don't switch to UnicodeDictStrategy
+        assert isinstance(w_d.get_strategy(), JsonDictStrategy)
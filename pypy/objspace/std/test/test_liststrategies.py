@@ -597,6 +597,90 @@ class TestW_ListStrategies(TestW_ListObject):
         l3 = l1.descr_add(self.space, l2)
         assert self.space.eq_w(l3, W_ListObject(self.space, [self.space.wrap(1), self.space.wrap(2), self.space.wrap(3), self.space.wrap(4), self.space.wrap(5)]))
 
+    def test_count_unboxed(self):
+        space = self.space
+        w = space.wrap
+        l = W_ListObject(space, [w(1), w(2), w(1), w(3), w(1)])
+        assert isinstance(l.strategy, IntegerListStrategy)
+        assert l.count(w(1)) == 3
+        assert l.count(w(4)) == 0
+        assert l.count(w(1.0)) == 3
+        assert l.count(w("a")) == 0
+        assert isinstance(l.strategy, IntegerListStrategy)
+        #
+        nan = float('nan')
+        w_nan = w(nan)
+        l = W_ListObject(space, [w(0.0), w_nan, w(-0.0), w_nan])
+        assert isinstance(l.strategy, FloatListStrategy)
+        assert l.count(w(0.0)) == 2
+        assert l.count(w_nan) == 2
+        assert l.count(w(0)) == 2
+        #
+        l = W_ListObject(space, [w(1), w(2.5), w(1.0)])
+        assert isinstance(l.strategy, IntOrFloatListStrategy)
+        assert l.count(w(1)) == 2
+        assert l.count(w(2.5)) == 1
+        #
+        l = make_range_list(space, 1, 3, 5)
+        assert l.count(w(7)) == 1
+        assert l.count(w(8)) == 0
+        assert l.count(w(7.0)) == 1
+        assert isinstance(l.strategy, RangeListStrategy)
+        l = make_range_list(space, 0, 1, 5)
+        assert l.count(w(4)) == 1
+        assert l.count(w(5)) == 0
+
+    def test_first_difference(self):
+        space = self.space
+        w = space.wrap
+        l1 = W_ListObject(space, [w(1), w(2), w(3)])
+        l2 = W_ListObject(space, [w(1), w(2), w(4), w(5)])
+        assert isinstance(l1.strategy, IntegerListStrategy)
+        assert l1.strategy.first_difference(l1, l2) == 2
+        assert l1.strategy.first_difference(l1, l1) == 3
+        assert space.is_true(space.lt(l1, l2))
+        assert not space.eq_w(l1, l2)
+        l2 = W_ListObject(space, [w(1), w(2)])
+        assert l1.strategy.first_difference(l1, l2) == 2
+        assert space.is_true(space.gt(l1, l2))
+        #
+        nan = float('nan')
+        w_nan = w(nan)
+        l1 = W_ListObject(space, [w(0.0), w_nan, w(1.5)])
+        l2 = W_ListObject(space, [w(-0.0), w_nan, w(2.5)])
+        assert isinstance(l1.strategy, FloatListStrategy)
+        assert l1.strategy.first_difference(l1, l2) == 2
+        assert space.is_true(space.lt(l1, l2))
+        l2 = W_ListObject(space, [w(-0.0), w_nan, w(1.5)])
+        assert l1.strategy.first_difference(l1, l2) == 3
+        assert space.eq_w(l1, l2)
+        l2 = W_ListObject(space, [w(0.0), w(-nan), w(1.5)])
+        assert l1.strategy.first_difference(l1, l2) == 1
+        #
+        l1 = W_ListObject(space, [w("a"), w("b")])
+        assert l1.strategy.first_difference(l1, l1) == -1
+
+    def test_find_and_difference_long_lists(self):
+        # long enough for the loops with their own jitdrivers
+        from pypy.objspace.std.listobject import MIN_VECTORIZED_LENGTH
+        space = self.space
+        w = space.wrap
+        n = MIN_VECTORIZED_LENGTH * 3
+        for items in [range(n), [i * 0.5 for i in range(n)]]:
+            items2 = items[:]
+            items2[n - 5] = items[0] - 1
+            l1 = W_ListObject(space, [w(x) for x in items])
+            l2 = W_ListObject(space, [w(x) for x in items2])
+            assert l1.strategy is l2.strategy
+            assert l1.strategy.first_difference(l1, l1) == n
+            assert l1.strategy.first_difference(l1, l2) == n - 5
+            assert space.is_true(space.gt(l1, l2))
+            w_index = space.call_method(l1, 'index', w(items[n - 2]))
+            assert space.int_w(w_index) == n - 2
+            w_index = space.call_method(l1, 'index', w(items[3]), w(1))
+            assert space.int_w(w_index) == 3
+            assert not space.is_true(space.contains(l1, w(-1)))
+
     def test_unicode(self):
         l1 = W_ListObject(self.space, [self.space.newbytes("eins"), self.space.newbytes("zwei")])
         assert isinstance(l1.strategy, BytesListStrategy)
@@ -1291,6 +1291,116 @@ class AppTestWithMapDictAndCounters(object):
 
 
 
+class AppTestMegamorphic(object):
+    spaceconfig = {"objspace.std.megamorphiclimit": 3}
+
+    def setup_class(cls):
+        from pypy.interpreter import gateway
+        #
+        def is_megamorphic(space, w_func, name):
+            w_code = space.getattr(w_func, space.wrap('func_code'))
+            nameindex = map(space.str_w, w_code.co_names_w).index(name)
+            return space.wrap(w_code._megamorphic_names[nameindex])
+        is_megamorphic.unwrap_spec = [gateway.ObjSpace, gateway.W_Root, 'text']
+        cls.w_is_megamorphic = cls.space.wrap(gateway.interp2app(is_megamorphic))
+        #
+        # run LOOKUP_METHOD and CALL_METHOD as if they were traced
+        from pypy.objspace.std import callmethod
+        class FakeJit(object):
+            jitted = False
+            def we_are_jitted(self):
+                return self.jitted
+        fakejit = FakeJit()
+        def set_jitted(space, flag):
+            fakejit.jitted = flag
+        set_jitted.unwrap_spec = [gateway.ObjSpace, bool]
+        cls.w_set_jitted = cls.space.wrap(gateway.interp2app(set_jitted))
+        cls.orig_jit = callmethod.jit
+        callmethod.jit = fakejit
+
+    def teardown_class(cls):
+        from pypy.objspace.std import callmethod
+        callmethod.jit = cls.orig_jit
+
+    def test_load_attr(self):
+        classes = [type('A%d' % i, (object,), {}) for i in range(6)]
+        objs = []
+        for i, cls in enumerate(classes):
+            obj = cls()
+            obj.x = i
+            objs.append(obj)
+        def f(obj):
+            return obj.x
+        for i in range(3):
+            assert f(objs[i]) == i
+        assert not self.is_megamorphic(f, 'x')
+        assert f(objs[3]) == 3
+        assert self.is_megamorphic(f, 'x')
+        for j in range(2):
+            assert [f(obj) for obj in objs] == range(6)
+        # the global cache sees the changes to the classes
+        classes[2].x = property(lambda self: 'prop')
+        classes[4].__getattribute__ = lambda self, name: 'getattribute'
+        objs[5].x = 'changed'
+        assert [f(obj) for obj in objs] == [0, 1, 'prop', 3, 'getattribute',
+                                            'changed']
+
+    def test_lookup_method(self):
+        classes = [type('A%d' % i, (object,), {'m': lambda self, i=i: i})
+                   for i in range(6)]
+        objs = [cls() for cls in classes]
+        def f(obj):
+            return obj.m()
+        for j in range(2):
+            assert [f(obj) for obj in objs] == range(6)
+        assert self.is_megamorphic(f, 'm')
+        # instance attributes and changes to the classes
+        objs[1].m = lambda: 'instance'
+        classes[3].m = lambda self: 'changed'
+        classes[5].m = staticmethod(lambda: 'static')
+        assert [f(obj) for obj in objs] == [0, 'instance', 2, 'changed', 4,
+                                            'static']
+
+    def test_call_method_jitted(self):
+        classes = [type('A%d' % i, (object,),
+                        {'m': lambda self, a, b=0, i=i: (i, a, b)})
+                   for i in range(6)]
+        objs = [cls() for cls in classes]
+        def f(obj):
+            return obj.m(1)
+        def g(obj):
+            return obj.m(1, b=2)
+        for j in range(2):
+            assert [f(obj) for obj in objs] == [(i, 1, 0) for i in range(6)]
+            assert [g(obj) for obj in objs] == [(i, 1, 2) for i in range(6)]
+        assert self.is_megamorphic(f, 'm')
+        assert self.is_megamorphic(g, 'm')
+        self.set_jitted(True)
+        try:
+            assert [f(obj) for obj in objs] == [(i, 1, 0) for i in range(6)]
+            assert [g(obj) for obj in objs] == [(i, 1, 2) for i in range(6)]
+            objs[1].m = lambda a, b=0: 'instance'
+            assert f(objs[1]) == g(objs[1]) == 'instance'
+        finally:
+            self.set_jitted(False)
+
+    def test_same_class_many_maps(self):
+        class A(object):
+            pass
+        objs = []
+        for i in range(6):
+            obj = A()
+            setattr(obj, 'y%d' % i, i)
+            obj.x = i
+            objs.append(obj)
+        def f(obj):
+            return obj.x
+        assert [f(obj) for obj in objs] == range(6)
+        assert self.is_megamorphic(f, 'x')
+        del objs[0].x
+        raises(AttributeError, f, objs[0])
+
+
 class AppTestGlobalCaching(AppTestWithMapDict):
     spaceconfig = {"objspace.std.withmethodcachecounter": True}
 
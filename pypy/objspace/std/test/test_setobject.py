@@ -81,7 +81,7 @@ class TestW_SetObject:
     def test_create_set_from_list(self):
         from pypy.interpreter.baseobjspace import W_Root
         from pypy.objspace.std.setobject import BytesSetStrategy, ObjectSetStrategy, UnicodeSetStrategy
-        from pypy.objspace.std.floatobject import W_FloatObject
+        from pypy.objspace.std.setobject import FloatSetStrategy
 
         w = self.space.wrap
         wb = self.space.newbytes
@@ -118,9 +118,8 @@ class TestW_SetObject:
         w_list = W_ListObject(self.space, [w(1.0), w(2.0), w(3.0)])
         w_set = W_SetObject(self.space)
         _initialize_set(self.space, w_set, w_list)
-        assert w_set.strategy is self.space.fromcache(ObjectSetStrategy)
-        for item in w_set.strategy.unerase(w_set.sstorage):
-            assert isinstance(item, W_FloatObject)
+        assert w_set.strategy is self.space.fromcache(FloatSetStrategy)
+        assert sorted(w_set.strategy.unerase(w_set.sstorage).keys()) == [1.0, 2.0, 3.0]
 
         # changed cached object, need to change it back for other tests to pass
         intstr.get_storage_from_list = tmp_func
@@ -1032,6 +1031,29 @@ class AppTestAppSetTest:
         s.intersection_update(set())
         assert strategy(s) == "EmptySetStrategy"
 
+    def test_float_strategy(self):
+        from __pypy__ import strategy
+        nan = float("nan")
+        s = set([1.5, 2.0, nan, -0.0])
+        assert strategy(s) == "FloatSetStrategy"
+        assert 2 in s
+        assert 2.0 in s
+        assert nan in s
+        assert 0 in s and 0.0 in s
+        assert 3 not in s
+        s.add(0.0)
+        assert len(s) == 4
+        assert str(list(s)[list(s).index(0.0)]) == "-0.0"
+        assert strategy(s) == "FloatSetStrategy"
+        assert set([1, 2]) == set([1.0, 2.0])
+        assert set([1, 2]) < set([1.0, 2.0, 3.5])
+        assert set([1.0, 2.5]) & set([1, 2]) == set([1])
+        assert set([1.0, 2.5]) - set([1, 2]) == set([2.5])
+        s.add(5)
+        assert strategy(s) == "ObjectSetStrategy"
+        assert 5 in s and 1.5 in s and nan in s
+        assert "2.0" not in s and None not in s
+
     def test_weird_exception_from_iterable(self):
         def f():
            raise ValueError
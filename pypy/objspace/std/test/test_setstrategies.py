@@ -1,6 +1,7 @@
 from pypy.objspace.std.setobject import W_SetObject
 from pypy.objspace.std.setobject import (
     BytesIteratorImplementation, BytesSetStrategy, EmptySetStrategy,
+    FloatIteratorImplementation, FloatSetStrategy,
     IntegerIteratorImplementation, IntegerSetStrategy, ObjectSetStrategy,
     UnicodeIteratorImplementation, UnicodeSetStrategy)
 from pypy.objspace.std.listobject import W_ListObject
@@ -29,6 +30,12 @@ class TestW_SetStrategies:
         s = W_SetObject(self.space, self.wrapped([u"a", u"b"]))
         assert s.strategy is self.space.fromcache(UnicodeSetStrategy)
 
+        s = W_SetObject(self.space, self.wrapped([1.5, 2.5]))
+        assert s.strategy is self.space.fromcache(FloatSetStrategy)
+
+        s = W_SetObject(self.space, self.wrapped([1.5, 2]))
+        assert s.strategy is self.space.fromcache(ObjectSetStrategy)
+
     def test_switch_to_object(self):
         s = W_SetObject(self.space, self.wrapped([1,2,3,4,5]))
         s.add(self.space.wrap("six"))
@@ -114,6 +121,22 @@ class TestW_SetStrategies:
         assert s1.has_key(self.space.wrap(FakeInt(2)))
         assert s1.strategy is self.space.fromcache(ObjectSetStrategy)
 
+    def test_has_key_int_float(self):
+        space = self.space
+        s1 = W_SetObject(space, self.wrapped([1, 2, 3]))
+        assert s1.has_key(space.wrap(2.0))
+        assert not s1.has_key(space.wrap(2.5))
+        assert not s1.has_key(space.wrap(float("nan")))
+        assert not s1.has_key(space.wrap(1e300))
+        assert s1.strategy is space.fromcache(IntegerSetStrategy)
+
+        s2 = W_SetObject(space, self.wrapped([1.0, 2.5, -0.0]))
+        assert s2.has_key(space.wrap(1))
+        assert s2.has_key(space.wrap(0))
+        assert not s2.has_key(space.wrap(2))
+        assert not s2.has_key(space.wrap(2 ** 60 + 1))
+        assert s2.strategy is space.fromcache(FloatSetStrategy)
+
     def test_iter(self):
         space = self.space
         s = W_SetObject(space, self.wrapped([1,2]))
@@ -133,6 +156,11 @@ class TestW_SetStrategies:
         assert isinstance(it, UnicodeIteratorImplementation)
         assert space.unwrap(it.next()) == u"a"
         assert space.unwrap(it.next()) == u"b"
+        #
+        s = W_SetObject(space, self.wrapped([1.5]))
+        it = s.iter()
+        assert isinstance(it, FloatIteratorImplementation)
+        assert space.unwrap(it.next()) == 1.5
 
     def test_listview(self):
         space = self.space
@@ -144,3 +172,6 @@ class TestW_SetStrategies:
         #
         s = W_SetObject(space, self.wrapped([u"a", u"b"]))
         assert sorted(space.listview_unicode(s)) == [u"a", u"b"]
+        #
+        s = W_SetObject(space, self.wrapped([1.5, 2.5]))
+        assert sorted(space.listview_float(s)) == [1.5, 2.5]
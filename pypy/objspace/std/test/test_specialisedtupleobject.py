@@ -1,4 +1,6 @@
-from pypy.objspace.std.specialisedtupleobject import _specialisations
+from pypy.objspace.std.specialisedtupleobject import (
+    _specialisations, W_IntTupleObject, W_FloatTupleObject,
+    W_BytesTupleObject)
 from pypy.objspace.std.test import test_tupleobject
 from pypy.objspace.std.tupleobject import W_TupleObject
 from pypy.tool.pytest.objspace import gettestobjspace
@@ -52,6 +54,37 @@ class TestW_SpecialisedTupleObject():
         hash_test([1, 2, 3], must_be_specialized=False)
         hash_test([1 << 62, 0])
 
+    def test_homogeneous_tuples(self):
+        space = self.space
+        for values, cls in [([1, 2, 3, 4, 5, 6], W_IntTupleObject),
+                            ([-1, -1, -1], W_IntTupleObject),
+                            ([1.5, -0.0, 1e300, 2.0], W_FloatTupleObject),
+                            (['a', 'bc', '', 'def'], W_BytesTupleObject)]:
+            w_tuple = space.newtuple([space.wrap(x) for x in values])
+            assert type(w_tuple) is cls
+            assert w_tuple.items == values
+            assert space.unwrap(w_tuple) == tuple(values)
+            self.hash_test(values, must_be_specialized=False)
+        # mixed tuples and subclasses stay W_TupleObject
+        for values in [[1, 2, 3.5], [1.5, 2.5, 'x'], ['a', 'b', None],
+                       [1, 2, 3L], [1, 2, True]]:
+            w_tuple = space.newtuple([space.wrap(x) for x in values])
+            assert type(w_tuple) is W_TupleObject
+
+    def test_homogeneous_eq_unboxed(self):
+        space = self.space
+        w_t1 = space.newtuple([space.wrap(x) for x in range(10)])
+        w_t2 = space.newtuple([space.wrap(x) for x in range(10)])
+        w_t3 = space.newtuple([space.wrap(x) for x in range(11)])
+        w_t4 = space.newtuple([space.wrap(float(x)) for x in range(10)])
+        assert space.eq_w(w_t1, w_t2)
+        assert not space.eq_w(w_t1, w_t3)
+        assert space.eq_w(w_t1, w_t4)
+        assert space.eq_w(w_t1, W_TupleObject(w_t1.tolist()))
+        assert space.is_true(space.contains(w_t1, space.wrap(9)))
+        assert not space.is_true(space.contains(w_t1, space.wrap(10)))
+        assert space.is_true(space.contains(w_t1, space.wrap(9.0)))
+
     try:
         from hypothesis import given, strategies
     except ImportError:
@@ -250,6 +283,43 @@ class AppTestW_SpecialisedTupleObject:
         assert N in T
         assert T == (N, N)
         assert (0.0, 0.0) == (-0.0, -0.0)
+        T = (N, N, N)
+        assert N in T
+        assert T == (N, N, N)
+        assert (0.0, 0.0, 0.0) == (-0.0, -0.0, -0.0)
+
+    def test_homogeneous_tuples(self):
+        for t in [(1, 2, 3), (1.5, 2.5, 3.5, 4.5), ('a', 'b', 'c'),
+                  tuple(range(100))]:
+            r = self.isspecialised(t, '')
+            assert not r
+            assert len(t) == len(list(t))
+            assert t[-1] == list(t)[-1]
+            assert t == tuple(list(t))
+            assert hash(t) == hash(tuple(list(t) + [None])[:-1])
+            assert t[1:] + t[:1] == tuple(list(t)[1:] + list(t)[:1])
+            assert t.index(t[-1]) == len(t) - 1
+            assert t.count(t[0]) == 1
+            assert t[0] in t
+            assert None not in t
+            raises(IndexError, "t[len(t)]")
+        t = (1, 2, 3, 4, 5, 6)
+        assert t == (1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+        assert t != (1, 2, 3, 4, 5, 7)
+        assert t < (1, 2, 3, 4, 5, 7)
+        assert 6.0 in t
+        assert 6L in t
+        assert hash(t) == hash((1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+        assert hash(t) == hash((1, 2, 3, 4, 5, 6L))
+        assert hash(('a', 'b', 'c')) == hash(('a', 'b', u'c'))
+        assert {t: 42}[(1, 2, 3, 4, 5, 6)] == 42
+
+    def test_homogeneous_internal_repr(self):
+        import __pypy__
+        assert 'IntTupleObject' in __pypy__.internal_repr((1, 2, 3))
+        assert 'FloatTupleObject' in __pypy__.internal_repr((1., 2., 3.))
+        assert 'BytesTupleObject' in __pypy__.internal_repr(('a', 'b', 'c'))
+        assert 'W_TupleObject' in __pypy__.internal_repr((1, 2., 'c'))
 
 
 class AppTestAll(test_tupleobject.AppTestW_TupleObject):
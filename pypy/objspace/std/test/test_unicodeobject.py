@@ -33,6 +33,54 @@ class TestUnicodeObject:
                 space.w_unicode, "__new__", space.w_unicode, w_uni)
         assert w_new is w_uni
 
+    def test_utf8_storage(self):
+        space = self.space
+        u = (u'a\xe9\u1234\U00012345' * 40)[:-1]
+        s = u.encode('utf-8')
+        w_s = space.newbytes(s)
+        w_uni = space.call_method(w_s, 'decode', space.wrap('utf-8'))
+        storage = w_uni.get_utf8_storage()
+        assert storage is not None
+        assert storage.utf8 is s
+        assert space.len_w(w_uni) == len(u)
+        if sys.maxunicode > 0xffff:
+            for i in [0, 1, 2, 3, 64, 65, 66, 67, 130, 158, -1, -80]:
+                w_char = space.getitem(w_uni, space.newint(i))
+                assert space.unicode_w(w_char) == u[i]
+            assert storage.index is not None
+            py.test.raises(OperationError, space.getitem, w_uni,
+                           space.newint(len(u)))
+        w_res = space.call_method(w_uni, 'encode', space.wrap('utf-8'))
+        assert space.bytes_w(w_res) is s
+        w_other = space.call_method(space.newbytes(s), 'decode',
+                                    space.wrap('utf-8'))
+        assert space.is_true(space.eq(w_uni, w_other))
+        assert not space.is_true(space.ne(w_uni, w_other))
+        assert w_uni.get_utf8_storage() is not None
+        # forcing the unicode string drops the UTF-8 bytes
+        assert space.unicode_w(w_uni) == u
+        assert w_uni.get_utf8_storage() is None
+        assert space.is_true(space.eq(w_uni, w_other))
+        assert space.bytes_w(space.call_method(w_uni, 'encode',
+                                               space.wrap('utf-8'))) == s
+
+    def test_utf8_storage_ascii(self):
+        space = self.space
+        w_uni = space.call_method(space.newbytes('hello'), 'decode',
+                                  space.wrap('utf-8'))
+        assert w_uni.get_utf8_storage().is_ascii()
+        w_res = space.call_method(w_uni, 'encode', space.wrap('ascii'))
+        assert space.bytes_w(w_res) == 'hello'
+        assert space.unicode_w(space.getitem(w_uni, space.newint(-1))) == u'o'
+        assert w_uni.get_utf8_storage() is not None
+
+    def test_utf8_storage_not_used_for_surrogates(self):
+        space = self.space
+        w_uni = space.call_method(space.newbytes('a\xed\xa0\x80'), 'decode',
+                                  space.wrap('utf-8'))
+        assert w_uni.get_utf8_storage() is None
+        assert space.unicode_w(w_uni) == u'a\ud800'
+
 
 try:
     from hypothesis import given, strategies
@@ -226,8 +226,9 @@ class W_AbstractTupleObject(W_Root):
         """
         length = self.length()
         start, stop = unwrap_start_stop(space, length, w_start, w_stop)
+        items = self.tolist()
         for i in range(start, min(stop, length)):
-            w_item = self.tolist()[i]
+            w_item = items[i]
             if space.eq_w(w_item, w_obj):
                 return space.newint(i)
         raise oefmt(space.w_ValueError, "tuple.index(x): x not in tuple")
@@ -251,7 +252,7 @@ If the argument is a tuple, the return value is the same object.""",
 
     __len__ = interp2app(W_AbstractTupleObject.descr_len),
     __iter__ = interp2app(W_AbstractTupleObject.descr_iter),
-    __contains__ = interp2app(W_AbstractTupleObject.descr_contains),
+    __contains__ = interpindirect2app(W_AbstractTupleObject.descr_contains),
 
     __add__ = interp2app(W_AbstractTupleObject.descr_add),
     __mul__ = interp2app(W_AbstractTupleObject.descr_mul),
@@ -1,14 +1,16 @@
 """The builtin unicode implementation"""
 
+from rpython.rlib import jit
 from rpython.rlib.objectmodel import (
     compute_hash, compute_unique_id, import_from_mixin,
-    enforceargs)
+    enforceargs, instantiate)
 from rpython.rlib.buffer import StringBuffer
 from rpython.rlib.mutbuffer import MutableStringBuffer
 from rpython.rlib.rstring import StringBuilder, UnicodeBuilder
 from rpython.rlib.runicode import (
     make_unicode_escape_function, str_decode_ascii, str_decode_utf_8,
-    unicode_encode_ascii, unicode_encode_utf_8, fast_str_decode_ascii)
+    unicode_encode_ascii, unicode_encode_utf_8, fast_str_decode_ascii,
+    MAXUNICODE)
 
 from pypy.interpreter import unicodehelper
 from pypy.interpreter.baseobjspace import W_Root
@@ -27,27 +29,139 @@ __all__ = ['W_UnicodeObject', 'wrapunicode', 'plain_str2unicode',
            'unicode_from_string', 'unicode_to_decimal_w']
 
 
+INDEX_STEP = 64
+
+
+class Utf8Storage(object):
+    """ The text of a unicode object that was decoded from UTF-8 and that
+    was not needed as an RPython unicode string so far.  'utf8' is valid
+    UTF-8 without surrogates (see unicodehelper.utf8_length()), so encoding
+    the text as UTF-8 gives back the same string, and 'length' is the length
+    of the text.  'index' is built on the first indexing of non-ascii text:
+    it contains the byte position of every INDEX_STEP-th character. """
+    _immutable_fields_ = ['utf8', 'length']
+
+    def __init__(self, utf8, length):
+        self.utf8 = utf8
+        self.length = length
+        self.index = None
+
+    def is_ascii(self):
+        return self.length == len(self.utf8)
+
+    def getchar(self, index):
+        """ Returns the code point at 0 <= index < length.  Only works on
+        wide hosts or for ascii text. """
+        if self.is_ascii():
+            return ord(self.utf8[index])
+        return _utf8_code_point_at(self.utf8, self._byte_position(index))
+
+    def _byte_position(self, index):
+        positions = self.index
+        if positions is None:
+            positions = self._build_index()
+        pos = positions[index // INDEX_STEP]
+        for i in range(index % INDEX_STEP):
+            pos = _utf8_next(self.utf8, pos)
+        return pos
+
+    @jit.dont_look_inside
+    def _build_index(self):
+        utf8 = self.utf8
+        positions = [0] * ((self.length + INDEX_STEP - 1) // INDEX_STEP)
+        pos = 0
+        for i in range(self.length):
+            if i % INDEX_STEP == 0:
+                positions[i // INDEX_STEP] = pos
+            pos = _utf8_next(utf8, pos)
+        self.index = positions
+        return positions
+
+
+def _utf8_next(utf8, pos):
+    ordch = ord(utf8[pos])
+    if ordch < 0x80:
+        return pos + 1
+    elif ordch < 0xE0:
+        return pos + 2
+    elif ordch < 0xF0:
+        return pos + 3
+    return pos + 4
+
+def _utf8_code_point_at(utf8, pos):
+    ordch = ord(utf8[pos])
+    if ordch < 0x80:
+        return ordch
+    elif ordch < 0xE0:
+        return ((ordch & 0x1F) << 6) | (ord(utf8[pos + 1]) & 0x3F)
+    elif ordch < 0xF0:
+        return (((ordch & 0x0F) << 12) | ((ord(utf8[pos + 1]) & 0x3F) << 6) |
+                (ord(utf8[pos + 2]) & 0x3F))
+    return (((ordch & 0x07) << 18) | ((ord(utf8[pos + 1]) & 0x3F) << 12) |
+            ((ord(utf8[pos + 2]) & 0x3F) << 6) | (ord(utf8[pos + 3]) & 0x3F))
+
+
 class W_UnicodeObject(W_Root):
     import_from_mixin(StringMethods)
-    _immutable_fields_ = ['_value']
+    # Either '_value' or '_utf8storage' is not None.  Unicode objects that
+    # are decoded from UTF-8 only keep the UTF-8 bytes, until the RPython
+    # unicode string is needed for the first time.  In the meantime, len(),
+    # indexing, comparing for equality and encoding to UTF-8 work directly
+    # on the UTF-8 bytes.  Both fields are only written once more, by
+    # _force_value(), so the JIT can still constant-fold them.
+    _immutable_fields_ = ['_value?', '_utf8storage?']
+    _value = None
+    _utf8storage = None
 
     @enforceargs(uni=unicode)
     def __init__(self, unistr):
         assert isinstance(unistr, unicode)
         self._value = unistr
 
+    @staticmethod
+    def from_utf8(utf8, length):
+        """ Makes a unicode object out of 'utf8', which must be valid UTF-8
+        that decodes to a string of the given length and encodes back to the
+        same bytes, see unicodehelper.utf8_length(). """
+        w_res = instantiate(W_UnicodeObject)
+        w_res._utf8storage = Utf8Storage(utf8, length)
+        return w_res
+
+    def get_utf8_storage(self):
+        """ Returns the Utf8Storage if the text is only stored as UTF-8, and
+        None otherwise. """
+        return self._utf8storage
+
+    def _get_value(self):
+        value = self._value
+        if value is None:
+            value = self._force_value()
+        return value
+
+    @jit.dont_look_inside
+    def _force_value(self):
+        storage = self._utf8storage
+        assert storage is not None
+        utf8 = storage.utf8
+        value = str_decode_utf_8(utf8, len(utf8), 'strict', final=True,
+                                 allow_surrogates=True)[0]
+        # keep only one copy of the text
+        self._value = value
+        self._utf8storage = None
+        return value
+
     def __repr__(self):
         """representation for debugging purposes"""
-        return "%s(%r)" % (self.__class__.__name__, self._value)
+        return "%s(%r)" % (self.__class__.__name__, self._get_value())
 
     def unwrap(self, space):
         # for testing
-        return self._value
+        return self._get_value()
 
     def create_if_subclassed(self):
         if type(self) is W_UnicodeObject:
             return self
-        return W_UnicodeObject(self._value)
+        return W_UnicodeObject(self._get_value())
 
     def is_w(self, space, w_other):
         if not isinstance(w_other, W_UnicodeObject):
@@ -81,13 +195,14 @@ class W_UnicodeObject(W_Root):
         return space.text_w(space.str(self))
 
     def unicode_w(self, space):
-        return self._value
+        return self._get_value()
 
     def readbuf_w(self, space):
         from rpython.rlib.rstruct.unichar import pack_unichar, UNICODE_SIZE
-        buf = MutableStringBuffer(len(self._value) * UNICODE_SIZE)
+        value = self._get_value()
+        buf = MutableStringBuffer(len(value) * UNICODE_SIZE)
         pos = 0
-        for unich in self._value:
+        for unich in value:
             pack_unichar(unich, buf, pos)
             pos += UNICODE_SIZE
         return StringBuffer(buf.finish())
@@ -99,14 +214,15 @@ class W_UnicodeObject(W_Root):
     charbuf_w = str_w
 
     def listview_unicode(self):
-        return _create_list_from_unicode(self._value)
+        return _create_list_from_unicode(self._get_value())
 
     def ord(self, space):
-        if len(self._value) != 1:
+        length = self._len()
+        if length != 1:
             raise oefmt(space.w_TypeError,
                          "ord() expected a character, but string of length %d "
-                         "found", len(self._value))
-        return space.newint(ord(self._value[0]))
+                         "found", length)
+        return space.newint(ord(self._get_value()[0]))
 
     def _new(self, value):
         return W_UnicodeObject(value)
@@ -118,8 +234,28 @@ class W_UnicodeObject(W_Root):
         return W_UnicodeObject.EMPTY
 
     def _len(self):
+        storage = self._utf8storage
+        if storage is not None:
+            return storage.length
         return len(self._value)
 
+    def _getitem_result(self, space, index):
+        storage = self._utf8storage
+        if storage is None or (MAXUNICODE < 0x10000 and
+                               not storage.is_ascii()):
+            selfvalue = self._get_value()
+            try:
+                character = selfvalue[index]
+            except IndexError:
+                raise oefmt(space.w_IndexError, "string index out of range")
+            return self._new(character)
+        length = storage.length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise oefmt(space.w_IndexError, "string index out of range")
+        return self._new(unichr(storage.getchar(index)))
+
     _val = unicode_w
 
     @staticmethod
@@ -131,14 +267,14 @@ class W_UnicodeObject(W_Root):
     @staticmethod
     def _op_val(space, w_other, strict=None):
         if isinstance(w_other, W_UnicodeObject):
-            return w_other._value
+            return w_other._get_value()
         if space.isinstance_w(w_other, space.w_bytes):
-            return unicode_from_string(space, w_other)._value
+            return unicode_from_string(space, w_other)._get_value()
         if strict:
             raise oefmt(space.w_TypeError,
                 "%s arg must be None, unicode or str", strict)
         return unicode_from_encoded_object(
-            space, w_other, None, "strict")._value
+            space, w_other, None, "strict")._get_value()
 
     def _chr(self, char):
         assert len(char) == 1
@@ -212,11 +348,11 @@ class W_UnicodeObject(W_Root):
 
         assert isinstance(w_value, W_UnicodeObject)
         w_newobj = space.allocate_instance(W_UnicodeObject, w_unicodetype)
-        W_UnicodeObject.__init__(w_newobj, w_value._value)
+        W_UnicodeObject.__init__(w_newobj, w_value._get_value())
         return w_newobj
 
     def descr_repr(self, space):
-        chars = self._value
+        chars = self._get_value()
         size = len(chars)
         s = _repr_function(chars, size, "strict")
         return space.newtext(s)
@@ -225,11 +361,15 @@ class W_UnicodeObject(W_Root):
         return encode_object(space, self, None, None)
 
     def descr_hash(self, space):
-        x = compute_hash(self._value)
+        x = compute_hash(self._get_value())
         x -= (x == -1) # convert -1 to -2 without creating a bridge
         return space.newint(x)
 
     def descr_eq(self, space, w_other):
+        if isinstance(w_other, W_UnicodeObject):
+            res = _equal_utf8_storage(self, w_other)
+            if res >= 0:
+                return space.newbool(res == 1)
         try:
             res = self._val(space) == self._op_val(space, w_other)
         except OperationError as e:
@@ -246,6 +386,10 @@ class W_UnicodeObject(W_Root):
         return space.newbool(res)
 
     def descr_ne(self, space, w_other):
+        if isinstance(w_other, W_UnicodeObject):
+            res = _equal_utf8_storage(self, w_other)
+            if res >= 0:
+                return space.newbool(res == 0)
         try:
             res = self._val(space) != self._op_val(space, w_other)
         except OperationError as e:
@@ -307,7 +451,7 @@ class W_UnicodeObject(W_Root):
         formatter = newformat.unicode_formatter(space, spec)
         self2 = unicode_from_object(space, self)
         assert isinstance(self2, W_UnicodeObject)
-        return formatter.format_string(self2._value)
+        return formatter.format_string(self2._get_value())
 
     def descr_mod(self, space, w_values):
         return mod_format(space, self, w_values, do_unicode=True)
@@ -316,7 +460,7 @@ class W_UnicodeObject(W_Root):
         return mod_format(space, w_values, self, do_unicode=True)
 
     def descr_translate(self, space, w_table):
-        selfvalue = self._value
+        selfvalue = self._get_value()
         w_sys = space.getbuiltinmodule('sys')
         maxunicode = space.int_w(space.getattr(w_sys,
                                                space.newtext("maxunicode")))
@@ -388,7 +532,7 @@ class W_UnicodeObject(W_Root):
 
     def descr_islower(self, space):
         cased = False
-        for uchar in self._value:
+        for uchar in self._get_value():
             if (unicodedb.isupper(ord(uchar)) or
                 unicodedb.istitle(ord(uchar))):
                 return space.w_False
@@ -398,7 +542,7 @@ class W_UnicodeObject(W_Root):
 
     def descr_isupper(self, space):
         cased = False
-        for uchar in self._value:
+        for uchar in self._get_value():
             if (unicodedb.islower(ord(uchar)) or
                 unicodedb.istitle(ord(uchar))):
                 return space.w_False
@@ -413,6 +557,15 @@ def wrapunicode(space, uni):
     return W_UnicodeObject(uni)
 
 
+def _equal_utf8_storage(w_uni1, w_uni2):
+    # returns 1 or 0 if both texts are stored as UTF-8, and -1 otherwise
+    storage1 = w_uni1.get_utf8_storage()
+    storage2 = w_uni2.get_utf8_storage()
+    if storage1 is None or storage2 is None:
+        return -1
+    return int(storage1.utf8 == storage2.utf8)
+
+
 def plain_str2unicode(space, s):
     try:
         return unicode(s)
@@ -452,6 +605,14 @@ def encode_object(space, w_object, encoding, errors):
         w_encoder = space.sys.get_w_default_encoder()
     else:
         if errors is None or errors == 'strict':
+            storage = None
+            if isinstance(w_object, W_UnicodeObject):
+                storage = w_object.get_utf8_storage()
+            if storage is not None:
+                # the UTF-8 bytes can be returned without copying
+                if encoding == 'utf-8' or (encoding == 'ascii' and
+                                           storage.is_ascii()):
+                    return space.newbytes(storage.utf8)
             if encoding == 'ascii':
                 u = space.unicode_w(w_object)
                 eh = unicodehelper.encode_error_handler(space)
@@ -494,6 +655,9 @@ def decode_object(space, w_obj, encoding, errors):
             return space.newunicode(u)
         if encoding == 'utf-8':
             s = space.charbuf_w(w_obj)
+            length = unicodehelper.utf8_length(s)
+            if length >= 0:
+                return W_UnicodeObject.from_utf8(s, length)
             eh = unicodehelper.decode_error_handler(space)
             return space.newunicode(str_decode_utf_8(
                     s, len(s), None, final=True, errorhandler=eh,
@@ -1109,7 +1273,7 @@ W_UnicodeObject.EMPTY = W_UnicodeObject(u'')
 def unicode_to_decimal_w(space, w_unistr):
     if not isinstance(w_unistr, W_UnicodeObject):
         raise oefmt(space.w_TypeError, "expected unicode, got '%T'", w_unistr)
-    unistr = w_unistr._value
+    unistr = w_unistr._get_value()
     result = ['\0'] * len(unistr)
     digits = ['0', '1', '2', '3', '4',
               '5', '6', '7', '8', '9']
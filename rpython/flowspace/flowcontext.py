@@ -832,6 +832,16 @@ class FlowContext(object):
             raise FlowingError("Local variable referenced before assignment")
         self.pushvalue(w_value)
 
+    def LOAD_FAST_LOAD_FAST(self, oparg):
+        # PyPy-specific superinstruction, if PyPy is the host
+        self.LOAD_FAST(oparg & 0xff)
+        self.LOAD_FAST(oparg >> 8)
+
+    def LOAD_FAST_LOAD_ATTR(self, oparg):
+        # PyPy-specific superinstruction, if PyPy is the host
+        self.LOAD_FAST(oparg & 0xff)
+        self.LOAD_ATTR(oparg >> 8)
+
     def LOAD_CONST(self, constindex):
         w_const = self.getconstant_w(constindex)
         self.pushvalue(w_const)
@@ -986,11 +986,11 @@ class LLGraphCPU(model.AbstractCPU):
             count = self.vector_ext.vec_size() // descr.get_item_size_in_bytes()
             assert _count == count
             assert count > 0
-            adr = support.addr_add_bytes(struct, (offset * scale + disp))
-            a = support.cast_arg(lltype.Ptr(descr.A), adr)
-            array = a._obj
+            array, start = self._vec_array_and_start(struct, offset, scale,
+                                                     disp, descr)
             for i in range(count):
-                val = support.cast_result(descr.A.OF, array.getitem(i))
+                val = support.cast_result(descr.A.OF,
+                                          array.getitem(start + i))
                 values.append(val)
             return values
         return load
@@ -1000,11 +1000,23 @@ class LLGraphCPU(model.AbstractCPU):
     del build_load
 
     def bh_vec_store(self, struct, offset, newvalues, scale, disp, descr, count):
-        adr = support.addr_add_bytes(struct, offset * scale + disp)
-        a = support.cast_arg(lltype.Ptr(descr.A), adr)
-        array = a._obj
+        array, start = self._vec_array_and_start(struct, offset, scale,
+                                                 disp, descr)
         for i,n in enumerate(newvalues):
-            array.setitem(i, support.cast_arg(descr.A.OF, n))
+            array.setitem(start + i, support.cast_arg(descr.A.OF, n))
+
+    def _vec_array_and_start(self, struct, offset, scale, disp, descr):
+        # raw memory can be addressed bytewise, but the items of a gc
+        # array (e.g. the items of an RPython list) must be indexed
+        bytes = offset * scale + disp
+        if descr.A._gckind == 'gc':
+            a = support.cast_arg(lltype.Ptr(descr.A), struct)
+            itemsize = descr.get_item_size_in_bytes()
+            assert bytes % itemsize == 0
+            return a._obj, bytes // itemsize
+        adr = support.addr_add_bytes(struct, bytes)
+        a = support.cast_arg(lltype.Ptr(descr.A), adr)
+        return a._obj, 0
 
     def store_fail_descr(self, deadframe, descr):
         pass # I *think*
@@ -158,6 +158,12 @@ class AbstractCPU(object):
         """
         pass
 
+    def get_loop_code_size(self, compiled_loop_token):
+        """Return the number of bytes of machine code and data allocated
+        for this compiled loop and all bridges attached to it.
+        """
+        return 0
+
     def sizeof(self, S):
         raise NotImplementedError
 
@@ -4420,6 +4420,28 @@ class LLtypeBackendTest(BaseBackendTest):
         assert mem2 < mem1
         assert mem2 == mem0
 
+    def test_get_loop_code_size(self):
+        if not isinstance(self.cpu, AbstractLLCPU):
+            py.test.skip("not a subclass of llmodel.AbstractLLCPU")
+        if hasattr(self.cpu, 'setup_once'):
+            self.cpu.setup_once()
+        looptoken = JitCellToken()
+        loop = parse("""
+        [i0]
+        i1 = int_add(i0, 1)
+        finish(i1, descr=faildescr)
+        """, namespace={"faildescr": BasicFinalDescr(1)})
+        self.cpu.compile_loop(loop.inputargs, loop.operations, looptoken)
+        size1 = self.cpu.get_loop_code_size(looptoken.compiled_loop_token)
+        assert size1 > 0
+        looptoken = self.test_compile_bridge()
+        clt = looptoken.compiled_loop_token
+        blocks = clt.asmmemmgr_blocks
+        assert self.cpu.get_loop_code_size(clt) == sum(
+            [rawstop - rawstart for rawstart, rawstop in blocks])
+        self.cpu.free_loop_and_bridges(clt)
+        assert self.cpu.get_loop_code_size(clt) == 0
+
     def test_memoryerror(self):
         excdescr = BasicFailDescr(666)
         self.cpu.propagate_exception_descr = excdescr
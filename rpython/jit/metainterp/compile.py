@@ -346,6 +346,29 @@ def compile_loop(metainterp, greenkey, start, inputargs, jumpargs,
     loop_info.post_loop_compilation(loop, jitdriver_sd, metainterp, jitcell_token)
     return start_descr
 
+def compile_loop_segment(metainterp, greenkey, inputargs):
+    """Compile the beginning of a loop whose trace is too long.  The
+    history must end with a guard that always fails, from which the rest
+    of the loop is later traced as a bridge.
+    """
+    metainterp_sd = metainterp.staticdata
+    jitdriver_sd = metainterp.jitdriver_sd
+    history = metainterp.history
+    #
+    metainterp_sd.jitlog.start_new_trace(metainterp_sd,
+            faildescr=None, entry_bridge=False)
+    #
+    enable_opts = jitdriver_sd.warmstate.enable_opts
+    if 'unroll' in enable_opts:
+        enable_opts = enable_opts.copy()
+        del enable_opts['unroll']
+    # the JUMP is never reached, but a loop must end with one
+    jitcell_token = make_jitcell_token(jitdriver_sd)
+    cut_at = history.get_trace_position()
+    history.record(rop.JUMP, inputargs, None, descr=jitcell_token)
+    return compile_simple_loop(metainterp, greenkey, history.trace, inputargs,
+                               enable_opts, cut_at)
+
 def compile_retrace(metainterp, greenkey, start,
                     inputargs, jumpargs,
                     partial_trace, resumekey, start_state):
@@ -589,6 +612,7 @@ def send_loop_to_backend(greenkey, jitdriver_sd, metainterp_sd, loop, type,
                                       name=loopname)
     #
     if metainterp_sd.warmrunnerdesc is not None:    # for tests
+        record_loop_size(metainterp_sd, original_jitcell_token, operations)
         metainterp_sd.warmrunnerdesc.memory_manager.keep_loop_alive(original_jitcell_token)
 
 def send_bridge_to_backend(jitdriver_sd, metainterp_sd, faildescr, inputargs,
@@ -636,11 +660,34 @@ def send_bridge_to_backend(jitdriver_sd, metainterp_sd, faildescr, inputargs,
     metainterp_sd.logger_ops.log_bridge(inputargs, operations, None, faildescr,
                                         ops_offset, memo=memo)
     #
+    if metainterp_sd.warmrunnerdesc is not None:    # for tests
+        record_loop_size(metainterp_sd, original_loop_token, operations)
     #if metainterp_sd.warmrunnerdesc is not None:    # for tests
     #    metainterp_sd.warmrunnerdesc.memory_manager.keep_loop_alive(
     #        original_loop_token)
     return asminfo
 
+def record_loop_size(metainterp_sd, jitcell_token, operations):
+    clt = jitcell_token.compiled_loop_token
+    if clt is not None:
+        code_size = metainterp_sd.cpu.get_loop_code_size(clt)
+    else:
+        code_size = 0
+    metainterp_sd.warmrunnerdesc.memory_manager.record_loop_size(
+        jitcell_token, code_size, resume_data_size(operations))
+
+def resume_data_size(operations):
+    """Return the number of bytes of resume code of the guards in
+    'operations'.  Guards that share the resume data of a previous guard
+    are not counted."""
+    size = 0
+    for op in operations:
+        if op.is_guard():
+            descr = op.getdescr()
+            if isinstance(descr, ResumeGuardDescr) and descr.rd_numb:
+                size += len(descr.rd_numb.code)
+    return size
+
 # ____________________________________________________________
 
 class _DoneWithThisFrameDescr(AbstractFailDescr):
@@ -719,6 +766,10 @@ class AbstractResumeGuardDescr(ResumeDescr):
         raise NotImplementedError("abstract base class")
 
     def handle_fail(self, deadframe, metainterp_sd, jitdriver_sd):
+        if metainterp_sd.warmrunnerdesc is not None:    # for tests
+            loop_profile = metainterp_sd.warmrunnerdesc.loop_profile
+            if loop_profile.enabled:
+                loop_profile.guard_failed(self)
         if (self.must_compile(deadframe, metainterp_sd, jitdriver_sd)
                 and not rstack.stack_almost_full()):
             self.start_compiling()
@@ -796,7 +847,13 @@ class AbstractResumeGuardDescr(ResumeDescr):
                           intval * 1442968193)
         #
         increment = jitdriver_sd.warmstate.increment_trace_eagerness
-        return jitcounter.tick(hash, increment)
+        if not jitcounter.tick(hash, increment):
+            return False
+        if not jitcounter.consume_compile_budget():
+            # too many traces started recently: try again later
+            jitcounter.change_current_fraction(hash, 0.98)
+            return False
+        return True
 
     def start_compiling(self):
         # start tracing and compiling from this guard.
@@ -823,6 +880,9 @@ class AbstractResumeGuardDescr(ResumeDescr):
                                self, inputargs, new_loop.operations,
                                new_loop.original_jitcell_token,
                                metainterp.box_names_memo)
+        warmrunnerdesc = metainterp.staticdata.warmrunnerdesc
+        if warmrunnerdesc is not None and warmrunnerdesc.loop_profile.enabled:
+            warmrunnerdesc.loop_profile.bridge_compiled(self)
 
     def make_a_counter_per_value(self, guard_value_op, index):
         assert guard_value_op.getopnum() == rop.GUARD_VALUE
@@ -59,13 +59,20 @@ class JitCounter:
     'reset(hash)', 'change_current_fraction(hash, new_time_value)'
     change the time value associated with a hash.  The former resets
     it to zero, and the latter changes it to the given value (which
-    should be a value close to 1.0).
+    should be a value close to 1.0).  'lookup_fraction(hash)' returns
+    the current time value, or 0.0 if the hash is not in the table.
 
     'set_decay(decay)', 'decay_all_counters()' is used to globally
     reduce all the stored time values.  They all get multiplied by
     a fraction close to (but smaller than) 1.0, computed from the
     'decay' parameter.
 
+    'set_compile_budget(budget)', 'consume_compile_budget()' limit the
+    number of loops and bridges that start tracing between two regular
+    decays (every 32 minor collections), to spread the JIT pauses of a
+    burst of newly hot loops over a longer time.  A 'budget' of 0 means
+    no limit.
+
     'install_new_cell(hash, newcell)' adds the new JitCell to the
     celltable, at the index given by 'hash' (bits 21:32).  Unlike
     the timetable, the celltable stores a linked list of JitCells
@@ -98,6 +105,8 @@ class JitCounter:
                                        flavor='raw', zero=True,
                                        track_allocation=False)
         self._nexthash = r_uint(0)
+        self.compile_budget = 0
+        self.compile_budget_left = 0
         #
         # The table of JitCell entries, recording already-compiled loops
         self.celltable = [None] * size
@@ -114,6 +123,13 @@ class JitCounter:
                 if glob.step == 32:
                     glob.step = 0
                     self.decay_all_counters()
+                    # refill the compile budget.  Not done in a method:
+                    # this function is only annotated by the GC transformer,
+                    # after the JitCounter class was already rtyped.  If the
+                    # program never sets a budget, 'compile_budget' is the
+                    # constant 0 and this is not translated at all
+                    if self.compile_budget > 0:
+                        self.compile_budget_left = self.compile_budget
             if not hasattr(translator, '_jit2gc'):
                 translator._jit2gc = {}
             translator._jit2gc['invoke_after_minor_collection'] = (
@@ -229,6 +245,14 @@ class JitCounter:
         p_entry.subhashes[0] = rffi.cast(rffi.USHORT, subhash)
         p_entry.times[0]     = r_singlefloat(new_fraction)
 
+    def lookup_fraction(self, hash):
+        p_entry = self.timetable[self._get_index(hash)]
+        subhash = self._get_subhash(hash)
+        for i in range(5):
+            if p_entry.subhashes[i] == subhash:
+                return float(p_entry.times[i])
+        return 0.0
+
     def reset(self, hash):
         p_entry = self.timetable[self._get_index(hash)]
         subhash = self._get_subhash(hash)
@@ -255,6 +279,23 @@ class JitCounter:
             cell = nextcell
         self.celltable[index] = keep
 
+    def set_compile_budget(self, budget):
+        if budget < 0:
+            budget = 0
+        self.compile_budget = budget
+        self.compile_budget_left = budget
+
+    def consume_compile_budget(self):
+        """Return True if we can start tracing now.  If we return False,
+        the caller should postpone tracing, e.g. by calling
+        change_current_fraction() to try again a bit later."""
+        if self.compile_budget == 0:
+            return True
+        if self.compile_budget_left <= 0:
+            return False
+        self.compile_budget_left -= 1
+        return True
+
     def set_decay(self, decay):
         """Set the decay, from 0 (none) to 1000 (max)."""
         if decay < 0:
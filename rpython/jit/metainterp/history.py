@@ -405,10 +405,14 @@ class JitCellToken(AbstractDescr):
     failed_states = None
     retraced_count = 0
     invalidated = False
+    trace_segments_disabled = False
     outermost_jitdriver_sd = None
     # and more data specified by the backend when the loop is compiled
     number = -1
     generation = r_int64(0)
+    # bytes of machine code and of resume data, see memmgr.py
+    code_size = 0
+    resume_size = 0
     # one purpose of LoopToken is to keep alive the CompiledLoopToken
     # returned by the backend.  When the LoopToken goes away, the
     # CompiledLoopToken has its __del__ called, which frees the assembler
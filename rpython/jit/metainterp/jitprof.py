@@ -5,6 +5,8 @@
 import time
 from rpython.rlib.debug import debug_print, debug_start, debug_stop
 from rpython.rlib.debug import have_debug_prints
+from rpython.rlib.objectmodel import compute_unique_id
+from rpython.rtyper.lltypesystem import lltype
 from rpython.jit.metainterp.jitexc import JitException
 from rpython.rlib.jit import Counters
 
@@ -152,9 +154,11 @@ class Profiler(BaseProfiler):
         self._print_intline("abort: bad loop", cnt[Counters.ABORT_BAD_LOOP])
         self._print_intline("abort: force quasi-immut",
                             cnt[Counters.ABORT_FORCE_QUASIIMMUT])
+        self._print_intline("trace segments", cnt[Counters.TRACE_SEGMENTS])
         self._print_intline("nvirtuals", cnt[Counters.NVIRTUALS])
         self._print_intline("nvholes", cnt[Counters.NVHOLES])
         self._print_intline("nvreused", cnt[Counters.NVREUSED])
+        self._print_intline("nnumbreused", cnt[Counters.NNUMBREUSED])
         self._print_intline("vecopt tried", cnt[Counters.OPT_VECTORIZE_TRY])
         self._print_intline("vecopt success", cnt[Counters.OPT_VECTORIZED])
         cpu = self.cpu
@@ -180,3 +184,93 @@ class Profiler(BaseProfiler):
 
 class BrokenProfilerData(JitException):
     pass
+
+
+class GuardCounter(object):
+    def __init__(self, loop_number):
+        self.loop_number = loop_number
+        self.failures = 0
+        self.bridges = 0
+
+
+class LoopProfile(object):
+    """Optional runtime counters about the compiled code: how many times
+    each loop was entered from the interpreter, how many times each guard
+    failed back to the interpreter, and how many bridges were compiled
+    from it.  They are only updated while 'enabled' is True, and only on
+    paths that already leave the machine code, so they don't slow down
+    the machine code itself.
+
+    Loops are identified by their number and guards by compute_unique_id()
+    of their descr, like in the jitlog and in the backend counters.  The
+    counters of a loop and of its guards are dropped when the memory
+    manager frees the loop: the ids of its descrs can then be reused.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.loop_entries = {}    # loop number -> count
+        self.guards = {}          # loop number -> {guard number: GuardCounter}
+
+    def set_enabled(self, flag):
+        if flag and not self.enabled:
+            self.loop_entries = {}
+            self.guards = {}
+        self.enabled = flag
+
+    def loop_freed(self, looptoken):
+        n = looptoken.number
+        if n in self.loop_entries:
+            del self.loop_entries[n]
+        if n in self.guards:
+            del self.guards[n]
+
+    def loop_entered(self, looptoken):
+        n = looptoken.number
+        self.loop_entries[n] = self.loop_entries.get(n, 0) + 1
+
+    def _get_guard_counter(self, descr):
+        loop_number = descr.rd_loop_token.number
+        guards = self.guards.get(loop_number, None)
+        if guards is None:
+            guards = {}
+            self.guards[loop_number] = guards
+        key = compute_unique_id(descr)
+        counter = guards.get(key, None)
+        if counter is None:
+            counter = GuardCounter(loop_number)
+            guards[key] = counter
+        return counter
+
+    def guard_failed(self, descr):
+        self._get_guard_counter(descr).failures += 1
+
+    def bridge_compiled(self, descr):
+        self._get_guard_counter(descr).bridges += 1
+
+    def get_loop_entries(self):
+        """Returns an instance of LOOP_ENTRY_CONTAINER from rlib.jit_hooks."""
+        from rpython.rlib.jit_hooks import LOOP_ENTRY_CONTAINER
+        items = self.loop_entries.items()
+        l = lltype.malloc(LOOP_ENTRY_CONTAINER, len(items))
+        for i in range(len(items)):
+            number, entries = items[i]
+            l[i].number = number
+            l[i].entries = entries
+        return l
+
+    def get_guard_failures(self):
+        """Returns an instance of GUARD_FAILURE_CONTAINER from
+        rlib.jit_hooks."""
+        from rpython.rlib.jit_hooks import GUARD_FAILURE_CONTAINER
+        items = []
+        for guards in self.guards.itervalues():
+            items.extend(guards.items())
+        l = lltype.malloc(GUARD_FAILURE_CONTAINER, len(items))
+        for i in range(len(items)):
+            number, counter = items[i]
+            l[i].number = number
+            l[i].loop_number = counter.loop_number
+            l[i].failures = counter.failures
+            l[i].bridges = counter.bridges
+        return l
@@ -2,6 +2,8 @@ import math
 from rpython.rlib.rarithmetic import r_int64
 from rpython.rlib.debug import debug_start, debug_print, debug_stop
 from rpython.rlib.objectmodel import we_are_translated
+from rpython.rlib.listsort import make_timsort_class
+from rpython.rtyper.lltypesystem import lltype
 
 #
 # Logic to decide which loops are old and not used any more.
@@ -19,10 +21,25 @@ from rpython.rlib.objectmodel import we_are_translated
 # 'generation' field is much smaller than the current generation, and
 # removed from the set.
 #
+# In addition, if 'memory_limit' is set, the MemoryManager keeps track of
+# the size of the machine code and of the resume data of every loop in
+# 'alive_loops', as reported by record_loop_size().  When the total goes
+# above the limit, the least recently used loops are removed from the set
+# until the total is back below 3/4 of the limit.
+#
+
+def _lru_lt(looptoken1, looptoken2):
+    # invalidated loops first, then the oldest generations
+    if looptoken1.invalidated != looptoken2.invalidated:
+        return looptoken1.invalidated
+    return looptoken1.generation < looptoken2.generation
+
+LRUSort = make_timsort_class(lt=_lru_lt)
+
 
 class MemoryManager(object):
 
-    def __init__(self):
+    def __init__(self, loop_profile=None):
         self.check_frequency = -1
         # NB. use of r_int64 to be extremely far on the safe side:
         # this is increasing by one after each loop or bridge is
@@ -38,6 +55,9 @@ class MemoryManager(object):
         self.current_generation = r_int64(1)
         self.next_check = r_int64(-1)
         self.alive_loops = {}
+        self.memory_limit = 0        # in bytes, 0 = no limit
+        self.memory_used = 0         # total size of the loops in alive_loops
+        self.loop_profile = loop_profile    # a jitprof.LoopProfile or None
 
     def set_max_age(self, max_age, check_frequency=0):
         if max_age <= 0:
@@ -49,6 +69,12 @@ class MemoryManager(object):
             self.check_frequency = check_frequency
             self.next_check = self.current_generation + 1
 
+    def set_memory_limit(self, limit):
+        if limit < 0:
+            limit = 0
+        self.memory_limit = limit
+        self._check_memory_limit()
+
     def next_generation(self):
         self.current_generation += 1
         if self.current_generation == self.next_check:
@@ -58,7 +84,71 @@ class MemoryManager(object):
     def keep_loop_alive(self, looptoken):
         if looptoken.generation != self.current_generation:
             looptoken.generation = self.current_generation
-            self.alive_loops[looptoken] = None
+            if looptoken not in self.alive_loops:
+                self.alive_loops[looptoken] = None
+                self.memory_used += looptoken.code_size + looptoken.resume_size
+                self._check_memory_limit()
+
+    def record_loop_size(self, looptoken, code_size, extra_resume_size):
+        """Called after a loop or a bridge was compiled.  'code_size' is
+        the total size of the machine code of the loop and all its bridges,
+        and 'extra_resume_size' the size of the resume data of the newly
+        compiled operations.
+        """
+        old_size = looptoken.code_size + looptoken.resume_size
+        looptoken.code_size = code_size
+        looptoken.resume_size += extra_resume_size
+        if looptoken in self.alive_loops:
+            # a bridge is only compiled for a loop that is in use
+            looptoken.generation = self.current_generation
+            self.memory_used += (code_size + looptoken.resume_size) - old_size
+            self._check_memory_limit()
+
+    def _forget_loop(self, looptoken):
+        del self.alive_loops[looptoken]
+        self.memory_used -= looptoken.code_size + looptoken.resume_size
+        if self.loop_profile is not None:
+            self.loop_profile.loop_freed(looptoken)
+
+    def _check_memory_limit(self):
+        if 0 < self.memory_limit < self.memory_used:
+            self._free_memory_now()
+
+    def _free_memory_now(self):
+        debug_start("jit-mem-collect")
+        oldtotal = len(self.alive_loops)
+        debug_print("Memory used before:", self.memory_used)
+        target = self.memory_limit - self.memory_limit // 4
+        looptokens = self.alive_loops.keys()
+        LRUSort(looptokens).sort()
+        for looptoken in looptokens:
+            if self.memory_used <= target:
+                break
+            # never free the loops used in the current generation
+            if looptoken.generation == self.current_generation:
+                continue
+            self._forget_loop(looptoken)
+        newtotal = len(self.alive_loops)
+        debug_print("Loop tokens freed: ", oldtotal - newtotal)
+        debug_print("Memory used after: ", self.memory_used)
+        if oldtotal != newtotal:
+            looptokens = None
+            looptoken = None
+            self._collect()
+        debug_stop("jit-mem-collect")
+
+    def get_loop_memory(self):
+        """Returns an instance of LOOP_MEMORY_CONTAINER from rlib.jit_hooks,
+        with the sizes of all the loops kept alive."""
+        from rpython.rlib.jit_hooks import LOOP_MEMORY_CONTAINER
+        looptokens = self.alive_loops.keys()
+        l = lltype.malloc(LOOP_MEMORY_CONTAINER, len(looptokens))
+        for i in range(len(looptokens)):
+            looptoken = looptokens[i]
+            l[i].number = looptoken.number
+            l[i].code_size = looptoken.code_size
+            l[i].resume_size = looptoken.resume_size
+        return l
 
     def _kill_old_loops_now(self):
         debug_start("jit-mem-collect")
@@ -70,14 +160,18 @@ class MemoryManager(object):
         for looptoken in self.alive_loops.keys():
             if (0 <= looptoken.generation < max_generation or
                 looptoken.invalidated):
-                del self.alive_loops[looptoken]
+                self._forget_loop(looptoken)
         newtotal = len(self.alive_loops)
         debug_print("Loop tokens freed: ", oldtotal - newtotal)
         debug_print("Loop tokens left:  ", newtotal)
         #print self.alive_loops.keys()
-        if not we_are_translated() and oldtotal != newtotal:
+        if oldtotal != newtotal:
             looptoken = None
+            self._collect()
+        debug_stop("jit-mem-collect")
+
+    def _collect(self):
+        if not we_are_translated():
             from rpython.rlib import rgc
             # a single one is not enough for all tests :-(
             rgc.collect(); rgc.collect(); rgc.collect()
-        debug_stop("jit-mem-collect")
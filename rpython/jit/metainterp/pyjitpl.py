@@ -1136,6 +1136,9 @@ class MIFrame(object):
                 else:
                     return self.metainterp.perform_call(portal_code, allboxes,
                                 greenkey=greenboxes)
+            elif warmrunnerstate.too_big_to_inline(greenboxes):
+                # it is traced from its start and called instead
+                warmrunnerstate.dont_trace_here(greenboxes)
             assembler_call = True
             # verify that we have all green args, needed to make sure
             # that assembler that we call is still correct
@@ -1998,6 +2001,9 @@ class MetaInterpGlobalData(object):
         self.initialized = False
         self.indirectcall_dict = None
         self.addr2name = None
+        # how many times a trace was too long, for the hooks
+        self.num_traces_too_long = 0
+        self.num_trace_segments = 0
 
 # ____________________________________________________________
 
@@ -2006,6 +2012,7 @@ class MetaInterp(object):
     cancel_count = 0
     exported_state = None
     last_exc_box = None
+    trace_segment_pending = False
     _last_op = None
 
     def __init__(self, staticdata, jitdriver_sd):
@@ -2378,7 +2385,8 @@ class MetaInterp(object):
                 if hooks.are_hooks_enabled():
                     hooks.on_trace_too_long(
                         jd_sd.jitdriver, greenkey,
-                        jd_sd.warmstate.get_location_str(greenkey))
+                        jd_sd.warmstate.get_location_str(greenkey), False,
+                        self.staticdata.globaldata.num_traces_too_long)
                 # no ops for now
                 self.aborted_tracing_jitdriver = None
                 self.aborted_tracing_greenkey = None
@@ -2388,10 +2396,33 @@ class MetaInterp(object):
         warmrunnerstate = self.jitdriver_sd.warmstate
         if (self.history.length() > warmrunnerstate.trace_limit or
                 self.history.trace_tag_overflow()):
+            if self.trace_segment_pending:
+                # we are looking for a position where the trace can end;
+                # give up if the trace grew by more than 10% meanwhile
+                if (not self.history.trace_tag_overflow() and
+                        self.history.length() <=
+                            warmrunnerstate.trace_limit * 11 // 10):
+                    if self.can_end_trace_segment_here():
+                        self.compile_trace_segment()
+                    return
+                self.staticdata.stats.record_aborted(None)
+                self.portal_trace_positions = None
+                self.disable_trace_segments()
+                raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
             jd_sd, greenkey_of_huge_function = self.find_biggest_function()
+            if (greenkey_of_huge_function is None and
+                    not self.history.trace_tag_overflow() and
+                    self.may_compile_trace_segment()):
+                # no inlined function is responsible: compile the trace
+                # in several segments instead
+                self.trace_segment_pending = True
+                if self.can_end_trace_segment_here():
+                    self.compile_trace_segment()
+                return
             self.staticdata.stats.record_aborted(greenkey_of_huge_function)
             self.portal_trace_positions = None
             if greenkey_of_huge_function is not None:
+                self.staticdata.globaldata.num_traces_too_long += 1
                 jd_sd.warmstate.disable_noninlinable_function(
                     greenkey_of_huge_function)
                 self.aborted_tracing_jitdriver = jd_sd
@@ -2402,6 +2433,111 @@ class MetaInterp(object):
                     warmrunnerstate.JitCell.trace_next_iteration(greenkey)
             raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
 
+    def may_compile_trace_segment(self):
+        if (self.staticdata.warmrunnerdesc is None or
+                not self.jitdriver_sd.warmstate.trace_segments):
+            return False
+        if self.partial_trace is not None:
+            return False    # retracing
+        if isinstance(self.resumekey, compile.ResumeFromInterpDescr):
+            if len(self.current_merge_points) == 0:
+                return False
+            greenkey = self._get_loop_greenkey()
+            return not self.jitdriver_sd.warmstate.trace_segments_disabled(
+                greenkey)
+        looptoken = self.resumekey_original_loop_token
+        return looptoken is None or not looptoken.trace_segments_disabled
+
+    def _get_loop_greenkey(self):
+        original_boxes = self.current_merge_points[0][0]
+        return original_boxes[:self.jitdriver_sd.num_green_args]
+
+    def disable_trace_segments(self):
+        # no position where the segment could end was found in time:
+        # tracing again from the same place would fail in the same way,
+        # so the next attempt aborts instead of segmenting the trace
+        if isinstance(self.resumekey, compile.ResumeFromInterpDescr):
+            if len(self.current_merge_points) > 0:
+                self.jitdriver_sd.warmstate.disable_trace_segments(
+                    self._get_loop_greenkey())
+        elif self.resumekey_original_loop_token is not None:
+            self.resumekey_original_loop_token.trace_segments_disabled = True
+
+    def can_end_trace_segment_here(self):
+        # the guard ending the segment resumes at the start of the next
+        # instruction, which needs liveness information
+        if self.last_exc_value:
+            return False
+        frame = self.framestack[-1]
+        return frame.jitcode.has_liveness_info(frame.pc)
+
+    def compile_trace_segment(self):
+        """Compile what was traced so far, ending with a guard that always
+        fails.  The rest of the code is traced later as a bridge from this
+        guard, like for any other guard that fails often enough.  The
+        current iteration is finished in the blackhole interpreter.
+        """
+        from rpython.jit.metainterp.blackhole import convert_and_run_from_pyjitpl
+        sd = self.staticdata
+        jd_sd = self.jitdriver_sd
+        funcbox = ConstInt(rffi.cast(lltype.Signed, sd.segment_end_ptr))
+        resbox = self.history.record(rop.CALL_I, [funcbox], 0,
+                                     descr=sd.segment_end_descr)
+        self.generate_guard(rop.GUARD_TRUE, resbox)
+        num_green_args = jd_sd.num_green_args
+        if isinstance(self.resumekey, compile.ResumeFromInterpDescr):
+            original_boxes = self.current_merge_points[0][0]
+            greenkey = original_boxes[:num_green_args]
+            ptoken = self.get_procedure_token(greenkey)
+            if ptoken is not None and ptoken.target_tokens is not None:
+                raise SwitchToBlackhole(Counters.ABORT_BAD_LOOP)
+            if self.history.trace_tag_overflow():
+                raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
+            self.history.trace.tracing_done()
+            target_token = compile.compile_loop_segment(self, greenkey,
+                                            original_boxes[num_green_args:])
+            if target_token is None:
+                raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
+            assert isinstance(target_token, TargetToken)
+            jitcell_token = target_token.targeting_jitcell_token
+            jd_sd.warmstate.attach_procedure_to_interp(greenkey, jitcell_token)
+            sd.stats.add_jitcell_token(jitcell_token)
+            location = jd_sd.warmstate.get_location_str(greenkey)
+        else:
+            # a bridge: the FINISH is never reached
+            result_type = jd_sd.result_type
+            if result_type == history.VOID:
+                exits = []
+                token = sd.done_with_this_frame_descr_void
+            elif result_type == history.INT:
+                exits = [history.CONST_FALSE]
+                token = sd.done_with_this_frame_descr_int
+            elif result_type == history.REF:
+                exits = [history.CONST_NULL]
+                token = sd.done_with_this_frame_descr_ref
+            elif result_type == history.FLOAT:
+                exits = [history.CONST_FZERO]
+                token = sd.done_with_this_frame_descr_float
+            else:
+                assert False
+            self.history.record(rop.FINISH, exits, None, descr=token)
+            if self.history.trace_tag_overflow():
+                raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
+            self.history.trace.tracing_done()
+            if compile.compile_trace(self, self.resumekey, exits) is None:
+                raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
+            greenkey = None
+            location = ''
+        sd.profiler.count(Counters.TRACE_SEGMENTS)
+        sd.globaldata.num_trace_segments += 1
+        debug_print('~~~ COMPILED TRACE SEGMENT')
+        hooks = sd.warmrunnerdesc.hooks
+        if hooks.are_hooks_enabled():
+            hooks.on_trace_too_long(jd_sd.jitdriver, greenkey, location, True,
+                                    sd.globaldata.num_trace_segments)
+        convert_and_run_from_pyjitpl(self)
+        assert False    # ^^^ must raise
+
     def _interpret(self):
         # Execute the frames forward until we raise a DoneWithThisFrame,
         # a ExitFrameWithException, or a ContinueRunningNormally exception.
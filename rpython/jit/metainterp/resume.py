@@ -155,6 +155,7 @@ TAGCONST    = 0
 TAGINT      = 1
 TAGBOX      = 2
 TAGVIRTUAL  = 3
+assert resumecode.DELTA_TAG == TAGBOX    # boxes are delta-encoded
 
 UNASSIGNED = tag(-1 << 13, TAGBOX)
 UNASSIGNEDVIRTUAL = tag(-1 << 13, TAGVIRTUAL)
@@ -180,10 +181,15 @@ class ResumeDataLoopMemo(object):
         self.refs = self.cpu.ts.new_ref_dict_2()
         self.cached_boxes = {}
         self.cached_virtuals = {}
+        # the numberings already created for this loop or bridge, keyed
+        # by their encoded content; guards with the same resume data
+        # share the same NUMBERING
+        self.numberings = {}
 
         self.nvirtuals = 0
         self.nvholes = 0
         self.nvreused = 0
+        self.nnumbreused = 0
 
     def getconst(self, const):
         if const.type == INT:
@@ -282,6 +288,17 @@ class ResumeDataLoopMemo(object):
         return numb_state
 
 
+    def create_numbering(self, numb_state):
+        final = numb_state.encode()
+        key = resumecode.encoded_key(final)
+        numb = self.numberings.get(key, resumecode.NULL_NUMBER)
+        if numb:
+            self.nnumbreused += 1
+        else:
+            numb = resumecode.numbering_from_encoded(final)
+            self.numberings[key] = numb
+        return numb
+
     # caching for virtuals and boxes inside them
 
     def num_cached_boxes(self):
@@ -317,6 +334,7 @@ class ResumeDataLoopMemo(object):
         profiler.count(jitprof.Counters.NVIRTUALS, self.nvirtuals)
         profiler.count(jitprof.Counters.NVHOLES, self.nvholes)
         profiler.count(jitprof.Counters.NVREUSED, self.nvreused)
+        profiler.count(jitprof.Counters.NNUMBREUSED, self.nnumbreused)
 
 _frame_info_placeholder = (None, 0, 0)
 
@@ -465,7 +483,7 @@ class ResumeDataVirtualAdder(VirtualVisitor):
         numb_state.patch(1, len(liveboxes))
 
         self._add_optimizer_sections(numb_state, liveboxes, liveboxes_from_env)
-        storage.rd_numb = numb_state.create_numbering()
+        storage.rd_numb = self.memo.create_numbering(numb_state)
         storage.rd_consts = self.memo.consts
         return liveboxes[:]
 
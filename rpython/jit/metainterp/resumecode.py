@@ -20,6 +20,15 @@
 
   # ----- optimization section
   <more code>                                      further sections according to bridgeopt.py
+
+Every item is stored as a zigzag-encoded varint of 1 to 3 bytes.  The
+items whose two lowest bits are DELTA_TAG (boxes, see TAGBOX in resume.py)
+are stored as the difference with the previous such item, rounded down to
+a multiple of 4.  The boxes are numbered in the order in which they are
+first seen, so this turns most of them into small numbers that fit in a
+single byte, even in frames with many boxes.  The tag bits are unchanged
+by this transformation, so decoding is unambiguous, but the items must be
+read in order.
 """
 
 from rpython.rtyper.lltypesystem import rffi, lltype
@@ -31,6 +40,9 @@ NUMBERING = lltype.GcStruct('Numbering',
 NUMBERINGP.TO.become(NUMBERING)
 NULL_NUMBER = lltype.nullptr(NUMBERING)
 
+DELTA_TAG = 2
+DELTA_MASK = 3
+
 def append_numbering(lst, item):
     item = rffi.cast(lltype.Signed, item)
     item *= 2
@@ -44,7 +56,7 @@ def append_numbering(lst, item):
         lst.append(rffi.cast(rffi.UCHAR, item | 0x80))
         lst.append(rffi.cast(rffi.UCHAR, item >> 7))
     else:
-        assert item < 2**16
+        assert item < 2**22
         lst.append(rffi.cast(rffi.UCHAR, item | 0x80))
         lst.append(rffi.cast(rffi.UCHAR, (item >> 7) | 0x80))
         lst.append(rffi.cast(rffi.UCHAR, item >> 14))
@@ -72,11 +84,28 @@ def numb_next_n_items(numb, size, index):
         _, index = numb_next_item(numb, index)
     return index
 
+def delta_encode(item, prev_base):
+    """Return the value to store for 'item' and the new base."""
+    if item & DELTA_MASK == DELTA_TAG:
+        return item - prev_base, item & ~DELTA_MASK
+    return item, prev_base
+delta_encode._always_inline_ = True
+
+def delta_decode(value, prev_base):
+    """Return the item stored as 'value' and the new base."""
+    if value & DELTA_MASK == DELTA_TAG:
+        item = value + prev_base
+        return item, item & ~DELTA_MASK
+    return value, prev_base
+delta_decode._always_inline_ = True
+
 def unpack_numbering(numb):
     l = []
     i = 0
+    base = 0
     while i < len(numb.code):
         next, i = numb_next_item(numb, i)
+        next, base = delta_decode(next, base)
         l.append(next)
     return l
 
@@ -92,14 +121,17 @@ class Writer(object):
         assert rffi.cast(lltype.Signed, short) == item
         return self.append_short(short)
 
-    def create_numbering(self):
+    def encode(self):
+        """Return the encoded items, as a list of UCHARs."""
         final = objectmodel.newlist_hint(len(self.current) * 3)
+        base = 0
         for item in self.current:
-            append_numbering(final, item)
-        numb = lltype.malloc(NUMBERING, len(final))
-        for i, elt in enumerate(final):
-            numb.code[i] = elt
-        return numb
+            value, base = delta_encode(rffi.cast(lltype.Signed, item), base)
+            append_numbering(final, value)
+        return final
+
+    def create_numbering(self):
+        return numbering_from_encoded(self.encode())
 
     def patch_current_size(self, index):
         self.patch(index, len(self.current))
@@ -107,6 +139,17 @@ class Writer(object):
     def patch(self, index, item):
         self.current[index] = item
 
+def numbering_from_encoded(final):
+    numb = lltype.malloc(NUMBERING, len(final))
+    for i, elt in enumerate(final):
+        numb.code[i] = elt
+    return numb
+
+def encoded_key(final):
+    """Return a string with the same content as the list of UCHARs
+    'final', usable as a dictionary key."""
+    return ''.join([chr(rffi.cast(lltype.Signed, elt)) for elt in final])
+
 def create_numbering(l):
     w = Writer()
     for item in l:
@@ -119,23 +162,29 @@ class Reader(object):
         self.code = code
         self.cur_pos = 0 # index into the code
         self.items_read = 0 # number of items read
+        self.base = 0 # for delta_decode()
 
     def next_item(self):
         result, self.cur_pos = numb_next_item(self.code, self.cur_pos)
+        result, self.base = delta_decode(result, self.base)
         self.items_read += 1
         return result
 
     def peek(self):
         result, _ = numb_next_item(self.code, self.cur_pos)
+        result, _ = delta_decode(result, self.base)
         return result
 
     def jump(self, size):
         """ jump n items forward without returning anything """
         index = self.cur_pos
+        base = self.base
         for i in range(size):
-            _, index = numb_next_item(self.code, index)
+            value, index = numb_next_item(self.code, index)
+            _, base = delta_decode(value, base)
         self.items_read += size
         self.cur_pos = index
+        self.base = base
 
     def unpack(self):
         # mainly for debugging
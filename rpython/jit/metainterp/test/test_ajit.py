@@ -4702,6 +4702,83 @@ class TestLLtype(BaseLLtypeTests, LLJitMixin):
         res = self.meta_interp(f, [10])
         assert res == f(10)
 
+    def test_trace_too_long_segments(self):
+        driver = JitDriver(greens=[], reds=['n', 'total'])
+        @unroll_safe
+        def body(n):
+            total = 0
+            for i in range(40):
+                if n & (1 << (i % 8)):
+                    total += i * n
+                else:
+                    total -= 1
+            return total
+
+        def f(n, segments):
+            set_param(driver, 'trace_segments', segments)
+            total = 0
+            while n > 0:
+                driver.jit_merge_point(n=n, total=total)
+                total += body(n)
+                n -= 1
+            return total
+
+        res = self.meta_interp(f, [300, 1], trace_limit=200)
+        assert res == f(300, 1)
+        self.check_aborted_count(0)
+        # the loop, and at least one bridge continuing it
+        self.check_jitcell_token_count(1)
+        assert get_stats().compiled_count >= 2
+        res = self.meta_interp(f, [300, 0], trace_limit=200)
+        assert res == f(300, 0)
+        self.check_aborted_count_at_least(1)
+        self.check_trace_count(0)
+
+    def test_trace_too_long_segments_give_up(self):
+        from rpython.jit.metainterp import pyjitpl
+        driver = JitDriver(greens=[], reds=['n', 'total'])
+        @unroll_safe
+        def body(n):
+            total = 0
+            for i in range(40):
+                if n & (1 << (i % 8)):
+                    total += i * n
+                else:
+                    total -= 1
+            return total
+
+        def f(n):
+            total = 0
+            while n > 0:
+                driver.jit_merge_point(n=n, total=total)
+                total += body(n)
+                n -= 1
+            return total
+
+        # pretend that there is never a position where the segment
+        # could end: the first attempt gives up, and the following ones
+        # must not try to segment the trace again
+        results = []
+        orig_may_compile = pyjitpl.MetaInterp.may_compile_trace_segment.im_func
+        orig_can_end = pyjitpl.MetaInterp.can_end_trace_segment_here.im_func
+        def may_compile_trace_segment(self):
+            res = orig_may_compile(self)
+            results.append(res)
+            return res
+        pyjitpl.MetaInterp.may_compile_trace_segment = may_compile_trace_segment
+        pyjitpl.MetaInterp.can_end_trace_segment_here = lambda self: False
+        try:
+            res = self.meta_interp(f, [300], trace_limit=100)
+        finally:
+            pyjitpl.MetaInterp.may_compile_trace_segment = orig_may_compile
+            pyjitpl.MetaInterp.can_end_trace_segment_here = orig_can_end
+        assert res == f(300)
+        self.check_trace_count(0)
+        self.check_aborted_count_at_least(2)
+        assert results[0] is True
+        assert len(results) >= 2
+        assert True not in results[1:]
+
     def test_cached_info_missing(self):
         py.test.skip("XXX hitting a non-translated assert in optimizeopt/heap.py, but seems not to hurt the rest")
         driver = JitDriver(greens = [],
@@ -128,3 +128,40 @@ def test_change_current_fraction():
     assert r is False
     r = jc.tick(index2hash(jc, 104), incr)
     assert r is True
+
+def test_lookup_fraction():
+    jc = JitCounter()
+    incr = jc.compute_threshold(8)
+    hash = index2hash(jc, 104)
+    assert jc.lookup_fraction(hash) == 0.0
+    jc.tick(hash, incr)
+    jc.tick(hash, incr)
+    assert abs(jc.lookup_fraction(hash) - 2 * incr) < 1e-6
+    assert jc.lookup_fraction(index2hash(jc, 104, 1)) == 0.0
+    jc.change_current_fraction(hash, 0.95)
+    assert abs(jc.lookup_fraction(hash) - 0.95) < 1e-6
+    jc.reset(hash)
+    assert jc.lookup_fraction(hash) == 0.0
+
+def test_compile_budget():
+    class FakeTranslator:
+        pass
+    translator = FakeTranslator()
+    jc = JitCounter(translator=translator)
+    jc.decay_all_counters = lambda: None
+    after_minor_collection = translator._jit2gc['invoke_after_minor_collection']
+    assert jc.consume_compile_budget()     # no limit by default
+    jc.set_compile_budget(2)
+    assert jc.consume_compile_budget()
+    assert jc.consume_compile_budget()
+    assert not jc.consume_compile_budget()
+    for i in range(31):
+        after_minor_collection()
+    assert not jc.consume_compile_budget()
+    after_minor_collection()      # refilled every 32 minor collections
+    assert jc.consume_compile_budget()
+    assert jc.consume_compile_budget()
+    assert not jc.consume_compile_budget()
+    jc.set_compile_budget(0)
+    for i in range(5):
+        assert jc.consume_compile_budget()
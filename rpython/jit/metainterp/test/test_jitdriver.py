@@ -115,6 +115,7 @@ class MultipleJitDriversTests(object):
                 self.val = val
 
         def loop1(n):
+            set_param(None, "trace_segments", 0)
             i = 0
             box = IntBox(10)
             while i < n:
@@ -1,6 +1,7 @@
 
 import py
 from rpython.rlib.jit import JitDriver, JitHookInterface, Counters, dont_look_inside
+from rpython.rlib.jit import set_param
 from rpython.rlib import jit_hooks
 from rpython.jit.metainterp.test.support import LLJitMixin
 from rpython.jit.codewriter.policy import JitPolicy
@@ -52,6 +53,50 @@ class JitHookInterfaceTests(object):
         assert res == 721
         assert reasons == [Counters.ABORT_FORCE_QUASIIMMUT] * 2
 
+    def test_trace_too_long_segmented(self):
+        from rpython.rlib.jit import unroll_safe
+        events = []
+
+        class MyJitIface(JitHookInterface):
+            def on_trace_too_long(self, jitdriver, greenkey, greenkey_repr,
+                                  segmented, count):
+                assert jitdriver is myjitdriver
+                if greenkey is not None:
+                    assert greenkey_repr == 'blah'
+                events.append((greenkey is None, segmented, count))
+
+        iface = MyJitIface()
+
+        myjitdriver = JitDriver(greens=['foo'], reds=['x', 'total'],
+                                get_printable_location=lambda *args: 'blah')
+
+        @unroll_safe
+        def body(x):
+            total = 0
+            for i in range(60):
+                if x & (1 << (i % 8)):
+                    total += i * x
+                else:
+                    total -= 1
+            return total
+
+        def f(foo, x):
+            set_param(myjitdriver, 'trace_limit', 200)
+            total = 0
+            while x > 0:
+                myjitdriver.jit_merge_point(foo=foo, x=x, total=total)
+                total += body(x)
+                x -= 1
+            return total
+        #
+        res = self.meta_interp(f, [1, 500], policy=JitPolicy(iface))
+        assert res == f(1, 500)
+        # first the loop, then bridges, each ending in another segment
+        assert events[0] == (False, True, 1)
+        assert len(events) >= 2
+        for i in range(1, len(events)):
+            assert events[i] == (True, True, i + 1)
+
     def test_on_compile(self):
         called = []
 
@@ -202,6 +247,176 @@ class JitHookInterfaceTests(object):
         self.meta_interp(main, [5])
         self.check_jitcell_token_count(2)
 
+    def test_warm_start_at_key(self):
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit')
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                i -= 1
+
+        def main(s):
+            set_param(driver, "threshold", 1000)
+            loop(5, s)
+            assert not jit_hooks.get_jitcell_at_key("jit", s)
+            jit_hooks.warm_start_at_key("jit", s + 1)
+            loop(5, s + 1)
+            assert jit_hooks.get_jitcell_at_key("jit", s + 1)
+
+        self.meta_interp(main, [5])
+        self.check_jitcell_token_count(1)
+
+    def test_warm_start_at_key_not_confirmed(self):
+        # the warm start is only used up when tracing really starts
+        def confirm_enter_jit(s, i):
+            return i < 3
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit',
+                           confirm_enter_jit=confirm_enter_jit)
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                i -= 1
+
+        def main(s):
+            set_param(driver, "threshold", 1000)
+            jit_hooks.warm_start_at_key("jit", s)
+            loop(6, s)
+            assert jit_hooks.get_jitcell_at_key("jit", s)
+
+        self.meta_interp(main, [5])
+        self.check_jitcell_token_count(1)
+
+    def test_get_set_counter_at_key(self):
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit')
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                i -= 1
+
+        def main(s):
+            set_param(driver, "threshold", 1000)
+            assert jit_hooks.get_counter_at_key("jit", s) == 0.0
+            loop(3, s)
+            assert 0.0 < jit_hooks.get_counter_at_key("jit", s) < 0.5
+            jit_hooks.set_counter_at_key("jit", 0.5, s + 1)
+            assert jit_hooks.get_counter_at_key("jit", s + 1) == 0.5
+            loop(3, s + 1)
+            assert jit_hooks.get_counter_at_key("jit", s + 1) > 0.5
+
+        self.meta_interp(main, [5])
+        self.check_jitcell_token_count(0)
+
+    def test_compile_budget(self):
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit')
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                i -= 1
+
+        def main(budget):
+            set_param(driver, "compile_budget", budget)
+            loop(30, 1)
+            loop(30, 2)
+            loop(30, 3)
+
+        self.meta_interp(main, [1])
+        self.check_jitcell_token_count(1)
+        self.meta_interp(main, [0])
+        self.check_jitcell_token_count(3)
+
+    def test_compile_budget_not_spent_without_tracing(self, monkeypatch):
+        from rpython.rlib import rstack
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit')
+
+        calls = []
+        def stack_almost_full():
+            # the first time the loop is hot, we cannot start tracing
+            calls.append(None)
+            return len(calls) == 1
+        monkeypatch.setattr(rstack, 'stack_almost_full', stack_almost_full)
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                i -= 1
+
+        def main(budget):
+            set_param(driver, "compile_budget", budget)
+            loop(30, budget)
+
+        self.meta_interp(main, [1])
+        self.check_jitcell_token_count(1)
+
+    def test_loop_memory(self):
+        driver = JitDriver(greens = ['s'], reds = ['i'], name='jit')
+
+        def loop(i, s):
+            while i > 0:
+                driver.jit_merge_point(i=i, s=s)
+                if i % 3 == 0:
+                    i -= 1
+                i -= 1
+
+        def main(limit):
+            set_param(None, "loop_memory_limit", limit)
+            loop(30, 1)
+            loop(30, 2)
+            l = jit_hooks.stats_get_loop_memory(None)
+            total = 0
+            for i in range(len(l)):
+                assert l[i].resume_size > 0
+                total += l[i].code_size + l[i].resume_size
+            assert jit_hooks.stats_loop_memory_used(None) == total
+            return len(l)
+
+        assert self.meta_interp(main, [0]) == 2
+        assert self.meta_interp(main, [1]) == 1
+
+    def test_loop_profile(self):
+        driver = JitDriver(greens = [], reds = ['i', 'total'], name='jit')
+
+        def loop(i):
+            total = 0
+            while i > 0:
+                driver.jit_merge_point(i=i, total=total)
+                if i % 5 == 0:
+                    total += 2
+                total += 1
+                i -= 1
+            return total
+
+        def main(eagerness):
+            set_param(None, "trace_eagerness", eagerness)
+            jit_hooks.stats_set_loop_profile(None, True)
+            loop(100)
+            loop(100)
+            jit_hooks.stats_set_loop_profile(None, False)
+            loop(100)
+            entries = jit_hooks.stats_get_loop_entries(None)
+            guards = jit_hooks.stats_get_guard_failures(None)
+            assert len(entries) == 1
+            failures = bridges = 0
+            for i in range(len(guards)):
+                assert guards[i].loop_number == entries[0].number
+                failures += guards[i].failures
+                bridges += guards[i].bridges
+            return entries[0].entries * 10000 + failures * 100 + bridges
+
+        res = self.meta_interp(main, [1000])
+        entries, failures, bridges = res // 10000, res // 100 % 100, res % 100
+        # without bridges, we leave the loop with a guard failure
+        assert entries > 0
+        assert failures == entries
+        assert bridges == 0
+        res = self.meta_interp(main, [2])
+        entries, failures, bridges = res // 10000, res // 100 % 100, res % 100
+        assert 0 < entries < 10
+        assert failures >= 2
+        assert bridges >= 1
+
     def test_dont_trace_here(self):
         driver = JitDriver(greens = ['s'], reds = ['i', 'k'], name='jit')
 
@@ -227,6 +442,34 @@ class JitHookInterfaceTests(object):
         self.meta_interp(main, [1, 1], inline=True)
         self.check_resops(call_assembler_n=8)
 
+    def test_inline_hot_size(self):
+        driver = JitDriver(greens = ['s'], reds = ['i', 'k'], name='jit',
+                           get_code_size=lambda s: 10 if s == 0 else 100)
+
+        def loop(i, s):
+            k = 4
+            while i > 0:
+                driver.jit_merge_point(k=k, i=i, s=s)
+                if s == 1:
+                    loop(3, 0)
+                k -= 1
+                i -= 1
+                if k == 0:
+                    k = 4
+                    driver.can_enter_jit(k=k, i=i, s=s)
+
+        def main(s, hot_size):
+            jit_hooks.dont_trace_here("jit", 0)
+            set_param(driver, 'inline_hot_size', hot_size)
+            loop(30, s)
+
+        # the function is small and was compiled from its start as soon
+        # as it was called, so it is inlined in spite of dont_trace_here
+        self.meta_interp(main, [1, 10], inline=True)
+        self.check_resops(call_assembler_n=0)
+        self.meta_interp(main, [1, 9], inline=True)
+        self.check_resops(call_assembler_n=8)
+
     def test_trace_next_iteration_hash(self):
         driver = JitDriver(greens = ['s'], reds = ['i'], name="name")
         class Hashes(object):
@@ -12,8 +12,9 @@ if len(sys.argv) >= 4 and sys.argv[1] == '--sub':
 
 import py
 from rpython.jit.metainterp.memmgr import MemoryManager
+from rpython.jit.metainterp.jitprof import LoopProfile
 from rpython.jit.metainterp.test.support import LLJitMixin
-from rpython.rlib.jit import JitDriver, dont_look_inside
+from rpython.rlib.jit import JitDriver, dont_look_inside, set_param
 from rpython.jit.metainterp.warmspot import get_stats
 from rpython.jit.metainterp.warmstate import BaseJitCell
 from rpython.rlib import rgc
@@ -21,6 +22,9 @@ from rpython.rlib import rgc
 class FakeLoopToken:
     generation = 0
     invalidated = False
+    number = -1
+    code_size = 0
+    resume_size = 0
 
 
 class _TestMemoryManager:
@@ -78,6 +82,96 @@ class _TestMemoryManager:
             else:
                 assert tokens[i] in memmgr.alive_loops
 
+    def test_memory_limit(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_age(0)
+        memmgr.set_memory_limit(1000)
+        tokens = [FakeLoopToken() for i in range(10)]
+        for token in tokens:
+            memmgr.record_loop_size(token, 300, 100)
+            memmgr.keep_loop_alive(token)
+            memmgr.next_generation()
+        # every time the limit is exceeded, the oldest loops are freed
+        # until we're back below 750 bytes
+        assert memmgr.alive_loops == dict.fromkeys(tokens[8:])
+        assert memmgr.memory_used == 800
+
+    def test_memory_limit_lru(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_age(0)
+        memmgr.set_memory_limit(1000)
+        a, b, c, d, e = [FakeLoopToken() for i in range(5)]
+        for token in [a, b, c, d]:
+            memmgr.record_loop_size(token, 200, 50)
+            memmgr.keep_loop_alive(token)
+            memmgr.next_generation()
+        assert memmgr.memory_used == 1000
+        memmgr.keep_loop_alive(a)
+        memmgr.next_generation()
+        memmgr.record_loop_size(e, 200, 50)
+        memmgr.keep_loop_alive(e)
+        assert memmgr.alive_loops == dict.fromkeys([a, d, e])
+        assert memmgr.memory_used == 750
+
+    def test_memory_limit_invalidated_first(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_age(0)
+        tokens = [FakeLoopToken() for i in range(4)]
+        for token in tokens:
+            memmgr.record_loop_size(token, 200, 50)
+            memmgr.keep_loop_alive(token)
+            memmgr.next_generation()
+        tokens[3].invalidated = True
+        memmgr.set_memory_limit(900)
+        assert memmgr.alive_loops == dict.fromkeys(tokens[1:3])
+        assert memmgr.memory_used == 500
+
+    def test_memory_limit_bridges(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_age(0)
+        memmgr.set_memory_limit(1000)
+        a, b = FakeLoopToken(), FakeLoopToken()
+        memmgr.record_loop_size(a, 200, 50)
+        memmgr.keep_loop_alive(a)
+        memmgr.next_generation()
+        memmgr.record_loop_size(b, 200, 50)
+        memmgr.keep_loop_alive(b)
+        memmgr.next_generation()
+        assert memmgr.memory_used == 500
+        # a bridge is attached to 'b': the code size is the new total
+        memmgr.record_loop_size(b, 600, 150)
+        assert (b.code_size, b.resume_size) == (600, 200)
+        # the total was 1050: 'a' was freed, but not 'b', which we're compiling a bridge for
+        assert memmgr.alive_loops == {b: None}
+        assert memmgr.memory_used == 800
+        l = memmgr.get_loop_memory()
+        assert len(l) == 1
+        assert (l[0].code_size, l[0].resume_size) == (600, 200)
+
+    def test_loop_profile_forgets_freed_loops(self):
+        class FakeDescr:
+            def __init__(self, looptoken):
+                self.rd_loop_token = looptoken
+        profile = LoopProfile()
+        profile.set_enabled(True)
+        memmgr = MemoryManager(profile)
+        memmgr.set_max_age(4, 1)
+        a, b = FakeLoopToken(), FakeLoopToken()
+        a.number, b.number = 1, 2
+        memmgr.keep_loop_alive(a)
+        memmgr.next_generation()
+        memmgr.keep_loop_alive(b)
+        for token in [a, b]:
+            profile.loop_entered(token)
+            profile.guard_failed(FakeDescr(token))
+        assert sorted(profile.loop_entries) == [1, 2]
+        assert sorted(profile.guards) == [1, 2]
+        for i in range(3):
+            memmgr.next_generation()
+        assert memmgr.alive_loops == {b: None}
+        assert profile.loop_entries == {2: 1}
+        assert sorted(profile.guards) == [2]
+
 
 class _TestIntegration(LLJitMixin):
     # See comments in TestMemoryManager.  To get temporarily the normal
@@ -212,6 +306,36 @@ class _TestIntegration(LLJitMixin):
         assert res == 42
         self.check_enter_count(2 + 10*4)
 
+    def test_memory_limit(self):
+        myjitdriver = JitDriver(greens=['m'], reds=['n'])
+        def g(m):
+            n = 10
+            while n > 0:
+                myjitdriver.can_enter_jit(n=n, m=m)
+                myjitdriver.jit_merge_point(n=n, m=m)
+                n = n - 1
+            return 21
+        def f(limit):
+            set_param(None, 'loop_memory_limit', limit)
+            for i in range(10):
+                g(1)
+                g(2)
+                g(3)
+            return 42
+
+        res = self.meta_interp(f, [0], loop_longevity=0)
+        assert res == 42
+        tokens = [t() for t in get_stats().jitcell_token_wrefs]
+        assert None not in tokens
+        count_without_limit = len(tokens)
+        #
+        # with a tiny limit, only the last loop used is kept alive
+        res = self.meta_interp(f, [1], loop_longevity=0)
+        assert res == 42
+        tokens = [t() for t in get_stats().jitcell_token_wrefs]
+        assert None in tokens
+        assert len(tokens) > count_without_limit
+
     def test_call_assembler_keep_alive(self):
         myjitdriver1 = JitDriver(greens=['m'], reds=['n'])
         myjitdriver2 = JitDriver(greens=['m'], reds=['n', 'rec'])
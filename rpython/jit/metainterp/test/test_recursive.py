@@ -331,6 +331,7 @@ class RecursiveTests:
             return 0
         def loop(n):
             set_param(myjitdriver, "threshold", 10)
+            set_param(myjitdriver, "trace_segments", 0)
             pc = 0
             while n:
                 myjitdriver.can_enter_jit(n=n)
@@ -354,6 +355,7 @@ class RecursiveTests:
         def loop(n):
             set_param(None, "threshold", 4)
             set_param(None, "trace_eagerness", 2)
+            set_param(None, "trace_segments", 0)
             while n:
                 myjitdriver.can_enter_jit(n=n)
                 myjitdriver.jit_merge_point(n=n)
@@ -579,6 +581,55 @@ class RecursiveTests:
         self.check_resops(call=0, call_assembler_i=2)
         self.check_jitcell_token_count(2)
 
+    def test_inline_max_size(self):
+        def p(pc, code):
+            code = hlstr(code)
+            return "%s %d %s" % (code, pc, code[pc])
+        def get_code_size(pc, code):
+            return len(hlstr(code))
+        myjitdriver = JitDriver(greens=['pc', 'code'], reds=['n'],
+                                get_printable_location=p,
+                                get_code_size=get_code_size,
+                                is_recursive=True)
+
+        def f(code, n):
+            pc = 0
+            while pc < len(code):
+
+                myjitdriver.jit_merge_point(n=n, code=code, pc=pc)
+                op = code[pc]
+                if op == "-":
+                    n -= 1
+                elif op == "c":
+                    f('--------------------', n)
+                elif op == "l":
+                    if n > 0:
+                        myjitdriver.can_enter_jit(n=n, code=code, pc=0)
+                        pc = 0
+                        continue
+                else:
+                    assert 0
+                pc += 1
+            return n
+        def g(m, max_size):
+            set_param(None, 'inlining', True)
+            set_param(None, 'inline_max_size', max_size)
+            if m > 1000000:
+                f('', 0)
+            result = 0
+            for i in range(m):
+                result += f('-c-----------l-', i+100)
+        # the inner function is bigger than inline_max_size: it is
+        # compiled from its start and called, without any abort
+        self.meta_interp(g, [10, 16], backendopt=True)
+        self.check_aborted_count(0)
+        self.check_resops(call=0, call_assembler_i=2)
+        self.check_jitcell_token_count(2)
+        self.meta_interp(g, [10, 20], backendopt=True)
+        self.check_aborted_count(0)
+        self.check_resops(call_assembler_i=0)
+        self.check_jitcell_token_count(1)
+
     def test_directly_call_assembler(self):
         driver = JitDriver(greens = ['codeno'], reds = ['i'],
                            get_printable_location = lambda codeno : str(codeno))
@@ -10,7 +10,7 @@ from rpython.jit.metainterp.resume import ResumeDataVirtualAdder,\
      VArrayInfoNotClear, VStrPlainInfo, VStrConcatInfo, VStrSliceInfo,\
      VUniPlainInfo, VUniConcatInfo, VUniSliceInfo,\
      capture_resumedata, ResumeDataLoopMemo, UNASSIGNEDVIRTUAL, INT,\
-     annlowlevel, PENDINGFIELDSP, TAG_CONST_OFFSET
+     annlowlevel, PENDINGFIELDSP, TAG_CONST_OFFSET, NumberingState
 from rpython.jit.metainterp.resumecode import unpack_numbering,\
      create_numbering, NULL_NUMBER
 from rpython.jit.metainterp.opencoder import Trace, Snapshot, TopSnapshot
@@ -815,6 +815,21 @@ def test_ResumeDataLoopMemo_other():
     assert tagbits == TAGCONST
     assert memo.consts[index - TAG_CONST_OFFSET] is const
 
+def test_ResumeDataLoopMemo_create_numbering():
+    memo = ResumeDataLoopMemo(FakeMetaInterpStaticData())
+    numbs = []
+    for items in [[3, tag(0, TAGBOX), tag(1, TAGINT)],
+                  [3, tag(0, TAGBOX), tag(2, TAGINT)],
+                  [3, tag(0, TAGBOX), tag(1, TAGINT)]]:
+        numb_state = NumberingState(len(items))
+        for item in items:
+            numb_state.append_int(item)
+        numbs.append(memo.create_numbering(numb_state))
+    assert unpack_numbering(numbs[0]) == [3, tag(0, TAGBOX), tag(1, TAGINT)]
+    assert numbs[0] != numbs[1]
+    assert numbs[0] == numbs[2]
+    assert memo.nnumbreused == 1
+
 class Frame(object):
     def __init__(self, boxes):
         self.boxes = boxes
@@ -1,5 +1,5 @@
 from rpython.jit.metainterp.resumecode import create_numbering,\
-    unpack_numbering, Reader, Writer
+    unpack_numbering, Reader, Writer, DELTA_TAG
 from rpython.rtyper.lltypesystem import lltype
 
 from hypothesis import strategies, given, example
@@ -8,7 +8,9 @@ examples = [
     [1, 2, 3, 4, 257, 10000, 13, 15],
     [1, 2, 3, 4],
     range(1, 10, 2),
-    [13000, 12000, 10000, 256, 255, 254, 257, -3, -1000]
+    [13000, 12000, 10000, 256, 255, 254, 257, -3, -1000],
+    [-2**15, 2**15-1, -2**15+2, 2**15-2, 2, -2, 6, 32766],
+    [i * 4 + DELTA_TAG for i in range(100)] + [6, 1, 398, 5, 2],
 ]
 
 def hypothesis_and_examples(func):
@@ -27,6 +29,13 @@ def test_compressing(l):
     n = create_numbering(l)
     assert len(n.code) <= len(l) * 3
 
+def test_compressing_boxes():
+    # the boxes are numbered in order, and each one fits in a single byte
+    l = [i * 4 + DELTA_TAG for i in range(1000)]
+    n = create_numbering(l)
+    assert len(n.code) == len(l)
+    assert unpack_numbering(n) == l
+
 @hypothesis_and_examples
 def test_reader(l):
     n = create_numbering(l)
@@ -36,6 +45,20 @@ def test_reader(l):
         item = r.next_item()
         assert elt == item
 
+@hypothesis_and_examples
+def test_reader_jump_peek(l):
+    n = create_numbering(l)
+    r = Reader(n)
+    i = 0
+    while i < len(l):
+        assert r.peek() == l[i]
+        if i % 3 == 1:
+            r.jump(min(2, len(l) - i))
+            i += 2
+        else:
+            assert r.next_item() == l[i]
+            i += 1
+
 @hypothesis_and_examples
 def test_writer(l):
     for size in [len(l), 0]:
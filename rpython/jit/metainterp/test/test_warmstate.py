@@ -121,6 +121,7 @@ def test_make_jitdriver_callbacks_1():
         _get_unique_id_ptr = None
         _can_never_inline_ptr = None
         _should_unroll_one_iteration_ptr = None
+        _get_code_size_ptr = None
         red_args_types = []
     class FakeCell:
         dont_trace_here = False
@@ -152,6 +153,7 @@ def test_make_jitdriver_callbacks_3():
         _can_never_inline_ptr = None
         _get_unique_id_ptr = None
         _should_unroll_one_iteration_ptr = None
+        _get_code_size_ptr = None
         red_args_types = []
     state = WarmEnterState(FakeWarmRunnerDesc(), FakeJitDriverSD())
     state.make_jitdriver_callbacks()
@@ -179,6 +181,7 @@ def test_make_jitdriver_callbacks_4():
         _can_never_inline_ptr = None
         _get_unique_id_ptr = None
         _should_unroll_one_iteration_ptr = None
+        _get_code_size_ptr = None
         red_args_types = []
 
     state = WarmEnterState(FakeWarmRunnerDesc(), FakeJitDriverSD())
@@ -206,6 +209,7 @@ def test_make_jitdriver_callbacks_5():
         _get_unique_id_ptr = None
         _can_never_inline_ptr = llhelper(CAN_NEVER_INLINE, can_never_inline)
         _should_unroll_one_iteration_ptr = None
+        _get_code_size_ptr = None
         red_args_types = []
 
     state = WarmEnterState(FakeWarmRunnerDesc(), FakeJitDriverSD())
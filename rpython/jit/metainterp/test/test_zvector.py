@@ -691,6 +691,62 @@ class VectorizeTests(object):
         res = self.meta_interp(f, [22], vec=True, vec_all=True)
         assert res == f(22)
 
+    @py.test.mark.parametrize('type,value', [(int, 5), (float, 2.5)])
+    def test_list_find(self, type, value):
+        myjitdriver = JitDriver(greens = [], reds = 'auto', vectorize=True)
+        def f(size, value):
+            l = [type(0)] * size
+            l[size - 3] = value
+            i = 0
+            while i < len(l):
+                myjitdriver.jit_merge_point()
+                if l[i] == value:
+                    return i
+                i += 1
+            return -1
+        res = self.meta_interp(f, [60, value], vec=True)
+        assert res == f(60, value) == 57
+        if type is int:
+            self.check_resops(vec_int_eq=1)
+        else:
+            self.check_resops(vec_float_eq=1)
+
+    @py.test.mark.parametrize('type', [int, float])
+    def test_list_first_difference(self, type):
+        myjitdriver = JitDriver(greens = [], reds = 'auto', vectorize=True)
+        def f(size, at):
+            l1 = [type(1)] * size
+            l2 = [type(1)] * size
+            l2[at] = type(2)
+            i = 0
+            while i < size:
+                myjitdriver.jit_merge_point()
+                if l1[i] != l2[i]:
+                    break
+                i += 1
+            return i
+        res = self.meta_interp(f, [60, 41], vec=True)
+        assert res == f(60, 41) == 41
+        if type is int:
+            self.check_resops(vec_int_ne=1)
+        else:
+            self.check_resops(vec_float_ne=1)
+
+    def test_list_map(self):
+        myjitdriver = JitDriver(greens = [], reds = 'auto', vectorize=True)
+        def f(size):
+            l = [float(i) for i in range(size)]
+            result = [0.0] * size
+            i = 0
+            while i < size:
+                myjitdriver.jit_merge_point()
+                result[i] = l[i] * 2.5
+                i += 1
+            return result[size - 1]
+        res = self.meta_interp(f, [60], vec=True)
+        assert res == f(60) == 59 * 2.5
+        self.check_resops(vec_store=1)
+
     def run_unpack(self, unpack, vector_type, assignments, float=True):
         vars = {'v':0,'f':0,'i':0}
         def newvar(type):
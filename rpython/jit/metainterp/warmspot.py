@@ -21,6 +21,7 @@ from rpython.translator.unsimplify import call_final_function
 from rpython.jit.metainterp import history, pyjitpl, gc, memmgr, jitexc
 from rpython.jit.metainterp.pyjitpl import MetaInterpStaticData
 from rpython.jit.metainterp.jitprof import Profiler, EmptyProfiler
+from rpython.jit.metainterp.jitprof import LoopProfile
 from rpython.jit.metainterp.jitdriver import JitDriverStaticData
 from rpython.jit.codewriter import support, codewriter
 from rpython.jit.codewriter.policy import JitPolicy
@@ -209,6 +210,7 @@ def reset_jit():
     """Helper for some tests (see micronumpy/test/test_zjit.py)"""
     reset_stats()
     pyjitpl._warmrunnerdesc.memory_manager.alive_loops.clear()
+    pyjitpl._warmrunnerdesc.memory_manager.memory_used = 0
     pyjitpl._warmrunnerdesc.jitcounter._clear_all()
 
 def get_translator():
@@ -236,7 +238,8 @@ class WarmRunnerDesc(object):
                  ProfilerClass=EmptyProfiler, **kwds):
         pyjitpl._warmrunnerdesc = self   # this is a global for debugging only!
         self.set_translator(translator)
-        self.memory_manager = memmgr.MemoryManager()
+        self.loop_profile = LoopProfile()
+        self.memory_manager = memmgr.MemoryManager(self.loop_profile)
         self.build_cpu(CPUClass, **kwds)
         self.inline_inlineable_portals()
         self.find_portals()
@@ -270,6 +273,7 @@ class WarmRunnerDesc(object):
         #
         self.make_hooks(policy.jithookiface)
         self.make_virtualizable_infos()
+        self.make_segment_end_helper()
         self.make_driverhook_graphs()
         self.make_enter_functions()
         self.rewrite_jit_merge_points(policy)
@@ -544,6 +548,20 @@ class WarmRunnerDesc(object):
                 vinfos[VTYPEPTR] = VirtualizableInfo(self, VTYPEPTR)
             jd.virtualizable_info = vinfos[VTYPEPTR]
 
+    def make_segment_end_helper(self):
+        # a function that returns 0: a GUARD_TRUE on the result of calling
+        # it always fails.  Used to end the traces compiled in segments.
+        def segment_end():
+            return 0
+        FUNCPTR = lltype.Ptr(lltype.FuncType([], lltype.Signed))
+        FUNC = FUNCPTR.TO
+        ei = EffectInfo([], [], [], [], [], [], EffectInfo.EF_CANNOT_RAISE,
+                        can_invalidate=False)
+        self.metainterp_sd.segment_end_ptr = self.helper_func(FUNCPTR,
+                                                              segment_end)
+        self.metainterp_sd.segment_end_descr = self.cpu.calldescrof(
+            FUNC, FUNC.ARGS, FUNC.RESULT, ei)
+
     def make_enter_functions(self):
         for jd in self.jitdrivers_sd:
             self.make_enter_function(jd)
@@ -601,6 +619,8 @@ class WarmRunnerDesc(object):
             jd._should_unroll_one_iteration_ptr = self._make_hook_graph(jd,
                 annhelper, jd.jitdriver.should_unroll_one_iteration,
                 annmodel.s_Bool)
+            jd._get_code_size_ptr = self._make_hook_graph(jd,
+                annhelper, jd.jitdriver.get_code_size, annmodel.SomeInteger())
             #
             items = []
             types = ()
@@ -691,7 +711,9 @@ class WarmRunnerDesc(object):
                 jitdrivers_by_name[name] = jd
         m = _find_jit_markers(self.translator.graphs,
                               ('get_jitcell_at_key', 'trace_next_iteration',
-                               'dont_trace_here', 'trace_next_iteration_hash'))
+                               'dont_trace_here', 'trace_next_iteration_hash',
+                               'warm_start_at_key', 'get_counter_at_key',
+                               'set_counter_at_key'))
         accessors = {}
 
         def get_accessor(name, jitdriver_name, function, ARGS, green_arg_spec):
@@ -703,10 +725,15 @@ class WarmRunnerDesc(object):
                  'lltype': lltype}
             arg_spec = ", ".join([("arg%d" % i) for i in range(len(ARGS))])
             arg_converters = []
+            if name == 'set_counter_at_key':
+                first = 1     # arg0 is the new counter value
+            else:
+                first = 0
             for i, spec in enumerate(green_arg_spec):
                 if isinstance(spec, lltype.Ptr):
-                    arg_converters.append("arg%d = lltype.cast_opaque_ptr(type%d, arg%d)" % (i, i, i))
-                    d['type%d' % i] = spec
+                    j = i + first
+                    arg_converters.append("arg%d = lltype.cast_opaque_ptr(type%d, arg%d)" % (j, j, j))
+                    d['type%d' % j] = spec
             convert = ";".join(arg_converters)
             if name == 'get_jitcell_at_key':
                 exec py.code.Source("""
@@ -715,6 +742,13 @@ class WarmRunnerDesc(object):
                     return cast_instance_to_gcref(function(%s))
                 """ % (arg_spec, convert, arg_spec)).compile() in d
                 FUNC = lltype.Ptr(lltype.FuncType(ARGS, llmemory.GCREF))
+            elif name == 'get_counter_at_key':
+                exec py.code.Source("""
+                def accessor(%s):
+                    %s
+                    return function(%s)
+                """ % (arg_spec, convert, arg_spec)).compile() in d
+                FUNC = lltype.Ptr(lltype.FuncType(ARGS, lltype.Float))
             elif name == "trace_next_iteration_hash":
                 exec py.code.Source("""
                 def accessor(arg0):
@@ -745,6 +779,12 @@ class WarmRunnerDesc(object):
                 func = JitCell.dont_trace_here
             elif op.args[0].value == 'trace_next_iteration_hash':
                 func = JitCell.trace_next_iteration_hash
+            elif op.args[0].value == 'warm_start_at_key':
+                func = JitCell.warm_start_at_key
+            elif op.args[0].value == 'get_counter_at_key':
+                func = JitCell.get_counter_at_key
+            elif op.args[0].value == 'set_counter_at_key':
+                func = JitCell.set_counter_at_key
             else:
                 func = JitCell._trace_next_iteration
             argspec = jitdrivers_by_name[jitdriver_name]._green_args_spec
@@ -138,6 +138,9 @@ JC_TRACING         = 0x01
 JC_DONT_TRACE_HERE = 0x02
 JC_TEMPORARY       = 0x04
 JC_TRACING_OCCURRED= 0x08
+JC_WARM_START      = 0x10
+JC_NOT_HOT_INLINED = 0x20
+JC_DONT_SEGMENT    = 0x40
 
 class BaseJitCell(object):
     """Subclasses of BaseJitCell are used in tandem with the single
@@ -184,6 +187,17 @@ class BaseJitCell(object):
         this particular function.  (We only set this flag when aborting
         due to a trace too long, so we use the same flag as a hint to
         also mean "please trace from here as soon as possible".)
+
+        JC_WARM_START: the greenkey was hot in a previous run of the
+        program, according to a profile loaded with warm_start_at_key().
+        We start tracing the first time we reach it, instead of waiting
+        for the JitCounter.  Unlike a JitCounter value, this flag does
+        not decay, so the profile can be loaded long before the code
+        runs.
+
+        JC_NOT_HOT_INLINED: a JC_DONT_TRACE_HERE function that was
+        inlined anyway because of 'inline_hot_size', but then got the
+        blame for a trace too long.  Don't inline it any more.
     """
     flags = 0     # JC_xxx flags
     wref_procedure_token = None
@@ -215,6 +229,10 @@ class BaseJitCell(object):
             return False    # don't remove JitCells with a procedure_token
         if self.flags & JC_TRACING:
             return False    # don't remove JitCells that are being traced
+        if self.flags & JC_WARM_START:
+            return False    # don't remove JitCells not reached yet
+        if self.flags & JC_DONT_SEGMENT:
+            return False    # don't forget that segmenting failed here
         if self.flags & JC_DONT_TRACE_HERE:
             # if we have this flag, and we *had* a procedure_token but
             # we no longer have one, then remove me.  this prevents this
@@ -259,12 +277,24 @@ class WarmEnterState(object):
     def set_param_trace_limit(self, value):
         self.trace_limit = value
 
+    def set_param_trace_segments(self, value):
+        self.trace_segments = bool(value)
+
     def set_param_decay(self, decay):
         self.warmrunnerdesc.jitcounter.set_decay(decay)
 
+    def set_param_compile_budget(self, budget):
+        self.warmrunnerdesc.jitcounter.set_compile_budget(budget)
+
     def set_param_inlining(self, value):
         self.inlining = value
 
+    def set_param_inline_max_size(self, value):
+        self.inline_max_size = value
+
+    def set_param_inline_hot_size(self, value):
+        self.inline_hot_size = value
+
     def set_param_disable_unrolling(self, value):
         self.disable_unrolling_threshold = value
 
@@ -289,6 +319,12 @@ class WarmEnterState(object):
             self.warmrunnerdesc.memory_manager is not None):   # all for tests
             self.warmrunnerdesc.memory_manager.set_max_age(value)
 
+    def set_param_loop_memory_limit(self, value):
+        # note: it's a global parameter, not a per-jitdriver one
+        if (self.warmrunnerdesc is not None and
+            self.warmrunnerdesc.memory_manager is not None):   # all for tests
+            self.warmrunnerdesc.memory_manager.set_memory_limit(value)
+
     def set_param_retrace_limit(self, value):
         if self.warmrunnerdesc:
             if self.warmrunnerdesc.memory_manager:
@@ -320,12 +356,27 @@ class WarmEnterState(object):
 
     def disable_noninlinable_function(self, greenkey):
         cell = self.JitCell.ensure_jit_cell_at_key(greenkey)
+        if cell.flags & JC_DONT_TRACE_HERE:
+            # it was only inlined because it is small and hot
+            cell.flags |= JC_NOT_HOT_INLINED
         cell.flags |= JC_DONT_TRACE_HERE
         debug_start("jit-disableinlining")
         loc = self.get_location_str(greenkey)
         debug_print("disabled inlining", loc)
         debug_stop("jit-disableinlining")
 
+    def disable_trace_segments(self, greenkey):
+        cell = self.JitCell.ensure_jit_cell_at_key(greenkey)
+        cell.flags |= JC_DONT_SEGMENT
+        debug_start("jit-disablesegments")
+        loc = self.get_location_str(greenkey)
+        debug_print("disabled trace segments", loc)
+        debug_stop("jit-disablesegments")
+
+    def trace_segments_disabled(self, greenkey):
+        cell = self.JitCell.get_jit_cell_at_key(greenkey)
+        return cell is not None and bool(cell.flags & JC_DONT_SEGMENT)
+
     def attach_procedure_to_interp(self, greenkey, procedure_token):
         cell = self.JitCell.ensure_jit_cell_at_key(greenkey)
         old_token = cell.get_procedure_token()
@@ -390,6 +441,8 @@ class WarmEnterState(object):
             # Record in the memmgr that we just ran this loop,
             # so that it will keep it alive for a longer time
             warmrunnerdesc.memory_manager.keep_loop_alive(loop_token)
+            if warmrunnerdesc.loop_profile.enabled:
+                warmrunnerdesc.loop_profile.loop_entered(loop_token)
             #
             # Handle the failure
             fail_descr = cpu.get_latest_descr(deadframe)
@@ -418,6 +471,11 @@ class WarmEnterState(object):
             jitcounter.decay_all_counters()
             if rstack.stack_almost_full():
                 return
+            # only spend the budget if we really start tracing
+            if not jitcounter.consume_compile_budget():
+                # too many traces started recently: try again later
+                jitcounter.change_current_fraction(hash, 0.98)
+                return
             # start tracing
             from rpython.jit.metainterp.pyjitpl import MetaInterp
             metainterp = MetaInterp(metainterp_sd, jitdriver_sd)
@@ -426,6 +484,7 @@ class WarmEnterState(object):
                 cell = JitCell(*greenargs)
                 jitcounter.install_new_cell(hash, cell)
             cell.flags |= JC_TRACING | JC_TRACING_OCCURRED
+            cell.flags &= ~JC_WARM_START    # only start tracing early once
             try:
                 metainterp.compile_and_run_once(jitdriver_sd, *args)
             finally:
@@ -468,6 +527,11 @@ class WarmEnterState(object):
             # machine code was already compiled for these greenargs
             procedure_token = cell.get_procedure_token()
             if procedure_token is None:
+                if cell.flags & JC_WARM_START:
+                    # hot in a previous run: start tracing immediately.
+                    # bound_reached() clears the flag if tracing starts
+                    bound_reached(hash, cell, *args)
+                    return
                 if cell.flags & JC_DONT_TRACE_HERE:
                     if not cell.has_seen_a_procedure_token():
                         # A JC_DONT_TRACE_HERE, i.e. a non-inlinable function.
@@ -480,6 +544,12 @@ class WarmEnterState(object):
                         if tick:
                             bound_reached(hash, cell, *args)
                         return
+                if cell.flags & JC_DONT_SEGMENT:
+                    # tracing gave up on segmenting the trace: count
+                    # normally, the next attempt will not segment it
+                    if jitcounter.tick(hash, increment_threshold):
+                        bound_reached(hash, cell, *args)
+                    return
                 # it was an aborted compilation, or maybe a weakref that
                 # has been freed
                 jitcounter.cleanup_chain(hash)
@@ -630,6 +700,22 @@ class WarmEnterState(object):
             def dont_trace_here(*greenargs):
                 cell = JitCell._ensure_jit_cell_at_key(*greenargs)
                 cell.flags |= JC_DONT_TRACE_HERE
+
+            @staticmethod
+            def warm_start_at_key(*greenargs):
+                cell = JitCell._ensure_jit_cell_at_key(*greenargs)
+                if not cell.has_seen_a_procedure_token():
+                    cell.flags |= JC_WARM_START
+
+            @staticmethod
+            def get_counter_at_key(*greenargs):
+                hash = JitCell.get_uhash(*greenargs)
+                return jitcounter.lookup_fraction(hash)
+
+            @staticmethod
+            def set_counter_at_key(fraction, *greenargs):
+                hash = JitCell.get_uhash(*greenargs)
+                jitcounter.change_current_fraction(hash, fraction)
         #
         self.JitCell = JitCell
         return JitCell
@@ -647,16 +733,36 @@ class WarmEnterState(object):
         cpu = self.cpu
         rtyper = self.warmrunnerdesc.rtyper
 
+        get_code_size_ptr = jd._get_code_size_ptr
+        def get_code_size(*greenargs):
+            if get_code_size_ptr is None:
+                return -1
+            fn = support.maybe_on_top_of_llinterp(rtyper, get_code_size_ptr)
+            return fn(*greenargs)
+
         def can_inline_callable(greenkey):
             greenargs = unwrap_greenkey(greenkey)
             if can_never_inline(*greenargs):
                 return False
+            size = get_code_size(*greenargs)
+            if 0 < self.inline_max_size < size:
+                return False    # too big, see too_big_to_inline()
             cell = JitCell.get_jitcell(*greenargs)
             if cell is not None and (cell.flags & JC_DONT_TRACE_HERE) != 0:
-                return False
+                # a small function that is hot enough to have been compiled
+                # from its start is inlined anyway, unless doing so already
+                # made a trace too long
+                return (0 <= size <= self.inline_hot_size and
+                        cell.flags & JC_NOT_HOT_INLINED == 0 and
+                        cell.get_procedure_token() is not None)
             return True
         self.can_inline_callable = can_inline_callable
 
+        def too_big_to_inline(greenkey):
+            greenargs = unwrap_greenkey(greenkey)
+            return 0 < self.inline_max_size < get_code_size(*greenargs)
+        self.too_big_to_inline = too_big_to_inline
+
         def dont_trace_here(greenkey):
             # Set greenkey as somewhere that tracing should not occur into;
             # notice that, as per the description of JC_DONT_TRACE_HERE earlier,
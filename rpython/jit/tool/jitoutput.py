@@ -24,9 +24,11 @@ REGEXES = [
     (('abort.vable_escape',), '^abort: vable escape:\s+(\d+)$'),
     (('abort.bad_loop',), '^abort: bad loop:\s+(\d+)$'),
     (('abort.force_quasiimmut',), '^abort: force quasi-immut:\s+(\d+)$'),
+    (('trace_segments',), '^trace segments:\s+(\d+)$'),
     (('nvirtuals',), '^nvirtuals:\s+(\d+)$'),
     (('nvholes',), '^nvholes:\s+(\d+)$'),
     (('nvreused',), '^nvreused:\s+(\d+)$'),
+    (('nnumbreused',), '^nnumbreused:\s+(\d+)$'),
     (('vecopt_tried',), '^vecopt tried:\s+(\d+)$'),
     (('vecopt_success',), '^vecopt success:\s+(\d+)$'),
     (('total_compiled_loops',),   '^Total # of loops:\s+(\d+)$'),
@@ -57,9 +59,11 @@ class OutputInfo(object):
     opt_ops = 0
     opt_guards = 0
     forcings = 0
+    trace_segments = 0
     nvirtuals = 0
     nvholes = 0
     nvreused = 0
+    nnumbreused = 0
     vecopt_tried = 0
     vecopt_success = 0
 
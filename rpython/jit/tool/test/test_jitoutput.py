@@ -59,9 +59,11 @@ abort: compiling:       11
 abort: vable escape:    12
 abort: bad loop:        135
 abort: force quasi-immut: 3
+trace segments:         7
 nvirtuals:              13
 nvholes:                14
 nvreused:               15
+nnumbreused:            16
 vecopt tried:           12
 vecopt success:         4
 Total # of loops:       100
@@ -88,8 +90,10 @@ def test_parse():
     assert info.abort.vable_escape == 12
     assert info.abort.bad_loop == 135
     assert info.abort.force_quasiimmut == 3
+    assert info.trace_segments == 7
     assert info.nvirtuals == 13
     assert info.nvholes == 14
     assert info.nvreused == 15
+    assert info.nnumbreused == 16
     assert info.vecopt_tried == 12
     assert info.vecopt_success == 4
@@ -403,6 +403,12 @@ class GCBase(object):
         ll_assert(bool(destructor), "no destructor found")
         destructor(obj)
 
+    def wait_for_concurrent_sweep(self):
+        """Called before walking the heap and changing the flags of the
+        objects, e.g. GCFLAG_EXTRA.  Only needed by the GCs that sweep
+        in another thread."""
+        pass
+
     def debug_check_consistency(self):
         """To use after a collection.  If self.DEBUG is set, this
         enumerates all roots and traces all objects to check if we didn't
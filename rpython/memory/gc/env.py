@@ -11,7 +11,8 @@ from rpython.rtyper.lltypesystem.lloperation import llop
 # ____________________________________________________________
 # Reading env vars.  Supports returning ints, uints or floats,
 # and in the first two cases accepts the suffixes B, KB, MB and GB
-# (lower case or upper case).
+# (lower case or upper case).  Durations accept the suffixes s, ms
+# and us.
 
 def _read_float_and_factor_from_env(varname):
     value = os.environ.get(varname)
@@ -48,6 +49,32 @@ def read_float_from_env(varname):
         return 0.0
     return value
 
+def read_duration_from_env(varname):
+    """Returns a number of seconds, or 0.0."""
+    value = os.environ.get(varname)
+    if value:
+        value = value.lower()
+        end = len(value)
+        factor = 1.0
+        if value.endswith('ms'):
+            end -= 2
+            factor = 0.001
+        elif value.endswith('us'):
+            end -= 2
+            factor = 0.000001
+        elif value.endswith('s'):
+            end -= 1
+        assert end >= 0
+        realvalue = value[:end]
+        try:
+            result = float(realvalue) * factor
+        except ValueError:
+            pass
+        else:
+            if result > 0.0:
+                return result
+    return 0.0
+
 
 # ____________________________________________________________
 # Get the total amount of RAM installed in a system.
@@ -125,6 +152,44 @@ else:
     def get_total_memory():
         return addressable_size       # XXX implement me for other platforms
 
+# ____________________________________________________________
+# Get the resident set size of the process, to compare it with the
+# memory that the GC thinks it uses.  Returns -1 if unknown.
+
+def get_rss_linux(label, filename='/proc/self/status'):
+    try:
+        fd = os.open(filename, os.O_RDONLY, 0644)
+        try:
+            buf = os.read(fd, 8192)
+        finally:
+            os.close(fd)
+    except OSError:
+        return -1
+    pos = buf.find('\n' + label)
+    if pos < 0:
+        return -1
+    start = _skipspace(buf, pos + 1 + len(label))
+    stop = start
+    while stop < len(buf) and buf[stop].isdigit():
+        stop += 1
+    if start == stop:
+        return -1
+    return int(buf[start:stop]) * 1024   # in kB
+
+if sys.platform.startswith('linux'):
+    def get_rss():
+        return get_rss_linux('VmRSS:')
+
+    def get_peak_rss():
+        return get_rss_linux('VmHWM:')
+
+else:
+    def get_rss():
+        return -1                     # XXX implement me for other platforms
+
+    def get_peak_rss():
+        return -1
+
 
 # ____________________________________________________________
 # Estimation of the nursery size, based on the L2 cache.
@@ -21,12 +21,18 @@ class GcHooks(object):
     def is_gc_collect_enabled(self):
         return False
 
-    def on_gc_minor(self, duration, total_memory_used, pinned_objects):
+    def on_gc_minor(self, duration, total_memory_used, pinned_objects,
+                    nursery_size, surviving_size):
         """
         Called after a minor collection
+
+        ``nursery_size`` is the size of the nursery for the next minor
+        collection, and ``surviving_size`` the total size of the young
+        objects that this one copied out of the nursery.
         """
 
-    def on_gc_collect_step(self, duration, oldstate, newstate):
+    def on_gc_collect_step(self, duration, oldstate, newstate,
+                           increment_step, sweep_step, nursery_size):
         """
         Called after each individual step of a major collection, in case the GC is
         incremental.
@@ -34,6 +40,10 @@ class GcHooks(object):
         ``oldstate`` and ``newstate`` are integers which indicate the GC
         state; for incminimark, see incminimark.STATE_* and
         incminimark.GC_STATES.
+
+        ``increment_step``, ``sweep_step`` and ``nursery_size`` are the
+        sizes in bytes that the GC uses for the next steps; they only change
+        if the GC adjusts them to a pause target (PYPY_GC_MAX_PAUSE).
         """
 
 
@@ -49,14 +59,18 @@ class GcHooks(object):
     # overridden
 
     @rgc.no_collect
-    def fire_gc_minor(self, duration, total_memory_used, pinned_objects):
+    def fire_gc_minor(self, duration, total_memory_used, pinned_objects,
+                      nursery_size, surviving_size):
         if self.is_gc_minor_enabled():
-            self.on_gc_minor(duration, total_memory_used, pinned_objects)
+            self.on_gc_minor(duration, total_memory_used, pinned_objects,
+                             nursery_size, surviving_size)
 
     @rgc.no_collect
-    def fire_gc_collect_step(self, duration, oldstate, newstate):
+    def fire_gc_collect_step(self, duration, oldstate, newstate,
+                             increment_step, sweep_step, nursery_size):
         if self.is_gc_collect_step_enabled():
-            self.on_gc_collect_step(duration, oldstate, newstate)
+            self.on_gc_collect_step(duration, oldstate, newstate,
+                                    increment_step, sweep_step, nursery_size)
 
     @rgc.no_collect
     def fire_gc_collect(self, num_major_collects,
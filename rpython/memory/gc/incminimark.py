@@ -6,6 +6,11 @@ Environment variables can be used to fine-tune the following parameters:
                          '4M'.  Small values
                          (like 1 or 1KB) are useful for debugging.
 
+ PYPY_GC_NURSERY_MAX     If larger than the nursery size, the nursery grows
+                         up to this size while many young objects survive
+                         the minor collections, and shrinks back when they
+                         don't.  Defaults to the nursery size (fixed).
+
  PYPY_GC_NURSERY_DEBUG   If set to non-zero, will fill nursery with garbage,
                          to help debugging.
 
@@ -52,6 +57,34 @@ Environment variables can be used to fine-tune the following parameters:
                          in time.  Defaults to a conservative value depending
                          on nursery size and maximum object size inside the
                          nursery.  Useful for debugging by setting it to 0.
+
+ PYPY_GC_MARK_THREADS    The number of threads that do the marking steps of
+                         a major collection, including the thread that runs
+                         the GC.  Defaults to 1, which marks without helper
+                         threads.  The program is still stopped during each
+                         step, but a step marks up to N times more memory
+                         in the same time; see parallelmark.py.
+
+ PYPY_GC_SWEEP_THREAD    If set to non-zero, the sweeping phase of a major
+                         collection runs in a helper thread while the
+                         program continues, instead of in steps in the
+                         thread that allocates; see sweeper.py.
+
+ PYPY_GC_MAX_PAUSE       The target for the longest pause of the program,
+                         like '2ms' or '500us'.  If set, the GC measures
+                         each of its steps and adjusts the size of the
+                         steps of major collections and the size of the
+                         nursery to stay below this target.  Overrides the
+                         step given by PYPY_GC_INCREMENT_STEP; the nursery
+                         only shrinks below PYPY_GC_NURSERY.
+
+ PYPY_GC_ARENA_SLACK     The amount of memory in empty arenas to keep for
+                         reuse after a major collection, like '8MB'.  If
+                         set, the other empty arenas are given back to the
+                         OS at once (MADV_DONTNEED), which lowers the RSS.
+                         By default, they are all freed but the OS only
+                         reclaims their memory lazily (MADV_FREE), when it
+                         runs low on memory.
 """
 # XXX Should find a way to bound the major collection threshold by the
 # XXX total addressable size.  Maybe by keeping some minimarkpage arenas
@@ -72,9 +105,12 @@ from rpython.memory.support import mangle_hash
 from rpython.rlib.rarithmetic import ovfcheck, LONG_BIT, intmask, r_uint
 from rpython.rlib.rarithmetic import LONG_BIT_SHIFT
 from rpython.rlib.debug import ll_assert, debug_print, debug_start, debug_stop
-from rpython.rlib.objectmodel import specialize
+from rpython.rlib.objectmodel import specialize, we_are_translated
 from rpython.rlib import rgc
 from rpython.memory.gc.minimarkpage import out_of_memory
+from rpython.memory.gc import parallelmark, sweeper
+from rpython.memory.support import DEFAULT_CHUNK_SIZE
+from rpython.rtyper.annlowlevel import llhelper
 
 #
 # Handles the objects in 2 generations:
@@ -189,6 +225,15 @@ FORWARDSTUB = lltype.GcStruct('forwarding_stub',
                               ('forw', llmemory.Address))
 FORWARDSTUBPTR = lltype.Ptr(FORWARDSTUB)
 NURSARRAY = lltype.Array(llmemory.Address)
+NURSERY_HISTOGRAM = lltype.Array(lltype.Signed, hints={'nolength': True})
+
+# With PYPY_GC_NURSERY_MAX, the nursery grows when more than this fraction
+# of it survives the minor collections (on average), and shrinks when less
+# than this other fraction survives.  After growing did not make the minor
+# collections cheaper, wait this number of minor collections.
+NURSERY_GROW_ABOVE = 0.10
+NURSERY_SHRINK_BELOW = 0.02
+NURSERY_GROWTH_BACKOFF = 16
 
 # ____________________________________________________________
 
@@ -285,6 +330,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
                  card_page_indices=0,
                  large_object=8*WORD,
                  ArenaCollectionClass=None,
+                 mark_threads=1,
+                 concurrent_sweep=False,
+                 max_pause=0.0,
+                 nursery_max_size=0,
+                 arena_slack=-1,
                  **kwds):
         "NOT_RPYTHON"
         MovingGCBase.__init__(self, config, **kwds)
@@ -325,6 +375,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
             ArenaCollectionClass = minimarkpage.ArenaCollection
         self.ac = ArenaCollectionClass(arena_size, page_size,
                                        small_request_threshold)
+        self.ac.arena_slack = arena_slack
         #
         # Used by minor collection: a list of (mostly non-young) objects that
         # (may) contain a pointer to a young object.  Populated by
@@ -348,6 +399,35 @@ class IncrementalMiniMarkGC(MovingGCBase):
         #
         self._init_writebarrier_logic()
         #
+        # The stacks of gray objects used when marking with several threads
+        # (PYPY_GC_MARK_THREADS).
+        self.mark_threads = mark_threads
+        MarkWorkers = parallelmark.get_mark_workers(
+            kwds.get('chunk_size', DEFAULT_CHUNK_SIZE))
+        self.mark_workers = MarkWorkers()
+        self._init_parallel_marking()
+        #
+        # Sweeping in a helper thread (PYPY_GC_SWEEP_THREAD).
+        self.concurrent_sweep = concurrent_sweep
+        self.concurrent_sweep_running = False
+        self._init_concurrent_sweep()
+        #
+        # Pause-time target in seconds (PYPY_GC_MAX_PAUSE), or 0.0.
+        self.max_pause = max_pause
+        self.last_minor_duration = 0.0
+        #
+        # Adaptive nursery size (PYPY_GC_NURSERY_MAX), and the number of
+        # minor collections by fraction of the nursery that survived; see
+        # _record_nursery_survival().
+        self.max_nursery_size = nursery_max_size
+        self.adaptive_nursery = False
+        self.nursery_survival_rate = 0.0
+        self.nursery_cost_before_growth = 0.0
+        self.nursery_growth_backoff = 0
+        self.nursery_survival_histogram = lltype.malloc(
+            NURSERY_HISTOGRAM, rgc.NURSERY_SURVIVAL_BUCKETS, flavor='raw',
+            zero=True, immortal=True)
+        #
         # The size of all the objects turned from 'young' to 'old'
         # since we started the last major collection cycle.  This is
         # used to track progress of the incremental GC: normally, we
@@ -375,6 +455,10 @@ class IncrementalMiniMarkGC(MovingGCBase):
         self.old_rawmalloced_objects = self.AddressStack()
         self.raw_malloc_might_sweep = self.AddressStack()
         self.rawmalloced_total_size = r_uint(0)
+        #
+        # Old objects whose header may have been written at the same
+        # time as the sweeper thread cleared their GCFLAG_VISITED.
+        self.objects_written_while_sweeping = self.AddressStack()
         self.rawmalloced_peak_size = r_uint(0)
         self.total_gc_time = 0.0
 
@@ -500,10 +584,44 @@ class IncrementalMiniMarkGC(MovingGCBase):
                 self.gc_nursery_debug = True
             else:
                 self.gc_nursery_debug = False
+            #
+            mark_threads = env.read_uint_from_env('PYPY_GC_MARK_THREADS')
+            if mark_threads > parallelmark.MAX_MARK_WORKERS:
+                mark_threads = parallelmark.MAX_MARK_WORKERS
+            if mark_threads > 0:
+                self.mark_threads = intmask(mark_threads)
+            #
+            sweep_thread = env.read_uint_from_env('PYPY_GC_SWEEP_THREAD')
+            if sweep_thread > 0:
+                self.concurrent_sweep = True
+            #
+            max_pause = env.read_duration_from_env('PYPY_GC_MAX_PAUSE')
+            #
+            nursery_max_size = env.read_from_env('PYPY_GC_NURSERY_MAX')
+            if nursery_max_size > 0:
+                self.max_nursery_size = nursery_max_size
+            #
+            if os.environ.get('PYPY_GC_ARENA_SLACK'):
+                arena_slack = env.read_from_env('PYPY_GC_ARENA_SLACK')
+                self.ac.arena_slack = max(arena_slack, 0)
             self._minor_collection()    # to empty the nursery
             llarena.arena_free(self.nursery)
             self.nursery_size = newsize
             self.allocate_nursery()
+            if max_pause > 0.0:
+                self.max_pause = max_pause
+        #
+        # The size of memory processed by a sweeping step.  With
+        # PYPY_GC_MAX_PAUSE, it changes together with gc_increment_step
+        # and the nursery size, within these limits.
+        self.gc_sweep_step = 3 * self.nursery_size
+        self.base_nursery_size = self.nursery_size
+        self.min_nursery_size = 2 * (self.nonlarge_max + 1)
+        if self.max_nursery_size > self.nursery_size:
+            self.max_nursery_size &= ~(WORD-1)
+            self.adaptive_nursery = True
+        else:
+            self.max_nursery_size = self.nursery_size
         #
         env_max_number_of_pinned_objects = os.environ.get('PYPY_GC_MAX_PINNED')
         if env_max_number_of_pinned_objects:
@@ -1280,6 +1398,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
 
     def debug_check_consistency(self):
         if self.DEBUG:
+            # the checks below read the flags that the sweeper changes
+            self._concurrent_sweep_in_progress(wait=True)
             ll_assert(not self.young_rawmalloced_objects,
                       "young raw-malloced objects in a major collection")
             ll_assert(not self.young_objects_with_weakrefs.non_empty(),
@@ -1694,6 +1814,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
         #
         start = time.time()
         debug_start("gc-minor")
+        if self.nursery_free:
+            nursery_used = self.nursery_free - self.nursery
+        else:
+            # from collect_and_reserve(): the nursery is full
+            nursery_used = self.nursery_top - self.nursery
         #
         # All nursery barriers are invalid from this point on.  They
         # are evaluated anew as part of the minor collection.
@@ -1893,15 +2018,24 @@ class IncrementalMiniMarkGC(MovingGCBase):
         debug_stop("gc-minor")
         duration = time.time() - start
         self.total_gc_time += duration
+        surviving_size = self.nursery_surviving_size
+        if nursery_used > 0:
+            self._record_nursery_survival(nursery_used)
+        if self.max_pause > 0.0 or self.adaptive_nursery:
+            self._adjust_nursery_size(duration, nursery_used)
         self.hooks.fire_gc_minor(
             duration=duration,
             total_memory_used=total_memory_used,
-            pinned_objects=self.pinned_objects_in_nursery)
+            pinned_objects=self.pinned_objects_in_nursery,
+            nursery_size=self.nursery_size,
+            surviving_size=surviving_size)
 
     def _reset_flag_old_objects_pointing_to_pinned(self, obj, ignore):
         ll_assert(self.header(obj).tid & GCFLAG_PINNED_OBJECT_PARENT_KNOWN != 0,
                   "!GCFLAG_PINNED_OBJECT_PARENT_KNOWN, but requested to reset.")
         self.header(obj).tid &= ~GCFLAG_PINNED_OBJECT_PARENT_KNOWN
+        if self.concurrent_sweep_running:
+            self._record_header_write(obj)
 
     def _visit_old_objects_pointing_to_pinned(self, obj, ignore):
         self.trace(obj, self._trace_drag_out, obj)
@@ -1941,6 +2075,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
             ll_assert(self.header(obj).tid & GCFLAG_CARDS_SET != 0,
                 "!GCFLAG_CARDS_SET but object in 'old_objects_with_cards_set'")
             self.header(obj).tid &= ~GCFLAG_CARDS_SET
+            if self.concurrent_sweep_running:
+                self._record_header_write(obj)
             #
             # Get the number of card marker bytes in the header.
             typeid = self.get_type_id(obj)
@@ -2020,6 +2156,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
             # Add the flag GCFLAG_TRACK_YOUNG_PTRS.  All live objects should
             # have this flag set after a nursery collection.
             self.header(obj).tid |= GCFLAG_TRACK_YOUNG_PTRS
+            if self.concurrent_sweep_running:
+                self._record_header_write(obj)
             #
             # Trace the 'obj' to replace pointers to nursery with pointers
             # outside the nursery, possibly forcing nursery objects out
@@ -2116,6 +2254,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
                 self.old_objects_pointing_to_pinned.append(parent)
                 self.updated_old_objects_pointing_to_pinned = True
                 self.header(parent).tid |= GCFLAG_PINNED_OBJECT_PARENT_KNOWN
+                if self.concurrent_sweep_running:
+                    self._record_header_write(parent)
             #
             if hdr.tid & GCFLAG_VISITED:
                 return
@@ -2284,6 +2424,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
 
     def gc_step_until(self, state):
         while self.gc_state != state:
+            self._concurrent_sweep_in_progress(wait=True)
             self._minor_collection()
             self.major_collection_step()
 
@@ -2366,7 +2507,10 @@ class IncrementalMiniMarkGC(MovingGCBase):
             if estimate_from_nursery > estimate:
                 estimate = estimate_from_nursery
             estimate = intmask(estimate)
-            remaining = self.visit_all_objects_step(estimate)
+            if self.mark_threads > 1:
+                remaining = self.visit_all_objects_parallel_step(estimate)
+            else:
+                remaining = self.visit_all_objects_step(estimate)
             #
             if remaining >= estimate // 2:
                 if self.more_objects_to_trace.non_empty():
@@ -2378,7 +2522,10 @@ class IncrementalMiniMarkGC(MovingGCBase):
                     swap = self.objects_to_trace
                     self.objects_to_trace = self.more_objects_to_trace
                     self.more_objects_to_trace = swap
-                    self.visit_all_objects()
+                    if self.mark_threads > 1:
+                        self.visit_all_objects_parallel_step(sys.maxint)
+                    else:
+                        self.visit_all_objects()
 
             # XXX A simplifying assumption that should be checked,
             # finalizers/weak references are rare and short which means that
@@ -2441,16 +2588,24 @@ class IncrementalMiniMarkGC(MovingGCBase):
                 self.stat_ac_arenas_count = self.ac.arenas_count
                 self.stat_rawmalloced_total_size = self.rawmalloced_total_size
                 self.gc_state = STATE_SWEEPING
+                if self.concurrent_sweep:
+                    self.start_concurrent_sweep()
             #END MARKING
         elif self.gc_state == STATE_SWEEPING:
             #
-            if self.raw_malloc_might_sweep.non_empty():
+            if self._concurrent_sweep_in_progress():
+                # Nothing to do in this thread.  When the sweeper thread
+                # is done, the next step gives its pages back to malloc(),
+                # and then the code below finds nothing left to sweep.
+                debug_print("the sweeper thread is still running")
+                done = False
+            elif self.raw_malloc_might_sweep.non_empty():
                 # Walk all rawmalloced objects and free the ones that don't
                 # have the GCFLAG_VISITED flag.  Visit at most 'limit' objects.
                 # This limit is conservatively high enough to guarantee that
-                # a total object size of at least '3 * nursery_size' bytes
+                # a total object size of at least 'gc_sweep_step' bytes
                 # is processed.
-                limit = 3 * self.nursery_size // self.small_request_threshold
+                limit = self.gc_sweep_step // self.small_request_threshold
                 nobjects = self.free_unvisited_rawmalloc_objects_step(limit)
                 debug_print("freeing raw objects:", limit-nobjects,
                             "freed, limit was", limit)
@@ -2458,9 +2613,9 @@ class IncrementalMiniMarkGC(MovingGCBase):
             else:
                 # Ask the ArenaCollection to visit a fraction of the objects.
                 # Free the ones that have not been visited above, and reset
-                # GCFLAG_VISITED on the others.  Visit at most '3 *
-                # nursery_size' bytes.
-                limit = 3 * self.nursery_size // self.ac.page_size
+                # GCFLAG_VISITED on the others.  Visit at most
+                # 'gc_sweep_step' bytes.
+                limit = self.gc_sweep_step // self.ac.page_size
                 done = self.ac.mass_free_incremental(self._free_if_unvisited,
                                                      limit)
                 status = done and "No more pages left." or "More to do."
@@ -2468,6 +2623,9 @@ class IncrementalMiniMarkGC(MovingGCBase):
             # XXX tweak the limits above
             #
             if done:
+                if self.concurrent_sweep:
+                    debug_print("the sweeper thread took",
+                                self.sweeper_duration, "seconds")
                 self.num_major_collects += 1
                 #
                 # We also need to reset the GCFLAG_VISITED on prebuilt GC objects.
@@ -2493,6 +2651,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
                             self.ac.arenas_count)
                 debug_print("bytes used in arenas: ",
                             self.ac.total_memory_used)
+                debug_print("spare arenas:         ",
+                            self.ac.spare_arenas_count)
                 debug_print("bytes raw-malloced:   ",
                             self.stat_rawmalloced_total_size, " => ",
                             self.rawmalloced_total_size)
@@ -2546,10 +2706,17 @@ class IncrementalMiniMarkGC(MovingGCBase):
         debug_stop("gc-collect-step")
         duration = time.time() - start
         self.total_gc_time += duration
+        if self.max_pause > 0.0 and oldstate == self.gc_state:
+            # only the steps that stay in the same state do an amount
+            # of work that depends on the step size
+            self._adjust_steps_to_max_pause(oldstate, duration)
         self.hooks.fire_gc_collect_step(
             duration=duration,
             oldstate=oldstate,
-            newstate=self.gc_state)
+            newstate=self.gc_state,
+            increment_step=intmask(self.gc_increment_step),
+            sweep_step=self.gc_sweep_step,
+            nursery_size=self.nursery_size)
 
     def _sweep_old_objects_pointing_to_pinned(self, obj, new_list):
         if self.header(obj).tid & GCFLAG_VISITED:
@@ -2559,7 +2726,10 @@ class IncrementalMiniMarkGC(MovingGCBase):
         size_gc_header = self.gcheaderbuilder.size_gc_header
         obj = hdr + size_gc_header
         if self.header(obj).tid & GCFLAG_VISITED:
-            self.header(obj).tid &= ~GCFLAG_VISITED
+            if self.concurrent_sweep_running:
+                self._clear_visited_atomically(hdr)
+            else:
+                self.header(obj).tid &= ~GCFLAG_VISITED
             return False     # survives
         return True      # dies
 
@@ -2571,28 +2741,33 @@ class IncrementalMiniMarkGC(MovingGCBase):
             self.header(obj).tid &= ~check_flag   # survives
             self.old_rawmalloced_objects.append(obj)
         else:
-            size_gc_header = self.gcheaderbuilder.size_gc_header
-            totalsize = size_gc_header + self.get_size(obj)
-            allocsize = raw_malloc_usage(totalsize)
-            arena = llarena.getfakearenaaddress(obj - size_gc_header)
-            #
-            # Must also include the card marker area, if any
-            if (self.card_page_indices > 0    # <- this is constant-folded
-                and self.header(obj).tid & GCFLAG_HAS_CARDS):
-                #
-                # Get the length and compute the number of extra bytes
-                typeid = self.get_type_id(obj)
-                ll_assert(self.has_gcptr_in_varsize(typeid),
-                          "GCFLAG_HAS_CARDS but not has_gcptr_in_varsize")
-                offset_to_length = self.varsize_offset_to_length(typeid)
-                length = (obj + offset_to_length).signed[0]
-                extra_words = self.card_marking_words_for_length(length)
-                arena -= extra_words * WORD
-                allocsize += extra_words * WORD
-            #
-            llarena.arena_free(arena)
+            allocsize = self._free_rawmalloced_object(obj)
             self.rawmalloced_total_size -= r_uint(allocsize)
 
+    def _free_rawmalloced_object(self, obj):
+        # Frees a dead raw-malloced object and returns its size.
+        size_gc_header = self.gcheaderbuilder.size_gc_header
+        totalsize = size_gc_header + self.get_size(obj)
+        allocsize = raw_malloc_usage(totalsize)
+        arena = llarena.getfakearenaaddress(obj - size_gc_header)
+        #
+        # Must also include the card marker area, if any
+        if (self.card_page_indices > 0    # <- this is constant-folded
+            and self.header(obj).tid & GCFLAG_HAS_CARDS):
+            #
+            # Get the length and compute the number of extra bytes
+            typeid = self.get_type_id(obj)
+            ll_assert(self.has_gcptr_in_varsize(typeid),
+                      "GCFLAG_HAS_CARDS but not has_gcptr_in_varsize")
+            offset_to_length = self.varsize_offset_to_length(typeid)
+            length = (obj + offset_to_length).signed[0]
+            extra_words = self.card_marking_words_for_length(length)
+            arena -= extra_words * WORD
+            allocsize += extra_words * WORD
+        #
+        llarena.arena_free(arena)
+        return allocsize
+
     def start_free_rawmalloc_objects(self):
         ll_assert(not self.raw_malloc_might_sweep.non_empty(),
                   "raw_malloc_might_sweep must be empty")
@@ -2720,6 +2895,328 @@ class IncrementalMiniMarkGC(MovingGCBase):
         totalsize = size_gc_header + self.get_size(obj)
         return raw_malloc_usage(totalsize)
 
+    # ----------
+    # Marking with several threads
+
+    def _init_parallel_marking(self):
+        # like remember_young_pointer, 'mark_worker' is a function attached
+        # to the instance, because the helper threads call it from C.  It
+        # must not raise: these threads don't hold the GIL.
+        def mark_worker(index):
+            self._parallel_mark_worker(index)
+        self._mark_worker = mark_worker
+
+    def visit_all_objects_parallel_step(self, size_to_track):
+        # Like visit_all_objects_step(), but every worker thread can mark
+        # up to 'size_to_track' bytes.  Returns what is left of the budget
+        # of the worker that marked the most, or 0 if there are still
+        # objects to trace.
+        workers = self.mark_workers
+        pending = self.objects_to_trace
+        if not pending.non_empty():
+            return size_to_track
+        n = workers.prepare(self.mark_threads)
+        if n <= 1:
+            return self.visit_all_objects_step(size_to_track)
+        i = 0
+        while pending.non_empty():
+            obj = pending.pop()
+            if not workers.push(i, obj):
+                pending.append(obj)     # no memory: keep the rest for later
+                break
+            i += 1
+            if i == n:
+                i = 0
+        workers.budget = size_to_track
+        parallelmark.c_run(n, llhelper(parallelmark.WORKER_FN,
+                                       self._mark_worker))
+        max_marked = workers.finish(pending)
+        while True:
+            obj = workers.pop_retrace()
+            if not obj:
+                break
+            # a worker had no memory to push all the references of 'obj':
+            # make it gray again, so that it is traced again
+            self.header(obj).tid &= ~GCFLAG_VISITED
+            pending.append(obj)
+        debug_print("parallel marking:", n, "threads marked",
+                    workers.total_marked(), "bytes, with",
+                    workers.total_steals(), "steals")
+        if pending.non_empty() or max_marked >= size_to_track:
+            return 0
+        return size_to_track - max_marked
+
+    def _parallel_mark_worker(self, index):
+        # Runs in the thread number 'index', while the other threads,
+        # including the mutator, are stopped or marking too.
+        workers = self.mark_workers
+        may_steal = True
+        while True:
+            while True:
+                obj = workers.pop(index)
+                if not obj:
+                    if not workers.steal(index):
+                        break
+                    continue
+                if not workers.add_marked(index,
+                                          self._parallel_visit(obj, index)):
+                    # this worker used all its budget, or had no memory
+                    may_steal = False
+                    break
+            if not workers.wait_for_work(index, may_steal):
+                break
+
+    def _parallel_visit(self, obj, index):
+        # Same as visit(), but pushes the references on the stack of the
+        # worker 'index'.  Two workers may both find an object without
+        # GCFLAG_VISITED; then both trace it, which is harmless.
+        hdr = self.header(obj)
+        ll_assert((hdr.tid & GCFLAG_PINNED) == 0,
+                  "pinned object in 'objects_to_trace'")
+        ll_assert(not self.is_in_nursery(obj),
+                  "nursery object in 'objects_to_trace'")
+        if hdr.tid & (GCFLAG_VISITED | GCFLAG_NO_HEAP_PTRS):
+            return 0
+        hdr.tid |= GCFLAG_VISITED | GCFLAG_TRACK_YOUNG_PTRS
+        if self.has_gcptr(llop.extract_ushort(llgroup.HALFWORD, hdr.tid)):
+            self.trace(obj, self._parallel_collect_ref, index)
+            self.mark_workers.traced(index, obj)
+        size_gc_header = self.gcheaderbuilder.size_gc_header
+        totalsize = size_gc_header + self.get_size(obj)
+        return raw_malloc_usage(totalsize)
+
+    def _parallel_collect_ref(self, root, index):
+        obj = root.address[0]
+        llop.debug_nonnull_pointer(lltype.Void, obj)
+        if not self.is_in_nursery(obj):
+            self.mark_workers.push_ref(index, obj)
+        else:
+            ll_assert(self._is_pinned(obj),
+                      "non-pinned nursery obj in _parallel_collect_ref")
+
+    # ----------
+    # Nursery size: PYPY_GC_MAX_PAUSE and PYPY_GC_NURSERY_MAX
+
+    def _record_nursery_survival(self, nursery_used):
+        # Bucket 0 counts the minor collections where less than 1% of the
+        # used nursery survived, bucket 1 less than 2%, bucket 2 less than
+        # 4%, and so on; the last bucket counts all the others.
+        surviving = self.nursery_surviving_size
+        percent = surviving * 100 // nursery_used
+        i = 0
+        limit = 1
+        while i < rgc.NURSERY_SURVIVAL_BUCKETS - 1 and percent >= limit:
+            i += 1
+            limit *= 2
+        self.nursery_survival_histogram[i] += 1
+        rate = float(surviving) / float(nursery_used)
+        self.nursery_survival_rate = (self.nursery_survival_rate + rate) * 0.5
+
+    def _adjust_nursery_size(self, duration, nursery_used):
+        # Called at the end of a minor collection.
+        self.last_minor_duration = duration
+        if (self.pinned_objects_in_nursery > 0 or
+                self.debug_rotating_nurseries or
+                self.debug_tiny_nursery >= 0):
+            return
+        size = self.nursery_size
+        newsize = size
+        if self.adaptive_nursery and nursery_used > 0:
+            newsize = self._nursery_size_from_survival(duration, nursery_used)
+        if self.max_pause > 0.0:
+            # Minor collections get half of the pause: the other half is
+            # for the major collection step that often follows.  Their
+            # duration is roughly proportional to the nursery size.
+            target = self.max_pause * 0.5
+            if duration > target:
+                newsize = min(newsize, size // 2)
+            elif duration < target * 0.25:
+                newsize = max(newsize, min(size * 2, self.base_nursery_size))
+            else:
+                newsize = min(newsize, size)
+        newsize &= ~(WORD-1)
+        if newsize < self.min_nursery_size:
+            newsize = self.min_nursery_size
+        if newsize > self.max_nursery_size:
+            newsize = self.max_nursery_size
+        if newsize != self.nursery_size:
+            self._resize_nursery(newsize)
+
+    def _nursery_size_from_survival(self, duration, nursery_used):
+        # A larger nursery gives more time to the young objects to die
+        # before they are copied, which helps when many of them survive.
+        # It doesn't help if the minor collections are not cheaper per
+        # byte allocated after growing; then shrink back and wait a bit
+        # before trying again.
+        size = self.nursery_size
+        cost = duration / nursery_used
+        if self.nursery_growth_backoff > 0:
+            self.nursery_growth_backoff -= 1
+        if self.nursery_cost_before_growth > 0.0:
+            previous_cost = self.nursery_cost_before_growth
+            self.nursery_cost_before_growth = 0.0
+            if cost >= previous_cost:
+                self.nursery_growth_backoff = NURSERY_GROWTH_BACKOFF
+                return size // 2
+        rate = self.nursery_survival_rate
+        if (rate > NURSERY_GROW_ABOVE and self.nursery_growth_backoff == 0
+                and size < self.max_nursery_size):
+            self.nursery_cost_before_growth = cost
+            return size * 2
+        if rate < NURSERY_SHRINK_BELOW and size > self.base_nursery_size:
+            return max(size // 2, self.base_nursery_size)
+        return size
+
+    def _resize_nursery(self, newsize):
+        # Called at the end of a minor collection, when the nursery is
+        # empty.  Unlike allocate_nursery(), keeps the thresholds of the
+        # major collections.
+        debug_start("gc-set-nursery-size")
+        debug_print("nursery size:", newsize)
+        llarena.arena_free(self.nursery)
+        self.nursery_size = newsize
+        self.nursery = self._alloc_nursery()
+        self.nursery_free = self.nursery
+        self.nursery_top = self.nursery + self.nursery_size
+        debug_stop("gc-set-nursery-size")
+
+    def _adjust_steps_to_max_pause(self, state, duration):
+        # The program was also stopped by the minor collection just before.
+        budget = self.max_pause - self.last_minor_duration
+        if budget < self.max_pause * 0.25:
+            budget = self.max_pause * 0.25
+        if state == STATE_MARKING:
+            step = self._scale_step(intmask(self.gc_increment_step),
+                                    budget, duration)
+            self.gc_increment_step = r_uint(step)
+        elif state == STATE_SWEEPING and not self.concurrent_sweep_running:
+            self.gc_sweep_step = self._scale_step(self.gc_sweep_step,
+                                                  budget, duration)
+
+    def _scale_step(self, step, budget, duration):
+        # Aim a bit below the budget, and change by at most a factor 2
+        # each time.  Below the nursery size, the major collections would
+        # not progress faster than the objects are made old.
+        if duration * 2.0 <= budget * 0.9:
+            ratio = 2.0
+        else:
+            ratio = budget * 0.9 / duration
+            if ratio < 0.5:
+                ratio = 0.5
+        newstep = int(step * ratio)
+        if newstep < self.nursery_size:
+            newstep = self.nursery_size
+        maxstep = self.base_nursery_size * 64
+        if newstep > maxstep:
+            newstep = maxstep
+        return newstep
+
+    # ----------
+    # Sweeping in another thread
+
+    def _init_concurrent_sweep(self):
+        # like mark_worker, attached to the instance for the C code
+        def sweep_in_thread(ignored):
+            self._concurrent_sweep()
+        self._sweep_in_thread = sweep_in_thread
+        self.sweeper_duration = 0.0
+        self.raw_survivors = lltype.nullptr(self._ADDRARRAY)
+        self.raw_survivors_count = 0
+        self.raw_freed_size = r_uint(0)
+
+    def start_concurrent_sweep(self):
+        # Called when entering STATE_SWEEPING, after mass_free_prepare()
+        # and start_free_rawmalloc_objects().  The surviving raw-malloced
+        # objects are collected in a raw array, because the AddressStacks
+        # share their free list of chunks with this thread.
+        count = self.raw_malloc_might_sweep.length()
+        self.raw_survivors = lltype.malloc(self._ADDRARRAY, max(count, 1),
+                                           flavor='raw',
+                                           track_allocation=False)
+        self.raw_survivors_count = 0
+        self.raw_freed_size = r_uint(0)
+        self.concurrent_sweep_running = True
+        if not sweeper.c_start(llhelper(sweeper.SWEEPER_FN,
+                                        self._sweep_in_thread)):
+            # no thread: sweep in steps, as usual
+            self.concurrent_sweep_running = False
+            lltype.free(self.raw_survivors, flavor='raw',
+                        track_allocation=False)
+
+    def _concurrent_sweep(self):
+        # Runs in the sweeper thread.  It must not allocate anything with
+        # the GC or from the free list of the AddressStack chunks.
+        start = time.time()
+        self.raw_malloc_might_sweep.foreach(self._sweep_rawmalloced_object,
+                                            None)
+        self.ac.mass_free_concurrent(self._free_if_unvisited)
+        self.sweeper_duration = time.time() - start
+
+    def _sweep_rawmalloced_object(self, obj, ignored):
+        if self.header(obj).tid & GCFLAG_VISITED:
+            size_gc_header = self.gcheaderbuilder.size_gc_header
+            self._clear_visited_atomically(obj - size_gc_header)
+            self.raw_survivors[self.raw_survivors_count] = obj
+            self.raw_survivors_count += 1
+        else:
+            self.raw_freed_size += r_uint(self._free_rawmalloced_object(obj))
+
+    def _clear_visited_atomically(self, hdr):
+        # the program may write to the same header at the same time,
+        # e.g. in the write barrier; never lose its changes
+        if we_are_translated():
+            sweeper.c_atomic_and(hdr, ~GCFLAG_VISITED)
+        else:
+            size_gc_header = self.gcheaderbuilder.size_gc_header
+            self.header(hdr + size_gc_header).tid &= ~GCFLAG_VISITED
+
+    def _record_header_write(self, obj):
+        # 'obj' got a new flag while the sweeper might be clearing its
+        # GCFLAG_VISITED.  If the flag is still there, the write may have
+        # put it back: clear it again when the sweeper is done.
+        if self.header(obj).tid & GCFLAG_VISITED:
+            self.objects_written_while_sweeping.append(obj)
+
+    def _concurrent_sweep_in_progress(self, wait=False):
+        # Returns True if the sweeper thread is still running.  Otherwise,
+        # finishes its work in this thread: the pages and the raw-malloced
+        # objects that survive go back to the lists used by the allocator.
+        if not self.concurrent_sweep_running:
+            return False
+        if wait:
+            sweeper.c_wait()
+        elif not sweeper.c_is_done():
+            return True
+        self.concurrent_sweep_running = False
+        self.ac.mass_free_concurrent_finish()
+        #
+        i = 0
+        while i < self.raw_survivors_count:
+            self.old_rawmalloced_objects.append(self.raw_survivors[i])
+            i += 1
+        lltype.free(self.raw_survivors, flavor='raw', track_allocation=False)
+        self.raw_malloc_might_sweep.delete()
+        self.raw_malloc_might_sweep = self.AddressStack()
+        self.rawmalloced_total_size -= self.raw_freed_size
+        #
+        while self.objects_written_while_sweeping.non_empty():
+            obj = self.objects_written_while_sweeping.pop()
+            self.header(obj).tid &= ~GCFLAG_VISITED
+        #
+        # The write barrier changes the flags of the objects that it adds
+        # to these two lists without an atomic operation.  Usually the next
+        # minor collection calls _record_header_write() on them, but we
+        # may be called before it, e.g. from gc_step_until().
+        self.old_objects_pointing_to_young.foreach(
+            self._reset_gcflag_visited, None)
+        self.old_objects_with_cards_set.foreach(
+            self._reset_gcflag_visited, None)
+        return False
+
+    def wait_for_concurrent_sweep(self):
+        # for the heap walks of inspector.py, which change GCFLAG_EXTRA
+        self._concurrent_sweep_in_progress(wait=True)
+
     # ----------
     # id() and identityhash() support
 
@@ -2945,6 +3442,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
 
     def ignore_finalizer(self, obj):
         self.header(obj).tid |= GCFLAG_IGNORE_FINALIZER
+        if self.concurrent_sweep_running:
+            self._record_header_write(obj)
 
 
     # ----------
@@ -3054,6 +3553,14 @@ class IncrementalMiniMarkGC(MovingGCBase):
             return intmask(self.nursery_size)
         elif stats_no == rgc.TOTAL_GC_TIME:
             return int(self.total_gc_time * 1000)
+        elif (rgc.NURSERY_SURVIVAL <= stats_no <
+                  rgc.NURSERY_SURVIVAL + rgc.NURSERY_SURVIVAL_BUCKETS):
+            return self.nursery_survival_histogram[
+                stats_no - rgc.NURSERY_SURVIVAL]
+        elif stats_no == rgc.RSS_MEMORY:
+            return env.get_rss()
+        elif stats_no == rgc.PEAK_RSS_MEMORY:
+            return env.get_peak_rss()
         return 0
 
 
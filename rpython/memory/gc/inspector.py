@@ -31,6 +31,7 @@ def _do_append_rpy_roots(gc, lst):
 
 def get_rpy_roots(gc):
     # returns a list that may end with some NULLs
+    gc.wait_for_concurrent_sweep()
     while True:
         result = [lltype.nullptr(llmemory.GCREF.TO)] * gc._totalroots_rpy
         count = _do_append_rpy_roots(gc, result)
@@ -263,6 +264,7 @@ def _hd_unadd_root(obj, heap_dumper):
     heap_dumper.unadd(obj)
 
 def dump_rpy_heap(gc, fd):
+    gc.wait_for_concurrent_sweep()
     heapdumper = HeapDumper(gc, fd)
     heapdumper.process()
     heapdumper.flush()
@@ -271,6 +273,7 @@ def dump_rpy_heap(gc, fd):
     return True
 
 def count_memory_pressure(gc):
+    gc.wait_for_concurrent_sweep()
     counter = MemoryPressureCounter(gc)
     counter.process()
     counter.finish_processing()
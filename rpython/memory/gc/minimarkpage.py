@@ -39,6 +39,12 @@ ARENA_NULL = lltype.nullptr(ARENA)
 # arenas that have 'nfreepages == i'.  We allocate pages out of the
 # arena in 'current_arena'; when it is exhausted we pick another arena
 # with the smallest value for nfreepages (but > 0).
+#
+# Arenas that become entirely free are normally returned to malloc() at
+# once.  If 'arena_slack' is set, we keep up to 'arena_slack' bytes of
+# them in 'spare_arenas' to reuse them before calling malloc() again, and
+# we give the others back to the OS immediately with MADV_DONTNEED instead
+# of letting it reclaim them lazily with MADV_FREE.
 
 # ____________________________________________________________
 #
@@ -95,6 +101,11 @@ class ArenaCollection(object):
         self.small_request_threshold = small_request_threshold
         self.arenas_count = 0
         #
+        # see above.  The default of -1 means "no spare arena, MADV_FREE".
+        self.arena_slack = -1
+        self.spare_arenas = ARENA_NULL
+        self.spare_arenas_count = 0
+        #
         # 'pageaddr_for_size': for each size N between WORD and
         # small_request_threshold (included), contains either NULL or
         # a pointer to a page that has room for at least one more
@@ -104,6 +115,15 @@ class ArenaCollection(object):
         self.full_page_for_size     = self._new_page_ptr_list(length)
         self.old_page_for_size      = self._new_page_ptr_list(length)
         self.old_full_page_for_size = self._new_page_ptr_list(length)
+        #
+        # used by mass_free_concurrent(): the pages swept in another thread
+        # wait here until mass_free_concurrent_finish() gives them back to
+        # malloc().  The pages completely freed are chained via 'nextpage'
+        # in 'swept_free_pages'.
+        self.swept_page_for_size      = self._new_page_ptr_list(length)
+        self.swept_full_page_for_size = self._new_page_ptr_list(length)
+        self.swept_free_pages = PAGE_NULL
+        self.swept_memory_used = r_uint(0)
         self.nblocks_for_size = lltype.malloc(rffi.CArray(lltype.Signed),
                                               length, flavor='raw',
                                               immortal=True)
@@ -254,6 +274,10 @@ class ArenaCollection(object):
             while arena:
                 yield arena
                 arena = arena.nextarena
+        arena = self.spare_arenas
+        while arena:
+            yield arena
+            arena = arena.nextarena
 
 
     def _pick_next_arena(self):
@@ -288,6 +312,13 @@ class ArenaCollection(object):
         if self._pick_next_arena():
             return
         #
+        # Reuse a spare arena.  Its pages are all in its 'freepages' list.
+        if self.spare_arenas != ARENA_NULL:
+            self.current_arena = self.spare_arenas
+            self.spare_arenas = self.current_arena.nextarena
+            self.spare_arenas_count -= 1
+            return
+        #
         # No more arena with any free page.  We must allocate a new arena.
         if not we_are_translated():
             for a in self._all_arenas():
@@ -384,6 +415,99 @@ class ArenaCollection(object):
         ll_assert(res, "non-incremental mass_free_in_pages() returned False")
 
 
+    def mass_free_concurrent(self, ok_to_free_func):
+        """Like mass_free_incremental() without a limit, but can run in
+        another thread than malloc().  It only touches the pages moved away
+        by mass_free_prepare(), and puts them in the 'swept_xxx' lists instead
+        of 'page_for_size' and 'arena.freepages'.  Must be followed by
+        mass_free_concurrent_finish() in the thread that does malloc().
+        """
+        size_class = self.size_class_with_old_pages
+        freed_pages = PAGE_NULL
+        memory_used = r_uint(0)
+        #
+        while size_class >= 1:
+            nblocks = self.nblocks_for_size[size_class]
+            block_size = size_class * WORD
+            partial_pages = PAGE_NULL
+            full_pages = PAGE_NULL
+            #
+            step = 0
+            while step < 2:
+                if step == 0:
+                    page = self.old_full_page_for_size[size_class]
+                    self.old_full_page_for_size[size_class] = PAGE_NULL
+                else:
+                    page = self.old_page_for_size[size_class]
+                    self.old_page_for_size[size_class] = PAGE_NULL
+                #
+                while page != PAGE_NULL:
+                    surviving = self.walk_page(page, block_size,
+                                               ok_to_free_func)
+                    memory_used += r_uint(surviving * block_size)
+                    nextpage = page.nextpage
+                    if surviving == nblocks:
+                        ll_assert(step == 0,
+                                  "A non-full page became full while freeing")
+                        page.nextpage = full_pages
+                        full_pages = page
+                    elif surviving > 0:
+                        page.nextpage = partial_pages
+                        partial_pages = page
+                    else:
+                        page.nextpage = freed_pages
+                        freed_pages = page
+                    page = nextpage
+                step += 1
+            #
+            self.swept_page_for_size[size_class] = partial_pages
+            self.swept_full_page_for_size[size_class] = full_pages
+            size_class -= 1
+        #
+        self.swept_free_pages = freed_pages
+        self.swept_memory_used = memory_used
+
+
+    def mass_free_concurrent_finish(self):
+        """Gives the pages swept by mass_free_concurrent() back to
+        malloc() and frees the arenas that became empty."""
+        size_class = self.size_class_with_old_pages
+        while size_class >= 1:
+            self.page_for_size[size_class] = self._append_pages(
+                self.page_for_size[size_class],
+                self.swept_page_for_size[size_class])
+            self.full_page_for_size[size_class] = self._append_pages(
+                self.full_page_for_size[size_class],
+                self.swept_full_page_for_size[size_class])
+            self.swept_page_for_size[size_class] = PAGE_NULL
+            self.swept_full_page_for_size[size_class] = PAGE_NULL
+            size_class -= 1
+        #
+        page = self.swept_free_pages
+        self.swept_free_pages = PAGE_NULL
+        while page != PAGE_NULL:
+            nextpage = page.nextpage
+            self.free_page(page)
+            page = nextpage
+        #
+        self.total_memory_used += self.swept_memory_used
+        self.swept_memory_used = r_uint(0)
+        self._rehash_arenas_lists()
+        self.size_class_with_old_pages = -1
+
+
+    def _append_pages(self, pages, more_pages):
+        # the pages allocated since mass_free_prepare() stay first, so
+        # that malloc() goes on filling the current one
+        if pages == PAGE_NULL:
+            return more_pages
+        page = pages
+        while page.nextpage != PAGE_NULL:
+            page = page.nextpage
+        page.nextpage = more_pages
+        return pages
+
+
     def _rehash_arenas_lists(self):
         #
         # Rehash arenas into the correct arenas_lists[i].  If
@@ -404,12 +528,8 @@ class ArenaCollection(object):
                 #
                 if arena.nfreepages == arena.totalpages:
                     #
-                    # The whole arena is empty.  Free it.
-                    llarena.arena_reset(arena.base, self.arena_size, 4)
-                    llarena.arena_free(arena.base)
-                    self.total_memory_alloced -= self.arena_size
-                    lltype.free(arena, flavor='raw', track_allocation=False)
-                    self.arenas_count -= 1
+                    # The whole arena is empty.  Keep it or free it.
+                    self._release_empty_arena(arena)
                     #
                 else:
                     # Insert 'arena' in the correct arenas_lists[n]
@@ -425,6 +545,23 @@ class ArenaCollection(object):
         self.min_empty_nfreepages = 1
 
 
+    def _release_empty_arena(self, arena):
+        spare_size = (self.spare_arenas_count + 1) * self.arena_size
+        if spare_size <= self.arena_slack:
+            arena.nextarena = self.spare_arenas
+            self.spare_arenas = arena
+            self.spare_arenas_count += 1
+            return
+        if self.arena_slack < 0:
+            llarena.arena_reset(arena.base, self.arena_size, 4)
+        else:
+            llarena.arena_reset(arena.base, self.arena_size, 5)
+        llarena.arena_free(arena.base)
+        self.total_memory_alloced -= self.arena_size
+        lltype.free(arena, flavor='raw', track_allocation=False)
+        self.arenas_count -= 1
+
+
     def mass_free_in_pages(self, size_class, ok_to_free_func, max_pages):
         nblocks = self.nblocks_for_size[size_class]
         block_size = size_class * WORD
@@ -444,6 +581,7 @@ class ArenaCollection(object):
                 #
                 # Collect the page.
                 surviving = self.walk_page(page, block_size, ok_to_free_func)
+                self.total_memory_used += r_uint(surviving * block_size)
                 nextpage = page.nextpage
                 #
                 if surviving == nblocks:
@@ -561,10 +699,8 @@ class ArenaCollection(object):
             #
             obj += block_size
         #
-        # Update the global total size of objects.
-        self.total_memory_used += r_uint(surviving * block_size)
-        #
-        # Return the number of surviving objects.
+        # Return the number of surviving objects.  The caller updates the
+        # global total size of objects.
         return surviving
 
 
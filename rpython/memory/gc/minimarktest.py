@@ -21,6 +21,8 @@ class SimpleArenaCollection(object):
         self.all_objects = []
         self.total_memory_used = 0
         self.arenas_count = 0
+        self.arena_slack = -1
+        self.spare_arenas_count = 0
 
     def malloc(self, size):
         nsize = raw_malloc_usage(size)
@@ -53,6 +55,22 @@ class SimpleArenaCollection(object):
                 return False
         return True
 
+    def mass_free_concurrent(self, ok_to_free_func):
+        old = self.old_all_objects
+        self.swept_objects = []
+        while old:
+            rawobj, nsize = old.pop()
+            if ok_to_free_func(rawobj):
+                llarena.arena_free(rawobj)
+            else:
+                self.swept_objects.append((rawobj, nsize))
+
+    def mass_free_concurrent_finish(self):
+        for rawobj, nsize in self.swept_objects:
+            self.all_objects.append((rawobj, nsize))
+            self.total_memory_used += nsize
+        self.swept_objects = []
+
     def mass_free(self, ok_to_free_func):
         self.mass_free_prepare()
         res = self.mass_free_incremental(ok_to_free_func, sys.maxint)
@@ -0,0 +1,561 @@
+"""
+Helper threads for the marking steps of the incminimark GC.
+
+With PYPY_GC_MARK_THREADS=N, a marking step of a major collection is done
+by N threads at once: the thread that runs the GC and N-1 helper threads.
+The mutator is stopped during the whole step, exactly like for a
+single-threaded marking step, so the helpers only see the mark bits in the
+headers of the objects and the gray objects that still need to be traced.
+
+Each worker has a private stack of gray objects, made of the same chunks
+as the AddressStacks.  When the top chunk is full, the worker publishes it
+in its 'shared' field, unless the previous one was not taken yet.  A worker
+whose stack is empty first takes back its own shared chunk, then steals the
+shared chunks of the other workers.  An idle worker sleeps until a chunk
+is published or until all workers are idle.  The step ends when all
+workers are idle: either because there is no work left, or because they
+marked their part of the step's budget.  What is left in the stacks then
+goes back to 'objects_to_trace'.
+
+The workers run without the GIL, so they must not raise: when malloc()
+fails to give a new chunk, the worker stops, and the object whose
+references it could not push is traced again by the main thread.
+
+Two threads can race to set GCFLAG_VISITED on the same object; they write
+the same value, and at worst the object is traced twice.
+"""
+
+import sys
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
+from rpython.rlib.objectmodel import not_rpython, we_are_translated
+from rpython.memory.support import get_chunk_manager, DEFAULT_CHUNK_SIZE
+from rpython.translator.tool.cbuild import ExternalCompilationInfo
+
+
+MAX_MARK_WORKERS = 64
+GLOBAL_LOCK = MAX_MARK_WORKERS      # protects the chunk free list and 'idle'
+
+WORKER_FN = lltype.Ptr(lltype.FuncType([lltype.Signed], lltype.Void))
+
+_C_SOURCE = r"""
+#define PYPY_GC_MAX_MARK_WORKERS  %(MAX)d
+
+#ifdef _WIN32
+
+RPY_EXTERN long pypy_gc_mark_workers_prepare(long n) { return 1; }
+RPY_EXTERN void pypy_gc_mark_workers_run(long n, pypy_gc_mark_fn fn)
+{
+    fn(0);
+}
+RPY_EXTERN void pypy_gc_mark_lock(long i) { }
+RPY_EXTERN void pypy_gc_mark_unlock(long i) { }
+RPY_EXTERN void pypy_gc_mark_wait_idle(void) { }
+RPY_EXTERN void pypy_gc_mark_wake_idle(void) { }
+
+#else
+
+#include <pthread.h>
+#include <signal.h>
+#include <unistd.h>
+
+static pthread_mutex_t gcmark_mutex;
+static pthread_cond_t gcmark_start, gcmark_done, gcmark_idle;
+static pthread_mutex_t gcmark_locks[PYPY_GC_MAX_MARK_WORKERS + 1];
+static long gcmark_first_generation[PYPY_GC_MAX_MARK_WORKERS];
+static long gcmark_nhelpers, gcmark_generation, gcmark_active;
+static long gcmark_running;
+static pypy_gc_mark_fn gcmark_fn;
+static pid_t gcmark_pid;
+
+static void *gcmark_helper(void *arg)
+{
+    long index = (long)arg;
+    long seen;
+    pthread_mutex_lock(&gcmark_mutex);
+    seen = gcmark_first_generation[index];
+    while (1) {
+        pypy_gc_mark_fn fn;
+        while (gcmark_generation == seen)
+            pthread_cond_wait(&gcmark_start, &gcmark_mutex);
+        seen = gcmark_generation;
+        if (index > gcmark_active)
+            continue;
+        fn = gcmark_fn;
+        pthread_mutex_unlock(&gcmark_mutex);
+        fn(index);
+        pthread_mutex_lock(&gcmark_mutex);
+        if (--gcmark_running == 0)
+            pthread_cond_signal(&gcmark_done);
+    }
+    return NULL;
+}
+
+RPY_EXTERN long pypy_gc_mark_workers_prepare(long n)
+{
+    /* Make sure that there are n-1 helper threads.  Returns the number of
+       workers that can really be used, including the current thread. */
+    long i;
+    sigset_t all, old;
+
+    if (n > PYPY_GC_MAX_MARK_WORKERS)
+        n = PYPY_GC_MAX_MARK_WORKERS;
+    if (gcmark_pid != getpid()) {
+        /* first call, or we are in a child process after fork(), where
+           the helper threads of the parent don't exist */
+        pthread_mutex_init(&gcmark_mutex, NULL);
+        pthread_cond_init(&gcmark_start, NULL);
+        pthread_cond_init(&gcmark_done, NULL);
+        pthread_cond_init(&gcmark_idle, NULL);
+        for (i = 0; i <= PYPY_GC_MAX_MARK_WORKERS; i++)
+            pthread_mutex_init(&gcmark_locks[i], NULL);
+        gcmark_nhelpers = 0;
+        gcmark_pid = getpid();
+    }
+    /* the helpers never handle signals */
+    sigfillset(&all);
+    pthread_sigmask(SIG_BLOCK, &all, &old);
+    pthread_mutex_lock(&gcmark_mutex);
+    while (gcmark_nhelpers < n - 1) {
+        pthread_t th;
+        pthread_attr_t attr;
+        long index = gcmark_nhelpers + 1;
+        int err;
+        gcmark_first_generation[index] = gcmark_generation;
+        pthread_attr_init(&attr);
+        pthread_attr_setdetachstate(&attr, PTHREAD_CREATE_DETACHED);
+        err = pthread_create(&th, &attr, gcmark_helper, (void *)index);
+        pthread_attr_destroy(&attr);
+        if (err != 0)
+            break;
+        gcmark_nhelpers = index;
+    }
+    if (n - 1 > gcmark_nhelpers)
+        n = gcmark_nhelpers + 1;
+    pthread_mutex_unlock(&gcmark_mutex);
+    pthread_sigmask(SIG_SETMASK, &old, NULL);
+    return n < 1 ? 1 : n;
+}
+
+RPY_EXTERN void pypy_gc_mark_workers_run(long n, pypy_gc_mark_fn fn)
+{
+    /* Run fn(0) in the current thread and fn(1) ... fn(n-1) in the
+       helper threads, and wait until they all returned. */
+    pthread_mutex_lock(&gcmark_mutex);
+    gcmark_fn = fn;
+    gcmark_active = n - 1;
+    gcmark_running = n - 1;
+    gcmark_generation++;
+    pthread_cond_broadcast(&gcmark_start);
+    pthread_mutex_unlock(&gcmark_mutex);
+
+    fn(0);
+
+    pthread_mutex_lock(&gcmark_mutex);
+    while (gcmark_running > 0)
+        pthread_cond_wait(&gcmark_done, &gcmark_mutex);
+    pthread_mutex_unlock(&gcmark_mutex);
+}
+
+RPY_EXTERN void pypy_gc_mark_lock(long i)
+{
+    pthread_mutex_lock(&gcmark_locks[i]);
+}
+
+RPY_EXTERN void pypy_gc_mark_unlock(long i)
+{
+    pthread_mutex_unlock(&gcmark_locks[i]);
+}
+
+RPY_EXTERN void pypy_gc_mark_wait_idle(void)
+{
+    /* called with the lock GLOBAL_LOCK, which is released while waiting */
+    pthread_cond_wait(&gcmark_idle,
+                      &gcmark_locks[PYPY_GC_MAX_MARK_WORKERS]);
+}
+
+RPY_EXTERN void pypy_gc_mark_wake_idle(void)
+{
+    /* called with the lock GLOBAL_LOCK */
+    pthread_cond_broadcast(&gcmark_idle);
+}
+
+#endif
+""" % {'MAX': MAX_MARK_WORKERS}
+
+eci = ExternalCompilationInfo(
+    post_include_bits=["""
+typedef void (*pypy_gc_mark_fn)(long);
+RPY_EXTERN long pypy_gc_mark_workers_prepare(long);
+RPY_EXTERN void pypy_gc_mark_workers_run(long, pypy_gc_mark_fn);
+RPY_EXTERN void pypy_gc_mark_lock(long);
+RPY_EXTERN void pypy_gc_mark_unlock(long);
+RPY_EXTERN void pypy_gc_mark_wait_idle(void);
+RPY_EXTERN void pypy_gc_mark_wake_idle(void);
+"""],
+    separate_module_sources=[_C_SOURCE],
+    libraries=[] if sys.platform == 'win32' else ['pthread'])
+
+# ---------- emulation with Python threads, for the untranslated tests ------
+#
+# lltype is not thread-safe, so the emulated workers take turns: only the
+# one that holds 'turn' runs, and it lets the others run at every lock,
+# unlock and wait.  This is enough to test the publishing and stealing.
+
+class _Emulation(object):
+    def __init__(self):
+        import threading
+        self.locks = [threading.Lock() for i in range(MAX_MARK_WORKERS + 1)]
+        self.turn = threading.Lock()
+        self.running = False
+        self.failed = False
+
+    def switch(self):
+        import time
+        if self.running:
+            if self.failed:
+                raise AssertionError("another marking thread failed")
+            self.turn.release()
+            time.sleep(0)
+            self.turn.acquire()
+
+_emulation = None
+
+@not_rpython
+def _emulated_prepare(n):
+    global _emulation
+    if _emulation is None:
+        _emulation = _Emulation()
+    return max(1, min(n, MAX_MARK_WORKERS))
+
+@not_rpython
+def _emulated_run(n, fn):
+    import threading
+    errors = []
+    def run(index):
+        _emulation.turn.acquire()
+        try:
+            fn(index)
+        except:
+            # the other workers would wait forever for this one
+            _emulation.failed = True
+            errors.append(sys.exc_info())
+        _emulation.turn.release()
+    _emulation.running = True
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(1, n)]
+    for t in threads:
+        t.start()
+    run(0)
+    for t in threads:
+        t.join()
+    _emulation.running = False
+    _emulation.failed = False
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+
+@not_rpython
+def _emulated_lock(i):
+    _emulation.switch()
+    while not _emulation.locks[i].acquire(False):
+        _emulation.switch()
+
+@not_rpython
+def _emulated_unlock(i):
+    _emulation.locks[i].release()
+    _emulation.switch()
+
+@not_rpython
+def _emulated_wait_idle():
+    # no condition variable: let the others run, then check again
+    _emulation.locks[GLOBAL_LOCK].release()
+    _emulation.switch()
+    _emulated_lock(GLOBAL_LOCK)
+
+@not_rpython
+def _emulated_wake_idle():
+    pass
+
+def llexternal(name, args, result, _callable):
+    return rffi.llexternal(name, args, result, compilation_info=eci,
+                           _callable=_callable, _nowrapper=True,
+                           sandboxsafe=True)
+
+c_prepare = llexternal('pypy_gc_mark_workers_prepare', [lltype.Signed],
+                       lltype.Signed, _emulated_prepare)
+c_run = llexternal('pypy_gc_mark_workers_run', [lltype.Signed, WORKER_FN],
+                   lltype.Void, _emulated_run)
+c_lock = llexternal('pypy_gc_mark_lock', [lltype.Signed], lltype.Void,
+                    _emulated_lock)
+c_unlock = llexternal('pypy_gc_mark_unlock', [lltype.Signed], lltype.Void,
+                      _emulated_unlock)
+c_wait_idle = llexternal('pypy_gc_mark_wait_idle', [], lltype.Void,
+                         _emulated_wait_idle)
+c_wake_idle = llexternal('pypy_gc_mark_wake_idle', [], lltype.Void,
+                         _emulated_wake_idle)
+
+# ---------- the stacks of gray objects of the workers ----------
+
+def get_mark_workers(chunk_size=DEFAULT_CHUNK_SIZE, cache={}):
+    try:
+        return cache[chunk_size]
+    except KeyError:
+        pass
+
+    unused_chunks, null_chunk, _ = get_chunk_manager(chunk_size)
+    CHUNKPTR = lltype.typeOf(null_chunk)
+    CHUNK = CHUNKPTR.TO
+    WORKER = lltype.Struct('GCMarkWorker',
+                           ('chunk', CHUNKPTR),     # top of the stack
+                           ('used', lltype.Signed), # items in 'chunk'
+                           ('shared', CHUNKPTR),    # a full chunk or NULL
+                           ('marked', lltype.Signed),
+                           ('steals', lltype.Signed),
+                           ('lost', lltype.Signed), # references not pushed
+                           ('retrace', llmemory.Address))
+    WORKERS = lltype.Array(WORKER, hints={'nolength': True})
+
+    class MarkWorkers(object):
+        """The private stacks of the workers.  Only worker 'i' touches
+        'chunk' and 'used' of worker 'i'; the 'shared' chunk is protected
+        by the lock number 'i'.  'idle' and the chunk free list are
+        protected by GLOBAL_LOCK.
+        """
+        _alloc_flavor_ = "raw"
+
+        def __init__(self):
+            self.array = lltype.nullptr(WORKERS)
+            self.count = 0
+            self.idle = 0
+            self.budget = 0
+
+        def prepare(self, nworkers):
+            """Get the helper threads ready and set up the stacks.  Returns
+            the number of workers, which may be less than 'nworkers'."""
+            if not self.array:
+                self.array = lltype.malloc(WORKERS, MAX_MARK_WORKERS,
+                                           flavor='raw', zero=True,
+                                           track_allocation=False)
+            n = c_prepare(nworkers)
+            for i in range(n):
+                w = self.array[i]
+                w.chunk = unused_chunks.get()
+                w.chunk.next = null_chunk
+                w.used = 0
+                w.shared = null_chunk
+                w.marked = 0
+                w.steals = 0
+                w.lost = 0
+                w.retrace = llmemory.NULL
+            self.count = n
+            self.idle = 0
+            return n
+
+        def _get_chunk(self):
+            # Runs in the workers, so it must not raise: returns NULL
+            # if there is no free chunk and malloc() fails.
+            c_lock(GLOBAL_LOCK)
+            chunk = unused_chunks.free_list
+            if chunk:
+                unused_chunks.free_list = chunk.next
+            c_unlock(GLOBAL_LOCK)
+            if not chunk:
+                chunk = self._malloc_chunk()
+            return chunk
+
+        def _malloc_chunk(self):
+            if we_are_translated():
+                # unlike lltype.malloc(), never raises MemoryError
+                addr = llmemory.raw_malloc(llmemory.sizeof(CHUNK))
+                return llmemory.cast_adr_to_ptr(addr, CHUNKPTR)
+            return lltype.malloc(CHUNK, flavor='raw', zero=True,
+                                 track_allocation=False)
+
+        def _put_chunk(self, chunk):
+            c_lock(GLOBAL_LOCK)
+            unused_chunks.put(chunk)
+            c_unlock(GLOBAL_LOCK)
+
+        def push(self, i, addr):
+            """Push a gray object on the stack of worker 'i'.  Returns
+            False if there was no memory for a new chunk."""
+            w = self.array[i]
+            used = w.used
+            if used == chunk_size:
+                if not self._enlarge(i):
+                    return False
+                used = 0
+            w.chunk.items[used] = addr
+            w.used = used + 1
+            return True
+
+        def push_ref(self, i, addr):
+            # like push(), for the worker 'i' itself
+            if not self.push(i, addr):
+                self.array[i].lost += 1
+
+        def _enlarge(self, i):
+            # the top chunk is full: publish it for the other workers
+            # if the previous one was taken already
+            w = self.array[i]
+            new = self._get_chunk()
+            if not new:
+                return False
+            full = w.chunk
+            below = full.next
+            published = False
+            if not w.shared:
+                c_lock(i)
+                if not w.shared:
+                    full.next = null_chunk
+                    w.shared = full
+                    published = True
+                c_unlock(i)
+            if published:
+                new.next = below
+                # wake up the idle workers, which can steal it
+                c_lock(GLOBAL_LOCK)
+                if self.idle > 0:
+                    c_wake_idle()
+                c_unlock(GLOBAL_LOCK)
+            else:
+                new.next = full
+            w.chunk = new
+            w.used = 0
+            return True
+        _enlarge._dont_inline_ = True
+
+        def pop(self, i):
+            """Pop a gray object, or return NULL if the stack and the
+            shared chunk of worker 'i' are empty."""
+            w = self.array[i]
+            used = w.used
+            if used == 0:
+                if not self._refill(i):
+                    return llmemory.NULL
+                used = w.used
+            used -= 1
+            w.used = used
+            return w.chunk.items[used]
+
+        def _refill(self, i):
+            w = self.array[i]
+            top = w.chunk
+            if top.next:
+                w.chunk = top.next
+                w.used = chunk_size
+                self._put_chunk(top)
+                return True
+            if w.shared:
+                return self._take_shared(i, i)
+            return False
+        _refill._dont_inline_ = True
+
+        def _take_shared(self, i, j):
+            # worker 'i', whose stack is empty, takes the shared chunk
+            # of worker 'j'
+            victim = self.array[j]
+            c_lock(j)
+            chunk = victim.shared
+            victim.shared = null_chunk
+            c_unlock(j)
+            if not chunk:
+                return False
+            w = self.array[i]
+            ll_empty = w.chunk
+            w.chunk = chunk
+            w.used = chunk_size
+            self._put_chunk(ll_empty)
+            return True
+
+        def steal(self, i):
+            """Called by worker 'i' when its stack is empty."""
+            n = self.count
+            j = i + 1
+            while j < i + n:
+                victim = j % n
+                if self.array[victim].shared:
+                    if self._take_shared(i, victim):
+                        self.array[i].steals += 1
+                        return True
+                j += 1
+            return False
+
+        def traced(self, i, obj):
+            """Called by worker 'i' after it pushed the references of
+            'obj'.  If some of them were lost, 'obj' must be traced again
+            after the step, and the worker stops."""
+            w = self.array[i]
+            if w.lost and not w.retrace:
+                w.retrace = obj
+
+        def add_marked(self, i, size):
+            w = self.array[i]
+            w.marked += size
+            return w.marked < self.budget and not w.lost
+
+        def pop_retrace(self):
+            """After the step, returns the next object that a worker
+            could not trace completely, or NULL."""
+            for i in range(self.count):
+                w = self.array[i]
+                obj = w.retrace
+                if obj:
+                    w.retrace = llmemory.NULL
+                    return obj
+            return llmemory.NULL
+
+        def wait_for_work(self, i, may_steal):
+            """Worker 'i' has nothing left to mark.  Returns True if some
+            other worker published a chunk in the meantime, which 'i'
+            should try to steal, or False when all the workers are idle.
+            """
+            n = self.count
+            c_lock(GLOBAL_LOCK)
+            self.idle += 1
+            while True:
+                if self.idle == n:
+                    c_wake_idle()       # the others can return too
+                    c_unlock(GLOBAL_LOCK)
+                    return False
+                if may_steal:
+                    j = 0
+                    while j < n:
+                        if self.array[j].shared:
+                            self.idle -= 1
+                            c_unlock(GLOBAL_LOCK)
+                            return True
+                        j += 1
+                # sleep until a chunk is published or all are idle
+                c_wait_idle()
+
+        def finish(self, stack):
+            """Called after all the workers returned.  Moves the gray
+            objects left in the stacks to 'stack', frees the chunks, and
+            returns the largest number of bytes marked by one worker."""
+            max_marked = 0
+            for i in range(self.count):
+                while True:
+                    addr = self.pop(i)
+                    if not addr:
+                        break
+                    stack.append(addr)
+                w = self.array[i]
+                unused_chunks.put(w.chunk)
+                w.chunk = null_chunk
+                if w.marked > max_marked:
+                    max_marked = w.marked
+            return max_marked
+
+        def total_steals(self):
+            result = 0
+            for i in range(self.count):
+                result += self.array[i].steals
+            return result
+
+        def total_marked(self):
+            result = 0
+            for i in range(self.count):
+                result += self.array[i].marked
+            return result
+
+    cache[chunk_size] = MarkWorkers
+    return MarkWorkers
@@ -0,0 +1,214 @@
+"""
+A helper thread for the sweeping phase of the incminimark GC.
+
+With PYPY_GC_SWEEP_THREAD=1, the sweeping of a major collection runs in
+this thread while the program continues.  The thread only touches:
+
+  * the pages of the ArenaCollection moved away by mass_free_prepare(),
+    which malloc() doesn't use any more;
+
+  * the raw-malloced objects in 'raw_malloc_might_sweep';
+
+  * the headers of the surviving objects in these pages, to clear their
+    GCFLAG_VISITED, which it does with an atomic 'and'.
+
+The pages and the memory freed are given back to malloc() in the thread
+of the GC, at the next major collection step after the sweeper finished.
+The program can still write to the header of a surviving object at the same
+time as the sweeper, e.g. in the write barrier, and then put GCFLAG_VISITED
+back.  The GC records such objects and clears the flag again at the end.
+
+fork() waits until the sweeper is idle.
+"""
+
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
+from rpython.rlib.objectmodel import not_rpython
+from rpython.translator.tool.cbuild import ExternalCompilationInfo
+
+
+SWEEPER_FN = lltype.Ptr(lltype.FuncType([lltype.Signed], lltype.Void))
+
+_C_SOURCE = r"""
+#ifdef _WIN32
+
+RPY_EXTERN long pypy_gc_sweeper_start(pypy_gc_sweep_fn fn) { return 0; }
+RPY_EXTERN long pypy_gc_sweeper_is_done(void) { return 1; }
+RPY_EXTERN void pypy_gc_sweeper_wait(void) { }
+
+#else
+
+#include <pthread.h>
+#include <signal.h>
+
+static pthread_mutex_t gcsweep_mutex;
+static pthread_cond_t gcsweep_cond;
+static int gcsweep_initialized, gcsweep_has_thread;
+static int gcsweep_running;
+static pypy_gc_sweep_fn gcsweep_fn;
+
+static void *gcsweep_main(void *arg)
+{
+    pthread_mutex_lock(&gcsweep_mutex);
+    while (1) {
+        pypy_gc_sweep_fn fn;
+        while (!gcsweep_running)
+            pthread_cond_wait(&gcsweep_cond, &gcsweep_mutex);
+        fn = gcsweep_fn;
+        pthread_mutex_unlock(&gcsweep_mutex);
+        fn(0);
+        pthread_mutex_lock(&gcsweep_mutex);
+        gcsweep_running = 0;
+        pthread_cond_broadcast(&gcsweep_cond);
+    }
+    return NULL;
+}
+
+static void gcsweep_atfork_prepare(void)
+{
+    /* don't fork in the middle of a sweep: the child would not have
+       the sweeper thread to finish it */
+    pthread_mutex_lock(&gcsweep_mutex);
+    while (gcsweep_running)
+        pthread_cond_wait(&gcsweep_cond, &gcsweep_mutex);
+}
+
+static void gcsweep_atfork_parent(void)
+{
+    pthread_mutex_unlock(&gcsweep_mutex);
+}
+
+static void gcsweep_atfork_child(void)
+{
+    pthread_mutex_init(&gcsweep_mutex, NULL);
+    pthread_cond_init(&gcsweep_cond, NULL);
+    gcsweep_has_thread = 0;
+}
+
+RPY_EXTERN long pypy_gc_sweeper_start(pypy_gc_sweep_fn fn)
+{
+    /* Run fn(0) in the sweeper thread.  Returns 0 if the thread cannot
+       be started; then the caller must sweep by itself. */
+    if (!gcsweep_initialized) {
+        pthread_mutex_init(&gcsweep_mutex, NULL);
+        pthread_cond_init(&gcsweep_cond, NULL);
+        pthread_atfork(gcsweep_atfork_prepare, gcsweep_atfork_parent,
+                       gcsweep_atfork_child);
+        gcsweep_initialized = 1;
+    }
+    pthread_mutex_lock(&gcsweep_mutex);
+    if (!gcsweep_has_thread) {
+        pthread_t th;
+        pthread_attr_t attr;
+        sigset_t all, old;
+        int err;
+        /* the sweeper never handles signals */
+        sigfillset(&all);
+        pthread_sigmask(SIG_BLOCK, &all, &old);
+        pthread_attr_init(&attr);
+        pthread_attr_setdetachstate(&attr, PTHREAD_CREATE_DETACHED);
+        err = pthread_create(&th, &attr, gcsweep_main, NULL);
+        pthread_attr_destroy(&attr);
+        pthread_sigmask(SIG_SETMASK, &old, NULL);
+        if (err != 0) {
+            pthread_mutex_unlock(&gcsweep_mutex);
+            return 0;
+        }
+        gcsweep_has_thread = 1;
+    }
+    gcsweep_fn = fn;
+    gcsweep_running = 1;
+    pthread_cond_broadcast(&gcsweep_cond);
+    pthread_mutex_unlock(&gcsweep_mutex);
+    return 1;
+}
+
+RPY_EXTERN long pypy_gc_sweeper_is_done(void)
+{
+    long result;
+    pthread_mutex_lock(&gcsweep_mutex);
+    result = !gcsweep_running;
+    pthread_mutex_unlock(&gcsweep_mutex);
+    return result;
+}
+
+RPY_EXTERN void pypy_gc_sweeper_wait(void)
+{
+    pthread_mutex_lock(&gcsweep_mutex);
+    while (gcsweep_running)
+        pthread_cond_wait(&gcsweep_cond, &gcsweep_mutex);
+    pthread_mutex_unlock(&gcsweep_mutex);
+}
+
+#endif
+"""
+
+eci = ExternalCompilationInfo(
+    post_include_bits=["""
+typedef void (*pypy_gc_sweep_fn)(long);
+RPY_EXTERN long pypy_gc_sweeper_start(pypy_gc_sweep_fn);
+RPY_EXTERN long pypy_gc_sweeper_is_done(void);
+RPY_EXTERN void pypy_gc_sweeper_wait(void);
+#ifdef _MSC_VER
+#  include <intrin.h>
+#  ifdef _WIN64
+#    define pypy_gc_atomic_and(p, m)  \\
+         _InterlockedAnd64((volatile __int64 *)(p), (m))
+#  else
+#    define pypy_gc_atomic_and(p, m)  \\
+         _InterlockedAnd((volatile long *)(p), (m))
+#  endif
+#else
+#  define pypy_gc_atomic_and(p, m)  __sync_fetch_and_and((Signed *)(p), (m))
+#endif
+"""],
+    separate_module_sources=[_C_SOURCE])
+
+# ---------- emulation for the untranslated tests ----------
+#
+# lltype is not thread-safe, so the sweeping is only delayed: the first
+# call to is_done() says that it is still running, and the second one runs
+# it in the current thread.
+
+class _Emulation(object):
+    fn = None
+    polled = False
+
+    def run(self):
+        fn = self.fn
+        self.fn = None
+        if fn is not None:
+            fn(0)
+
+_emulation = _Emulation()
+
+@not_rpython
+def _emulated_start(fn):
+    _emulation.fn = fn
+    _emulation.polled = False
+    return 1
+
+@not_rpython
+def _emulated_is_done():
+    if _emulation.fn is not None and not _emulation.polled:
+        _emulation.polled = True
+        return 0
+    _emulation.run()
+    return 1
+
+@not_rpython
+def _emulated_wait():
+    _emulation.run()
+
+def llexternal(name, args, result, _callable=None):
+    return rffi.llexternal(name, args, result, compilation_info=eci,
+                           _callable=_callable, _nowrapper=True,
+                           sandboxsafe=True)
+
+c_start = llexternal('pypy_gc_sweeper_start', [SWEEPER_FN], lltype.Signed,
+                     _emulated_start)
+c_is_done = llexternal('pypy_gc_sweeper_is_done', [], lltype.Signed,
+                       _emulated_is_done)
+c_wait = llexternal('pypy_gc_sweeper_wait', [], lltype.Void, _emulated_wait)
+# only called when translated
+c_atomic_and = llexternal('pypy_gc_atomic_and',
+                          [llmemory.Address, lltype.Signed], lltype.Void)
@@ -6,10 +6,10 @@ see as the list of roots (stack and prebuilt objects).
 
 # XXX VERY INCOMPLETE, low coverage
 
-import py
+import py, random
 from rpython.rtyper.lltypesystem import lltype, llmemory
 from rpython.memory.gctypelayout import TypeLayoutBuilder, FIN_HANDLER_ARRAY
-from rpython.rlib.rarithmetic import LONG_BIT, is_valid_int
+from rpython.rlib.rarithmetic import LONG_BIT, is_valid_int, intmask
 from rpython.memory.gc import minimark, incminimark
 from rpython.memory.gctypelayout import zero_gc_pointers_inside, zero_gc_pointers
 from rpython.rlib.debug import debug_print
@@ -844,3 +844,232 @@ class TestIncrementalMiniMarkGCFull(DirectGCTest):
             (incminimark.STATE_SWEEPING, incminimark.STATE_FINALIZING),
             (incminimark.STATE_FINALIZING, incminimark.STATE_SCANNING)
             ]
+
+    def test_max_pause_steps(self):
+        self.gc.max_pause = 0.010
+        self.gc.last_minor_duration = 0.001
+        mark_step = intmask(self.gc.gc_increment_step)
+        sweep_step = self.gc.gc_sweep_step
+        # too slow: the steps are halved, but not below the nursery size
+        self.gc._adjust_steps_to_max_pause(incminimark.STATE_MARKING, 0.050)
+        assert self.gc.gc_increment_step == max(mark_step // 2,
+                                                self.gc.nursery_size)
+        self.gc._adjust_steps_to_max_pause(incminimark.STATE_SWEEPING, 1.0)
+        assert self.gc.gc_sweep_step == max(sweep_step // 2,
+                                            self.gc.nursery_size)
+        # fast enough: the steps grow again
+        self.gc._adjust_steps_to_max_pause(incminimark.STATE_MARKING, 0.0)
+        assert self.gc.gc_increment_step == 2 * max(mark_step // 2,
+                                                    self.gc.nursery_size)
+        self.gc._adjust_steps_to_max_pause(incminimark.STATE_SWEEPING, 0.004)
+        assert self.gc.gc_sweep_step > max(sweep_step // 2,
+                                           self.gc.nursery_size)
+
+    def test_nursery_survival_histogram(self):
+        from rpython.rlib import rgc
+        def histogram():
+            return [self.gc.get_stats(rgc.NURSERY_SURVIVAL + i)
+                    for i in range(rgc.NURSERY_SURVIVAL_BUCKETS)]
+        assert histogram() == [0] * rgc.NURSERY_SURVIVAL_BUCKETS
+        self.malloc(S)
+        self.gc._minor_collection()      # nothing survives
+        self.stackroots.append(self.malloc(S))
+        self.gc._minor_collection()      # everything survives
+        assert histogram() == [1, 0, 0, 0, 0, 0, 0, 1]
+
+    def test_arena_slack(self):
+        ac = self.gc.ac
+        ac.arena_slack = ac.arena_size
+        for i in range(100):
+            self.stackroots.append(self.malloc(S))
+        self.gc.collect()
+        arenas_count = ac.arenas_count
+        assert arenas_count > 2
+        del self.stackroots[:]
+        self.gc.collect()
+        # one empty arena is kept, the others are freed, apart from
+        # the one that malloc() was using
+        assert ac.spare_arenas_count == 1
+        assert ac.arenas_count <= 2
+        assert ac.total_memory_alloced == ac.arenas_count * ac.arena_size
+
+    def test_rss_stats(self):
+        from rpython.rlib import rgc
+        rss = self.gc.get_stats(rgc.RSS_MEMORY)
+        peak_rss = self.gc.get_stats(rgc.PEAK_RSS_MEMORY)
+        if rss == -1:
+            py.test.skip("the RSS is not known on this platform")
+        assert 0 < rss <= peak_rss
+
+    def test_adaptive_nursery(self):
+        base = self.gc.nursery_size
+        assert self.gc.adaptive_nursery
+        assert self.gc.max_nursery_size == 4 * base
+        # many survivors: grow
+        self.gc.nursery_survival_rate = 0.3
+        assert self.gc._nursery_size_from_survival(0.001, base) == 2 * base
+        # the minor collections are cheaper per byte: grow again
+        self.gc.nursery_size = 2 * base
+        assert self.gc._nursery_size_from_survival(0.001, 2 * base) == base * 4
+        # this time it doesn't help: shrink back and wait
+        self.gc.nursery_size = 4 * base
+        assert self.gc._nursery_size_from_survival(0.004, 4 * base) == base * 2
+        self.gc.nursery_size = 2 * base
+        for i in range(incminimark.NURSERY_GROWTH_BACKOFF - 1):
+            assert self.gc._nursery_size_from_survival(0.001, base) == base * 2
+        assert self.gc._nursery_size_from_survival(0.001, base) == base * 4
+        # few survivors: shrink, not below the initial size
+        self.gc.nursery_cost_before_growth = 0.0
+        self.gc.nursery_survival_rate = 0.01
+        assert self.gc._nursery_size_from_survival(0.001, base) == base
+        self.gc.nursery_size = base
+        assert self.gc._nursery_size_from_survival(0.001, base) == base
+    test_adaptive_nursery.GC_PARAMS = {'nursery_max_size': 128*WORD}
+
+    def test_adaptive_nursery_resizes(self):
+        # all objects survive: the nursery grows up to its maximum
+        base = self.gc.nursery_size
+        for i in range(500):
+            p = self.malloc(S)
+            p.x = i
+            self.stackroots.append(p)
+        assert self.gc.nursery_size > base
+        assert self.gc.nursery_size <= self.gc.max_nursery_size
+        self.gc.collect()
+        assert [p.x for p in self.stackroots] == range(500)
+    test_adaptive_nursery_resizes.GC_PARAMS = {'nursery_max_size': 128*WORD}
+
+    def test_max_pause_nursery(self):
+        self.gc.max_pause = 10.0    # the real minor collections are fast
+        max_size = self.gc.nursery_size
+        self.stackroots.append(self.malloc(S))
+        self.gc._minor_collection()
+        self.gc._adjust_nursery_size(20.0, 0)    # as if too slow
+        assert self.gc.nursery_size == max(max_size // 2,
+                                           self.gc.min_nursery_size)
+        assert self.gc.nursery_top - self.gc.nursery == self.gc.nursery_size
+        for i in range(100):
+            p = self.malloc(S)
+            p.x = i
+            self.write(p, 'next', self.stackroots[-1])
+            self.stackroots.append(p)
+        self.gc._minor_collection()
+        assert self.gc.nursery_size == max_size
+        self.gc.collect()
+        assert [p.x for p in self.stackroots[1:]] == range(100)
+        assert self.stackroots[-1].next.x == 98
+
+
+class TestIncrementalMiniMarkGCParallelMark(TestIncrementalMiniMarkGCFull):
+    # small chunks, so that the workers publish and steal them often
+    GC_PARAMS = {'mark_threads': 3, 'chunk_size': 4}
+
+    def test_parallel_mark_tree(self):
+        # a binary tree, marked in several steps by 3 threads
+        def build(depth):
+            p = self.malloc(S)
+            p.x = depth
+            if depth > 0:
+                self.stackroots.append(p)
+                left = build(depth - 1)
+                self.write(self.stackroots[-1], 'prev', left)
+                right = build(depth - 1)
+                p = self.stackroots.pop()
+                self.write(p, 'next', right)
+            return p
+
+        def check(p, depth):
+            assert p.x == depth
+            if depth > 0:
+                return 1 + check(p.prev, depth - 1) + check(p.next, depth - 1)
+            return 1
+
+        self.stackroots.append(build(8))
+        self.gc.debug_gc_step_until(incminimark.STATE_MARKING)
+        self.gc.gc_increment_step = 10 * WORD
+        self.gc.debug_gc_step_until(incminimark.STATE_SWEEPING)
+        self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
+        assert check(self.stackroots[0], 8) == 511
+
+    def test_parallel_mark_malloc_fails(self):
+        # the workers don't always get a new chunk for their stack; then
+        # the objects they could not finish are traced again
+        workers = self.gc.mark_workers
+        original_malloc_chunk = workers._malloc_chunk
+        failures = []
+        def malloc_chunk():
+            chunk = original_malloc_chunk()
+            if len(failures) < 20 and rnd.random() < 0.3:
+                lltype.free(chunk, flavor='raw', track_allocation=False)
+                failures.append(None)
+                return lltype.nullptr(lltype.typeOf(chunk).TO)
+            return chunk
+        rnd = random.Random(42)
+        workers._malloc_chunk = malloc_chunk
+        self.test_parallel_mark_tree()
+        assert failures
+
+
+class TestIncrementalMiniMarkGCConcurrentSweep(TestIncrementalMiniMarkGCFull):
+    GC_PARAMS = {'concurrent_sweep': True}
+
+    def test_concurrent_sweep(self):
+        for i in range(20):
+            p = self.malloc(S)
+            p.x = i
+            if i % 2:
+                self.stackroots.append(p)
+        large = self.malloc(VAR, 10000)    # raw-malloced
+        self.stackroots.append(large)
+        self.gc.debug_gc_step_until(incminimark.STATE_SWEEPING)
+        assert self.gc.concurrent_sweep_running
+        # the program goes on while the sweeper runs
+        oldobj = self.stackroots[0]
+        newobj = self.malloc(S)
+        newobj.x = 42
+        self.write(oldobj, 'next', newobj)
+        self.gc._minor_collection()
+        self.gc.major_collection_step()
+        self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
+        assert not self.gc.concurrent_sweep_running
+        assert [p.x for p in self.stackroots[:-1]] == range(1, 20, 2)
+        assert oldobj.next.x == 42
+        assert self.gc.old_rawmalloced_objects.length() == 1
+        for p in self.stackroots:
+            hdr = self.gc.header(llmemory.cast_ptr_to_adr(p))
+            assert hdr.tid & incminimark.GCFLAG_VISITED == 0
+
+    def test_header_written_while_sweeping(self):
+        p = self.malloc(S)
+        self.stackroots.append(p)
+        self.gc.debug_gc_step_until(incminimark.STATE_SWEEPING)
+        obj = llmemory.cast_ptr_to_adr(self.stackroots[0])
+        assert self.gc.header(obj).tid & incminimark.GCFLAG_VISITED
+        # as if the write had put back the flag cleared by the sweeper
+        self.gc.ignore_finalizer(obj)
+        assert self.gc.objects_written_while_sweeping.non_empty()
+        self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
+        assert not self.gc.objects_written_while_sweeping.non_empty()
+        assert self.gc.header(obj).tid & incminimark.GCFLAG_VISITED == 0
+
+    def test_write_barrier_while_sweeping(self):
+        p = self.malloc(S)
+        self.stackroots.append(p)
+        self.gc.debug_gc_step_until(incminimark.STATE_SWEEPING)
+        assert self.gc.concurrent_sweep_running
+        newobj = self.malloc(S)
+        newobj.x = 42
+        self.write(self.stackroots[0], 'next', newobj)
+        obj = llmemory.cast_ptr_to_adr(self.stackroots[0])
+        assert self.gc.old_objects_pointing_to_young.non_empty()
+        # the sweeper clears the flag, but the write barrier puts it back;
+        # the sweep is then finished before any minor collection
+        from rpython.memory.gc import sweeper
+        sweeper._emulation.run()
+        assert self.gc.header(obj).tid & incminimark.GCFLAG_VISITED == 0
+        self.gc.header(obj).tid |= incminimark.GCFLAG_VISITED
+        self.gc.wait_for_concurrent_sweep()
+        assert not self.gc.concurrent_sweep_running
+        assert self.gc.header(obj).tid & incminimark.GCFLAG_VISITED == 0
+        self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
+        assert self.stackroots[0].next.x == 42
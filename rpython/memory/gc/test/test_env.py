@@ -82,6 +82,18 @@ def test_read_from_env():
     finally:
         os.environ = saved
 
+def test_read_duration_from_env():
+    saved = os.environ
+    try:
+        for value, expected in [(None, 0.0), ('', 0.0), ('???', 0.0),
+                                ('ms', 0.0), ('-2ms', 0.0), ('0', 0.0),
+                                ('2', 2.0), ('0.5s', 0.5), ('2ms', 0.002),
+                                ('2MS', 0.002), ('250us', 0.00025)]:
+            os.environ = FakeEnviron(value)
+            check_equal(env.read_duration_from_env('FOOBAR'), expected)
+    finally:
+        os.environ = saved
+
 def test_get_total_memory_linux2():
     filepath = udir.join('get_total_memory_linux2')
     filepath.write("""\
@@ -114,6 +126,25 @@ etc.
     finally:
         env.addressable_size = saved
 
+def test_get_rss_linux():
+    filepath = udir.join('get_rss_linux')
+    filepath.write("""\
+Name:\tpypy
+VmPeak:\t  412380 kB
+VmHWM:\t   98304 kB
+VmRSS:\t   65536 kB
+etc.
+""")
+    assert env.get_rss_linux('VmRSS:', str(filepath)) == 65536 * 1024
+    assert env.get_rss_linux('VmHWM:', str(filepath)) == 98304 * 1024
+    assert env.get_rss_linux('VmSwap:', str(filepath)) == -1
+    assert env.get_rss_linux('VmRSS:', str(udir.join('missing'))) == -1
+
+def test_get_rss():
+    if not os.path.exists('/proc/self/status'):
+        py.test.skip("no /proc/self/status")
+    assert 0 < env.get_rss() <= env.get_peak_rss()
+
 def test_estimate_best_nursery_size_linux2():
     filepath = udir.join('estimate_best_nursery_size_linux2')
     filepath.write("""\
@@ -23,21 +23,27 @@ class MyGcHooks(GcHooks):
 
     def reset(self):
         self.minors = []
+        self.minor_sizes = []
         self.steps = []
+        self.step_sizes = []
         self.collects = []
         self.durations = []
 
-    def on_gc_minor(self, duration, total_memory_used, pinned_objects):
+    def on_gc_minor(self, duration, total_memory_used, pinned_objects,
+                    nursery_size, surviving_size):
         self.durations.append(duration)
         self.minors.append({
             'total_memory_used': total_memory_used,
             'pinned_objects': pinned_objects})
+        self.minor_sizes.append((nursery_size, surviving_size))
 
-    def on_gc_collect_step(self, duration, oldstate, newstate):
+    def on_gc_collect_step(self, duration, oldstate, newstate,
+                           increment_step, sweep_step, nursery_size):
         self.durations.append(duration)
         self.steps.append({
             'oldstate': oldstate,
             'newstate': newstate})
+        self.step_sizes.append((increment_step, sweep_step, nursery_size))
 
     def on_gc_collect(self, num_major_collects,
                       arenas_count_before, arenas_count_after,
@@ -81,6 +87,14 @@ class TestIncMiniMarkHooks(BaseDirectGCTest):
             {'total_memory_used': self.size_of_S*2, 'pinned_objects': 0}
             ]
 
+    def test_on_gc_minor_sizes(self):
+        self.gc.hooks._gc_minor_enabled = True
+        self.malloc(S)
+        self.stackroots.append(self.malloc(S))
+        self.gc._minor_collection()
+        assert self.gc.hooks.minor_sizes == [
+            (self.gc.nursery_size, self.size_of_S)]
+
     def test_on_gc_collect(self):
         from rpython.memory.gc import incminimark as m
         self.gc.hooks._gc_collect_step_enabled = True
@@ -117,6 +131,28 @@ class TestIncMiniMarkHooks(BaseDirectGCTest):
              'rawmalloc_bytes_before': 0}
             ]
 
+    def test_on_gc_collect_step_sizes(self):
+        from rpython.memory.gc import incminimark as m
+        self.gc.hooks._gc_collect_step_enabled = True
+        self.gc.collect()
+        sizes = (self.gc.gc_increment_step, self.gc.gc_sweep_step,
+                 self.gc.nursery_size)
+        assert self.gc.hooks.step_sizes == [sizes] * 4
+        #
+        # with a pause target, the steps that stay in the same state
+        # report the adjusted sizes
+        self.gc.hooks.reset()
+        self.gc.max_pause = 1e-12
+        for i in range(10):
+            self.stackroots.append(self.malloc(S))
+        self.gc.gc_step_until(m.STATE_MARKING)
+        self.gc.gc_increment_step = self.size_of_S
+        self.gc.major_collection_step()
+        assert self.gc.hooks.steps[-1] == {'oldstate': m.STATE_MARKING,
+                                           'newstate': m.STATE_MARKING}
+        assert self.gc.hooks.step_sizes[-1] == (
+            self.gc.nursery_size, self.gc.gc_sweep_step, self.gc.nursery_size)
+
     def test_hook_disabled(self):
         self.gc._minor_collection()
         self.gc.collect()
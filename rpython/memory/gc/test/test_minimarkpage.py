@@ -402,7 +402,7 @@ def test_mass_free_half_page_becomes_more_free():
 
 # ____________________________________________________________
 
-def test_random(incremental=False):
+def test_random(incremental=False, concurrent=False):
     import random
     pagesize = hdrsize + 24*WORD
     num_pages = 3
@@ -448,7 +448,20 @@ def test_random(incremental=False):
                                   multiarenas=True)
             live_objects_extra = {}
             fresh_extra = 0
-            if not incremental:
+            if concurrent:
+                # malloc() goes on between the steps, as in the GC
+                ac.mass_free_prepare()
+                for i in range(random.randrange(1, 5)):
+                    prev = ac.total_memory_used
+                    allocate_object(live_objects_extra)
+                    fresh_extra += ac.total_memory_used - prev
+                ac.mass_free_concurrent(ok_to_free)
+                for i in range(random.randrange(1, 5)):
+                    prev = ac.total_memory_used
+                    allocate_object(live_objects_extra)
+                    fresh_extra += ac.total_memory_used - prev
+                ac.mass_free_concurrent_finish()
+            elif not incremental:
                 ac.mass_free(ok_to_free)
             else:
                 ac.mass_free_prepare()
@@ -477,3 +490,55 @@ def test_random(incremental=False):
 
 def test_random_incremental():
     test_random(incremental=True)
+
+def test_random_concurrent():
+    test_random(concurrent=True)
+
+def _fill_and_free_arenas(ac, narenas):
+    objs = [ac.malloc(2*WORD) for i in range(narenas * 8)]
+    assert ac.arenas_count == narenas
+    ac.mass_free(lambda obj: True)
+    return objs
+
+def test_spare_arenas(monkeypatch):
+    resets = []
+    def my_arena_reset(addr, size, zero):
+        resets.append(zero)
+        prev_arena_reset(addr, size, zero)
+    prev_arena_reset = llarena.arena_reset
+    monkeypatch.setattr(llarena, 'arena_reset', my_arena_reset)
+    #
+    ac = ArenaCollection(SHIFT + 64*4, 64, 2*WORD)
+    ac.arena_slack = SHIFT + 64*4
+    _fill_and_free_arenas(ac, 3)
+    # one arena is kept, the two others are given back right away
+    assert ac.arenas_count == 1
+    assert ac.spare_arenas_count == 1
+    assert ac.total_memory_alloced == SHIFT + 64*4
+    assert resets.count(5) == 2 and 4 not in resets
+    spare = ac.spare_arenas
+    #
+    # the spare arena is reused before malloc() is called again
+    ac.malloc(2*WORD)
+    assert ac.current_arena == spare
+    assert ac.spare_arenas_count == 0
+    for i in range(7):
+        ac.malloc(2*WORD)
+    assert ac.arenas_count == 1
+    ac.malloc(2*WORD)
+    assert ac.arenas_count == 2
+
+def test_no_spare_arenas_by_default(monkeypatch):
+    resets = []
+    def my_arena_reset(addr, size, zero):
+        resets.append(zero)
+        prev_arena_reset(addr, size, zero)
+    prev_arena_reset = llarena.arena_reset
+    monkeypatch.setattr(llarena, 'arena_reset', my_arena_reset)
+    #
+    ac = ArenaCollection(SHIFT + 64*4, 64, 2*WORD)
+    _fill_and_free_arenas(ac, 3)
+    assert ac.arenas_count == 0
+    assert ac.spare_arenas_count == 0
+    assert ac.total_memory_alloced == 0
+    assert resets.count(4) == 3 and 5 not in resets
@@ -60,7 +60,6 @@ def get_chunk_manager(chunk_size=DEFAULT_CHUNK_SIZE, cache={}):
                 lltype.free(chunk, flavor="raw", track_allocation=False)
 
     unused_chunks = FreeList()
-    cache[chunk_size] = unused_chunks, null_chunk
 
     def partition(array, left, right):
         last_item = array[right]
@@ -84,6 +83,7 @@ def get_chunk_manager(chunk_size=DEFAULT_CHUNK_SIZE, cache={}):
     def sort_chunk(chunk, size):
         quicksort(chunk.items, 0, size - 1)
         
+    cache[chunk_size] = unused_chunks, null_chunk, sort_chunk
     return unused_chunks, null_chunk, sort_chunk
 
 
@@ -220,7 +220,7 @@ def get_address_deque(chunk_size=DEFAULT_CHUNK_SIZE, cache={}):
     except KeyError:
         pass
 
-    unused_chunks, null_chunk = get_chunk_manager(chunk_size)
+    unused_chunks, null_chunk, _ = get_chunk_manager(chunk_size)
 
     class AddressDeque(object):
         _alloc_flavor_ = "raw"
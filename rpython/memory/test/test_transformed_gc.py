@@ -1421,10 +1421,12 @@ class MyGcHooks(GcHooks):
     def is_gc_collect_enabled(self):
         return True
 
-    def on_gc_minor(self, duration, total_memory_used, pinned_objects):
+    def on_gc_minor(self, duration, total_memory_used, pinned_objects,
+                    nursery_size, surviving_size):
         self.stats.minors += 1
 
-    def on_gc_collect_step(self, duration, oldstate, newstate):
+    def on_gc_collect_step(self, duration, oldstate, newstate,
+                           increment_step, sweep_step, nursery_size):
         self.stats.steps += 1
         
     def on_gc_collect(self, num_major_collects,
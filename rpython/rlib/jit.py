@@ -546,9 +546,24 @@ PARAMETER_DOCS = {
     'function_threshold': 'number of times a function must run for it to become traced from start',
     'trace_eagerness': 'number of times a guard has to fail before we start compiling a bridge',
     'decay': 'amount to regularly decay counters by (0=none, 1000=max)',
+    'compile_budget': 'number of loops and bridges that can start tracing '
+                      'between two decays of the counters; the others are '
+                      'postponed (0=no limit)',
     'trace_limit': 'number of recorded operations before we abort tracing with ABORT_TOO_LONG',
+    'trace_segments': 'when a trace is too long and no inlined function '
+                      'is responsible, compile what was traced so far and '
+                      'trace the rest as a bridge (1/0)',
     'inlining': 'inline python functions or not (1/0)',
+    'inline_max_size': 'functions bigger than this are not inlined, but '
+                       'traced from their start and called (0=no limit)',
+    'inline_hot_size': 'functions up to this size are inlined even if they '
+                       'were marked as not inlinable, once they are hot '
+                       'enough to have been compiled from their start '
+                       '(0=never)',
     'loop_longevity': 'a parameter controlling how long loops will be kept before being freed, an estimate',
+    'loop_memory_limit': 'number of bytes of machine code and resume data '
+                         'of the compiled loops above which the least '
+                         'recently used loops are freed (0=no limit)',
     'retrace_limit': 'how many times we can try retracing before giving up',
     'max_retrace_guards': 'number of extra guards a retrace can cause',
     'max_unroll_loops': 'number of extra unrollings a loop can cause',
@@ -567,9 +582,14 @@ PARAMETERS = {'threshold': 1039, # just above 1024, prime
               'function_threshold': 1619, # slightly more than one above, also prime
               'trace_eagerness': 200,
               'decay': 40,
+              'compile_budget': 0,
               'trace_limit': 6000,
+              'trace_segments': 1,
               'inlining': 1,
+              'inline_max_size': 0,
+              'inline_hot_size': 0,
               'loop_longevity': 1000,
+              'loop_memory_limit': 0,
               'retrace_limit': 0,
               'max_retrace_guards': 15,
               'max_unroll_loops': 0,
@@ -603,8 +623,15 @@ class JitDriver(object):
                  get_printable_location=None, confirm_enter_jit=None,
                  can_never_inline=None, should_unroll_one_iteration=None,
                  name='jitdriver', check_untranslated=True, vectorize=False,
-                 get_unique_id=None, is_recursive=False, get_location=None):
-        """get_location:
+                 get_unique_id=None, is_recursive=False, get_location=None,
+                 get_code_size=None):
+        """get_code_size:
+              Takes the greens of the start of a function and returns its
+              size, e.g. the number of bytes of bytecode.  Used with the
+              'inline_max_size' and 'inline_hot_size' parameters to decide
+              which functions to inline.
+
+           get_location:
               The return value is designed to provide enough information to express the
               state of an interpreter when invoking jit_merge_point.
               For a bytecode interperter such as PyPy this includes, filename, line number,
@@ -665,6 +692,7 @@ class JitDriver(object):
         self.confirm_enter_jit = confirm_enter_jit
         self.can_never_inline = can_never_inline
         self.should_unroll_one_iteration = should_unroll_one_iteration
+        self.get_code_size = get_code_size
         self.check_untranslated = check_untranslated
         self.is_recursive = is_recursive
         self.vec = vectorize
@@ -1110,10 +1138,14 @@ class JitHookInterface(object):
         greenkey where it started, reason is a string why it got aborted
         """
 
-    def on_trace_too_long(self, jitdriver, greenkey, greenkey_repr):
-        """ A hook called each time we abort the trace because it's too
-        long with the greenkey being the one responsible for the
-        disabled function
+    def on_trace_too_long(self, jitdriver, greenkey, greenkey_repr,
+                          segmented, count):
+        """ A hook called each time a trace is too long.  If 'segmented'
+        is False, tracing was aborted and greenkey is the one of the
+        function that is no longer inlined.  If 'segmented' is True, what
+        was traced so far was compiled, and greenkey is the one of the
+        loop (None for a bridge).  'count' is the number of times this
+        kind of event happened so far.
         """
 
     #def before_optimize(self, debug_info):
@@ -1324,9 +1356,11 @@ class Counters(object):
     ABORT_BAD_LOOP
     ABORT_ESCAPE
     ABORT_FORCE_QUASIIMMUT
+    TRACE_SEGMENTS
     NVIRTUALS
     NVHOLES
     NVREUSED
+    NNUMBREUSED
     TOTAL_COMPILED_LOOPS
     TOTAL_COMPILED_BRIDGES
     TOTAL_FREED_LOOPS
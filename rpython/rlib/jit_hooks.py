@@ -137,6 +137,41 @@ def stats_asmmemmgr_allocated(warmrunnerdesc):
 def stats_asmmemmgr_used(warmrunnerdesc):
     return warmrunnerdesc.metainterp_sd.cpu.asmmemmgr.get_stats()[1]
 
+LOOP_MEMORY_CONTAINER = lltype.GcArray(lltype.Struct('elem',
+                                                     ('number', lltype.Signed),
+                                                     ('code_size', lltype.Signed),
+                                                     ('resume_size', lltype.Signed)))
+
+@register_helper(lltype.Ptr(LOOP_MEMORY_CONTAINER))
+def stats_get_loop_memory(warmrunnerdesc):
+    return warmrunnerdesc.memory_manager.get_loop_memory()
+
+@register_helper(annmodel.SomeInteger())
+def stats_loop_memory_used(warmrunnerdesc):
+    return warmrunnerdesc.memory_manager.memory_used
+
+@register_helper(annmodel.s_None)
+def stats_set_loop_profile(warmrunnerdesc, flag):
+    warmrunnerdesc.loop_profile.set_enabled(flag)
+
+LOOP_ENTRY_CONTAINER = lltype.GcArray(lltype.Struct('elem',
+                                                    ('number', lltype.Signed),
+                                                    ('entries', lltype.Signed)))
+
+@register_helper(lltype.Ptr(LOOP_ENTRY_CONTAINER))
+def stats_get_loop_entries(warmrunnerdesc):
+    return warmrunnerdesc.loop_profile.get_loop_entries()
+
+GUARD_FAILURE_CONTAINER = lltype.GcArray(lltype.Struct('elem',
+                                                   ('number', lltype.Signed),
+                                                   ('loop_number', lltype.Signed),
+                                                   ('failures', lltype.Signed),
+                                                   ('bridges', lltype.Signed)))
+
+@register_helper(lltype.Ptr(GUARD_FAILURE_CONTAINER))
+def stats_get_guard_failures(warmrunnerdesc):
+    return warmrunnerdesc.loop_profile.get_guard_failures()
+
 # ---------------------- jitcell interface ----------------------
 
 def _new_hook(name, resulttype):
@@ -166,3 +201,8 @@ get_jitcell_at_key = _new_hook('get_jitcell_at_key', SomePtr(llmemory.GCREF))
 trace_next_iteration = _new_hook('trace_next_iteration', None)
 dont_trace_here = _new_hook('dont_trace_here', None)
 trace_next_iteration_hash = _new_hook('trace_next_iteration_hash', None)
+warm_start_at_key = _new_hook('warm_start_at_key', None)
+get_counter_at_key = _new_hook('get_counter_at_key', annmodel.SomeFloat())
+# the first argument after the jitdriver name is the new counter value,
+# between 0.0 and 1.0, followed by the greenkey
+set_counter_at_key = _new_hook('set_counter_at_key', None)
@@ -786,7 +786,16 @@ def cast_gcref_to_int(gcref):
 (TOTAL_MEMORY, TOTAL_ALLOCATED_MEMORY, TOTAL_MEMORY_PRESSURE,
  PEAK_MEMORY, PEAK_ALLOCATED_MEMORY, TOTAL_ARENA_MEMORY,
  TOTAL_RAWMALLOCED_MEMORY, PEAK_ARENA_MEMORY, PEAK_RAWMALLOCED_MEMORY,
- NURSERY_SIZE, TOTAL_GC_TIME) = range(11)
+ NURSERY_SIZE, TOTAL_GC_TIME, NURSERY_SURVIVAL) = range(12)
+
+# get_stats(NURSERY_SURVIVAL + i) is the number of minor collections where
+# less than 2**i percent of the nursery survived, but not less than in the
+# previous bucket; the last bucket counts all the others.
+NURSERY_SURVIVAL_BUCKETS = 8
+
+# the resident set size of the process, current and peak, or -1 if unknown
+RSS_MEMORY = NURSERY_SURVIVAL + NURSERY_SURVIVAL_BUCKETS
+PEAK_RSS_MEMORY = RSS_MEMORY + 1
 
 @not_rpython
 def get_stats(stat_no):
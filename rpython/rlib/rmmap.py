@@ -796,15 +796,28 @@ if _POSIX:
                 c_madvise_safe(rffi.cast(PTR, addr),
                                rffi.cast(size_t, map_size),
                                rffi.cast(rffi.INT, MADV_DONTNEED))
+        def madvise_dontneed(addr, map_size):
+            # unlike MADV_FREE, the pages are dropped from the RSS now
+            c_madvise_safe(rffi.cast(PTR, addr),
+                           rffi.cast(size_t, map_size),
+                           rffi.cast(rffi.INT, MADV_DONTNEED))
     elif has_madvise and not (MADV_FREE is MADV_DONTNEED is None):
         use_flag = MADV_FREE if MADV_FREE is not None else MADV_DONTNEED
         def madvise_free(addr, map_size):
             c_madvise_safe(rffi.cast(PTR, addr),
                            rffi.cast(size_t, map_size),
                            rffi.cast(rffi.INT, use_flag))
+        if MADV_DONTNEED is not None:
+            def madvise_dontneed(addr, map_size):
+                c_madvise_safe(rffi.cast(PTR, addr),
+                               rffi.cast(size_t, map_size),
+                               rffi.cast(rffi.INT, MADV_DONTNEED))
+        else:
+            madvise_dontneed = madvise_free
     else:
         def madvise_free(addr, map_size):
             "No madvise() on this platform"
+        madvise_dontneed = madvise_free
 
 elif _MS_WINDOWS:
     def mmap(fileno, length, tagname="", access=_ACCESS_DEFAULT, offset=0):
@@ -966,3 +979,6 @@ elif _MS_WINDOWS:
             rffi.cast(DWORD, PAGE_READWRITE))
         #from rpython.rlib import debug
         #debug.debug_print("madvise_free:", r)
+
+    # the heap memory of malloc() cannot be decommitted on Windows
+    madvise_dontneed = madvise_free
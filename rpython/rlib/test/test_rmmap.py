@@ -5,7 +5,7 @@ from rpython.rtyper.lltypesystem import rffi, lltype
 from rpython.rlib.rarithmetic import intmask
 from rpython.rlib import rmmap as mmap
 from rpython.rlib.rmmap import RTypeError, RValueError, alloc, free
-from rpython.rlib.rmmap import madvise_free
+from rpython.rlib.rmmap import madvise_free, madvise_dontneed
 
 
 class TestMMap:
@@ -495,6 +495,18 @@ def test_alloc_free():
     madvise_free(data, map_size)
     free(data, map_size)
 
+def test_alloc_madvise_dontneed():
+    map_size = 65536
+    data = alloc(map_size)
+    for i in range(0, map_size, 171):
+        data[i] = chr(i & 0xff)
+    madvise_dontneed(data, map_size)
+    if sys.platform.startswith('linux'):
+        # private anonymous pages read back as zeroes
+        for i in range(0, map_size, 171):
+            assert data[i] == '\x00'
+    free(data, map_size)
+
 def test_compile_alloc_free():
     from rpython.translator.c.test.test_genc import compile
 
@@ -337,6 +337,8 @@ def arena_reset(arena_addr, size, zero):
       * 3: fill with garbage
       * 4: large area of memory that can benefit from MADV_FREE
              (i.e. contains garbage, may be zero-filled or not)
+      * 5: like 4, but give the memory back to the OS right away
+             (MADV_DONTNEED), so that it no longer counts in the RSS
     """
     arena_addr = getfakearenaaddress(arena_addr)
     arena_addr.arena.reset(zero, arena_addr.offset, size)
@@ -453,7 +455,7 @@ else:
             return rmmap.PAGESIZE
     posixpagesize = PosixPageSize()
 
-def madvise_arena_free(baseaddr, size):
+def madvise_arena_free(baseaddr, size, release_now=False):
     from rpython.rlib import rmmap
 
     pagesize = posixpagesize.get()
@@ -461,8 +463,12 @@ def madvise_arena_free(baseaddr, size):
     aligned_addr = (baseaddr + pagesize - 1) & ~(pagesize - 1)
     size -= (aligned_addr - baseaddr)
     if size >= pagesize:
-        rmmap.madvise_free(rffi.cast(rmmap.PTR, aligned_addr),
-                           size & ~(pagesize - 1))
+        if release_now:
+            rmmap.madvise_dontneed(rffi.cast(rmmap.PTR, aligned_addr),
+                                   size & ~(pagesize - 1))
+        else:
+            rmmap.madvise_free(rffi.cast(rmmap.PTR, aligned_addr),
+                               size & ~(pagesize - 1))
 
 
 if os.name == "posix":
@@ -537,6 +543,8 @@ def llimpl_arena_reset(arena_addr, size, zero):
             llop.raw_memset(lltype.Void, arena_addr, ord('#'), size)
         elif zero == 4:
             madvise_arena_free(arena_addr, size)
+        elif zero == 5:
+            madvise_arena_free(arena_addr, size, release_now=True)
         else:
             llmemory.raw_memclear(arena_addr, size)
 llimpl_arena_reset._always_inline_ = True
@@ -1672,6 +1672,127 @@ class TestMiniMarkGC(TestSemiSpaceGC):
 class TestIncrementalMiniMarkGC(TestMiniMarkGC):
     gcpolicy = "incminimark"
 
+    def define_parallel_mark(cls):
+        class Node(object):
+            def __init__(self, left, right, value):
+                self.left = left
+                self.right = right
+                self.value = value
+        def build(depth):
+            if depth == 0:
+                return None
+            return Node(build(depth - 1), build(depth - 1), depth)
+        def total(node):
+            if node is None:
+                return 0
+            return node.value + total(node.left) + total(node.right)
+        def f():
+            trees = [build(14) for i in range(4)]
+            for i in range(20):
+                trees[i % 4] = build(14)   # garbage for the next collections
+                gc.collect(1)
+            gc.collect()
+            result = 0
+            for tree in trees:
+                result += total(tree)
+            return result
+        return f
+
+    def test_parallel_mark(self):
+        def myrunner(args):
+            env = os.environ.copy()
+            env['PYPY_GC_MARK_THREADS'] = '4'
+            env['PYPY_GC_INCREMENT_STEP'] = '64KB'
+            return subprocess.check_output(args, env=env)
+        res = self.run("parallel_mark", runner=myrunner)
+        assert res == self.run_orig("parallel_mark")
+
+    def define_sweep_thread(cls):
+        class Node(object):
+            def __init__(self, next, value):
+                self.next = next
+                self.value = value
+                self.big = [value] * (value % 300)    # some are raw-malloced
+        def f():
+            # the major collections start on their own, and the program
+            # changes the old objects while the sweeper runs
+            keep = [None] * 1000
+            result = 0
+            for i in range(100000):
+                node = Node(keep[i % 1000], i)
+                if i % 7 == 0:
+                    keep[i % 1000] = node
+                if i % 20000 == 0:
+                    gc.collect(1)
+            for node in keep:
+                while node is not None:
+                    result += node.value + len(node.big)
+                    node = node.next
+            return result
+        return f
+
+    def test_sweep_thread(self):
+        def myrunner(args):
+            env = os.environ.copy()
+            env['PYPY_GC_SWEEP_THREAD'] = '1'
+            env['PYPY_GC_NURSERY'] = '64KB'
+            return subprocess.check_output(args, env=env)
+        res = self.run("sweep_thread", runner=myrunner)
+        assert res == self.run_orig("sweep_thread")
+
+    def define_max_pause(cls):
+        # same program, with steps and a nursery that change all the time
+        return cls.define_sweep_thread.im_func(cls)
+
+    def test_max_pause(self):
+        def myrunner(args):
+            env = os.environ.copy()
+            env['PYPY_GC_MAX_PAUSE'] = '50us'
+            return subprocess.check_output(args, env=env)
+        res = self.run("max_pause", runner=myrunner)
+        assert res == self.run_orig("max_pause")
+
+    def define_adaptive_nursery(cls):
+        return cls.define_sweep_thread.im_func(cls)
+
+    def test_adaptive_nursery(self):
+        def myrunner(args):
+            env = os.environ.copy()
+            env['PYPY_GC_NURSERY'] = '300KB'
+            env['PYPY_GC_NURSERY_MAX'] = '4MB'
+            return subprocess.check_output(args, env=env)
+        res = self.run("adaptive_nursery", runner=myrunner)
+        assert res == self.run_orig("adaptive_nursery")
+
+    def define_arena_slack(cls):
+        class A(object):
+            def __init__(self, i):
+                self.i = i
+        class Glob(object):
+            pass
+        glob = Glob()
+
+        def f():
+            glob.l = [A(i) for i in range(1000000)]
+            rgc.collect()
+            rss_before = rgc.get_stats(rgc.RSS_MEMORY)
+            glob.l = None
+            rgc.collect()
+            rss_after = rgc.get_stats(rgc.RSS_MEMORY)
+            if rss_before < 0:
+                return 1     # unknown on this platform
+            # the arenas of the A instances are given back
+            return int(rss_before - rss_after > 16 * 1024 * 1024)
+        return f
+
+    def test_arena_slack(self):
+        def myrunner(args):
+            env = os.environ.copy()
+            env['PYPY_GC_ARENA_SLACK'] = '0'
+            return subprocess.check_output(args, env=env)
+        res = self.run("arena_slack", runner=myrunner)
+        assert res == 1
+
     def define_total_memory_pressure(cls):
         class A(object):
             def __init__(self):